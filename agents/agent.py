@@ -49,9 +49,11 @@ import logging
 import os
 import re
 import sys
+from contextlib import AsyncExitStack
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
+import anyio
 import mcp
 import yaml
 
@@ -478,6 +480,135 @@ def calculator(expression: str) -> str:
         return f"Error evaluating expression: {str(e)}"
 
 
+class _PooledMCPSession:
+    """
+    One initialized MCP session kept open in a background task.
+
+    The transport and ClientSession contexts are entered and exited by the same
+    task (anyio requires it), while tool calls from any task share the session;
+    ClientSession multiplexes concurrent requests by JSON-RPC id.
+    """
+
+    def __init__(self, server_url: str, headers: dict[str, str], use_sse: bool):
+        self.server_url = server_url
+        self.headers = headers
+        self.use_sse = use_sse
+        self.session: mcp.ClientSession | None = None
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._error: BaseException | None = None
+
+    @property
+    def alive(self) -> bool:
+        return self.session is not None and self._task is not None and not self._task.done()
+
+    async def open(self) -> None:
+        self._task = asyncio.create_task(self._run())
+        await self._ready.wait()
+        if self._error is not None:
+            raise self._error
+
+    async def close(self) -> None:
+        self._closing.set()
+        if self._task is not None:
+            try:
+                await asyncio.wait_for(self._task, timeout=5)
+            except (TimeoutError, asyncio.CancelledError):
+                self._task.cancel()
+            except Exception as e:
+                logger.debug(f"Error closing MCP session for {self.server_url}: {e}")
+
+    async def _run(self) -> None:
+        try:
+            async with AsyncExitStack() as stack:
+                if self.use_sse:
+                    read, write = await stack.enter_async_context(sse_client(self.server_url, headers=self.headers))
+                else:
+                    read, write, _ = await stack.enter_async_context(
+                        streamablehttp_client(url=self.server_url, headers=self.headers)
+                    )
+                session = await stack.enter_async_context(mcp.ClientSession(read, write, sampling_callback=None))
+                # Initialize the connection once; later tool calls reuse it
+                await session.initialize()
+                self.session = session
+                self._ready.set()
+                await self._closing.wait()
+        except Exception as e:
+            if not self._ready.is_set():
+                self._error = e
+            else:
+                logger.warning(f"MCP session for {self.server_url} closed unexpectedly: {e}")
+        finally:
+            self.session = None
+            self._ready.set()
+
+
+class MCPSessionManager:
+    """
+    Cache of initialized MCP sessions, one per (server URL, transport).
+
+    invoke_mcp_tool used to open a transport and run the full initialize handshake
+    for every call. Sessions are now opened on first use and reused across tool
+    calls, including parallel tool calls over the same session. A session whose
+    transport died is reopened on the next call, and a session opened with auth
+    headers that have since changed (e.g. a refreshed token) is closed and replaced.
+    A call is retried on a new session only if its request never reached the
+    transport, so a tool is never run twice. All sessions are closed on shutdown.
+    """
+
+    def __init__(self):
+        self._sessions: dict[tuple, _PooledMCPSession] = {}
+        self._locks: dict[tuple, asyncio.Lock] = {}
+
+    async def _get_session(self, server_url: str, headers: dict[str, str], use_sse: bool):
+        key = (server_url, use_sse)
+        pooled = self._sessions.get(key)
+        if pooled is not None and pooled.alive and pooled.headers == headers:
+            return pooled
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            pooled = self._sessions.get(key)
+            if pooled is not None and pooled.alive and pooled.headers == headers:
+                return pooled
+            if pooled is not None:
+                # Dead, or opened with credentials that have since been replaced.
+                del self._sessions[key]
+                await pooled.close()
+            pooled = _PooledMCPSession(server_url, dict(headers), use_sse)
+            await pooled.open()
+            self._sessions[key] = pooled
+            logger.info(f"Opened MCP session for {server_url} ({len(self._sessions)} cached)")
+            return pooled
+
+    async def call_tool(
+        self,
+        server_url: str,
+        headers: dict[str, str],
+        use_sse: bool,
+        tool_name: str,
+        arguments: dict[str, Any],
+    ):
+        pooled = await self._get_session(server_url, headers, use_sse)
+        session = pooled.session
+        if session is None:
+            logger.warning(f"MCP session for {server_url} ended before the call was sent, reconnecting")
+        else:
+            try:
+                return await session.call_tool(tool_name, arguments=arguments)
+            except (anyio.ClosedResourceError, anyio.BrokenResourceError) as e:
+                # The transport was gone before the request could be written, so the tool did not run.
+                logger.warning(f"MCP session for {server_url} closed before the call was sent ({e}), reconnecting")
+        pooled = await self._get_session(server_url, headers, use_sse)
+        return await pooled.session.call_tool(tool_name, arguments=arguments)
+
+    async def aclose(self) -> None:
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        self._locks.clear()
+        await asyncio.gather(*(pooled.close() for pooled in sessions), return_exceptions=True)
+
+
 @tool
 async def invoke_mcp_tool(
     mcp_registry_url: str,
@@ -490,7 +621,8 @@ async def invoke_mcp_tool(
     """
     Invoke a tool on an MCP server using the MCP Registry URL and server name with authentication.
 
-    This tool creates an MCP client and calls the specified tool with the provided arguments.
+    This tool calls the specified tool with the provided arguments over a cached MCP session
+    for the server, opening and initializing one on first use.
     Authentication details are automatically retrieved from the system configuration.
 
     Args:
@@ -681,38 +813,15 @@ async def invoke_mcp_tool(
             f"invoke_mcp_tool, Connecting to MCP server using {transport_name}: {server_url}, headers: {redacted_headers}"
         )
 
-        if use_sse:
-            # Create an MCP SSE client
-            async with sse_client(server_url, headers=headers) as (read, write):
-                async with mcp.ClientSession(read, write, sampling_callback=None) as session:
-                    # Initialize the connection
-                    await session.initialize()
-
-                    # Call the specified tool with the provided arguments
-                    result = await session.call_tool(tool_name, arguments=arguments)
+        # Call the specified tool with the provided arguments over a cached session
+        result = await mcp_session_manager.call_tool(server_url, headers, use_sse, tool_name, arguments)
 
-                    # Format the result as a string
-                    response = ""
-                    for r in result.content:
-                        response += r.text + "\n"
-
-                    return response.strip()
-        else:
-            # Create an MCP streamable-http client
-            async with streamablehttp_client(url=server_url, headers=headers) as (read, write, get_session_id):
-                async with mcp.ClientSession(read, write, sampling_callback=None) as session:
-                    # Initialize the connection
-                    await session.initialize()
+        # Format the result as a string
+        response = ""
+        for r in result.content:
+            response += r.text + "\n"
 
-                    # Call the specified tool with the provided arguments
-                    result = await session.call_tool(tool_name, arguments=arguments)
-
-                    # Format the result as a string
-                    response = ""
-                    for r in result.content:
-                        response += r.text + "\n"
-
-                    return response.strip()
+        return response.strip()
     except Exception as e:
         return f"Error invoking MCP tool: {str(e)}"
 
@@ -739,6 +848,9 @@ class AgentSettings:
 
 agent_settings = AgentSettings()
 
+# Global cache of MCP sessions used by invoke_mcp_tool
+mcp_session_manager = MCPSessionManager()
+
 # Global server configuration
 server_config = {}
 
@@ -1381,6 +1493,8 @@ async def main():
         import traceback
 
         print(traceback.format_exc())
+    finally:
+        await mcp_session_manager.aclose()
 
 
 if __name__ == "__main__":
@@ -11,23 +11,36 @@ Authentication is handled via JWT tokens retrieved from AWS SSM Parameter Store
 the get-m2m-token.sh script.
 """
 
+import asyncio
 import json
 import logging
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 from enum import StrEnum
 from typing import Any
 from urllib.parse import quote
 
+import httpx
 import requests
 from pydantic import BaseModel, ConfigDict, Field
 
 from registry.core.config import settings
 
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=settings.log_level, format=settings.log_format)
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_CONCURRENCY = 10
+
 
 class HealthStatus(StrEnum):
     """Health status enumeration for servers."""
@@ -719,6 +732,30 @@ class GroupDeleteResponse(BaseModel):
     deleted: bool = Field(True, description="Deletion status")
 
 
+class BulkItemResult(BaseModel):
+    """Result of one item of a bulk operation."""
+
+    key: str = Field(..., description="Item identifier (e.g., service path)")
+    success: bool = Field(..., description="Whether the operation succeeded for this item")
+    status_code: int | None = Field(None, description="HTTP status code if the request failed")
+    error: str | None = Field(None, description="Error message if the operation failed")
+    response: dict[str, Any] | None = Field(None, description="Response data if the operation succeeded")
+
+
+class BulkOperationResponse(BaseModel):
+    """Bulk operation response model with one result per item, in input order."""
+
+    results: list[BulkItemResult] = Field(default_factory=list, description="Per-item results")
+
+    @property
+    def succeeded(self) -> list[BulkItemResult]:
+        return [result for result in self.results if result.success]
+
+    @property
+    def failed(self) -> list[BulkItemResult]:
+        return [result for result in self.results if not result.success]
+
+
 class RegistryClient:
     """
     MCP Gateway Registry API client.
@@ -1745,3 +1782,298 @@ class RegistryClient:
         result = GroupDeleteResponse(**response.json())
         logger.info(f"Group deleted successfully: {name}")
         return result
+
+
+class AsyncRegistryClient:
+    """
+    Asynchronous MCP Gateway Registry API client for fleet-wide operations.
+
+    All requests share one pooled httpx session (HTTP/2 when the h2 package is
+    installed), and at most max_concurrency of them are in flight at a time.
+    Request and response models are the same as RegistryClient's. The bulk
+    helpers (register_services, toggle_services, remove_services,
+    rescan_servers) never raise for a single item; they report a
+    BulkItemResult per item instead.
+
+    Usage:
+        async with AsyncRegistryClient(registry_url, token, max_concurrency=20) as client:
+            response = await client.toggle_services(["/server-a", "/server-b"])
+            for failure in response.failed:
+                print(failure.key, failure.error)
+    """
+
+    def __init__(
+        self,
+        registry_url: str,
+        token: str,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: float = 30.0,
+        http2: bool = True,
+    ):
+        """
+        Initialize the async Registry Client.
+
+        Args:
+            registry_url: Base URL of the registry (e.g., https://registry.mycorp.click)
+            token: JWT access token for authentication
+            max_concurrency: Maximum number of requests in flight at the same time
+            timeout: Request timeout in seconds
+            http2: Use HTTP/2 if the h2 package is installed
+        """
+        self.registry_url = registry_url.rstrip("/")
+        self.max_concurrency = max(1, max_concurrency)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        use_http2 = http2 and HTTP2_AVAILABLE
+        if http2 and not HTTP2_AVAILABLE:
+            logger.debug("h2 package not installed, using HTTP/1.1")
+
+        self._client = httpx.AsyncClient(
+            base_url=self.registry_url,
+            headers={"Authorization": f"Bearer {token}"},
+            http2=use_http2,
+            limits=httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency),
+            timeout=timeout,
+        )
+
+        # Redact token in logs - show only first 8 characters
+        redacted_token = f"{token[:8]}..." if len(token) > 8 else "***"
+        logger.info(
+            f"Initialized AsyncRegistryClient for {self.registry_url} "
+            f"(token: {redacted_token}, concurrency: {self.max_concurrency}, http2: {use_http2})"
+        )
+
+    async def __aenter__(self) -> "AsyncRegistryClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP session."""
+        await self._client.aclose()
+
+    async def _make_request(
+        self, method: str, endpoint: str, data: dict[str, Any] | None = None, params: dict[str, Any] | None = None
+    ) -> httpx.Response:
+        """
+        Make HTTP request to the Registry API, waiting for a free concurrency slot first.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            data: Request body data (sent as form-encoded except for agent and management endpoints)
+            params: Query parameters
+
+        Returns:
+            Response object
+
+        Raises:
+            httpx.HTTPStatusError: If request fails
+        """
+        logger.debug(f"{method} {self.registry_url}{endpoint}")
+
+        # Agent and Management API endpoints use JSON, server registration uses form data
+        if endpoint.startswith("/api/agents") or endpoint.startswith("/api/management"):
+            body = {"json": data}
+        else:
+            body = {"data": data}
+
+        async with self._semaphore:
+            response = await self._client.request(method, endpoint, params=params, **body)
+
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError:
+            # For 422 errors, try to extract validation details
+            if response.status_code == 422:
+                try:
+                    logger.error(f"Validation error details: {json.dumps(response.json(), indent=2)}")
+                except Exception:
+                    pass
+            raise
+        return response
+
+    async def register_service(self, registration: InternalServiceRegistration) -> ServiceResponse:
+        """
+        Register a new service in the registry.
+
+        Args:
+            registration: Service registration data
+
+        Returns:
+            Service response with registration details
+
+        Raises:
+            httpx.HTTPStatusError: If registration fails
+        """
+        response = await self._make_request(
+            method="POST",
+            endpoint="/api/servers/register",
+            data=registration.model_dump(exclude_none=True, by_alias=True),
+        )
+        logger.debug(f"Service registered successfully: {registration.service_path}")
+        return ServiceResponse(**response.json())
+
+    async def remove_service(self, service_path: str) -> dict[str, Any]:
+        """
+        Remove a service from the registry.
+
+        Args:
+            service_path: Path of service to remove
+
+        Returns:
+            Response data
+
+        Raises:
+            httpx.HTTPStatusError: If removal fails
+        """
+        response = await self._make_request(method="POST", endpoint="/api/servers/remove", data={"path": service_path})
+        logger.debug(f"Service removed successfully: {service_path}")
+        return response.json()
+
+    async def toggle_service(self, service_path: str) -> ToggleResponse:
+        """
+        Toggle service enabled/disabled status.
+
+        Args:
+            service_path: Path of service to toggle
+
+        Returns:
+            Toggle response with current status
+
+        Raises:
+            httpx.HTTPStatusError: If toggle fails
+        """
+        response = await self._make_request(
+            method="POST", endpoint="/api/servers/toggle", data={"service_path": service_path}
+        )
+        result = ToggleResponse(**response.json())
+        logger.debug(f"Service toggled: {service_path} -> enabled={result.is_enabled}")
+        return result
+
+    async def list_services(self) -> ServerListResponse:
+        """
+        List all services in the registry.
+
+        Returns:
+            Server list response
+
+        Raises:
+            httpx.HTTPStatusError: If list operation fails
+        """
+        response = await self._make_request(method="GET", endpoint="/api/servers")
+        result = ServerListResponse(**response.json())
+        logger.info(f"Retrieved {len(result.servers)} services")
+        return result
+
+    async def rescan_server(self, path: str) -> RescanResponse:
+        """
+        Trigger a manual security scan for a server (admin only).
+
+        Args:
+            path: Server path (e.g., /cloudflare-docs)
+
+        Returns:
+            Newly generated security scan results
+
+        Raises:
+            httpx.HTTPStatusError: If scan fails (403 for non-admin, 404 for not found, 500 for scan error)
+        """
+        response = await self._make_request(method="POST", endpoint=f"/api/servers{path}/rescan")
+        result = RescanResponse(**response.json())
+        logger.debug(f"Security scan completed for '{path}': {'SAFE' if result.is_safe else 'UNSAFE'}")
+        return result
+
+    async def _run_bulk(
+        self, operation: str, items: list[tuple[str, Callable[[], Awaitable[Any]]]]
+    ) -> BulkOperationResponse:
+        """
+        Run one request per item concurrently and collect a result for each.
+
+        Args:
+            operation: Operation name for logging
+            items: (key, coroutine factory) pairs
+
+        Returns:
+            Per-item results in input order
+        """
+
+        async def run_one(key: str, call: Callable[[], Awaitable[Any]]) -> BulkItemResult:
+            try:
+                result = await call()
+            except httpx.HTTPStatusError as e:
+                try:
+                    detail = e.response.json().get("detail")
+                except Exception:
+                    detail = None
+                error = str(detail) if detail else e.response.text[:500] or str(e)
+                return BulkItemResult(key=key, success=False, status_code=e.response.status_code, error=error)
+            except Exception as e:
+                return BulkItemResult(key=key, success=False, error=f"{type(e).__name__}: {e}")
+            response = result.model_dump(mode="json") if isinstance(result, BaseModel) else result
+            return BulkItemResult(key=key, success=True, response=response if isinstance(response, dict) else None)
+
+        logger.info(f"Running {operation} for {len(items)} item(s) with concurrency {self.max_concurrency}")
+        results = await asyncio.gather(*(run_one(key, call) for key, call in items))
+        response = BulkOperationResponse(results=list(results))
+        logger.info(f"{operation} complete: {len(response.succeeded)} succeeded, {len(response.failed)} failed")
+        return response
+
+    async def register_services(self, registrations: list[InternalServiceRegistration]) -> BulkOperationResponse:
+        """
+        Register many services concurrently.
+
+        Args:
+            registrations: Service registration data
+
+        Returns:
+            Per-service results keyed by service path
+        """
+        return await self._run_bulk(
+            "register",
+            [
+                (registration.service_path, lambda registration=registration: self.register_service(registration))
+                for registration in registrations
+            ],
+        )
+
+    async def toggle_services(self, service_paths: list[str]) -> BulkOperationResponse:
+        """
+        Toggle the enabled/disabled status of many services concurrently.
+
+        Args:
+            service_paths: Paths of services to toggle
+
+        Returns:
+            Per-service results keyed by service path
+        """
+        return await self._run_bulk(
+            "toggle", [(path, lambda path=path: self.toggle_service(path)) for path in service_paths]
+        )
+
+    async def remove_services(self, service_paths: list[str]) -> BulkOperationResponse:
+        """
+        Remove many services concurrently.
+
+        Args:
+            service_paths: Paths of services to remove
+
+        Returns:
+            Per-service results keyed by service path
+        """
+        return await self._run_bulk(
+            "remove", [(path, lambda path=path: self.remove_service(path)) for path in service_paths]
+        )
+
+    async def rescan_servers(self, paths: list[str]) -> BulkOperationResponse:
+        """
+        Trigger security scans for many servers concurrently (admin only).
+
+        Args:
+            paths: Server paths (e.g., /cloudflare-docs)
+
+        Returns:
+            Per-server results keyed by server path
+        """
+        return await self._run_bulk("rescan", [(path, lambda path=path: self.rescan_server(path)) for path in paths])
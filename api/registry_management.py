@@ -9,12 +9,18 @@ Server Management:
     # Register a server from JSON config
     uv run python registry_management.py register --config /path/to/config.json
 
+    # Register many servers concurrently (per-server results, exit 1 if any failed)
+    uv run python registry_management.py --concurrency 20 register --config servers/*.json
+
     # List all servers
     uv run python registry_management.py list
 
     # Toggle server status
     uv run python registry_management.py toggle --path /cloudflare-docs
 
+    # Toggle several servers at once
+    uv run python registry_management.py toggle --path /cloudflare-docs /context7
+
     # Remove server
     uv run python registry_management.py remove --path /cloudflare-docs
 
@@ -33,6 +39,9 @@ Server Management:
     # Trigger manual security scan (admin only)
     uv run python registry_management.py rescan --path /cloudflare-docs
 
+    # Rescan every registered server, 5 scans at a time
+    uv run python registry_management.py --concurrency 5 rescan --all
+
 Group Management:
     # Add server to groups
     uv run python registry_management.py add-to-groups --server my-server --groups group1,group2
@@ -112,6 +121,7 @@ Global Options (can be set via environment variables or command-line arguments):
     --aws-region REGION      AWS region (overrides AWS_REGION env var)
     --keycloak-url URL       Keycloak base URL (overrides KEYCLOAK_URL env var)
     --token-file PATH        Path to file containing JWT token (bypasses token script)
+    --concurrency N          Maximum concurrent requests for multi-server commands (default: 10)
 
 Environment Variables (used if command-line options not provided):
     REGISTRY_URL: Registry base URL (e.g., https://registry.mycorp.click)
@@ -161,6 +171,7 @@ Local Development (running against local Docker Compose setup):
 """
 
 import argparse
+import asyncio
 import json
 import logging
 import os
@@ -170,6 +181,7 @@ from pathlib import Path
 from typing import Any
 
 from registry_client import (
+    DEFAULT_MAX_CONCURRENCY,
     AgentProvider,
     AgentRegistration,
     AgentRescanResponse,
@@ -177,6 +189,8 @@ from registry_client import (
     AgentVisibility,
     AnthropicServerList,
     AnthropicServerResponse,
+    AsyncRegistryClient,
+    BulkOperationResponse,
     InternalServiceRegistration,
     RatingInfoResponse,
     RatingResponse,
@@ -323,15 +337,15 @@ def _load_json_config(config_path: str) -> dict[str, Any]:
     return config
 
 
-def _create_client(args: argparse.Namespace) -> RegistryClient:
+def _resolve_connection(args: argparse.Namespace) -> tuple[str, str]:
     """
-    Create and return a configured RegistryClient instance.
+    Resolve the registry URL and JWT token from CLI options and environment.
 
     Args:
         args: Command arguments containing optional CLI values
 
     Returns:
-        RegistryClient instance
+        Tuple of (registry_url, token)
 
     Raises:
         RuntimeError: If token retrieval fails
@@ -412,12 +426,115 @@ def _create_client(args: argparse.Namespace) -> RegistryClient:
             "  --registry-url https://registry.example.com"
         )
 
+    return registry_url, token
+
+
+def _create_client(args: argparse.Namespace) -> RegistryClient:
+    """
+    Create and return a configured RegistryClient instance.
+
+    Args:
+        args: Command arguments containing optional CLI values
+
+    Returns:
+        RegistryClient instance
+    """
+    registry_url, token = _resolve_connection(args)
     return RegistryClient(registry_url=registry_url, token=token)
 
 
+def _create_async_client(args: argparse.Namespace) -> AsyncRegistryClient:
+    """
+    Create and return a configured AsyncRegistryClient for multi-server commands.
+
+    Args:
+        args: Command arguments containing optional CLI values and --concurrency
+
+    Returns:
+        AsyncRegistryClient instance
+    """
+    registry_url, token = _resolve_connection(args)
+    return AsyncRegistryClient(registry_url=registry_url, token=token, max_concurrency=args.concurrency)
+
+
+def _run_bulk(args: argparse.Namespace, operation) -> BulkOperationResponse:
+    """
+    Run a bulk operation against the registry with a pooled async client.
+
+    Args:
+        args: Command arguments
+        operation: Async callable taking the AsyncRegistryClient and returning a BulkOperationResponse
+
+    Returns:
+        Bulk operation response
+    """
+
+    async def run() -> BulkOperationResponse:
+        async with _create_async_client(args) as client:
+            return await operation(client)
+
+    return asyncio.run(run())
+
+
+def _report_bulk_results(args: argparse.Namespace, response: BulkOperationResponse, describe) -> int:
+    """
+    Print one line per item of a bulk operation (or raw JSON with --json).
+
+    Args:
+        args: Command arguments with optional json flag
+        response: Bulk operation response
+        describe: Callable returning the success message for a result's response data
+
+    Returns:
+        Exit code (0 if every item succeeded, 1 otherwise)
+    """
+    if getattr(args, "json", False):
+        print(json.dumps(response.model_dump(), indent=2, default=str))
+    else:
+        for result in response.results:
+            if result.success:
+                print(f"✓ {result.key}: {describe(result.response or {})}")
+            else:
+                status = f" (HTTP {result.status_code})" if result.status_code else ""
+                print(f"✗ {result.key}{status}: {result.error}")
+        logger.info(f"\n{len(response.succeeded)} succeeded, {len(response.failed)} failed")
+
+    return 1 if response.failed else 0
+
+
+def _registration_from_config(config: dict[str, Any], overwrite: bool) -> InternalServiceRegistration:
+    """
+    Convert a server JSON config to InternalServiceRegistration.
+
+    Handles both old and new config formats.
+
+    Args:
+        config: Server configuration dictionary
+        overwrite: Overwrite the server if it already exists
+
+    Returns:
+        Service registration data
+    """
+    return InternalServiceRegistration(
+        service_path=config.get("path") or config.get("service_path"),
+        name=config.get("server_name") or config.get("name"),
+        description=config.get("description"),
+        proxy_pass_url=config.get("proxy_pass_url"),
+        auth_provider=config.get("auth_provider"),
+        auth_type=config.get("auth_type"),
+        supported_transports=config.get("supported_transports"),
+        headers=config.get("headers"),
+        tool_list_json=config.get("tool_list_json"),
+        overwrite=overwrite,
+    )
+
+
 def cmd_register(args: argparse.Namespace) -> int:
     """
-    Register a new server from JSON configuration.
+    Register servers from JSON configuration files.
+
+    A single config is registered directly; several are registered concurrently
+    (up to --concurrency at a time) with one result line per server.
 
     Args:
         args: Command arguments
@@ -426,23 +543,15 @@ def cmd_register(args: argparse.Namespace) -> int:
         Exit code (0 for success, 1 for failure)
     """
     try:
-        config = _load_json_config(args.config)
-
-        # Convert config to InternalServiceRegistration
-        # Handle both old and new config formats
-        registration = InternalServiceRegistration(
-            service_path=config.get("path") or config.get("service_path"),
-            name=config.get("server_name") or config.get("name"),
-            description=config.get("description"),
-            proxy_pass_url=config.get("proxy_pass_url"),
-            auth_provider=config.get("auth_provider"),
-            auth_type=config.get("auth_type"),
-            supported_transports=config.get("supported_transports"),
-            headers=config.get("headers"),
-            tool_list_json=config.get("tool_list_json"),
-            overwrite=args.overwrite,
-        )
+        registrations = [
+            _registration_from_config(_load_json_config(config_path), args.overwrite) for config_path in args.config
+        ]
+
+        if len(registrations) > 1:
+            response = _run_bulk(args, lambda client: client.register_services(registrations))
+            return _report_bulk_results(args, response, lambda data: data.get("message", "registered"))
 
+        registration = registrations[0]
         client = _create_client(args)
         response = client.register_service(registration)
 
@@ -512,6 +621,8 @@ def cmd_toggle(args: argparse.Namespace) -> int:
     """
     Toggle server enabled/disabled status.
 
+    Several paths are toggled concurrently (up to --concurrency at a time).
+
     Args:
         args: Command arguments
 
@@ -519,8 +630,14 @@ def cmd_toggle(args: argparse.Namespace) -> int:
         Exit code (0 for success, 1 for failure)
     """
     try:
+        if len(args.path) > 1:
+            response = _run_bulk(args, lambda client: client.toggle_services(args.path))
+            return _report_bulk_results(
+                args, response, lambda data: "enabled" if data.get("is_enabled") else "disabled"
+            )
+
         client = _create_client(args)
-        response = client.toggle_service(args.path)
+        response = client.toggle_service(args.path[0])
 
         status = "enabled" if response.is_enabled else "disabled"
         logger.info(f"Server {response.path} is now {status}")
@@ -534,7 +651,9 @@ def cmd_toggle(args: argparse.Namespace) -> int:
 
 def cmd_remove(args: argparse.Namespace) -> int:
     """
-    Remove a server from the registry.
+    Remove servers from the registry.
+
+    Several paths are removed concurrently (up to --concurrency at a time).
 
     Args:
         args: Command arguments
@@ -544,15 +663,19 @@ def cmd_remove(args: argparse.Namespace) -> int:
     """
     try:
         if not args.force:
-            confirmation = input(f"Remove server {args.path}? (yes/no): ")
+            confirmation = input(f"Remove server(s) {', '.join(args.path)}? (yes/no): ")
             if confirmation.lower() != "yes":
                 logger.info("Operation cancelled")
                 return 0
 
+        if len(args.path) > 1:
+            response = _run_bulk(args, lambda client: client.remove_services(args.path))
+            return _report_bulk_results(args, response, lambda data: "removed")
+
         client = _create_client(args)
-        client.remove_service(args.path)
+        client.remove_service(args.path[0])
 
-        logger.info(f"Server removed successfully: {args.path}")
+        logger.info(f"Server removed successfully: {args.path[0]}")
         return 0
 
     except Exception as e:
@@ -827,17 +950,42 @@ def cmd_security_scan(args: argparse.Namespace) -> int:
 
 def cmd_rescan(args: argparse.Namespace) -> int:
     """
-    Trigger manual security scan for a server (admin only).
+    Trigger manual security scan for servers (admin only).
+
+    Several paths (or --all) are scanned concurrently (up to --concurrency at a time).
 
     Args:
-        args: Command arguments with path and optional json flag
+        args: Command arguments with path or all, and optional json flag
 
     Returns:
         Exit code (0 for success, 1 for failure)
     """
     try:
+        if args.all or len(args.path) > 1:
+
+            async def rescan(client: AsyncRegistryClient) -> BulkOperationResponse:
+                paths = args.path
+                if args.all:
+                    paths = [server.path for server in (await client.list_services()).servers]
+                return await client.rescan_servers(paths)
+
+            response = _run_bulk(args, rescan)
+            exit_code = _report_bulk_results(
+                args,
+                response,
+                lambda data: (
+                    "SCAN FAILED"
+                    if data.get("scan_failed")
+                    else f"{'SAFE' if data.get('is_safe') else 'UNSAFE'} "
+                    f"(critical: {data.get('critical_issues', 0)}, high: {data.get('high_severity', 0)})"
+                ),
+            )
+            scan_failed = any(result.response and result.response.get("scan_failed") for result in response.results)
+            return 1 if scan_failed else exit_code
+
+        path = args.path[0]
         client = _create_client(args)
-        response: RescanResponse = client.rescan_server(path=args.path)
+        response: RescanResponse = client.rescan_server(path=path)
 
         if args.json:
             # Output raw JSON
@@ -845,7 +993,7 @@ def cmd_rescan(args: argparse.Namespace) -> int:
         else:
             # Pretty print results
             safety_status = "SAFE" if response.is_safe else "UNSAFE"
-            logger.info(f"\nSecurity scan completed for server '{args.path}':")
+            logger.info(f"\nSecurity scan completed for server '{path}':")
             logger.info(f"  Status: {safety_status}")
             logger.info(f"  Scan timestamp: {response.scan_timestamp}")
             logger.info(f"  Analyzers used: {', '.join(response.analyzers_used)}")
@@ -1857,6 +2005,9 @@ Examples:
   # Toggle server status
   uv run python registry_management.py toggle --path /cloudflare-docs
 
+  # Rescan all servers, 5 at a time
+  uv run python registry_management.py --concurrency 5 rescan --all
+
   # Add server to groups
   uv run python registry_management.py add-to-groups --server my-server --groups finance,analytics
         """,
@@ -1870,14 +2021,24 @@ Examples:
 
     parser.add_argument("--token-file", help="Path to file containing JWT token (bypasses token script)")
 
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=f"Maximum concurrent requests for multi-server commands (default: {DEFAULT_MAX_CONCURRENCY})",
+    )
+
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
 
     subparsers = parser.add_subparsers(dest="command", help="Command to execute")
 
     # Register command
-    register_parser = subparsers.add_parser("register", help="Register a new server")
-    register_parser.add_argument("--config", required=True, help="Path to server configuration JSON file")
+    register_parser = subparsers.add_parser("register", help="Register one or more servers")
+    register_parser.add_argument(
+        "--config", required=True, nargs="+", help="Path(s) to server configuration JSON file(s)"
+    )
     register_parser.add_argument("--overwrite", action="store_true", help="Overwrite if server already exists")
+    register_parser.add_argument("--json", action="store_true", help="Output raw JSON results (multiple servers)")
 
     # List command
     list_parser = subparsers.add_parser("list", help="List all servers")
@@ -1885,11 +2046,13 @@ Examples:
 
     # Toggle command
     toggle_parser = subparsers.add_parser("toggle", help="Toggle server status")
-    toggle_parser.add_argument("--path", required=True, help="Server path to toggle")
+    toggle_parser.add_argument("--path", required=True, nargs="+", help="Server path(s) to toggle")
+    toggle_parser.add_argument("--json", action="store_true", help="Output raw JSON results (multiple servers)")
 
     # Remove command
-    remove_parser = subparsers.add_parser("remove", help="Remove a server")
-    remove_parser.add_argument("--path", required=True, help="Server path to remove")
+    remove_parser = subparsers.add_parser("remove", help="Remove one or more servers")
+    remove_parser.add_argument("--path", required=True, nargs="+", help="Server path(s) to remove")
+    remove_parser.add_argument("--json", action="store_true", help="Output raw JSON results (multiple servers)")
     remove_parser.add_argument("--force", action="store_true", help="Skip confirmation prompt")
 
     # Healthcheck command
@@ -1941,8 +2104,10 @@ Examples:
     security_scan_parser.add_argument("--json", action="store_true", help="Output raw JSON")
 
     # Server rescan command
-    rescan_parser = subparsers.add_parser("rescan", help="Trigger manual security scan for a server (admin only)")
-    rescan_parser.add_argument("--path", required=True, help="Server path (e.g., /cloudflare-docs)")
+    rescan_parser = subparsers.add_parser("rescan", help="Trigger manual security scan for servers (admin only)")
+    rescan_target = rescan_parser.add_mutually_exclusive_group(required=True)
+    rescan_target.add_argument("--path", nargs="+", default=[], help="Server path(s) (e.g., /cloudflare-docs)")
+    rescan_target.add_argument("--all", action="store_true", help="Rescan every registered server")
     rescan_parser.add_argument("--json", action="store_true", help="Output raw JSON")
 
     # Agent Management Commands
@@ -14,6 +14,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from registry_pkgs import load_scopes_config
 from registry_pkgs.core.config import MongoConfig, ScopesConfig, TelemetryConfig
+from registry_pkgs.core.logging_config import configure_logging, parse_log_levels, parse_sample_rates
 
 
 class AuthSettings(BaseSettings):
@@ -82,6 +83,10 @@ class AuthSettings(BaseSettings):
         "INFO"  # Default to INFO, can be overridden by LOG_LEVEL env var (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     )
     log_format: str = "%(asctime)s,p%(process)s,{%(name)s:%(lineno)d},%(levelname)s,%(message)s"
+    log_levels: str = ""  # Per-logger levels, e.g. "auth_server.routes.oauth_flow=DEBUG,httpx=WARNING"
+    log_sampling: str = ""  # INFO/DEBUG sample rates per logger, e.g. "auth_server.server=0.1"
+    log_async: bool = True  # Write log records from a background thread
+    log_redact: bool = True  # Mask credentials in log messages and extra fields
 
     # ==================== Metrics Settings ====================
     metrics_service_url: str = "http://localhost:8890"
@@ -169,14 +174,17 @@ class AuthSettings(BaseSettings):
         This should be called once at application startup to initialize logging
         for all modules. Individual modules can then use logging.getLogger(__name__)
         without needing to call basicConfig again.
-        """
-        # Convert string log level to numeric level
-        numeric_level = getattr(logging, self.log_level.upper(), logging.INFO)
 
-        logging.basicConfig(
-            level=numeric_level,
-            format=self.log_format,
-            force=True,  # Override any existing configuration
+        Records pass through per-logger sampling (LOG_SAMPLING) and credential
+        redaction, and are written from a background thread unless LOG_ASYNC is off.
+        """
+        configure_logging(
+            getattr(logging, self.log_level.upper(), logging.INFO),
+            self.log_format,
+            levels=parse_log_levels(self.log_levels),
+            sample_rates=parse_sample_rates(self.log_sampling),
+            redact=self.log_redact,
+            use_queue=self.log_async,
         )
 
 
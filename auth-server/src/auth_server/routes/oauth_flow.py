@@ -1165,104 +1165,88 @@ def validate_server_tool_access(server_name: str, method: str, tool_name: str, u
     Returns:
         True if access is allowed, False otherwise
     """
+    # Runs on every proxied MCP request: the per-scope trace is DEBUG and %-formatted so it
+    # costs nothing unless enabled (LOG_LEVELS=auth_server.routes.oauth_flow=DEBUG).
     try:
-        # Verbose logging: Print input parameters
-        logger.info("=== VALIDATE_SERVER_TOOL_ACCESS START ===")
-        logger.info(f"Requested server: '{server_name}'")
-        logger.info(f"Requested method: '{method}'")
-        logger.info(f"Requested tool: '{tool_name}'")
-        logger.info(f"User scopes: {user_scopes}")
-        logger.info(
-            f"Available scopes config keys: {list(settings.scopes_config.keys()) if settings.scopes_config else 'None'}"
+        logger.debug(
+            "Validating access: server=%r method=%r tool=%r scopes=%s", server_name, method, tool_name, user_scopes
         )
 
         if not settings.scopes_config:
             logger.warning("No scopes configuration loaded, allowing access")
-            logger.info("=== VALIDATE_SERVER_TOOL_ACCESS END: ALLOWED (no config) ===")
             return True
 
         # Check each user scope to see if it grants access
         for scope in user_scopes:
-            logger.info(f"--- Checking scope: '{scope}' ---")
             scope_config = settings.scopes_config.get(scope, [])
 
             if not scope_config:
-                logger.info(f"Scope '{scope}' not found in configuration")
+                logger.debug("Scope '%s' not found in configuration", scope)
                 continue
 
-            logger.info(f"Scope '{scope}' config: {scope_config}")
-
             # The scope_config is directly a list of server configurations
             # since the permission type is already encoded in the scope name
             for server_config in scope_config:
-                logger.info(f"  Examining server config: {server_config}")
                 server_config_name = server_config.get("server")
-                logger.info(f"  Server name in config: '{server_config_name}' vs requested: '{server_name}'")
-
-                if _server_names_match(server_config_name, server_name):
-                    logger.info("  ✓ Server name matches!")
-
-                    # Check methods first
-                    allowed_methods = server_config.get("methods", [])
-                    logger.info(f"  Allowed methods for server '{server_name}': {allowed_methods}")
-                    logger.info(f"  Checking if method '{method}' is in allowed methods...")
-
-                    # Check if all methods are allowed (wildcard support)
-                    has_wildcard_methods = "all" in allowed_methods or "*" in allowed_methods
-
-                    # for all methods except tools/call we are good if the method is allowed
-                    # for tools/call we need to do an extra validation to check if the tool
-                    # itself is allowed or not
-                    if (method in allowed_methods or has_wildcard_methods) and method != "tools/call":
-                        logger.info(f"  ✓ Method '{method}' found in allowed methods!")
-                        logger.info(f"Access granted: scope '{scope}' allows access to {server_name}.{method}")
-                        logger.info("=== VALIDATE_SERVER_TOOL_ACCESS END: GRANTED ===")
-                        return True
-
-                    # Check tools if method not found in methods
-                    allowed_tools = server_config.get("tools", [])
-                    logger.info(f"  Allowed tools for server '{server_name}': {allowed_tools}")
-
-                    # Check if all tools are allowed (wildcard support)
-                    has_wildcard_tools = "all" in allowed_tools or "*" in allowed_tools
-
-                    # For tools/call, check if the specific tool is allowed
-                    if method == "tools/call" and tool_name:
-                        logger.info(f"  Checking if tool '{tool_name}' is in allowed tools for tools/call...")
-                        if tool_name in allowed_tools or has_wildcard_tools:
-                            logger.info(f"  ✓ Tool '{tool_name}' found in allowed tools!")
-                            logger.info(
-                                f"Access granted: scope '{scope}' allows access to {server_name}.{method} for tool {tool_name}"
-                            )
-                            logger.info("=== VALIDATE_SERVER_TOOL_ACCESS END: GRANTED ===")
-                            return True
-                        else:
-                            logger.info(f"  ✗ Tool '{tool_name}' NOT found in allowed tools")
-                    else:
-                        # For other methods, check if method is in tools list (backward compatibility)
-                        logger.info(f"  Checking if method '{method}' is in allowed tools...")
-                        if method in allowed_tools or has_wildcard_tools:
-                            logger.info(f"  ✓ Method '{method}' found in allowed tools!")
-                            logger.info(f"Access granted: scope '{scope}' allows access to {server_name}.{method}")
-                            logger.info("=== VALIDATE_SERVER_TOOL_ACCESS END: GRANTED ===")
-                            return True
-                        else:
-                            logger.info(f"  ✗ Method '{method}' NOT found in allowed tools")
-                else:
-                    logger.info("  ✗ Server name does not match")
+
+                if not _server_names_match(server_config_name, server_name):
+                    continue
+
+                # Check methods first
+                allowed_methods = server_config.get("methods", [])
+                allowed_tools = server_config.get("tools", [])
+                logger.debug(
+                    "Scope '%s' matches server '%s': methods=%s tools=%s",
+                    scope,
+                    server_name,
+                    allowed_methods,
+                    allowed_tools,
+                )
+
+                # Check if all methods are allowed (wildcard support)
+                has_wildcard_methods = "all" in allowed_methods or "*" in allowed_methods
+
+                # for all methods except tools/call we are good if the method is allowed
+                # for tools/call we need to do an extra validation to check if the tool
+                # itself is allowed or not
+                if (method in allowed_methods or has_wildcard_methods) and method != "tools/call":
+                    _log_access_granted(scope, server_name, method, tool_name)
+                    return True
+
+                # Check if all tools are allowed (wildcard support)
+                has_wildcard_tools = "all" in allowed_tools or "*" in allowed_tools
+
+                # For tools/call, check if the specific tool is allowed;
+                # for other methods, check if method is in tools list (backward compatibility)
+                requested = tool_name if method == "tools/call" and tool_name else method
+                if requested in allowed_tools or has_wildcard_tools:
+                    _log_access_granted(scope, server_name, method, tool_name)
+                    return True
 
         logger.warning(
-            f"Access denied: no scope allows access to {server_name}.{method} (tool: {tool_name}) for user scopes: {user_scopes}"
+            "Access denied: no scope allows access to %s.%s (tool: %s) for user scopes: %s",
+            server_name,
+            method,
+            tool_name,
+            user_scopes,
         )
-        logger.info("=== VALIDATE_SERVER_TOOL_ACCESS END: DENIED ===")
         return False
 
     except Exception as e:
-        logger.error(f"Error validating server/tool access: {e}")
-        logger.info("=== VALIDATE_SERVER_TOOL_ACCESS END: ERROR ===")
+        logger.error("Error validating server/tool access: %s", e)
         return False  # Deny access on error
 
 
+def _log_access_granted(scope: str, server_name: str, method: str, tool_name: str) -> None:
+    logger.info(
+        "Access granted: scope '%s' allows access to %s.%s",
+        scope,
+        server_name,
+        method,
+        extra={"tool": tool_name} if method == "tools/call" and tool_name else None,
+    )
+
+
 def _server_names_match(name1: str, name2: str) -> bool:
     """
     Compare two server names, normalizing for trailing slashes.
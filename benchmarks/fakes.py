@@ -0,0 +1,302 @@
+"""
+In-process stand-ins for the registry's infrastructure.
+
+MongoDB is replaced by mongomock-motor, Redis by fakeredis and Weaviate by an
+in-memory LangChain vector store with deterministic fake embeddings. They are
+patched into the same factories the application lifespans call, so startup,
+Beanie initialization and the vector repositories run unchanged.
+"""
+
+import hashlib
+import importlib
+import math
+import re
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager
+from typing import Any
+from unittest.mock import patch
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import InMemoryVectorStore, VectorStore
+
+from registry_pkgs.vector.adapters.adapter import VectorStoreAdapter
+from registry_pkgs.vector.client import DatabaseClient
+from registry_pkgs.vector.enum.enums import SearchType
+
+EMBEDDING_SIZE = 256
+
+_TOKEN = re.compile(r"\w+")
+
+
+def _require(module: str, package: str):
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise ImportError(
+            f"The benchmark suite needs '{package}'. Run it with: uv run --with mongomock-motor --with fakeredis "
+            "python -m benchmarks"
+        ) from e
+
+
+class HashingEmbeddings(Embeddings):
+    """
+    Deterministic bag-of-words embedding: every token is hashed into one of ``size``
+    buckets and the counts are L2-normalized. Texts sharing words land close
+    together, so searches return plausible hits without a model download.
+
+    ``encode`` mirrors SentenceTransformer's, so it can stand in for the embedded
+    FAISS service's model as well. ``calls`` and ``texts`` count the work done.
+    """
+
+    def __init__(self, size: int = EMBEDDING_SIZE):
+        self.size = size
+        self.calls = 0
+        self.texts = 0
+
+    def _vector(self, text: str) -> list[float]:
+        vector = [0.0] * self.size
+        for token in _TOKEN.findall(text.lower()):
+            digest = hashlib.blake2b(token.encode(), digest_size=8).digest()
+            vector[int.from_bytes(digest) % self.size] += 1.0
+        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+        return [value / norm for value in vector]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.calls += 1
+        self.texts += len(texts)
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embed_documents([text])[0]
+
+    def encode(self, sentences: str | list[str], **kwargs):
+        import numpy as np
+
+        single = isinstance(sentences, str)
+        vectors = np.array(self.embed_documents([sentences] if single else list(sentences)), dtype=np.float32)
+        return vectors[0] if single else vectors
+
+
+def _matches(metadata: dict[str, Any], filters: dict[str, Any] | None) -> bool:
+    """Evaluate the dict filter syntax the Weaviate adapter accepts against document metadata."""
+    if not filters:
+        return True
+    for key, expected in filters.items():
+        if key == "$and":
+            if not all(_matches(metadata, clause) for clause in expected):
+                return False
+            continue
+        if key == "$or":
+            if not any(_matches(metadata, clause) for clause in expected):
+                return False
+            continue
+        actual = metadata.get(key)
+        if isinstance(expected, dict):
+            if not all(_compare(actual, op, value) for op, value in expected.items()):
+                return False
+        elif isinstance(expected, list):
+            if not _compare(actual, "$in", expected):
+                return False
+        elif actual != expected:
+            return False
+    return True
+
+
+def _compare(actual: Any, op: str, value: Any) -> bool:
+    if op == "$eq":
+        return actual == value
+    if op == "$ne":
+        return actual != value
+    if op == "$in":
+        if isinstance(actual, list):
+            return any(item in value for item in actual)
+        return actual in value
+    if actual is None:
+        return False
+    if op == "$gt":
+        return actual > value
+    if op == "$gte":
+        return actual >= value
+    if op == "$lt":
+        return actual < value
+    if op == "$lte":
+        return actual <= value
+    raise ValueError(f"Unsupported operator: {op}")
+
+
+class InMemoryStore(VectorStoreAdapter):
+    """Vector store adapter backed by LangChain's InMemoryVectorStore."""
+
+    def _create_vector_store(self, collection_name: str) -> VectorStore:
+        return InMemoryVectorStore(self.embedding)
+
+    def close(self):
+        self._stores.clear()
+
+    def _is_native_filter(self, filters: Any) -> bool:
+        return callable(filters)
+
+    def _dict_to_native_filter(self, filters: dict[str, Any]) -> Callable[[Document], bool]:
+        return lambda doc: _matches(doc.metadata, filters)
+
+    def _records(self, collection_name: str | None) -> dict[str, dict[str, Any]]:
+        return self.get_vector_store(collection_name).store
+
+    def similarity_search(
+        self, query: str, k: int = 10, filters: Any = None, collection_name: str | None = None, **kwargs
+    ) -> list[Document]:
+        store = self.get_vector_store(collection_name)
+        return store.similarity_search(query, k=k, filter=self.normalize_filters(filters))
+
+    def get_by_id(self, doc_id: str, collection_name: str | None = None) -> Document | None:
+        docs = self.get_by_ids([doc_id], collection_name)
+        return docs[0] if docs else None
+
+    def get_by_ids(self, ids: list[str], collection_name: str | None = None) -> list[Document]:
+        return self.get_vector_store(collection_name).get_by_ids(ids)
+
+    def filter_by_metadata(
+        self, filters: Any, limit: int, collection_name: str | None = None, **kwargs
+    ) -> list[Document]:
+        predicate = self.normalize_filters(filters)
+        docs = []
+        for record in self._records(collection_name).values():
+            doc = Document(id=record["id"], page_content=record["text"], metadata=record["metadata"])
+            if predicate is None or predicate(doc):
+                docs.append(doc)
+                if len(docs) >= limit:
+                    break
+        return docs
+
+    def bm25_search(
+        self, query: str, k: int = 10, filters: Any = None, collection_name: str | None = None, **kwargs
+    ) -> list[Document]:
+        terms = {term.lower() for term in _TOKEN.findall(query)}
+        scored = []
+        records = self._records(collection_name)
+        for doc in self.filter_by_metadata(filters, limit=len(records), collection_name=collection_name):
+            score = sum(1 for token in _TOKEN.findall(doc.page_content) if token.lower() in terms)
+            if score:
+                scored.append((score, doc))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [doc for _, doc in scored[:k]]
+
+    def hybrid_search(
+        self,
+        query: str,
+        k: int = 10,
+        alpha: float = 0.5,
+        filters: Any = None,
+        collection_name: str | None = None,
+        **kwargs,
+    ) -> list[Document]:
+        return self.similarity_search(query, k=k, filters=filters, collection_name=collection_name)
+
+    def near_text(
+        self,
+        query: str,
+        k: int = 10,
+        alpha: float = 0.5,
+        filters: Any = None,
+        collection_name: str | None = None,
+        **kwargs,
+    ) -> list[Document]:
+        return self.similarity_search(query, k=k, filters=filters, collection_name=collection_name)
+
+    def search(
+        self,
+        query: str,
+        search_type: SearchType = SearchType.NEAR_TEXT,
+        k: int = 10,
+        filters: Any = None,
+        collection_name: str | None = None,
+        **kwargs,
+    ) -> list[Document]:
+        if SearchType(search_type) == SearchType.BM25:
+            return self.bm25_search(query=query, k=k, filters=filters, collection_name=collection_name)
+        return self.similarity_search(query, k=k, filters=filters, collection_name=collection_name)
+
+    def search_with_rerank(
+        self,
+        query: str,
+        k: int = 10,
+        candidate_k: int | None = None,
+        search_type: SearchType = SearchType.HYBRID,
+        filters: Any = None,
+        reranker_type: str = "flashrank",
+        reranker_kwargs: dict[str, Any] | None = None,
+        collection_name: str | None = None,
+        **kwargs,
+    ) -> list[Document]:
+        # No reranker model locally; the candidate fetch is the part the gateway pays for.
+        candidates = self.search(
+            query, search_type, k=candidate_k or k * 3, filters=filters, collection_name=collection_name
+        )
+        return candidates[:k]
+
+    def update_metadata(self, doc_id: str, metadata: dict[str, Any], collection_name: str | None = None) -> bool:
+        record = self._records(collection_name).get(doc_id)
+        if record is None:
+            return False
+        record["metadata"].update(metadata)
+        return True
+
+    def delete_by_filter(self, filters: Any, collection_name: str | None = None) -> int:
+        records = self._records(collection_name)
+        ids = [doc.id for doc in self.filter_by_metadata(filters, limit=len(records), collection_name=collection_name)]
+        for doc_id in ids:
+            records.pop(doc_id, None)
+        return len(ids)
+
+
+class InMemoryDatabaseClient(DatabaseClient):
+    """DatabaseClient already initialized with an InMemoryStore."""
+
+    def __init__(self, collection_name: str = "Default", embedding: Embeddings | None = None):
+        super().__init__()
+        self._adapter = InMemoryStore(embedding or HashingEmbeddings(), {"collection_name": collection_name})
+        self._initialized = True
+
+
+def _mock_mongo_client_class():
+    mongomock_motor = _require("mongomock_motor", "mongomock-motor")
+
+    class MockMongoClient(mongomock_motor.AsyncMongoMockClient):
+        """Accepts the pooling options the real AsyncMongoClient is created with and closes asynchronously."""
+
+        def __init__(self, *args, **kwargs):
+            super().__init__()
+
+        async def close(self):
+            return None
+
+    return MockMongoClient
+
+
+@contextmanager
+def local_mongodb() -> Iterator[None]:
+    """Patch MongoDB.connect_db to create a mongomock-motor client instead of a real one."""
+    with patch("registry_pkgs.database.mongodb.AsyncMongoClient", _mock_mongo_client_class()):
+        yield
+
+
+@contextmanager
+def local_infrastructure() -> Iterator[None]:
+    """Patch the registry and auth-server startup paths to use in-process fakes."""
+    fakeredis = _require("fakeredis", "fakeredis")
+    redis_server = fakeredis.FakeServer()
+
+    def create_redis_client(config):
+        return fakeredis.FakeRedis(server=redis_server, decode_responses=True)
+
+    def create_database_client(config):
+        from registry_pkgs.models.extended_mcp_server import ExtendedMCPServer
+
+        return InMemoryDatabaseClient(collection_name=ExtendedMCPServer.COLLECTION_NAME)
+
+    with ExitStack() as stack:
+        stack.enter_context(local_mongodb())
+        stack.enter_context(patch("registry.main.create_redis_client", create_redis_client))
+        stack.enter_context(patch("registry.main.create_database_client", create_database_client))
+        yield
@@ -0,0 +1,338 @@
+"""
+End-to-end gateway benchmark.
+
+Boots the registry app (``registry.main``) and the auth server in-process on
+loopback ports, with MongoDB, Redis and Weaviate replaced by local fakes and one
+or more local FastMCP servers registered as downstream MCP servers. It then
+measures throughput and latency percentiles for:
+
+- ``execute_tool``: gateway MCP tool call proxied to a downstream server
+- ``discover_servers``: gateway MCP tool call answered from the vector index
+- ``list_servers``: ``GET /api/{version}/servers``
+- ``validate``: the auth server's ``GET /validate`` (self-signed token path)
+
+Usage:
+    uv run --with mongomock-motor --with fakeredis python -m benchmarks
+    uv run --with mongomock-motor --with fakeredis python -m benchmarks \\
+        --concurrency 1,16,64 --requests 2000 --output bench.json --baseline main.json
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from .runner import Scenario, find_regressions, run_scenario
+
+logger = logging.getLogger(__name__)
+
+SCENARIOS = ("execute_tool", "discover_servers", "list_servers", "validate")
+
+# Scopes granted to the benchmark token; see registry-pkgs/src/registry_pkgs/scopes.yml.
+BENCHMARK_SCOPES = ("servers-read", "mcp-proxy-ops")
+
+# Applied with setdefault before the applications are imported, so any of them can be overridden.
+_ENVIRONMENT = {
+    "SECRET_KEY": "benchmark-secret-key",
+    "MONGO_URI": "mongodb://127.0.0.1:27017/benchmark",
+    "REDIS_URI": "redis://127.0.0.1:6379/0",
+    "TOOL_DISCOVERY_MODE": "external",
+    "CHANGE_STREAM_MODE": "off",
+    "HEALTH_CHECK_INTERVAL_SECONDS": "3600",
+    "MCPGW_ENABLE_DNS_REBINDING_PROTECTION": "false",
+    "SECURITY_SCAN_ENABLED": "false",
+    "AGENT_SECURITY_SCAN_ENABLED": "false",
+    "LOG_LEVEL": "WARNING",
+}
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="MCP gateway performance benchmarks")
+    parser.add_argument(
+        "--scenarios",
+        type=lambda value: [name.strip() for name in value.split(",") if name.strip()],
+        default=list(SCENARIOS),
+        help=f"Comma-separated scenarios to run (default: {','.join(SCENARIOS)})",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=lambda value: [int(level) for level in value.split(",")],
+        default=[1, 8, 32],
+        help="Comma-separated concurrency levels (default: 1,8,32)",
+    )
+    parser.add_argument("--requests", type=int, default=500, help="Measured requests per run (default: 500)")
+    parser.add_argument("--warmup", type=int, default=50, help="Unmeasured requests per run (default: 50)")
+    parser.add_argument("--servers", type=int, default=2, help="Local MCP servers to register (default: 2)")
+    parser.add_argument(
+        "--query", default="current time in a timezone", help="Query sent by the discover_servers scenario"
+    )
+    parser.add_argument("--output", type=Path, help="Write the JSON report here instead of stdout")
+    parser.add_argument("--baseline", type=Path, help="Previous JSON report to compare against")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed relative p99/throughput change against --baseline before failing (default: 0.2)",
+    )
+    args = parser.parse_args(argv)
+
+    unknown = sorted(set(args.scenarios) - set(SCENARIOS))
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+    if args.requests < 1 or args.servers < 1 or any(level < 1 for level in args.concurrency):
+        parser.error("--requests, --servers and --concurrency levels must be >= 1")
+    return args
+
+
+def _git_commit() -> str | None:
+    try:
+        completed = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+
+async def _seed(container, stand_ins) -> tuple[Any, list[Any]]:
+    """Register each stand-in server the way the registry stores it, with a public view ACL and vector docs."""
+    from registry.services.server_service import _convert_tool_list_to_functions
+    from registry_pkgs.models._generated import IUser, PrincipalType, ResourceType
+    from registry_pkgs.models.enums import PermissionBits
+    from registry_pkgs.models.extended_acl_entry import ExtendedAclEntry
+    from registry_pkgs.models.extended_mcp_server import ExtendedMCPServer
+
+    now = datetime.now(UTC)
+    user = IUser(
+        name="Benchmark User",
+        username="benchmark",
+        email="benchmark@example.com",
+        emailVerified=True,
+        role="ADMIN",
+        provider="local",
+        createdAt=now,
+        updatedAt=now,
+    )
+    await user.insert()
+
+    servers = []
+    for mcp, local in stand_ins:
+        tools = [tool.model_dump(exclude_none=True) for tool in await mcp.list_tools()]
+        server = ExtendedMCPServer(
+            serverName=local.name,
+            author=user.id,
+            path=f"/{local.name}",
+            status="active",
+            tags=["benchmark"],
+            numTools=len(tools),
+            config={
+                "title": local.name,
+                "description": "Local current time server used by the benchmark suite",
+                "type": "streamable-http",
+                "url": f"{local.url}/mcp",
+                "requiresOAuth": False,
+                "toolFunctions": _convert_tool_list_to_functions(tools, local.name),
+            },
+            createdAt=now,
+            updatedAt=now,
+        )
+        await server.insert()
+        await ExtendedAclEntry(
+            principalType=PrincipalType.PUBLIC,
+            principalId=None,
+            resourceType=ResourceType.MCPSERVER.value,
+            resourceId=server.id,
+            permBits=PermissionBits.VIEW,
+            grantedAt=now,
+            createdAt=now,
+            updatedAt=now,
+        ).insert()
+        await container.mcp_server_repo.sync_server_to_vector_db(server, is_delete=False)
+        servers.append(server)
+    return user, servers
+
+
+def _mint_token(user) -> str:
+    """Self-signed access token accepted by both the registry middleware and the auth server's /validate."""
+    from registry.core.config import settings
+    from registry_pkgs.core.jwt_utils import build_jwt_payload, encode_jwt
+
+    payload = build_jwt_payload(
+        subject=user.username,
+        issuer=settings.jwt_issuer,
+        audience=settings.jwt_audience,
+        expires_in_seconds=3600,
+        token_type="access_token",
+        extra_claims={
+            "user_id": str(user.id),
+            "groups": [],
+            "scope": " ".join(BENCHMARK_SCOPES),
+            "token_use": "access",
+            "client_id": "user-generated",
+        },
+    )
+    return encode_jwt(payload, settings.secret_key, kid=settings.jwt_self_signed_kid)
+
+
+def _http_scenario(name: str, client: httpx.AsyncClient, url: str, headers: dict[str, str]) -> Scenario:
+    @asynccontextmanager
+    async def open_worker(index: int):
+        async def operation():
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+
+        yield operation
+
+    return Scenario(name, open_worker)
+
+
+def _gateway_scenario(
+    name: str, url: str, token: str, build_call: Callable[[int], tuple[str, dict[str, Any]]]
+) -> Scenario:
+    """Each worker holds its own initialized gateway MCP session, like an independent agent would."""
+    from mcp import ClientSession
+    from mcp.client.streamable_http import streamablehttp_client
+
+    @asynccontextmanager
+    async def open_worker(index: int):
+        async with streamablehttp_client(url, headers={"Authorization": f"Bearer {token}"}) as (read, write, _):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                sequence = itertools.count(index)
+
+                async def operation():
+                    tool_name, arguments = build_call(next(sequence))
+                    result = await session.call_tool(tool_name, arguments)
+                    if result.isError:
+                        text = " ".join(getattr(item, "text", "") for item in result.content)
+                        raise RuntimeError(f"{tool_name} failed: {text[:200]}")
+
+                yield operation
+
+    return Scenario(name, open_worker)
+
+
+def _build_scenarios(args, client, registry_url: str, auth_url: str, token: str, servers) -> list[Scenario]:
+    from registry.core.config import settings
+
+    gateway_url = f"{registry_url}/proxy/mcpgw/mcp"
+    server_ids = [str(server.id) for server in servers]
+    auth_headers = {"Authorization": f"Bearer {token}"}
+
+    def execute_call(sequence: int):
+        arguments = {"tz_name": "UTC"}
+        return "execute_tool", {
+            "tool_name": "current_time_by_timezone",
+            "arguments": arguments,
+            "server_id": server_ids[sequence % len(server_ids)],
+        }
+
+    def discover_call(sequence: int):
+        return "discover_servers", {"query": args.query, "type_list": ["tool"], "top_n": 3}
+
+    available = {
+        "execute_tool": lambda: _gateway_scenario("execute_tool", gateway_url, token, execute_call),
+        "discover_servers": lambda: _gateway_scenario("discover_servers", gateway_url, token, discover_call),
+        "list_servers": lambda: _http_scenario(
+            "list_servers", client, f"{registry_url}/api/{settings.api_version}/servers", auth_headers
+        ),
+        "validate": lambda: _http_scenario("validate", client, f"{auth_url}/validate", auth_headers),
+    }
+    return [available[name]() for name in args.scenarios]
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Boot everything, run every scenario at every concurrency level and return the report."""
+    from .fakes import local_infrastructure
+    from .servers import LocalServer, create_time_server
+
+    stand_ins = []
+    for index in range(args.servers):
+        mcp = create_time_server(f"bench-time-{index}")
+        stand_ins.append((mcp, LocalServer(mcp.streamable_http_app(), f"bench-time-{index}")))
+
+    with local_infrastructure():
+        from auth_server.server import app as auth_app
+        from registry.main import app as registry_app
+
+        registry = LocalServer(registry_app, "registry")
+        auth = LocalServer(auth_app, "auth-server")
+        started: list[LocalServer] = []
+        try:
+            for server in [local for _, local in stand_ins] + [registry, auth]:
+                await server.start()
+                started.append(server)
+
+            user, servers = await _seed(registry_app.state.container, stand_ins)
+            token = _mint_token(user)
+
+            limits = httpx.Limits(
+                max_connections=max(args.concurrency), max_keepalive_connections=max(args.concurrency)
+            )
+            async with httpx.AsyncClient(limits=limits, timeout=30.0) as client:
+                scenarios = _build_scenarios(args, client, registry.url, auth.url, token, servers)
+                results = []
+                for scenario in scenarios:
+                    for concurrency in args.concurrency:
+                        result = await run_scenario(
+                            scenario, concurrency=concurrency, requests=args.requests, warmup=args.warmup
+                        )
+                        logger.warning(
+                            "%s @ %d: %.1f req/s, p50 %.2fms, p99 %.2fms, %d errors",
+                            result["scenario"],
+                            concurrency,
+                            result["throughput_rps"],
+                            result["latency_ms"]["p50"],
+                            result["latency_ms"]["p99"],
+                            result["errors"],
+                        )
+                        results.append(result)
+        finally:
+            for server in reversed(started):
+                await server.stop()
+
+    return {
+        "metadata": {
+            "timestamp": datetime.now(UTC).isoformat(),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "servers": args.servers,
+            "requests": args.requests,
+            "warmup": args.warmup,
+        },
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_arguments(argv)
+    for key, value in _ENVIRONMENT.items():
+        os.environ.setdefault(key, value)
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+
+    report = asyncio.run(run(args))
+
+    rendered = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(rendered + "\n")
+    else:
+        print(rendered)
+
+    if args.baseline:
+        regressions = find_regressions(json.loads(args.baseline.read_text()), report, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
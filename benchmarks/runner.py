@@ -0,0 +1,133 @@
+"""
+Closed-loop load generation and latency statistics.
+
+Each scenario runs ``concurrency`` workers that issue requests back to back until
+the shared request budget is spent. Workers open their per-client state (an HTTP
+client, an MCP session) before the clock starts and run an unmeasured warmup
+budget first, so the numbers describe the steady-state hot path.
+"""
+
+import asyncio
+import math
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from typing import Any
+
+Operation = Callable[[], Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A named operation; ``open_worker(index)`` yields the callable one worker issues repeatedly."""
+
+    name: str
+    open_worker: Callable[[int], AbstractAsyncContextManager[Operation]]
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict[str, Any]:
+    ordered = sorted(latencies)
+    completed = len(ordered)
+    return {
+        "requests": completed + errors,
+        "errors": errors,
+        "duration_seconds": round(elapsed, 4),
+        "throughput_rps": round(completed / elapsed, 2) if elapsed > 0 else 0.0,
+        "latency_ms": {
+            "mean": round(sum(ordered) / completed * 1000, 3) if completed else 0.0,
+            "p50": round(percentile(ordered, 50) * 1000, 3),
+            "p90": round(percentile(ordered, 90) * 1000, 3),
+            "p99": round(percentile(ordered, 99) * 1000, 3),
+            "max": round(ordered[-1] * 1000, 3) if completed else 0.0,
+        },
+    }
+
+
+class _Budget:
+    def __init__(self, total: int):
+        self.remaining = total
+
+    def take(self) -> bool:
+        if self.remaining <= 0:
+            return False
+        self.remaining -= 1
+        return True
+
+
+async def run_scenario(scenario: Scenario, *, concurrency: int, requests: int, warmup: int = 0) -> dict[str, Any]:
+    """Run one scenario at one concurrency level and return its summary."""
+    barrier = asyncio.Barrier(concurrency + 1)
+    warmup_budget = _Budget(warmup)
+    budget = _Budget(requests)
+    latencies: list[float] = []
+    errors = 0
+    first_error: str | None = None
+
+    async def worker(index: int) -> None:
+        nonlocal errors, first_error
+        async with scenario.open_worker(index) as operation:
+            await barrier.wait()  # every worker is connected
+            while warmup_budget.take():
+                try:
+                    await operation()
+                except Exception:
+                    pass
+            await barrier.wait()  # warmup finished, the clock starts
+            while budget.take():
+                started = time.perf_counter()
+                try:
+                    await operation()
+                except Exception as e:
+                    errors += 1
+                    first_error = first_error or f"{type(e).__name__}: {e}"
+                    continue
+                latencies.append(time.perf_counter() - started)
+            await barrier.wait()  # every worker drained the budget
+
+    async def coordinator() -> float:
+        await barrier.wait()
+        await barrier.wait()
+        started = time.perf_counter()
+        await barrier.wait()
+        return time.perf_counter() - started
+
+    async with asyncio.TaskGroup() as tg:
+        for index in range(concurrency):
+            tg.create_task(worker(index))
+        elapsed_task = tg.create_task(coordinator())
+
+    result = {"scenario": scenario.name, "concurrency": concurrency}
+    result.update(summarize(latencies, errors, elapsed_task.result()))
+    if first_error:
+        result["first_error"] = first_error
+    return result
+
+
+def find_regressions(baseline: dict[str, Any], current: dict[str, Any], tolerance: float) -> list[str]:
+    """Compare two reports and describe every p99 or throughput change worse than ``tolerance``."""
+    previous = {(r["scenario"], r["concurrency"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for result in current.get("results", []):
+        key = (result["scenario"], result["concurrency"])
+        before = previous.get(key)
+        if before is None:
+            continue
+        label = f"{key[0]} @ concurrency {key[1]}"
+        p99_before, p99_now = before["latency_ms"]["p99"], result["latency_ms"]["p99"]
+        if p99_before > 0 and p99_now > p99_before * (1 + tolerance):
+            regressions.append(f"{label}: p99 {p99_before:.3f}ms -> {p99_now:.3f}ms")
+        rps_before, rps_now = before["throughput_rps"], result["throughput_rps"]
+        if rps_before > 0 and rps_now < rps_before * (1 - tolerance):
+            regressions.append(f"{label}: throughput {rps_before:.2f} -> {rps_now:.2f} req/s")
+        if result["errors"] > before["errors"]:
+            regressions.append(f"{label}: errors {before['errors']} -> {result['errors']}")
+    return regressions
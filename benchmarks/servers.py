@@ -0,0 +1,90 @@
+"""
+Local MCP servers and an in-process HTTP host for the benchmark suite.
+
+The stand-in servers are modelled on ``servers/currenttime/server.py`` but answer
+from the local clock instead of calling timeapi.io, so measured latency is the
+gateway's own overhead plus a loopback hop.
+"""
+
+import asyncio
+import socket
+from datetime import datetime
+from typing import Annotated
+from zoneinfo import ZoneInfo
+
+import uvicorn
+from mcp.server.fastmcp import FastMCP
+from pydantic import Field
+
+
+def create_time_server(name: str) -> FastMCP:
+    """Build a FastMCP server exposing the currenttime tool plus a payload-sized echo tool."""
+    mcp = FastMCP(name, log_level="WARNING")
+
+    @mcp.tool()
+    def current_time_by_timezone(
+        tz_name: Annotated[
+            str,
+            Field(
+                default="America/New_York",
+                description="Name of the timezone for which to find out the current time",
+            ),
+        ] = "America/New_York",
+    ) -> str:
+        """Get the current time for a specified timezone."""
+        return datetime.now(ZoneInfo(tz_name)).isoformat()
+
+    @mcp.tool()
+    def echo(
+        text: Annotated[str, Field(description="Text to return")],
+        repeat: Annotated[int, Field(default=1, ge=1, le=10_000, description="Times to repeat the text")] = 1,
+    ) -> str:
+        """Return the given text, repeated to produce larger responses."""
+        return text * repeat
+
+    return mcp
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class LocalServer:
+    """Serve an ASGI app with uvicorn on a free loopback port inside the running event loop."""
+
+    def __init__(self, app, name: str):
+        self.app = app
+        self.name = name
+        self.port: int | None = None
+        self._server: uvicorn.Server | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def url(self) -> str:
+        if self.port is None:
+            raise RuntimeError(f"{self.name} is not running")
+        return f"http://127.0.0.1:{self.port}"
+
+    async def start(self, timeout: float = 60.0) -> None:
+        self.port = _free_port()
+        config = uvicorn.Config(self.app, host="127.0.0.1", port=self.port, log_level="warning", lifespan="on")
+        self._server = uvicorn.Server(config)
+        self._task = asyncio.create_task(self._server.serve(), name=f"serve-{self.name}")
+
+        async def wait_started():
+            while not self._server.started:
+                if self._task.done():
+                    # Surfaces the startup error, e.g. a failing lifespan.
+                    self._task.result()
+                    raise RuntimeError(f"{self.name} exited during startup")
+                await asyncio.sleep(0.05)
+
+        await asyncio.wait_for(wait_started(), timeout)
+
+    async def stop(self) -> None:
+        if self._server is None or self._task is None:
+            return
+        self._server.should_exit = True
+        await self._task
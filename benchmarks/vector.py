@@ -0,0 +1,471 @@
+"""
+Micro-benchmarks for vector sync and search.
+
+Runs the registry's indexing and search code paths in isolation, against a
+synthetic catalog of N servers x M tools, for several catalog sizes:
+
+- ``to_documents``: ``ExtendedMCPServer.to_documents`` for every server
+- ``sync_initial`` / ``sync_unchanged`` / ``sync_tool_changed``:
+  ``MCPServerRepository.smart_sync`` into an empty index, again with nothing
+  changed, and again after one tool description per server changed
+- ``search_with_rerank``: ``Repository.search_with_rerank`` for a set of queries
+- ``faiss_index`` / ``faiss_reindex_unchanged`` / ``faiss_search_mixed``:
+  ``EmbeddedFaissService.add_or_update_many`` and ``search_mixed`` (skipped when
+  faiss is not installed)
+
+MongoDB is mongomock-motor, the vector store is the in-memory adapter from
+``benchmarks/fakes.py`` and every embedding comes from ``HashingEmbeddings``, so
+the run is offline and deterministic. Each phase reports wall time, the
+tracemalloc peak and how many embedding calls and texts it needed; a power-law
+exponent per phase summarizes how it scales with the number of tools.
+
+Usage:
+    uv run --with mongomock-motor python -m benchmarks.vector
+    uv run --with mongomock-motor python -m benchmarks.vector --sizes 50x10,500x20 --profile cprofile
+"""
+
+import argparse
+import asyncio
+import cProfile
+import importlib.util
+import json
+import logging
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from .fakes import EMBEDDING_SIZE, HashingEmbeddings, InMemoryDatabaseClient, _require, local_mongodb
+from .gateway import _ENVIRONMENT, _git_commit
+
+logger = logging.getLogger(__name__)
+
+FACTORIES_PATH = Path(__file__).resolve().parents[1] / "registry" / "tests" / "fixtures" / "factories.py"
+
+PROFILERS = ("cprofile", "pyinstrument")
+
+# Vocabulary for tool and server descriptions that read like real MCP catalogs, so that
+# text lengths, token overlap and search hits resemble production data.
+_DOMAINS = {
+    "GitHub": ("repository", "pull request", "issue", "commit", "branch", "release"),
+    "Jira": ("ticket", "sprint", "board", "epic", "comment"),
+    "Slack": ("channel", "message", "thread", "reaction", "user group"),
+    "Postgres": ("table", "query", "schema", "index", "row"),
+    "Kubernetes": ("pod", "deployment", "namespace", "service", "config map"),
+    "Salesforce": ("account", "opportunity", "lead", "contact", "report"),
+    "Google Drive": ("file", "folder", "permission", "spreadsheet", "document"),
+    "Weather": ("forecast", "alert", "observation", "station"),
+    "Stripe": ("payment", "invoice", "customer", "subscription", "refund"),
+    "Confluence": ("page", "space", "attachment", "label"),
+}
+_VERBS = ("list", "get", "create", "update", "delete", "search", "archive", "export", "summarize", "sync")
+_QUALIFIERS = (
+    "matching the given filters",
+    "by identifier",
+    "for the authenticated user",
+    "with pagination support",
+    "and return the result as JSON",
+    "within a date range",
+    "including related metadata",
+)
+
+
+def _plural(noun: str) -> str:
+    if noun.endswith("y"):
+        return f"{noun[:-1]}ies"
+    if noun.endswith(("s", "ch")):
+        return f"{noun}es"
+    return f"{noun}s"
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.vector", description="Vector sync and search micro-benchmarks"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: [parse_size(size) for size in value.split(",") if size.strip()],
+        default=[(10, 10), (100, 10), (500, 20)],
+        help="Comma-separated catalog sizes as SERVERSxTOOLS (default: 10x10,100x10,500x20)",
+    )
+    parser.add_argument("--queries", type=int, default=50, help="Search queries per search phase (default: 50)")
+    parser.add_argument("--seed", type=int, default=1234, help="Seed for the synthetic catalog (default: 1234)")
+    parser.add_argument(
+        "--alloc",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Trace allocations with tracemalloc; slows every phase down (default: on)",
+    )
+    parser.add_argument("--profile", choices=PROFILERS, help="Write a profile of every phase")
+    parser.add_argument(
+        "--profile-dir",
+        type=Path,
+        default=Path("bench-profiles"),
+        help="Where to write profiles (default: %(default)s)",
+    )
+    parser.add_argument("--skip-faiss", action="store_true", help="Skip the EmbeddedFaissService phases")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    if args.queries < 1:
+        parser.error("--queries must be >= 1")
+    return args
+
+
+def parse_size(value: str) -> tuple[int, int]:
+    """Parse ``"100x20"`` into ``(100, 20)``."""
+    try:
+        servers, tools = (int(part) for part in value.strip().lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size '{value}', expected SERVERSxTOOLS") from None
+    if servers < 1 or tools < 0:
+        raise argparse.ArgumentTypeError(f"invalid size '{value}', need at least one server")
+    return servers, tools
+
+
+def _load_factories():
+    """Import the registry's test data factories, which are not part of an installed package."""
+    spec = importlib.util.spec_from_file_location("registry_test_factories", FACTORIES_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def generate_catalog(servers: int, tools: int, seed: int) -> list[dict[str, Any]]:
+    """
+    Build ``servers`` server_info dicts with ``tools`` tools each.
+
+    The dicts have the shape the legacy registry and EmbeddedFaissService use;
+    ``to_extended_server`` converts them to what MongoDB stores.
+    """
+    factories = _load_factories()
+    factories.fake.seed_instance(seed)
+    rng = random.Random(seed)
+
+    catalog = []
+    for index in range(servers):
+        domain = rng.choice(list(_DOMAINS))
+        objects = _DOMAINS[domain]
+        slug = f"{domain.lower().replace(' ', '-')}-{index}"
+
+        tool_list = []
+        for position in range(tools):
+            verb, obj = rng.choice(_VERBS), rng.choice(objects)
+            name = f"{verb}_{_plural(obj).replace(' ', '_')}_{position}"
+            description = (
+                f"{verb.capitalize()} {domain} {_plural(obj)} {rng.choice(_QUALIFIERS)}. {factories.fake.sentence()}"
+            )
+            tool_list.append(
+                factories.ToolInfoFactory(
+                    name=name,
+                    description=description,
+                    input_schema={
+                        "type": "object",
+                        "properties": {
+                            f"{obj.replace(' ', '_')}_id": {"type": "string", "description": f"The {obj} identifier"},
+                            "limit": {"type": "integer", "description": "Maximum number of results"},
+                        },
+                        "required": [f"{obj.replace(' ', '_')}_id"],
+                    },
+                )
+            )
+
+        catalog.append(
+            factories.ServerInfoFactory(
+                server_name=f"{domain} MCP {index}",
+                description=f"Work with {domain} {', '.join(_plural(obj) for obj in objects[:3])} from agents. {factories.fake.sentence()}",
+                path=f"/{slug}",
+                tags=[domain.lower(), *rng.sample(objects, k=min(2, len(objects)))],
+                num_tools=tools,
+                tool_list=tool_list,
+            )
+        )
+    return catalog
+
+
+def generate_queries(count: int, seed: int) -> list[str]:
+    rng = random.Random(seed + 1)
+    queries = []
+    for _ in range(count):
+        domain = rng.choice(list(_DOMAINS))
+        queries.append(f"{rng.choice(_VERBS)} {domain} {_plural(rng.choice(_DOMAINS[domain]))}")
+    return queries
+
+
+def to_extended_server(server_info: dict[str, Any]):
+    """Convert a server_info dict the way the registry does when a server is registered."""
+    from registry.services.server_service import _convert_tool_list_to_functions
+    from registry_pkgs.models.extended_mcp_server import ExtendedMCPServer
+
+    tools = [
+        {"name": tool["name"], "description": tool["description"], "inputSchema": tool["input_schema"]}
+        for tool in server_info["tool_list"]
+    ]
+    server = ExtendedMCPServer.from_server_info(
+        {
+            **server_info,
+            "toolFunctions": _convert_tool_list_to_functions(tools, server_info["server_name"]),
+        },
+        is_enabled=True,
+    )
+    now = datetime.now(UTC)
+    server.numTools = len(tools)
+    server.createdAt = now
+    server.updatedAt = now
+    return server
+
+
+class PhaseRecorder:
+    """Times phases and collects wall time, allocation peak, embedding work and optional profiles."""
+
+    def __init__(self, embedding: HashingEmbeddings, alloc: bool, profiler: str | None, profile_dir: Path):
+        self.embedding = embedding
+        self.alloc = alloc
+        self.profiler = profiler
+        self.profile_dir = profile_dir
+        if profiler == "pyinstrument":
+            _require("pyinstrument", "pyinstrument")
+        if profiler:
+            profile_dir.mkdir(parents=True, exist_ok=True)
+
+    @asynccontextmanager
+    async def phase(self, results: dict[str, Any], label: str, name: str, operations: int):
+        """Measure the body of the ``async with`` block as phase ``name`` of catalog ``label``."""
+        extra: dict[str, Any] = {}
+        calls, texts = self.embedding.calls, self.embedding.texts
+        profile = self._start_profile()
+        if self.alloc:
+            tracemalloc.start()
+        started = time.perf_counter()
+        try:
+            yield extra
+        finally:
+            elapsed = time.perf_counter() - started
+            peak = tracemalloc.get_traced_memory()[1] if self.alloc else None
+            if self.alloc:
+                tracemalloc.stop()
+            function_calls = self._stop_profile(profile, f"{label}-{name}")
+
+        result = {
+            "wall_ms": round(elapsed * 1000, 3),
+            "per_operation_ms": round(elapsed * 1000 / operations, 4) if operations else 0.0,
+            "operations": operations,
+            "embedding_calls": self.embedding.calls - calls,
+            "texts_embedded": self.embedding.texts - texts,
+        }
+        if peak is not None:
+            result["peak_alloc_kib"] = round(peak / 1024, 1)
+        if function_calls is not None:
+            result["function_calls"] = function_calls
+        result.update(extra)
+        results[name] = result
+        logger.warning(
+            "%s %-24s %10.2f ms  %8.4f ms/op  %s",
+            label,
+            name,
+            result["wall_ms"],
+            result["per_operation_ms"],
+            f"{result['peak_alloc_kib']:.0f} KiB peak" if peak is not None else "",
+        )
+
+    def _start_profile(self):
+        if self.profiler == "cprofile":
+            profile = cProfile.Profile()
+            profile.enable()
+            return profile
+        if self.profiler == "pyinstrument":
+            from pyinstrument import Profiler
+
+            profile = Profiler(async_mode="enabled")
+            profile.start()
+            return profile
+        return None
+
+    def _stop_profile(self, profile, stem: str) -> int | None:
+        if profile is None:
+            return None
+        if self.profiler == "cprofile":
+            import pstats
+
+            profile.disable()
+            profile.dump_stats(self.profile_dir / f"{stem}.prof")
+            return pstats.Stats(profile).total_calls
+        profile.stop()
+        (self.profile_dir / f"{stem}.html").write_text(profile.output_html())
+        return None
+
+
+async def _run_repository_phases(recorder: PhaseRecorder, label: str, catalog, queries) -> dict[str, Any]:
+    from registry_pkgs.models.extended_mcp_server import ExtendedMCPServer
+    from registry_pkgs.vector.repositories.mcp_server_repository import MCPServerRepository
+
+    await ExtendedMCPServer.find_all().delete()
+    servers = [to_extended_server(server_info) for server_info in catalog]
+    for server in servers:
+        await server.insert()
+
+    repo = MCPServerRepository(
+        InMemoryDatabaseClient(collection_name=ExtendedMCPServer.COLLECTION_NAME, embedding=recorder.embedding)
+    )
+    phases: dict[str, Any] = {}
+
+    async with recorder.phase(phases, label, "to_documents", len(servers)) as extra:
+        extra["documents"] = sum(len(server.to_documents()) for server in servers)
+
+    async with recorder.phase(phases, label, "sync_initial", len(servers)) as extra:
+        extra["failed"] = sum(1 for server in servers if not await repo.smart_sync(server))
+
+    async with recorder.phase(phases, label, "sync_unchanged", len(servers)) as extra:
+        extra["failed"] = sum(1 for server in servers if not await repo.smart_sync(server))
+
+    for server in servers:
+        tool_functions = server.config.get("toolFunctions") or {}
+        if tool_functions:
+            first = next(iter(tool_functions.values()))
+            first["function"]["description"] += " Results are cached for five minutes."
+
+    async with recorder.phase(phases, label, "sync_tool_changed", len(servers)) as extra:
+        extra["failed"] = sum(1 for server in servers if not await repo.smart_sync(server))
+
+    async with recorder.phase(phases, label, "search_with_rerank", len(queries)) as extra:
+        extra["results"] = sum(len(repo.search_with_rerank(query, k=10)) for query in queries)
+
+    repo.adapter.close()
+    return phases
+
+
+async def _run_faiss_phases(recorder: PhaseRecorder, label: str, catalog, queries) -> dict[str, Any]:
+    try:
+        from registry.core.config import settings
+        from registry.services.search.embedded_service import FAISS_AVAILABLE, EmbeddedFaissService
+    except ImportError as e:
+        return {"skipped": f"registry could not be imported: {e}"}
+    if not FAISS_AVAILABLE:
+        return {"skipped": "faiss-cpu and sentence-transformers are not installed"}
+
+    phases: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(prefix="bench-faiss-") as directory:
+        service = EmbeddedFaissService(
+            settings.model_copy(
+                update={"container_registry_dir": Path(directory), "local_embeddings_model_dimensions": EMBEDDING_SIZE}
+            )
+        )
+        service.embedding_model = recorder.embedding
+        await service._load_faiss_data()
+        items = [(server_info["path"], server_info, True) for server_info in catalog]
+
+        async with recorder.phase(phases, label, "faiss_index", len(items)):
+            await service.add_or_update_many(items)
+
+        async with recorder.phase(phases, label, "faiss_reindex_unchanged", len(items)):
+            await service.add_or_update_many(items)
+
+        async with recorder.phase(phases, label, "faiss_search_mixed", len(queries)) as extra:
+            hits = 0
+            for query in queries:
+                results = await service.search_mixed(query, max_results=10)
+                hits += sum(len(entries) for entries in results.values())
+            extra["results"] = hits
+
+        await service.cleanup()
+    return phases
+
+
+def scaling_exponents(sizes: list[dict[str, Any]]) -> dict[str, float]:
+    """
+    Least-squares slope of log(wall time) over log(total tools) for each phase:
+    about 1.0 is linear in the catalog size, about 0.0 is constant.
+    """
+    series: dict[str, list[tuple[float, float]]] = {}
+    for size in sizes:
+        total = size["servers"] * max(size["tools_per_server"], 1)
+        for name, phase in size["phases"].items():
+            if phase.get("wall_ms", 0) > 0:
+                series.setdefault(name, []).append((math.log(total), math.log(phase["wall_ms"])))
+
+    exponents = {}
+    for name, points in series.items():
+        if len({x for x, _ in points}) < 2:
+            continue
+        mean_x = sum(x for x, _ in points) / len(points)
+        mean_y = sum(y for _, y in points) / len(points)
+        numerator = sum((x - mean_x) * (y - mean_y) for x, y in points)
+        denominator = sum((x - mean_x) ** 2 for x, _ in points)
+        exponents[name] = round(numerator / denominator, 2)
+    return exponents
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    from registry_pkgs.core.config import MongoConfig
+    from registry_pkgs.database.mongodb import MongoDB
+
+    embedding = HashingEmbeddings()
+    recorder = PhaseRecorder(embedding, args.alloc, args.profile, args.profile_dir)
+    queries = generate_queries(args.queries, args.seed)
+
+    results = []
+    with local_mongodb():
+        await MongoDB.connect_db(MongoConfig(mongo_uri=os.environ["MONGO_URI"]))
+        try:
+            for servers, tools in args.sizes:
+                label = f"{servers}x{tools}"
+                catalog = generate_catalog(servers, tools, args.seed)
+                phases = await _run_repository_phases(recorder, label, catalog, queries)
+                if args.skip_faiss:
+                    phases["faiss"] = {"skipped": "--skip-faiss"}
+                else:
+                    faiss_phases = await _run_faiss_phases(recorder, label, catalog, queries)
+                    if "skipped" in faiss_phases:
+                        logger.warning("%s FAISS phases skipped: %s", label, faiss_phases["skipped"])
+                        phases["faiss"] = faiss_phases
+                    else:
+                        phases.update(faiss_phases)
+                results.append({"servers": servers, "tools_per_server": tools, "phases": phases})
+        finally:
+            await MongoDB.close_db()
+
+    return {
+        "metadata": {
+            "timestamp": datetime.now(UTC).isoformat(),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "queries": args.queries,
+            "embedding_size": EMBEDDING_SIZE,
+            "tracemalloc": args.alloc,
+            "profiler": args.profile,
+        },
+        "sizes": results,
+        "scaling_exponents": scaling_exponents(results),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_arguments(argv)
+    for key, value in _ENVIRONMENT.items():
+        os.environ.setdefault(key, value)
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+
+    report = asyncio.run(run(args))
+
+    rendered = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(rendered + "\n")
+    else:
+        print(rendered)
+    for name, exponent in report["scaling_exponents"].items():
+        print(f"{name:<24} wall time ~ tools^{exponent}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,19 +5,25 @@ Scan all enabled MCP servers for security vulnerabilities.
 This script:
 1. Uses the Registry Management API client to get a list of all servers
 2. Filters for enabled servers
-3. Runs security scans on each enabled server using mcp_security_scanner.py
+3. Skips servers whose listing (and the analyzers/rules version) is unchanged since
+   their last successful scan, unless --force is given
+4. Runs security scans on the remaining servers using mcp_security_scanner.py,
+   up to --concurrency scanner processes at a time, logging each result as it completes
 
 Usage:
     uv run python cli/scan_all_servers.py
     uv run python cli/scan_all_servers.py --base-url http://localhost
     uv run python cli/scan_all_servers.py --analyzers yara,llm
     uv run python cli/scan_all_servers.py --token-file .oauth-tokens/ingress.json
+    uv run python cli/scan_all_servers.py --concurrency 8 --rules-version 2026-10
 """
 
 import argparse
+import asyncio
+import hashlib
 import json
 import logging
-import subprocess
+import os
 import sys
 from datetime import UTC, datetime
 from pathlib import Path
@@ -42,12 +48,59 @@ logger = logging.getLogger(__name__)
 DEFAULT_TOKEN_FILE = PROJECT_ROOT / ".oauth-tokens" / "ingress.json"
 DEFAULT_BASE_URL = "http://localhost"
 DEFAULT_ANALYZERS = "yara"
+DEFAULT_CONCURRENCY = 4
+FINGERPRINT_FILE = PROJECT_ROOT / "security_scans" / ".scan_fingerprints.json"
 
+# Internal metadata that changes without the server changing; excluded from fingerprints.
+_VOLATILE_META_FIELDS = ("health_status", "is_enabled")
 
-def _run_security_scan(
+
+def _server_fingerprint(server: Any, analyzers: str, rules_version: str) -> str:
+    """Hash of a server's registry listing plus the scan configuration.
+
+    Args:
+        server: AnthropicServerDetail from the registry listing
+        analyzers: Comma-separated list of analyzers
+        rules_version: Scanner rules version; changing it makes every server due for a rescan
+
+    Returns:
+        Hex digest identifying this server content and scan configuration
+    """
+    detail = server.model_dump(mode="json", by_alias=True)
+    internal_meta = (detail.get("_meta") or {}).get("io.mcpgateway/internal")
+    if isinstance(internal_meta, dict):
+        for key in _VOLATILE_META_FIELDS:
+            internal_meta.pop(key, None)
+    content = {"server": detail, "analyzers": analyzers, "rules": rules_version}
+    canonical = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _load_fingerprints(path: Path) -> dict[str, Any]:
+    """Load the fingerprints and results of previous successful scans, keyed by server path."""
+    if not path.exists():
+        return {}
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable fingerprint file {path}: {e}")
+        return {}
+
+
+def _save_fingerprints(path: Path, fingerprints: dict[str, Any]) -> None:
+    """Write the fingerprint file atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(fingerprints, f, indent=2, default=str)
+    os.replace(tmp_path, path)
+
+
+async def _run_security_scan(
     server_url: str, analyzers: str, api_key: str | None = None, access_token: str | None = None
 ) -> dict[str, Any]:
-    """Run security scan on a server using mcp_security_scanner.py directly.
+    """Run security scan on a server using mcp_security_scanner.py in a child process.
 
     Args:
         server_url: URL of the MCP server to scan
@@ -99,23 +152,27 @@ def _run_security_scan(
     logger.info(f"Running: {' '.join(cmd_for_log)}")
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False, cwd=str(PROJECT_ROOT))
-
-        # Log output
-        if result.stdout:
-            logger.info(f"Scan output:\n{result.stdout}")
-        if result.stderr:
-            logger.warning(f"Scan stderr:\n{result.stderr}")
+        process = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=str(PROJECT_ROOT)
+        )
+        stdout, stderr = await process.communicate()
+        returncode = process.returncode
+
+        # Log output; scans run concurrently, so full output is only shown with --debug
+        if stdout:
+            logger.debug(f"Scan output for {server_url}:\n{stdout.decode(errors='replace')}")
+        if stderr and returncode != 0:
+            logger.warning(f"Scan stderr for {server_url}:\n{stderr.decode(errors='replace')}")
 
         # Parse scan results from security_scans directory
         scan_result = {
-            "success": result.returncode == 0,
+            "success": returncode == 0,
             "scan_output_file": None,
             "critical_issues": 0,
             "high_severity": 0,
             "medium_severity": 0,
             "low_severity": 0,
-            "is_safe": result.returncode == 0,
+            "is_safe": returncode == 0,
             "error_message": None,
         }
 
@@ -157,11 +214,8 @@ def _run_security_scan(
             logger.warning(f"Could not parse scan results: {e}")
 
         # Check exit code
-        if result.returncode == 0:
-            logger.info("✓ Scan completed successfully")
-        else:
-            logger.error(f"✗ Scan failed with exit code: {result.returncode}")
-            scan_result["error_message"] = f"Scanner exit code: {result.returncode}"
+        if returncode != 0:
+            scan_result["error_message"] = f"Scanner exit code: {returncode}"
 
         return scan_result
 
@@ -213,6 +267,7 @@ def _generate_markdown_report(
     lines.append(f"- **Total Servers Scanned:** {total}")
     lines.append(f"- **Passed:** {passed} ({pass_rate:.1f}%)")
     lines.append(f"- **Failed:** {failed} ({100 - pass_rate:.1f}%)")
+    lines.append(f"- **Unchanged Since Last Scan (not rescanned):** {stats.get('skipped', 0)}")
     lines.append("")
 
     # Aggregate Vulnerability Statistics
@@ -245,6 +300,8 @@ def _generate_markdown_report(
         lines.append("")
         lines.append(f"- **URL:** `{server_url}`")
         lines.append(f"- **Status:** {status}")
+        if result.get("skipped"):
+            lines.append("- **Result From:** previous scan (server unchanged)")
         lines.append("")
 
         # Vulnerability table
@@ -338,8 +395,58 @@ def _generate_markdown_report(
     return "\n".join(lines)
 
 
+async def _scan_servers(
+    jobs: list[dict[str, Any]],
+    analyzers: str,
+    api_key: str | None,
+    access_token: str,
+    concurrency: int,
+) -> list[dict[str, Any]]:
+    """Scan servers with at most ``concurrency`` scanner processes, logging each result as it completes.
+
+    Args:
+        jobs: Dicts with server_name and server_url
+        analyzers: Comma-separated list of analyzers
+        api_key: Optional API key for LLM analyzer
+        access_token: Access token for authenticated MCP servers
+        concurrency: Maximum number of scans running at once
+
+    Returns:
+        Scan results in the order of ``jobs``
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    total = len(jobs)
+    completed = 0
+
+    async def scan(job: dict[str, Any]) -> dict[str, Any]:
+        nonlocal completed
+        async with semaphore:
+            logger.info(f"Scanning: {job['server_name']} ({job['server_url']})")
+            scan_result = await _run_security_scan(job["server_url"], analyzers, api_key, access_token)
+        scan_result["server_name"] = job["server_name"]
+        scan_result["server_url"] = job["server_url"]
+
+        completed += 1
+        if not scan_result["success"]:
+            outcome = f"✗ FAILED: {scan_result.get('error_message')}"
+        elif scan_result["is_safe"]:
+            outcome = "✓ SAFE"
+        else:
+            outcome = f"✗ UNSAFE (critical: {scan_result['critical_issues']}, high: {scan_result['high_severity']})"
+        logger.info(f"[{completed}/{total}] {job['server_name']}: {outcome}")
+        return scan_result
+
+    return list(await asyncio.gather(*(scan(job) for job in jobs)))
+
+
 def _scan_all_servers(
-    base_url: str, token_file: Path, analyzers: str = DEFAULT_ANALYZERS, api_key: str | None = None
+    base_url: str,
+    token_file: Path,
+    analyzers: str = DEFAULT_ANALYZERS,
+    api_key: str | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    rules_version: str = "",
+    force: bool = False,
 ) -> dict[str, Any]:
     """Scan all enabled servers.
 
@@ -348,6 +455,9 @@ def _scan_all_servers(
         token_file: Path to token file
         analyzers: Comma-separated list of analyzers
         api_key: Optional API key for LLM analyzer
+        concurrency: Maximum number of scans running at once
+        rules_version: Scanner rules version, part of every server fingerprint
+        force: Rescan servers even if unchanged since their last successful scan
 
     Returns:
         Dictionary with scan statistics
@@ -405,27 +515,21 @@ def _scan_all_servers(
     if not enabled_servers:
         logger.warning("No enabled servers found to scan")
         return {
-            "stats": {"total": 0, "passed": 0, "failed": 0},
+            "stats": {"total": 0, "passed": 0, "failed": 0, "skipped": 0},
             "scan_results": [],
             "scan_timestamp": "",
             "analyzers": analyzers,
         }
 
     # Scan each server
-    stats = {"total": len(enabled_servers), "passed": 0, "failed": 0}
+    stats = {"total": len(enabled_servers), "passed": 0, "failed": 0, "skipped": 0}
 
     scan_results = []
     scan_timestamp = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S UTC")
+    fingerprints = {} if force else _load_fingerprints(FINGERPRINT_FILE)
+    jobs = []
 
-    logger.info("")
-    logger.info("=" * 80)
-    logger.info(f"Scanning {stats['total']} enabled servers")
-    logger.info("=" * 80)
-    logger.info("")
-
-    # Note: access_token already loaded above for RegistryClient
-
-    for idx, server in enumerate(enabled_servers, 1):
+    for server in enabled_servers:
         # Server is AnthropicServerDetail with direct attribute access
         server_name = server.name
 
@@ -436,8 +540,7 @@ def _scan_all_servers(
             server_path = internal_meta.get("path")
 
         if not server_path:
-            logger.warning(f"[{idx}/{stats['total']}] {server_name}: No path found in metadata, skipping")
-            stats["failed"] += 1
+            logger.warning(f"{server_name}: No path found in metadata, skipping")
             scan_results.append(
                 {
                     "server_name": server_name,
@@ -453,29 +556,50 @@ def _scan_all_servers(
             )
             continue
 
+        fingerprint = _server_fingerprint(server, analyzers, rules_version)
+        previous = fingerprints.get(server_path)
+        if previous and previous.get("fingerprint") == fingerprint:
+            logger.info(f"{server_name}: unchanged since last scan, skipping")
+            stats["skipped"] += 1
+            scan_results.append({**previous["result"], "skipped": True})
+            continue
+
         # Construct the gateway proxy URL using the path and base_url
-        if not server_path.endswith("/"):
-            server_path = server_path + "/"
-        server_url = f"{base_url}{server_path}mcp"
-
-        logger.info("-" * 80)
-        logger.info(f"[{idx}/{stats['total']}] Scanning: {server_name}")
-        logger.info(f"URL: {server_url}")
-        logger.info(f"Analyzers: {analyzers}")
-
-        # Run scan with access token for authentication
-        scan_result = _run_security_scan(server_url, analyzers, api_key, access_token)
-        scan_result["server_name"] = server_name
-        scan_result["server_url"] = server_url
-        scan_results.append(scan_result)
-
-        if scan_result["success"] and scan_result["is_safe"]:
+        server_url = f"{base_url}{server_path.rstrip('/')}/mcp"
+        jobs.append(
+            {"server_name": server_name, "server_url": server_url, "path": server_path, "fingerprint": fingerprint}
+        )
+
+    logger.info("")
+    logger.info("=" * 80)
+    logger.info(
+        f"Scanning {len(jobs)} of {stats['total']} enabled servers "
+        f"({stats['skipped']} unchanged, concurrency {concurrency}, analyzers {analyzers})"
+    )
+    logger.info("=" * 80)
+    logger.info("")
+
+    # Note: access_token already loaded above for RegistryClient
+    results = asyncio.run(_scan_servers(jobs, analyzers, api_key, access_token, concurrency))
+    scan_results.extend(results)
+
+    # Remember successful scans so unchanged servers are skipped next time
+    if not force:
+        fingerprints = _load_fingerprints(FINGERPRINT_FILE)
+    for job, scan_result in zip(jobs, results, strict=True):
+        if scan_result["success"]:
+            fingerprints[job["path"]] = {"fingerprint": job["fingerprint"], "result": scan_result}
+        else:
+            fingerprints.pop(job["path"], None)
+    if jobs:
+        _save_fingerprints(FINGERPRINT_FILE, fingerprints)
+
+    for scan_result in scan_results:
+        if scan_result.get("success") and scan_result.get("is_safe"):
             stats["passed"] += 1
         else:
             stats["failed"] += 1
 
-        logger.info("")
-
     return {"stats": stats, "scan_results": scan_results, "scan_timestamp": scan_timestamp, "analyzers": analyzers}
 
 
@@ -498,6 +622,13 @@ Examples:
     # Use custom token file
     uv run python cli/scan_all_servers.py --token-file .oauth-tokens/custom.json
 
+    # Run 8 scans at a time; after a scanner rules update, bump the rules version
+    # so servers unchanged since their last scan are rescanned too
+    uv run python cli/scan_all_servers.py --concurrency 8 --rules-version 2026-10
+
+    # Rescan every server regardless of fingerprints
+    uv run python cli/scan_all_servers.py --force
+
     # Production example
     uv run python cli/scan_all_servers.py \\
         --base-url https://registry.us-east-1.example.com \\
@@ -519,9 +650,25 @@ Examples:
         help=f"Comma-separated list of analyzers: yara, llm, or yara,llm (default: {DEFAULT_ANALYZERS})",
     )
     parser.add_argument("--api-key", help="LLM API key (optional, can also use MCP_SCANNER_LLM_API_KEY env var)")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Maximum number of scans running at once (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--rules-version",
+        default=os.getenv("SECURITY_SCAN_RULES_VERSION", ""),
+        help="Scanner rules version; changing it rescans unchanged servers (default: SECURITY_SCAN_RULES_VERSION)",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Rescan all servers, even those unchanged since their last scan"
+    )
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
 
     args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
 
     # Set debug level if requested
     if args.debug:
@@ -529,7 +676,13 @@ Examples:
 
     # Run scans
     results = _scan_all_servers(
-        base_url=args.base_url, token_file=args.token_file, analyzers=args.analyzers, api_key=args.api_key
+        base_url=args.base_url,
+        token_file=args.token_file,
+        analyzers=args.analyzers,
+        api_key=args.api_key,
+        concurrency=args.concurrency,
+        rules_version=args.rules_version,
+        force=args.force,
     )
 
     stats = results["stats"]
@@ -575,7 +728,8 @@ Examples:
     logger.info("=" * 80)
     logger.info("SCAN SUMMARY")
     logger.info("=" * 80)
-    logger.info(f"Total servers scanned: {stats['total']}")
+    logger.info(f"Total servers: {stats['total']}")
+    logger.info(f"Skipped (unchanged): {stats['skipped']}")
     logger.info(f"Passed: {stats['passed']}")
     logger.info(f"Failed: {stats['failed']}")
     logger.info("")
@@ -3,12 +3,16 @@
 OAuth Token Refresher Service
 
 This service monitors OAuth tokens in the .oauth-tokens directory and automatically
-refreshes them before they expire. It runs continuously in the background, checking
-tokens every configurable interval (default 5 minutes).
+refreshes them before they expire. It runs continuously in the background and sleeps
+until the next token is due for refresh, scanning the directory for new or changed
+token files at least every configurable interval (default 5 minutes). Due tokens are
+refreshed concurrently, and only the MCP client config entries of refreshed tokens
+are rewritten.
 
 Usage:
     uv run python credentials-provider/token_refresher.py                    # Run with defaults
-    uv run python credentials-provider/token_refresher.py --interval 300     # Check every 5 minutes
+    uv run python credentials-provider/token_refresher.py --interval 300     # Scan at least every 5 minutes
+    uv run python credentials-provider/token_refresher.py --max-workers 8    # Refresh up to 8 tokens at a time
     uv run python credentials-provider/token_refresher.py --buffer 3600      # Refresh 1 hour before expiry
     uv run python credentials-provider/token_refresher.py --once             # Run once and exit
     uv run python credentials-provider/token_refresher.py --once --force     # Force refresh all tokens once and exit
@@ -17,6 +21,7 @@ Usage:
 
 import argparse
 import contextlib
+import heapq
 import json
 import logging
 import os
@@ -24,7 +29,11 @@ import signal
 import subprocess
 import sys
 import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 
 import psutil
@@ -64,6 +73,11 @@ def _load_env_file() -> None:
 # Configuration constants
 DEFAULT_CHECK_INTERVAL = 300  # 5 minutes in seconds
 DEFAULT_EXPIRY_BUFFER = 3600  # 1 hour buffer before expiry
+# The buffer is capped at this fraction of a token's lifetime, so a freshly refreshed
+# token that lives shorter than the buffer (e.g. 1h M2M tokens) is not due again at once.
+MAX_BUFFER_FRACTION = 0.5
+DEFAULT_MAX_WORKERS = 4  # Refreshes running at the same time
+DEFAULT_MAX_PER_PROVIDER = 1  # Refreshes running at the same time for one provider
 
 # Process management
 PIDFILE_NAME = "token_refresher.pid"
@@ -74,6 +88,15 @@ PROJECT_ROOT = SCRIPT_DIR.parent
 OAUTH_TOKENS_DIR = PROJECT_ROOT / ".oauth-tokens"
 CREDENTIALS_PROVIDER_DIR = SCRIPT_DIR
 
+# Generated MCP client configurations
+VSCODE_CONFIG_FILE = "vscode_mcp.json"
+ROOCODE_CONFIG_FILE = "mcp.json"
+DEFAULT_REGISTRY_URL = "https://mcpgateway.ddns.net"
+
+# Token files whose headers are added to every generated MCP server entry
+KEYCLOAK_AGENT_TOKEN_FILE = "agent-ai-coding-assistant-m2m-token.json"
+INGRESS_TOKEN_FILES = {"ingress.json", KEYCLOAK_AGENT_TOKEN_FILE}
+
 # Files to ignore during token refresh (derived files that get regenerated)
 IGNORED_FILES = {
     "mcp.json",
@@ -125,94 +148,141 @@ def _parse_token_file(filepath: Path) -> dict | None:
         return None
 
 
-def _get_all_tokens() -> list[tuple[Path, dict]]:
+def _parse_expires_at(expires_at, filename: str) -> float | None:
     """
-    Get all valid token files regardless of expiration status.
+    Convert an expires_at value (Unix timestamp or ISO 8601 string) to a Unix timestamp.
+
+    Args:
+        expires_at: Value of the expires_at field
+        filename: Token filename, for logging
 
     Returns:
-        List of (filepath, token_data) tuples for all valid tokens
+        Unix timestamp or None if the value cannot be parsed
     """
-    if not OAUTH_TOKENS_DIR.exists():
-        logger.error("OAuth tokens directory not found")
-        return []
-
-    all_tokens = []
+    if isinstance(expires_at, str):
+        try:
+            return datetime.fromisoformat(expires_at.replace("Z", "+00:00")).timestamp()
+        except ValueError as e:
+            logger.warning(f"Could not parse expires_at timestamp '{expires_at}' in {filename}: {e}")
+            return None
+    if isinstance(expires_at, int | float):
+        return float(expires_at)
+    logger.warning(f"Unsupported expires_at value '{expires_at}' in {filename}")
+    return None
 
-    for filepath in OAUTH_TOKENS_DIR.glob("*.json"):
-        # Skip ignored files
-        if _should_ignore_file(filepath.name):
-            logger.debug(f"Ignoring file: {filepath.name}")
-            continue
 
-        # Parse token file
-        token_data = _parse_token_file(filepath)
-        if not token_data:
-            continue
+@dataclass
+class _TokenEntry:
+    """A token file as last seen on disk."""
 
-        logger.info(f"Found token file: {filepath.name}")
-        logger.debug(f"Reading token from: {filepath.absolute()}")
-        all_tokens.append((filepath, token_data))
+    mtime_ns: int
+    size: int
+    token_data: dict | None
+    expires_at: float | None
 
-    return all_tokens
 
+class _TokenIndex:
+    """
+    In-memory index of the token files in OAUTH_TOKENS_DIR.
 
-def _get_expiring_tokens(buffer_seconds: int = DEFAULT_EXPIRY_BUFFER) -> list[tuple[Path, dict]]:
+    A scan stats every file but only re-reads and re-parses the ones whose
+    modification time or size changed since the previous scan.
     """
-    Find all tokens that are expired or will expire within the buffer period.
 
-    Args:
-        buffer_seconds: Number of seconds before expiry to trigger refresh
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._entries: dict[Path, _TokenEntry] = {}
+
+    def scan(self) -> set[Path]:
+        """
+        Bring the index up to date with the directory.
+
+        Returns:
+            Paths of the token files that were added, modified or removed
+        """
+        if not self.directory.exists():
+            logger.error(f"OAuth tokens directory not found: {self.directory}")
+            removed = set(self._entries)
+            self._entries.clear()
+            return removed
+
+        seen = set()
+        changed = set()
+        for filepath in self.directory.glob("*.json"):
+            if _should_ignore_file(filepath.name):
+                logger.debug(f"Ignoring file: {filepath.name}")
+                continue
+            try:
+                stat = filepath.stat()
+            except OSError:
+                continue
+            seen.add(filepath)
 
-    Returns:
-        List of (filepath, token_data) tuples for expiring tokens
-    """
-    if not OAUTH_TOKENS_DIR.exists():
-        logger.error(f"OAuth tokens directory not found: {OAUTH_TOKENS_DIR}")
-        return []
+            entry = self._entries.get(filepath)
+            if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                continue
 
-    current_time = time.time()
-    expiring_tokens = []
+            logger.debug(f"Reading token from: {filepath.absolute()}")
+            token_data = _parse_token_file(filepath)
+            expires_at = _parse_expires_at(token_data["expires_at"], filepath.name) if token_data else None
+            self._entries[filepath] = _TokenEntry(stat.st_mtime_ns, stat.st_size, token_data, expires_at)
+            changed.add(filepath)
 
-    for filepath in OAUTH_TOKENS_DIR.glob("*.json"):
-        # Skip ignored files
-        if _should_ignore_file(filepath.name):
-            logger.debug(f"Ignoring file: {filepath.name}")
-            continue
+        for filepath in set(self._entries) - seen:
+            del self._entries[filepath]
+            changed.add(filepath)
+        return changed
 
-        # Parse token file
-        token_data = _parse_token_file(filepath)
-        if not token_data:
-            continue
+    def get(self, filepath: Path) -> _TokenEntry | None:
+        return self._entries.get(filepath)
 
-        logger.debug(f"Reading token from: {filepath.absolute()}")
+    def tokens(self) -> list[tuple[Path, dict]]:
+        """All token files with a usable expires_at field."""
+        return [
+            (filepath, entry.token_data)
+            for filepath, entry in self._entries.items()
+            if entry.token_data and entry.expires_at is not None
+        ]
 
-        # Check expiration
-        expires_at = token_data.get("expires_at", 0)
 
-        # Convert ISO timestamp to Unix timestamp if needed
-        if isinstance(expires_at, str):
-            try:
-                from datetime import datetime
+class _RefreshSchedule:
+    """
+    Min-heap of the times at which tokens are due for refresh.
 
-                # Parse ISO timestamp and convert to Unix timestamp
-                expires_at_dt = datetime.fromisoformat(expires_at.replace("Z", "+00:00"))
-                expires_at = expires_at_dt.timestamp()
-            except (ValueError, AttributeError) as e:
-                logger.warning(f"Could not parse expires_at timestamp '{expires_at}' in {filepath.name}: {e}")
-                continue
+    Rescheduling a token pushes a new heap item; items whose time no longer
+    matches the token's current due time are dropped when they reach the top.
+    """
 
-        time_until_expiry = expires_at - current_time
+    def __init__(self):
+        self._heap: list[tuple[float, Path]] = []
+        self._due: dict[Path, float] = {}
 
-        if time_until_expiry <= buffer_seconds:
-            hours_until_expiry = time_until_expiry / 3600
-            if time_until_expiry <= 0:
-                logger.warning(f"Token EXPIRED: {filepath.name} (expired {-hours_until_expiry:.1f} hours ago)")
-            else:
-                logger.info(f"Token expiring soon: {filepath.name} (expires in {hours_until_expiry:.1f} hours)")
-            logger.debug(f"Will refresh token at: {filepath.absolute()}")
-            expiring_tokens.append((filepath, token_data))
+    def schedule(self, filepath: Path, due_at: float) -> None:
+        self._due[filepath] = due_at
+        heapq.heappush(self._heap, (due_at, filepath))
 
-    return expiring_tokens
+    def discard(self, filepath: Path) -> None:
+        self._due.pop(filepath, None)
+
+    def _drop_stale(self) -> None:
+        while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def next_due(self) -> float | None:
+        """Time at which the next token is due, or None if nothing is scheduled."""
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float) -> list[Path]:
+        """Remove and return every token due at or before now."""
+        due = []
+        self._drop_stale()
+        while self._heap and self._heap[0][0] <= now:
+            _, filepath = heapq.heappop(self._heap)
+            del self._due[filepath]
+            due.append(filepath)
+            self._drop_stale()
+        return due
 
 
 def _determine_refresh_method(token_data: dict, filename: str) -> str | None:
@@ -507,7 +577,7 @@ def _get_ingress_headers(ingress_file: Path) -> dict[str, str]:
 
     if auth_provider == "keycloak":
         # When using Keycloak, get token from agent token file
-        agent_token_file = OAUTH_TOKENS_DIR / "agent-ai-coding-assistant-m2m-token.json"
+        agent_token_file = OAUTH_TOKENS_DIR / KEYCLOAK_AGENT_TOKEN_FILE
         if agent_token_file.exists():
             try:
                 with open(agent_token_file) as f:
@@ -686,6 +756,33 @@ def _create_noauth_server_config(
     return server_key, server_config
 
 
+def _write_json_atomic(config_file: Path, data: dict) -> None:
+    """
+    Write JSON to a file readable only by the owner, replacing it atomically.
+
+    Args:
+        config_file: Destination path
+        data: JSON-serializable data
+    """
+    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json", dir=config_file.parent) as temp_file:
+        temp_path = temp_file.name
+        try:
+            json.dump(data, temp_file, indent=2)
+        except Exception:
+            temp_file.close()
+            with contextlib.suppress(OSError):
+                os.unlink(temp_path)
+            raise
+
+    try:
+        os.chmod(temp_path, 0o600)
+        os.replace(temp_path, config_file)
+    except Exception:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_path)
+        raise
+
+
 def _generate_vscode_config(
     has_ingress: bool, ingress_file: Path, egress_files: list[Path], noauth_services: list[dict] = None
 ) -> bool:
@@ -701,50 +798,42 @@ def _generate_vscode_config(
     Returns:
         True if generation successful, False otherwise
     """
-    config_file = OAUTH_TOKENS_DIR / "vscode_mcp.json"
+    config_file = OAUTH_TOKENS_DIR / VSCODE_CONFIG_FILE
 
     try:
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as temp_file:
-            temp_path = temp_file.name
-
-            # Default registry URL
-            registry_url = os.getenv("REGISTRY_URL", "https://mcpgateway.ddns.net")
-
-            # Initialize configuration
-            config = {"mcp": {"servers": {}}}
-
-            # Get ingress headers
-            ingress_headers = _get_ingress_headers(ingress_file) if has_ingress else {}
-
-            # Process egress files
-            for egress_file in egress_files:
-                server_key, server_config = _create_egress_server_config(
-                    egress_file, ingress_headers, registry_url, "vscode"
+        # Default registry URL
+        registry_url = os.getenv("REGISTRY_URL", DEFAULT_REGISTRY_URL)
+
+        # Initialize configuration
+        config = {"mcp": {"servers": {}}}
+
+        # Get ingress headers
+        ingress_headers = _get_ingress_headers(ingress_file) if has_ingress else {}
+
+        # Process egress files
+        for egress_file in egress_files:
+            server_key, server_config = _create_egress_server_config(
+                egress_file, ingress_headers, registry_url, "vscode"
+            )
+            if server_key and server_config:
+                config["mcp"]["servers"][server_key] = server_config
+                logger.debug(f"Added egress service {server_key} to VS Code config")
+
+        # Process no-auth services
+        if noauth_services:
+            for service in noauth_services:
+                server_key, server_config = _create_noauth_server_config(
+                    service, ingress_headers, registry_url, "vscode"
                 )
-                if server_key and server_config:
-                    config["mcp"]["servers"][server_key] = server_config
-                    logger.debug(f"Added egress service {server_key} to VS Code config")
-
-            # Process no-auth services
-            if noauth_services:
-                for service in noauth_services:
-                    server_key, server_config = _create_noauth_server_config(
-                        service, ingress_headers, registry_url, "vscode"
-                    )
-
-                    # Skip if already added or invalid
-                    if not server_key or server_key in config["mcp"]["servers"]:
-                        continue
 
-                    config["mcp"]["servers"][server_key] = server_config
-                    logger.debug(f"Added no-auth service {server_key} to VS Code config")
+                # Skip if already added or invalid
+                if not server_key or server_key in config["mcp"]["servers"]:
+                    continue
 
-            # Write JSON to temp file
-            json.dump(config, temp_file, indent=2)
+                config["mcp"]["servers"][server_key] = server_config
+                logger.debug(f"Added no-auth service {server_key} to VS Code config")
 
-        # Move temp file to final location and set permissions
-        os.rename(temp_path, config_file)
-        os.chmod(config_file, 0o600)
+        _write_json_atomic(config_file, config)
 
         logger.info(f"Generated VS Code MCP config: {config_file}")
         logger.debug(f"VS Code config written to: {config_file.absolute()}")
@@ -752,9 +841,6 @@ def _generate_vscode_config(
 
     except Exception as e:
         logger.error(f"Error generating VS Code MCP config: {e}")
-        if "temp_path" in locals():
-            with contextlib.suppress(BaseException):
-                os.unlink(temp_path)
         return False
 
 
@@ -773,50 +859,42 @@ def _generate_roocode_config(
     Returns:
         True if generation successful, False otherwise
     """
-    config_file = OAUTH_TOKENS_DIR / "mcp.json"
+    config_file = OAUTH_TOKENS_DIR / ROOCODE_CONFIG_FILE
 
     try:
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as temp_file:
-            temp_path = temp_file.name
-
-            # Default registry URL
-            registry_url = os.getenv("REGISTRY_URL", "https://mcpgateway.ddns.net")
-
-            # Initialize configuration
-            config = {"mcpServers": {}}
-
-            # Get ingress headers
-            ingress_headers = _get_ingress_headers(ingress_file) if has_ingress else {}
-
-            # Process egress files
-            for egress_file in egress_files:
-                server_key, server_config = _create_egress_server_config(
-                    egress_file, ingress_headers, registry_url, "roocode"
+        # Default registry URL
+        registry_url = os.getenv("REGISTRY_URL", DEFAULT_REGISTRY_URL)
+
+        # Initialize configuration
+        config = {"mcpServers": {}}
+
+        # Get ingress headers
+        ingress_headers = _get_ingress_headers(ingress_file) if has_ingress else {}
+
+        # Process egress files
+        for egress_file in egress_files:
+            server_key, server_config = _create_egress_server_config(
+                egress_file, ingress_headers, registry_url, "roocode"
+            )
+            if server_key and server_config:
+                config["mcpServers"][server_key] = server_config
+                logger.debug(f"Added egress service {server_key} to Roocode config")
+
+        # Process no-auth services
+        if noauth_services:
+            for service in noauth_services:
+                server_key, server_config = _create_noauth_server_config(
+                    service, ingress_headers, registry_url, "roocode"
                 )
-                if server_key and server_config:
-                    config["mcpServers"][server_key] = server_config
-                    logger.debug(f"Added egress service {server_key} to Roocode config")
-
-            # Process no-auth services
-            if noauth_services:
-                for service in noauth_services:
-                    server_key, server_config = _create_noauth_server_config(
-                        service, ingress_headers, registry_url, "roocode"
-                    )
-
-                    # Skip if already added or invalid
-                    if not server_key or server_key in config["mcpServers"]:
-                        continue
 
-                    config["mcpServers"][server_key] = server_config
-                    logger.debug(f"Added no-auth service {server_key} to Roocode config")
+                # Skip if already added or invalid
+                if not server_key or server_key in config["mcpServers"]:
+                    continue
 
-            # Write JSON to temp file
-            json.dump(config, temp_file, indent=2)
+                config["mcpServers"][server_key] = server_config
+                logger.debug(f"Added no-auth service {server_key} to Roocode config")
 
-        # Move temp file to final location and set permissions
-        os.rename(temp_path, config_file)
-        os.chmod(config_file, 0o600)
+        _write_json_atomic(config_file, config)
 
         logger.info(f"Generated Roocode MCP config: {config_file}")
         logger.debug(f"Roocode config written to: {config_file.absolute()}")
@@ -824,59 +902,234 @@ def _generate_roocode_config(
 
     except Exception as e:
         logger.error(f"Error generating Roocode MCP config: {e}")
-        if "temp_path" in locals():
-            with contextlib.suppress(BaseException):
-                os.unlink(temp_path)
         return False
 
 
-def _run_refresh_cycle(buffer_seconds: int = DEFAULT_EXPIRY_BUFFER, force_refresh: bool = False) -> None:
+def _update_mcp_configs(changed_files: set[Path]) -> bool:
     """
-    Run a single refresh cycle, checking and refreshing expiring tokens.
+    Update the MCP configuration files after the given token files changed.
+
+    Only the entries of changed egress tokens are rebuilt. Everything is
+    regenerated instead when the ingress token changed (its headers are part of
+    every entry), an egress token was removed or a configuration file is missing.
 
     Args:
-        buffer_seconds: Number of seconds before expiry to trigger refresh
-        force_refresh: If True, refresh all tokens regardless of expiration
+        changed_files: Token files that were added, modified or removed
+
+    Returns:
+        True if the configuration files are up to date, False otherwise
     """
-    logger.info("Starting token refresh cycle...")
-    logger.debug(f"Token directory: {OAUTH_TOKENS_DIR.absolute()}")
+    if any(filepath.name in INGRESS_TOKEN_FILES for filepath in changed_files):
+        logger.info("Ingress token changed, regenerating all MCP configuration entries")
+        return _regenerate_mcp_configs()
 
-    # Find expiring tokens
-    if force_refresh:
-        expiring_tokens = _get_all_tokens()
-        logger.info("Force refresh enabled - will refresh all tokens")
-    else:
-        expiring_tokens = _get_expiring_tokens(buffer_seconds)
+    egress_files = sorted(filepath for filepath in changed_files if filepath.name.endswith("-egress.json"))
+    if not egress_files:
+        logger.debug("No egress token changed, MCP configuration files are up to date")
+        return True
+    if not all(filepath.exists() for filepath in egress_files):
+        return _regenerate_mcp_configs()
 
-    if not expiring_tokens:
-        logger.info("No tokens need refreshing")
-        return
+    vscode_file = OAUTH_TOKENS_DIR / VSCODE_CONFIG_FILE
+    roocode_file = OAUTH_TOKENS_DIR / ROOCODE_CONFIG_FILE
+    try:
+        with open(vscode_file) as f:
+            vscode_config = json.load(f)
+        with open(roocode_file) as f:
+            roocode_config = json.load(f)
+        targets = [
+            (vscode_config["mcp"]["servers"], "vscode", vscode_file),
+            (roocode_config["mcpServers"], "roocode", roocode_file),
+        ]
+    except (OSError, json.JSONDecodeError, KeyError, TypeError) as e:
+        logger.info(f"Cannot update MCP configuration files in place ({e}), regenerating them")
+        return _regenerate_mcp_configs()
+
+    try:
+        ingress_file = OAUTH_TOKENS_DIR / "ingress.json"
+        ingress_headers = _get_ingress_headers(ingress_file) if ingress_file.exists() else {}
+        registry_url = os.getenv("REGISTRY_URL", DEFAULT_REGISTRY_URL)
 
-    logger.info(f"Found {len(expiring_tokens)} token(s) needing refresh")
+        for servers, config_type, _ in targets:
+            for egress_file in egress_files:
+                server_key, server_config = _create_egress_server_config(
+                    egress_file, ingress_headers, registry_url, config_type
+                )
+                if server_key and server_config:
+                    servers[server_key] = server_config
+                    logger.debug(f"Updated egress service {server_key} in {config_type} config")
 
-    # Refresh each expiring token
-    success_count = 0
-    for filepath, token_data in expiring_tokens:
-        logger.info(f"Attempting to refresh: {filepath.name}")
-        logger.debug(f"Processing token file: {filepath.absolute()}")
+        _write_json_atomic(vscode_file, vscode_config)
+        _write_json_atomic(roocode_file, roocode_config)
+        logger.info(f"Updated {len(egress_files)} egress entr{'y' if len(egress_files) == 1 else 'ies'} in MCP configs")
+        return True
 
-        if _refresh_token(filepath, token_data):
-            success_count += 1
-            logger.info(f"Token successfully updated at: {filepath.absolute()}")
-        else:
-            logger.error(f"Failed to refresh: {filepath.name}")
-            logger.error(f"Failed token location: {filepath.absolute()}")
+    except Exception as e:
+        logger.error(f"Error updating MCP configs: {e}")
+        return False
 
-    logger.info(f"Refresh cycle complete: {success_count}/{len(expiring_tokens)} tokens refreshed successfully")
 
-    # Regenerate MCP configuration files if any tokens were refreshed
-    if success_count > 0:
-        logger.info("Regenerating MCP configuration files after token refresh...")
-        if _regenerate_mcp_configs():
+class TokenRefresher:
+    """
+    Keeps the tokens in OAUTH_TOKENS_DIR fresh.
+
+    Token files are tracked by a _TokenIndex and their refresh times by a
+    _RefreshSchedule, so a cycle only re-reads files that changed and only
+    refreshes tokens that are due. Due tokens are refreshed concurrently, with
+    at most max_per_provider refreshes running for the same provider, and
+    only the MCP configuration entries of the token files that changed (refreshed
+    here or written by another process) are rewritten afterwards.
+    """
+
+    def __init__(
+        self,
+        buffer_seconds: int = DEFAULT_EXPIRY_BUFFER,
+        retry_seconds: int = DEFAULT_CHECK_INTERVAL,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_per_provider: int = DEFAULT_MAX_PER_PROVIDER,
+    ):
+        """
+        Args:
+            buffer_seconds: Number of seconds before expiry to trigger refresh
+            retry_seconds: Delay before a token whose refresh failed is tried again
+            max_workers: Maximum number of refreshes running at the same time
+            max_per_provider: Maximum number of refreshes running at the same time for one provider
+        """
+        self.buffer_seconds = buffer_seconds
+        self.retry_seconds = retry_seconds
+        self.max_workers = max(1, max_workers)
+        self.max_per_provider = max(1, max_per_provider)
+        self._index = _TokenIndex(OAUTH_TOKENS_DIR)
+        self._schedule = _RefreshSchedule()
+        self._provider_limits: dict[str, threading.Semaphore] = {}
+        self._provider_limits_lock = threading.Lock()
+        # Token files changed since the MCP configuration files were last brought up to date
+        self._config_changes: set[Path] = set()
+
+    def refresh_due_at(self, entry: _TokenEntry) -> float:
+        """
+        When a token is due for refresh: buffer_seconds before it expires, but no earlier
+        than MAX_BUFFER_FRACTION of its lifetime (counted from when its file was written).
+        """
+        lifetime = entry.expires_at - entry.mtime_ns / 1e9
+        buffer = min(self.buffer_seconds, max(lifetime, 0.0) * MAX_BUFFER_FRACTION)
+        return entry.expires_at - buffer
+
+    def _apply_changes(self, changed: set[Path]) -> None:
+        """Reschedule the token files that changed on disk."""
+        self._config_changes |= changed
+        for filepath in changed:
+            entry = self._index.get(filepath)
+            if entry is None or entry.token_data is None or entry.expires_at is None:
+                self._schedule.discard(filepath)
+                continue
+            logger.info(f"Found token file: {filepath.name}")
+            self._schedule.schedule(filepath, self.refresh_due_at(entry))
+
+    def _sync_mcp_configs(self) -> None:
+        """Bring the MCP configuration files up to date with every token file change seen so far."""
+        if not self._config_changes:
+            return
+        logger.info("Updating MCP configuration files after token file changes...")
+        if _update_mcp_configs(self._config_changes):
             logger.info("MCP configuration files updated successfully")
+            self._config_changes.clear()
         else:
             logger.error("Failed to update MCP configuration files")
 
+    def _provider_limit(self, token_data: dict, filename: str) -> threading.Semaphore:
+        provider = token_data.get("provider", "").lower() or _determine_refresh_method(token_data, filename) or ""
+        with self._provider_limits_lock:
+            if provider not in self._provider_limits:
+                self._provider_limits[provider] = threading.Semaphore(self.max_per_provider)
+            return self._provider_limits[provider]
+
+    def _refresh_one(self, filepath: Path, token_data: dict) -> bool:
+        with self._provider_limit(token_data, filepath.name):
+            logger.info(f"Attempting to refresh: {filepath.name}")
+            logger.debug(f"Processing token file: {filepath.absolute()}")
+            if _refresh_token(filepath, token_data):
+                logger.info(f"Token successfully updated at: {filepath.absolute()}")
+                return True
+            logger.error(f"Failed to refresh: {filepath.name}")
+            logger.error(f"Failed token location: {filepath.absolute()}")
+            return False
+
+    def _log_due(self, filepath: Path, now: float) -> None:
+        entry = self._index.get(filepath)
+        time_until_expiry = entry.expires_at - now
+        hours_until_expiry = time_until_expiry / 3600
+        if time_until_expiry <= 0:
+            logger.warning(f"Token EXPIRED: {filepath.name} (expired {-hours_until_expiry:.1f} hours ago)")
+        else:
+            logger.info(f"Token expiring soon: {filepath.name} (expires in {hours_until_expiry:.1f} hours)")
+        logger.debug(f"Will refresh token at: {filepath.absolute()}")
+
+    def run_cycle(self, force_refresh: bool = False) -> int:
+        """
+        Pick up token file changes, refresh the tokens that are due and update the MCP configs.
+
+        Args:
+            force_refresh: If True, refresh all tokens regardless of expiration
+
+        Returns:
+            Number of tokens refreshed successfully
+        """
+        logger.info("Starting token refresh cycle...")
+        logger.debug(f"Token directory: {OAUTH_TOKENS_DIR.absolute()}")
+        self._apply_changes(self._index.scan())
+
+        now = time.time()
+        if force_refresh:
+            logger.info("Force refresh enabled - will refresh all tokens")
+            due = [filepath for filepath, _ in self._index.tokens()]
+            for filepath in due:
+                self._schedule.discard(filepath)
+        else:
+            due = [filepath for filepath in self._schedule.pop_due(now) if self._index.get(filepath)]
+            for filepath in due:
+                self._log_due(filepath, now)
+
+        if not due:
+            logger.info("No tokens need refreshing")
+            self._sync_mcp_configs()
+            return 0
+
+        logger.info(f"Found {len(due)} token(s) needing refresh")
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(due)), thread_name_prefix="refresh") as pool:
+            results = list(
+                pool.map(lambda filepath: self._refresh_one(filepath, self._index.get(filepath).token_data), due)
+            )
+        success_count = sum(results)
+        logger.info(f"Refresh cycle complete: {success_count}/{len(due)} tokens refreshed successfully")
+
+        # Refreshed tokens are rescheduled from their new expires_at; tokens whose file did not
+        # change (failed refresh, or a script that wrote nothing) are retried after retry_seconds.
+        changed = self._index.scan()
+        self._apply_changes(changed)
+        retry_at = time.time() + self.retry_seconds
+        for filepath in due:
+            if filepath not in changed and self._index.get(filepath):
+                self._schedule.schedule(filepath, retry_at)
+
+        self._sync_mcp_configs()
+        return success_count
+
+    def seconds_until_next_refresh(self, max_seconds: float) -> float:
+        """
+        How long to sleep before the next cycle: until the next token is due, but at most max_seconds.
+
+        Args:
+            max_seconds: Upper bound, so that new token files are picked up regularly
+
+        Returns:
+            Number of seconds to sleep
+        """
+        next_due = self._schedule.next_due()
+        if next_due is None:
+            return max_seconds
+        return min(max_seconds, max(1.0, next_due - time.time()))
+
 
 def _get_pidfile_path() -> Path:
     """
@@ -994,12 +1247,15 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
-    # Run with default settings (check every 5 minutes, refresh 1 hour before expiry)
+    # Run with default settings (refresh 1 hour before expiry, scan for new tokens every 5 minutes)
     uv run python credentials-provider/token_refresher.py
 
-    # Check every 10 minutes
+    # Scan the token directory at least every 10 minutes
     uv run python credentials-provider/token_refresher.py --interval 600
 
+    # Refresh up to 8 tokens at a time, 2 per provider
+    uv run python credentials-provider/token_refresher.py --max-workers 8 --max-per-provider 2
+
     # Refresh tokens 2 hours before expiry
     uv run python credentials-provider/token_refresher.py --buffer 7200
 
@@ -1018,14 +1274,32 @@ Examples:
         "--interval",
         type=int,
         default=DEFAULT_CHECK_INTERVAL,
-        help=f"Check interval in seconds (default: {DEFAULT_CHECK_INTERVAL})",
+        help=f"Maximum seconds between token directory scans; also the retry delay after a failed refresh "
+        f"(default: {DEFAULT_CHECK_INTERVAL})",
     )
 
     parser.add_argument(
         "--buffer",
         type=int,
         default=DEFAULT_EXPIRY_BUFFER,
-        help=f"Refresh tokens this many seconds before expiry (default: {DEFAULT_EXPIRY_BUFFER})",
+        help=(
+            f"Refresh tokens this many seconds before expiry, at most half of their lifetime "
+            f"(default: {DEFAULT_EXPIRY_BUFFER})"
+        ),
+    )
+
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Maximum number of tokens refreshed at the same time (default: {DEFAULT_MAX_WORKERS})",
+    )
+
+    parser.add_argument(
+        "--max-per-provider",
+        type=int,
+        default=DEFAULT_MAX_PER_PROVIDER,
+        help=f"Maximum number of tokens of one provider refreshed at the same time (default: {DEFAULT_MAX_PER_PROVIDER})",
     )
 
     parser.add_argument("--once", action="store_true", help="Run once and exit (for testing)")
@@ -1073,6 +1347,7 @@ Examples:
     logger.info("=" * 60)
     logger.info("OAuth Token Refresher Service Starting")
     logger.info(f"Check interval: {args.interval} seconds")
+    logger.info(f"Refresh concurrency: {args.max_workers} (per provider: {args.max_per_provider})")
     logger.info(f"Expiry buffer: {args.buffer} seconds ({args.buffer / 3600:.1f} hours)")
     logger.info("OAuth tokens directory is configured")
     logger.info("=" * 60)
@@ -1082,18 +1357,26 @@ Examples:
         _setup_signal_handlers()
         _write_pidfile()
 
+    refresher = TokenRefresher(
+        buffer_seconds=args.buffer,
+        retry_seconds=args.interval,
+        max_workers=args.max_workers,
+        max_per_provider=args.max_per_provider,
+    )
+
     try:
         # Run once or continuously
         if args.once:
             logger.info("Running single refresh cycle...")
-            _run_refresh_cycle(args.buffer, args.force)
+            refresher.run_cycle(args.force)
         else:
             logger.info("Starting continuous monitoring...")
             while True:
                 try:
-                    _run_refresh_cycle(args.buffer, args.force)
-                    logger.info(f"Sleeping for {args.interval} seconds...")
-                    time.sleep(args.interval)
+                    refresher.run_cycle(args.force)
+                    sleep_seconds = args.interval if args.force else refresher.seconds_until_next_refresh(args.interval)
+                    logger.info(f"Sleeping for {sleep_seconds:.0f} seconds...")
+                    time.sleep(sleep_seconds)
                 except KeyboardInterrupt:
                     logger.info("Received interrupt signal, shutting down...")
                     break
@@ -0,0 +1,328 @@
+"""
+Logging setup shared by the registry and the auth server.
+
+Application code keeps logging through the standard library. configure_logging()
+puts three stages between the loggers and the output, all on a single handler so
+each runs once per record:
+
+- Sampling: INFO and DEBUG records of selected loggers are kept at a configured
+  rate (e.g. 1 in 10), decided before the message is formatted. WARNING and above
+  are always kept.
+- Redaction: credentials in the message (Authorization headers, bearer tokens,
+  API keys, passwords), in exception tracebacks and in structured ``extra``
+  fields are masked.
+- A queue: records are handed to a QueueHandler and formatted and written by a
+  QueueListener thread, so slow output never blocks the event loop.
+
+Hot paths should log with %-style arguments (``logger.debug("body: %s", body)``)
+so nothing is formatted for records that are filtered out. Fields passed with
+``extra=`` are appended to the line as ``key=value``.
+
+Levels and sample rates can be changed while running with update_logging().
+"""
+
+import atexit
+import itertools
+import logging
+import logging.handlers
+import queue
+import re
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any, TextIO
+
+DEFAULT_LOG_FORMAT = "%(asctime)s,p%(process)s,{%(name)s:%(lineno)d},%(levelname)s,%(message)s"
+
+REDACTED = "***"
+
+_SENSITIVE_NAME = r"[\w-]*(?:authorization|cookie|api[_-]?key|apikey|token|secret|password|passwd)[\w-]*"
+_SENSITIVE_KEY_RE = re.compile(rf"^{_SENSITIVE_NAME}$", re.IGNORECASE)
+# `key: value` / `key=value` / `"key": "value"` pairs, including a Bearer/Basic scheme before the value
+_SENSITIVE_PAIR_RE = re.compile(
+    rf"""(["']?\b{_SENSITIVE_NAME}["']?\s*[:=]\s*["']?)(?:(?:Bearer|Basic)\s+)?[^\s"',;&}}\]]+""",
+    re.IGNORECASE,
+)
+_CREDENTIAL_RE = re.compile(r"\b(Bearer|Basic)\s+[\w.~+/=-]+", re.IGNORECASE)
+
+_exception_formatter = logging.Formatter()
+
+# Attributes every LogRecord has; anything else on a record came from ``extra=``.
+_RECORD_ATTRS = frozenset(logging.LogRecord("", 0, "", 0, "", None, None).__dict__) | {"message", "asctime"}
+
+
+def redact_text(text: str) -> str:
+    """Mask credential values in free text."""
+    return _CREDENTIAL_RE.sub(rf"\1 {REDACTED}", _SENSITIVE_PAIR_RE.sub(rf"\1{REDACTED}", text))
+
+
+def _redact_value(key: str, value: Any) -> Any:
+    if _SENSITIVE_KEY_RE.match(key):
+        return REDACTED
+    if isinstance(value, str):
+        return redact_text(value)
+    if isinstance(value, Mapping):
+        return {k: _redact_value(str(k), v) for k, v in value.items()}
+    return value
+
+
+def _extra_fields(record: logging.LogRecord) -> Iterator[tuple[str, Any]]:
+    for key, value in record.__dict__.items():
+        if key not in _RECORD_ATTRS and not key.startswith("_"):
+            yield key, value
+
+
+def _to_level(level: str | int) -> int:
+    if isinstance(level, int):
+        return level
+    numeric = logging.getLevelName(level.strip().upper())
+    if not isinstance(numeric, int):
+        raise ValueError(f"Unknown log level: {level!r}")
+    return numeric
+
+
+def parse_logging_spec[T](spec: str, convert: Callable[[str], T]) -> dict[str, T]:
+    """
+    Parse a ``name=value,name=value`` setting, e.g. LOG_LEVELS or LOG_SAMPLING.
+
+    Raises:
+        ValueError: If an entry has no ``=`` or its value is rejected by ``convert``
+    """
+    parsed: dict[str, T] = {}
+    for entry in spec.split(","):
+        if not entry.strip():
+            continue
+        name, separator, value = entry.partition("=")
+        if not separator or not name.strip():
+            raise ValueError(f"Expected 'logger=value', got {entry.strip()!r}")
+        parsed[name.strip()] = convert(value.strip())
+    return parsed
+
+
+def parse_log_levels(spec: str) -> dict[str, str]:
+    """Parse LOG_LEVELS, e.g. ``registry.mcpgw=DEBUG,httpx=WARNING``."""
+    return parse_logging_spec(spec, lambda value: logging.getLevelName(_to_level(value)))
+
+
+def parse_sample_rates(spec: str) -> dict[str, float]:
+    """Parse LOG_SAMPLING, e.g. ``registry.mcpgw.tools.proxied=0.1``."""
+    return parse_logging_spec(spec, float)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep a fraction of the INFO and DEBUG records of selected loggers.
+
+    A rate applies to the named logger and its children; the longest matching name
+    wins. Sampling is deterministic: a rate of 0.1 keeps every 10th record of each
+    logger. Records at WARNING and above are never dropped.
+    """
+
+    def __init__(self, rates: Mapping[str, float] | None = None):
+        super().__init__()
+        self.set_rates(rates or {})
+
+    @property
+    def rates(self) -> dict[str, float]:
+        return dict(self._rates)
+
+    def set_rates(self, rates: Mapping[str, float]) -> None:
+        """
+        Replace all sample rates.
+
+        Raises:
+            ValueError: If a rate is outside [0, 1]
+        """
+        for name, rate in rates.items():
+            if not 0 <= rate <= 1:
+                raise ValueError(f"Sample rate for '{name}' must be in [0, 1], got {rate}")
+        # Replaced rather than mutated, so filter() running on another thread never sees a half-updated dict.
+        self._rates = dict(rates)
+        self._intervals: dict[str, int | None] = {}
+        self._counters: dict[str, itertools.count] = {}
+
+    def _interval(self, name: str) -> int | None:
+        """Keep every Nth record of a logger; 0 drops all, None keeps all."""
+        try:
+            return self._intervals[name]
+        except KeyError:
+            pass
+        rate = None
+        probe = name
+        while rate is None and probe:
+            rate = self._rates.get(probe)
+            probe = probe.rpartition(".")[0]
+        if rate is None or rate >= 1:
+            interval = None
+        else:
+            interval = round(1 / rate) if rate > 0 else 0
+        self._intervals[name] = interval
+        return interval
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self._rates:
+            return True
+        interval = self._interval(record.name)
+        if interval is None:
+            return True
+        if interval == 0:
+            return False
+        counter = self._counters.setdefault(record.name, itertools.count())
+        return next(counter) % interval == 0
+
+
+class RedactionFilter(logging.Filter):
+    """Mask credentials in the message, traceback and ``extra`` fields of each record, in place."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # Interpolate once here; later formatting reuses the result.
+        record.msg = redact_text(record.getMessage())
+        record.args = None
+        # Render the traceback now as well: formatters only render exc_info when exc_text is unset.
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+        if record.exc_text:
+            record.exc_text = redact_text(record.exc_text)
+        if record.stack_info:
+            record.stack_info = redact_text(record.stack_info)
+        for key, value in list(_extra_fields(record)):
+            setattr(record, key, _redact_value(key, value))
+        return True
+
+
+class StructuredFormatter(logging.Formatter):
+    """Formatter that appends the record's ``extra`` fields as ``key=value`` pairs."""
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        line = super().formatMessage(record)
+        fields = " ".join(f"{key}={value}" for key, value in _extra_fields(record))
+        return f"{line} {fields}" if fields else line
+
+
+_lock = threading.Lock()
+_sampling = SamplingFilter()
+_level_overrides: dict[str, str] = {}
+_listener: logging.handlers.QueueListener | None = None
+_atexit_registered = False
+
+
+def configure_logging(
+    level: str | int = "INFO",
+    fmt: str = DEFAULT_LOG_FORMAT,
+    *,
+    levels: Mapping[str, str] | None = None,
+    sample_rates: Mapping[str, float] | None = None,
+    redact: bool = True,
+    use_queue: bool = True,
+    stream: TextIO | None = None,
+) -> None:
+    """
+    Replace the root logger's handlers with the sampled, redacted, queued pipeline.
+
+    Safe to call again; the previous listener is flushed and stopped first.
+
+    Args:
+        level: Root log level
+        fmt: Format string for the output handler
+        levels: Per-logger level overrides, e.g. {"httpx": "WARNING"}
+        sample_rates: Per-logger sample rates for INFO/DEBUG records, e.g. {"registry.mcpgw": 0.1}
+        redact: Mask credentials in messages, tracebacks and ``extra`` fields
+        use_queue: Write from a background thread; False writes synchronously (e.g. for scripts)
+        stream: Output stream, stderr by default
+    """
+    global _listener, _atexit_registered
+
+    with _lock:
+        _stop_listener()
+
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+            handler.close()
+
+        output = logging.StreamHandler(stream)
+        output.setFormatter(StructuredFormatter(fmt))
+        handler: logging.Handler = output
+        if use_queue:
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+            _listener.start()
+            handler = logging.handlers.QueueHandler(log_queue)
+            if not _atexit_registered:
+                atexit.register(shutdown_logging)
+                _atexit_registered = True
+
+        _sampling.set_rates(sample_rates or {})
+        handler.addFilter(_sampling)
+        if redact:
+            handler.addFilter(RedactionFilter())
+        root.addHandler(handler)
+        root.setLevel(_to_level(level))
+
+        for name in _level_overrides:
+            logging.getLogger(name).setLevel(logging.NOTSET)
+        _level_overrides.clear()
+        _apply_levels(levels or {})
+
+
+def _apply_levels(levels: Mapping[str, str]) -> None:
+    for name, level in levels.items():
+        numeric = _to_level(level)
+        logging.getLogger(name).setLevel(numeric)
+        if numeric == logging.NOTSET:
+            _level_overrides.pop(name, None)
+        else:
+            _level_overrides[name] = logging.getLevelName(numeric)
+
+
+def update_logging(
+    level: str | None = None,
+    levels: Mapping[str, str] | None = None,
+    sample_rates: Mapping[str, float] | None = None,
+) -> dict[str, Any]:
+    """
+    Change logging at runtime, without touching the handlers.
+
+    Args:
+        level: New root level
+        levels: Per-logger levels to set; "NOTSET" removes an override
+        sample_rates: Replaces all sample rates ({} turns sampling off)
+
+    Returns:
+        The resulting configuration (see get_logging_state)
+
+    Raises:
+        ValueError: For an unknown level or a sample rate outside [0, 1]
+    """
+    with _lock:
+        # Validate everything before changing anything.
+        root_level = _to_level(level) if level is not None else None
+        for value in (levels or {}).values():
+            _to_level(value)
+        if sample_rates is not None:
+            _sampling.set_rates(sample_rates)
+        if root_level is not None:
+            logging.getLogger().setLevel(root_level)
+        _apply_levels(levels or {})
+    return get_logging_state()
+
+
+def get_logging_state() -> dict[str, Any]:
+    """Current root level, per-logger level overrides and sample rates."""
+    return {
+        "level": logging.getLevelName(logging.getLogger().level),
+        "levels": dict(_level_overrides),
+        "sample_rates": _sampling.rates,
+    }
+
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def shutdown_logging() -> None:
+    """Write out queued records and stop the listener thread."""
+    with _lock:
+        _stop_listener()
@@ -38,6 +38,9 @@ Additional Fields (stored at root level):
 - lastConnected: datetime (nullable) - Last successful connection timestamp
 - lastError: datetime (nullable) - Last error timestamp
 - errorMessage: string (nullable) - Last error message details
+- healthFingerprint: string (nullable) - Hash of server version, capabilities and tools seen by the last health refresh
+- vectorContentHash: string (nullable) - Content hash of the documents last synced to the vector DB
+- vectorMetadataHash: string (nullable) - Metadata hash of the documents last synced to the vector DB
 
 Key Principle:
 - Configuration Fields are stored in the config object
@@ -45,6 +48,8 @@ Key Principle:
 - numTools is a calculated field, not stored in the database
 """
 
+import hashlib
+import json
 import logging
 from datetime import datetime
 from typing import Any, ClassVar
@@ -60,6 +65,14 @@ from ..models.enums import FederationSource, ServerEntityType
 
 logger = logging.getLogger(__name__)
 
+# Metadata keys that only describe the collection or the entity; they never change for a document.
+_STATIC_METADATA_KEYS = ("collection", "entity_type")
+
+
+def compute_content_hash(text: str) -> str:
+    """Stable hash of the text a vector document is embedded from."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
 
 class ExtendedMCPServer(Document):
     """
@@ -147,6 +160,11 @@ class ExtendedMCPServer(Document):
     )
     lastError: datetime | None = Field(default=None, alias="lastError", description="Last error timestamp")
     errorMessage: str | None = Field(default=None, alias="errorMessage", description="Last error message details")
+    healthFingerprint: str | None = Field(
+        default=None,
+        alias="healthFingerprint",
+        description="Hash of server version, capabilities and tool list seen by the last health refresh",
+    )
 
     # Timestamps (auto-generated by Beanie)
     createdAt: datetime | None = Field(default=None, alias="createdAt")
@@ -158,6 +176,14 @@ class ExtendedMCPServer(Document):
     federationSyncedAt: datetime | None = None
     federationMetadata: dict[str, Any] | None = None
 
+    # Vector sync state (root level, written by MCPServerRepository.smart_sync)
+    vectorContentHash: str | None = Field(
+        default=None, alias="vectorContentHash", description="Content hash of the last synced vector documents"
+    )
+    vectorMetadataHash: str | None = Field(
+        default=None, alias="vectorMetadataHash", description="Metadata hash of the last synced vector documents"
+    )
+
     class Settings:
         name = "mcpservers"
         keep_nulls = False
@@ -290,6 +316,8 @@ class ExtendedMCPServer(Document):
         Returns:
             List of LangChain Documents (1 if no split needed, N if split)
         """
+        # Every chunk carries the hash of the whole entity, so syncs can tell unchanged entities apart.
+        metadata = {**metadata, "content_hash": compute_content_hash(content)}
         if len(content) <= chunking_config.max_chunk_size:
             return [LangChainDocument(page_content=content, metadata=metadata)]
 
@@ -318,6 +346,46 @@ class ExtendedMCPServer(Document):
         logger.info(f"Split into {len(chunks)} chunks")
         return docs
 
+    def vector_metadata(self) -> dict[str, Any]:
+        """
+        Metadata shared by all vector documents of this server.
+
+        These fields can be updated in place without re-embedding any document.
+        """
+        metadata = self._get_base_metadata(ServerEntityType.SERVER)
+        for key in _STATIC_METADATA_KEYS:
+            metadata.pop(key, None)
+        metadata["tags"] = list(self.tags or [])
+        return metadata
+
+    def compute_vector_hashes(self, chunking_config: ChunkingConfig | None = None) -> tuple[str, str]:
+        """
+        Hash the vector representation of this server without building any document.
+
+        Returns:
+            Tuple of (content_hash, metadata_hash). The content hash changes only when
+            some document would have to be re-embedded; the metadata hash changes when
+            vector_metadata() changes.
+        """
+        chunking_config = chunking_config or ChunkingConfig()
+        digest = hashlib.sha256(f"{chunking_config.max_chunk_size}:{chunking_config.chunk_overlap}".encode())
+
+        contents = [("server", self.serverName, self.generate_server_content())]
+        for tool_name, tool_data in self.config.get("toolFunctions", {}).items():
+            downstream_tool_name = tool_data.get("mcpToolName", tool_name)
+            contents.append(("tool", downstream_tool_name, self.generate_tool_content(downstream_tool_name, tool_data)))
+        for resource in self.config.get("resources", []):
+            contents.append(("resource", resource.get("name", ""), self.generate_resource_content(resource)))
+        for prompt in self.config.get("prompts", []):
+            contents.append(("prompt", prompt.get("name", ""), self.generate_prompt_content(prompt)))
+
+        for entity_type, name, content in contents:
+            digest.update(f"\x00{entity_type}\x00{name}\x00".encode())
+            digest.update(content.encode("utf-8"))
+
+        metadata_json = json.dumps(self.vector_metadata(), sort_keys=True, default=str)
+        return digest.hexdigest(), compute_content_hash(metadata_json)
+
     def generate_server_content(self) -> str:
         """
         Generate content for Server Overview document.
@@ -5,6 +5,7 @@ Contains MCP Server-specific vector database operations
 that don't belong in the generic Repository class.
 """
 
+import asyncio
 import logging
 from typing import Any
 
@@ -12,6 +13,7 @@ from langchain_core.documents import Document
 
 from ...models import ExtendedMCPServer
 from ...models.enums import ServerEntityType
+from ..batch_result import BatchResult
 from ..client import DatabaseClient
 from ..repository import Repository
 
@@ -108,14 +110,93 @@ class MCPServerRepository(Repository[ExtendedMCPServer]):
             # 3. Save server object to vector database
             doc_id = await self.asave(server)
             success = doc_id is not None
+            if not success:
+                await self._clear_vector_hashes(server)
 
             logger.info(f"Indexed server '{server_name}' (server_id: {server_id}):{'success' if success else 'failed'}")
             return {"indexed_tools": 1 if success else 0, "failed_tools": 0 if success else 1, "deleted": deleted}
 
         except Exception as e:
             logger.error(f"Full sync failed for server {server.serverName}: {e}", exc_info=True)
+            await self._clear_vector_hashes(server)
             return None
 
+    async def bulk_sync_servers(
+        self,
+        servers: list[ExtendedMCPServer],
+        batch_size: int = 64,
+        max_concurrency: int = 2,
+    ) -> BatchResult:
+        """
+        Full rebuild of many servers at once.
+
+        Old records of all servers are deleted with a single filter, then the documents
+        of every server are written in batches of batch_size documents, with at most
+        max_concurrency batches in flight. The embedding provider receives whole
+        batches instead of one server's documents per call.
+
+        Args:
+            servers: ExtendedMCPServer objects from MongoDB
+            batch_size: Documents per add_documents (and embedding) call
+            max_concurrency: Maximum concurrent add_documents calls
+
+        The recorded vector hashes of failed servers are cleared, since their old
+        records are gone.
+
+        Returns:
+            BatchResult counting servers; a server fails if any batch holding its documents failed
+        """
+        if not servers:
+            return BatchResult(total=0, successful=0, failed=0, errors=[])
+
+        collection_existed = self.adapter.collection_exists(self.collection)
+        await self.ensure_collection()
+
+        server_ids = [str(server.id) for server in servers if server.id]
+        if server_ids and collection_existed and self.adapter.has_property(self.collection, "server_id"):
+            deleted = await self.adelete_by_filter({"server_id": {"$in": server_ids}})
+            logger.info(f"Deleted {deleted} old record(s) for {len(server_ids)} server(s)")
+
+        errors: list[dict[str, Any]] = []
+        failed: set[int] = set()
+        docs: list[tuple[int, Document]] = []
+        for position, server in enumerate(servers):
+            try:
+                docs.extend((position, doc) for doc in server.to_documents())
+            except Exception as e:
+                logger.error(f"Failed to build documents for server {server.serverName}: {e}", exc_info=True)
+                failed.add(position)
+                errors.append({"server_name": server.serverName, "error": str(e)})
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        batch_size = max(1, batch_size)
+
+        async def add_batch(batch: list[tuple[int, Document]]):
+            async with semaphore:
+                try:
+                    ids = await asyncio.to_thread(
+                        self.adapter.add_documents,
+                        documents=[doc for _, doc in batch],
+                        collection_name=self.collection,
+                    )
+                    if len(ids or []) < len(batch):
+                        raise RuntimeError(f"Only {len(ids or [])} of {len(batch)} document(s) were written")
+                except Exception as e:
+                    logger.error(f"Failed to index a batch of {len(batch)} document(s): {e}", exc_info=True)
+                    positions = {position for position, _ in batch}
+                    failed.update(positions)
+                    errors.extend({"server_name": servers[i].serverName, "error": str(e)} for i in sorted(positions))
+
+        await asyncio.gather(*(add_batch(docs[i : i + batch_size]) for i in range(0, len(docs), batch_size)))
+        for position in sorted(failed):
+            await self._clear_vector_hashes(servers[position])
+
+        result = BatchResult(
+            total=len(servers), successful=len(servers) - len(failed), failed=len(failed), errors=errors
+        )
+        logger.info(f"Bulk indexed {len(docs)} document(s) for {len(servers)} server(s): {result}")
+        return result
+
     async def get_by_server_id(self, server_id: str) -> ExtendedMCPServer | None:
         """
         Get server by MongoDB server_id (stored in metadata).
@@ -133,6 +214,29 @@ class MCPServerRepository(Repository[ExtendedMCPServer]):
             logger.error(f"Get by server_id failed: {e}")
             return None
 
+    async def get_indexed_server_ids(self, server_ids: list[str]) -> set[str]:
+        """
+        Which of the given servers already have a server document in the vector DB.
+
+        Answers for a whole page of servers with one metadata query instead of one
+        get_by_server_id call per server.
+
+        Args:
+            server_ids: MongoDB _ids as strings
+
+        Returns:
+            The subset of server_ids that are indexed
+        """
+        if not server_ids:
+            return set()
+        docs = await asyncio.to_thread(
+            self.adapter.filter_by_metadata,
+            filters={"server_id": {"$in": server_ids}, "entity_type": ServerEntityType.SERVER.value},
+            limit=len(server_ids),
+            collection_name=self.collection,
+        )
+        return {doc.metadata.get("server_id") for doc in docs} & set(server_ids)
+
     async def get_all_docs_by_server_id(self, server_id: str) -> dict[str, list[Any]]:
         """
         Get all vector documents (server, tools, resources, prompts) by server_id.
@@ -183,12 +287,18 @@ class MCPServerRepository(Repository[ExtendedMCPServer]):
         Smart incremental sync with fine-grained comparison by entity type.
 
         Strategy:
-        1. Generate new documents from server (grouped by entity type)
-        2. For each entity type (SERVER, TOOL, RESOURCE, PROMPT):
+        1. Compare the server's content and metadata hashes with the ones recorded at
+           the last sync (vectorContentHash / vectorMetadataHash on the MongoDB document).
+           If the content hash matches and the server document is still in Weaviate:
+           - Metadata unchanged too: nothing to do
+           - Only metadata changed: update metadata in place, no re-embedding
+        2. Otherwise generate new documents from server (grouped by entity type)
+        3. For each entity type (SERVER, TOOL, RESOURCE, PROMPT):
            - Query existing docs in Weaviate
-           - Compare with new docs
-           - Determine if content changed or only metadata changed
+           - Compare with new docs by their content_hash metadata
            - Update accordingly (delete+add for content changes, update for metadata only)
+        4. Record the new hashes on the MongoDB document once every write succeeded;
+           a failed sync clears them so the next one compares documents again
 
         Args:
             server: Server instance from MongoDB
@@ -196,12 +306,24 @@ class MCPServerRepository(Repository[ExtendedMCPServer]):
         Returns:
             True if sync successful, False otherwise
         """
-        await self.ensure_collection()
-
         server_id = str(server.id)
         server_name = server.serverName
 
         try:
+            content_hash, metadata_hash = server.compute_vector_hashes()
+            if server.vectorContentHash == content_hash and await self._has_server_document(server_id):
+                if server.vectorMetadataHash == metadata_hash:
+                    logger.debug(f"Vector documents of '{server_name}' are up to date, skipping sync")
+                    return True
+
+                logger.info(f"Only metadata changed for '{server_name}', updating it without re-embedding")
+                await self.ensure_collection()
+                if not await self._update_metadata_only(server, server_id):
+                    return False
+                await self._record_vector_hashes(server, content_hash, metadata_hash)
+                return True
+
+            await self.ensure_collection()
             new_docs = server.to_documents()
             new_docs_by_type = self._group_docs_by_entity_type(new_docs)
 
@@ -234,15 +356,12 @@ class MCPServerRepository(Repository[ExtendedMCPServer]):
                 elif not existing_docs and new_docs_for_type:
                     # No existing, has new: add all
                     logger.info(f"Adding {len(new_docs_for_type)} new {entity_type_value} docs")
-                    new_ids = self.adapter.add_documents(documents=new_docs_for_type, collection_name=self.collection)
-                    total_added += len(new_ids) if new_ids else 0
+                    total_added += self._add_documents(new_docs_for_type)
 
                 elif existing_docs and not new_docs_for_type:
                     # Has existing, no new: delete all
                     logger.info(f"Deleting {len(existing_docs)} removed {entity_type_value} docs")
-                    doc_ids_to_delete = [doc.id for doc in existing_docs]
-                    self.adapter.delete(ids=doc_ids_to_delete, collection_name=self.collection)
-                    total_deleted += len(doc_ids_to_delete)
+                    total_deleted += self._delete_documents([doc.id for doc in existing_docs])
 
                 else:
                     # Both exist: compare and update
@@ -250,6 +369,7 @@ class MCPServerRepository(Repository[ExtendedMCPServer]):
                         entity_type_value,
                         existing_docs,
                         new_docs_for_type,
+                        server.vector_metadata(),
                     )
                     total_added += added
                     total_deleted += deleted
@@ -259,10 +379,12 @@ class MCPServerRepository(Repository[ExtendedMCPServer]):
                 f"Smart sync completed for '{server_name}': "
                 f"added={total_added}, deleted={total_deleted}, updated={total_updated}"
             )
+            await self._record_vector_hashes(server, content_hash, metadata_hash)
             return True
 
         except Exception as e:
             logger.error(f"Smart sync failed for '{server_name}' (ID: {server_id}): {e}", exc_info=True)
+            await self._clear_vector_hashes(server)
             return False
 
     def _group_docs_by_entity_type(self, docs: list[Any]) -> dict[str, list[Any]]:
@@ -291,6 +413,7 @@ class MCPServerRepository(Repository[ExtendedMCPServer]):
         entity_type: str,
         existing_docs: list[Any],
         new_docs: list[Any],
+        metadata: dict[str, Any],
     ) -> tuple[int, int, int]:
         """
         Sync a specific entity type by comparing existing and new docs.
@@ -299,6 +422,7 @@ class MCPServerRepository(Repository[ExtendedMCPServer]):
             entity_type: Entity type (server, tool, resource, prompt)
             existing_docs: Existing documents from Weaviate
             new_docs: New documents to sync
+            metadata: Server metadata that can be updated without re-embedding
 
         Returns:
             Tuple of (added_count, deleted_count, updated_count)
@@ -321,19 +445,15 @@ class MCPServerRepository(Repository[ExtendedMCPServer]):
                 new_doc = new_map[key]
 
                 # Check if content changed
-                if old_doc.page_content != new_doc.page_content:
+                if self._content_changed(old_doc, new_doc):
                     # Content changed: delete old and add new
                     to_delete.append(old_doc.id)
                     to_add.append(new_doc)
                     logger.debug(f"[{entity_type}] Content changed for {key}, will re-register")
-                else:
-                    # Content unchanged, check metadata
-                    old_meta = {k: v for k, v in old_doc.metadata.items() if k in ["scope", "enabled"]}
-                    new_meta = {k: v for k, v in new_doc.metadata.items() if k in ["scope", "enabled"]}
-
-                    if old_meta != new_meta:
-                        to_update_metadata.append((old_doc.id, new_meta))
-                        logger.debug(f"[{entity_type}] Metadata changed for {key}, will update")
+                elif any((old_doc.metadata.get(k) or None) != (v or None) for k, v in metadata.items()):
+                    # Content unchanged, metadata changed
+                    to_update_metadata.append((old_doc.id, metadata))
+                    logger.debug(f"[{entity_type}] Metadata changed for {key}, will update")
 
         # Check for new documents
         for key, new_doc in new_map.items():
@@ -347,13 +467,11 @@ class MCPServerRepository(Repository[ExtendedMCPServer]):
         updated_count = 0
 
         if to_delete:
-            self.adapter.delete(ids=to_delete, collection_name=self.collection)
-            deleted_count = len(to_delete)
+            deleted_count = self._delete_documents(to_delete)
             logger.info(f"[{entity_type}] Deleted {deleted_count} documents")
 
         if to_add:
-            new_ids = self.adapter.add_documents(documents=to_add, collection_name=self.collection)
-            added_count = len(new_ids) if new_ids else 0
+            added_count = self._add_documents(to_add)
             logger.info(f"[{entity_type}] Added {added_count} documents")
 
         if to_update_metadata:
@@ -368,15 +486,67 @@ class MCPServerRepository(Repository[ExtendedMCPServer]):
 
         return added_count, deleted_count, updated_count
 
+    @staticmethod
+    def _content_changed(old_doc: Document, new_doc: Document) -> bool:
+        """Compare content hashes; documents written before hashes existed fall back to their text."""
+        old_hash = old_doc.metadata.get("content_hash")
+        if old_hash:
+            return old_hash != new_doc.metadata.get("content_hash")
+        return old_doc.page_content != new_doc.page_content
+
+    def _add_documents(self, docs: list[Document]) -> int:
+        """Write documents, raising unless every one of them was written."""
+        new_ids = self.adapter.add_documents(documents=docs, collection_name=self.collection) or []
+        if len(new_ids) < len(docs):
+            raise RuntimeError(f"Only {len(new_ids)} of {len(docs)} document(s) were written")
+        return len(new_ids)
+
+    def _delete_documents(self, doc_ids: list[str]) -> int:
+        """Delete documents, raising if the adapter reports a failure."""
+        if self.adapter.delete(ids=doc_ids, collection_name=self.collection) is False:
+            raise RuntimeError(f"Failed to delete {len(doc_ids)} document(s)")
+        return len(doc_ids)
+
+    async def _has_server_document(self, server_id: str) -> bool:
+        """Whether the server document is in Weaviate, so recorded hashes survive a reset or an outside delete."""
+        try:
+            docs = await asyncio.to_thread(
+                self.adapter.filter_by_metadata,
+                filters={"server_id": server_id, "entity_type": ServerEntityType.SERVER.value},
+                limit=1,
+                collection_name=self.collection,
+            )
+        except Exception as e:
+            logger.warning(f"Could not check vector documents of server {server_id}: {e}")
+            return False
+        return bool(docs)
+
+    async def _record_vector_hashes(
+        self, server: ExtendedMCPServer, content_hash: str | None, metadata_hash: str | None
+    ) -> None:
+        """Store the hashes of the synced documents on the MongoDB document."""
+        try:
+            await server.set({"vectorContentHash": content_hash, "vectorMetadataHash": metadata_hash})
+        except Exception as e:
+            # The next sync falls back to comparing documents, so this only costs a Weaviate round trip.
+            logger.warning(f"Failed to record vector hashes for '{server.serverName}': {e}")
+
+    async def _clear_vector_hashes(self, server: ExtendedMCPServer) -> None:
+        """Forget the recorded hashes after a failed write, so the next sync does not skip the server."""
+        if server.id and (server.vectorContentHash or server.vectorMetadataHash):
+            await self._record_vector_hashes(server, None, None)
+
     def build_doc_map(self, docs: list[Document]) -> dict[str, Document]:
         """
         Build a lookup map for documents using entity_type and entity name as key.
 
+        Chunks of a split document get the chunk index as a third key element.
+
         Args:
             docs: List of LangChain Documents
 
         Returns:
-            Dict mapping (entity_type, entity_name) to document
+            Dict mapping (entity_type, entity_name[, chunk_index]) to document
         """
         doc_map = {}
         for doc in docs:
@@ -395,6 +565,9 @@ class MCPServerRepository(Repository[ExtendedMCPServer]):
                 logger.warning(f"Unknown entity_type: {entity_type}")
                 continue
 
+            if doc.metadata.get("is_chunked"):
+                key += (doc.metadata.get("chunk_index", 0),)
+
             doc_map[key] = doc
 
         return doc_map
@@ -413,9 +586,7 @@ class MCPServerRepository(Repository[ExtendedMCPServer]):
             True if all updates successful
         """
         try:
-            new_metadata = {
-                "enabled": server.config.get("enabled", False) if server.config else False,
-            }
+            new_metadata = server.vector_metadata()
 
             total_success = 0
             total_count = 0
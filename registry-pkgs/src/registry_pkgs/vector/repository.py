@@ -226,6 +226,9 @@ class Repository[T: VectorStorable]:
         """
         Full update: delete all old docs and save new ones (fallback strategy).
 
+        Skipped when the new documents match the existing ones by content_hash and
+        metadata, so nothing is re-embedded.
+
         Args:
             instance: Model instance
             existing_docs: Existing vector documents
@@ -234,19 +237,44 @@ class Repository[T: VectorStorable]:
             True if update successful
         """
         try:
+            new_docs = instance.to_documents()
+            if self._docs_unchanged(existing_docs, new_docs):
+                logger.info(f"{len(new_docs)} documents unchanged, skipping full update")
+                return True
+
             # Delete all old documents
             old_ids = [doc.id for doc in existing_docs]
             self.adapter.delete(ids=old_ids, collection_name=self.collection)
             logger.info(f"Deleted {len(old_ids)} old documents (full update)")
 
             # Save new documents
-            new_ids = self.save(instance)
+            new_ids = self.adapter.add_documents(documents=new_docs, collection_name=self.collection)
             return new_ids is not None and len(new_ids) > 0
 
         except Exception as e:
             logger.error(f"Full update failed: {e}", exc_info=True)
             return False
 
+    def _docs_unchanged(self, existing_docs: list[Document], new_docs: list[Document]) -> bool:
+        """
+        Check whether existing documents already match the new ones.
+
+        Documents match when both sets have the same keys and every pair has the same
+        content_hash and metadata. Documents without a content_hash never match.
+        """
+        existing_map = self.build_doc_map(existing_docs)
+        new_map = self.build_doc_map(new_docs)
+        if existing_map.keys() != new_map.keys():
+            return False
+
+        for key, new_doc in new_map.items():
+            old_metadata = existing_map[key].metadata
+            if not old_metadata.get("content_hash"):
+                return False
+            if any(old_metadata.get(k) != v for k, v in new_doc.metadata.items() if k != "collection"):
+                return False
+        return True
+
     def build_doc_map(self, docs: list[Document]) -> dict[str, Document]:
         """
         Build lookup map for documents by unique key.
@@ -0,0 +1,198 @@
+"""Unit tests for registry_pkgs.core.logging_config module."""
+
+import io
+import logging
+import sys
+
+import pytest
+
+from registry_pkgs.core.logging_config import (
+    RedactionFilter,
+    SamplingFilter,
+    StructuredFormatter,
+    configure_logging,
+    get_logging_state,
+    parse_log_levels,
+    parse_sample_rates,
+    redact_text,
+    shutdown_logging,
+    update_logging,
+)
+
+
+def _record(name: str = "app", level: int = logging.INFO, msg: str = "hello", args=None, **extra):
+    record = logging.LogRecord(name, level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.fixture
+def restore_logging():
+    """Put the root logger back the way the test runner configured it."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    shutdown_logging()
+    update_logging(sample_rates={}, levels=dict.fromkeys(get_logging_state()["levels"], "NOTSET"))
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+class TestSamplingFilter:
+    def test_keeps_one_in_n_records(self):
+        sampling = SamplingFilter({"app.hot": 0.25})
+
+        kept = [sampling.filter(_record("app.hot")) for _ in range(8)]
+
+        assert kept == [True, False, False, False] * 2
+
+    def test_longest_prefix_wins_and_children_inherit(self):
+        sampling = SamplingFilter({"app": 0.0, "app.hot.quiet": 1.0})
+
+        assert not sampling.filter(_record("app.hot"))
+        assert sampling.filter(_record("app.hot.quiet.child"))
+        assert sampling.filter(_record("other"))
+
+    def test_never_drops_warnings(self):
+        sampling = SamplingFilter({"app": 0.0})
+
+        assert sampling.filter(_record("app", logging.WARNING))
+        assert sampling.filter(_record("app", logging.ERROR))
+        assert not sampling.filter(_record("app", logging.DEBUG))
+
+    def test_rejects_rates_outside_unit_interval(self):
+        with pytest.raises(ValueError, match="must be in"):
+            SamplingFilter({"app": 1.5})
+
+
+class TestRedaction:
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Authorization: Bearer abc.def", "Authorization: ***"),
+            ("sent Bearer abc.def upstream", "sent Bearer *** upstream"),
+            ("{'x-api-key': 'k1', 'accept': 'json'}", "{'x-api-key': '***', 'accept': 'json'}"),
+            ('{"client_secret": "s3"}', '{"client_secret": "***"}'),
+            ("password=hunter2&user=bob", "password=***&user=bob"),
+            ("nothing to hide", "nothing to hide"),
+        ],
+    )
+    def test_redact_text(self, text, expected):
+        assert redact_text(text) == expected
+
+    def test_filter_redacts_interpolated_message_once(self):
+        record = _record(msg="headers: %s", args=({"Authorization": "Basic dXNlcg=="},))
+
+        RedactionFilter().filter(record)
+
+        assert record.getMessage() == "headers: {'Authorization': '***'}"
+        assert record.args is None
+
+    def test_filter_redacts_extra_fields(self):
+        record = _record(token="abc", headers={"Cookie": "sid=1", "Accept": "json"}, note="Bearer xyz")
+
+        RedactionFilter().filter(record)
+
+        assert record.token == "***"
+        assert record.headers == {"Cookie": "***", "Accept": "json"}
+        assert record.note == "Bearer ***"
+
+    def test_filter_redacts_exception_text(self):
+        try:
+            raise ValueError("upstream rejected Authorization: Bearer abc.def")
+        except ValueError:
+            record = logging.LogRecord("app", logging.ERROR, __file__, 1, "call failed", None, sys.exc_info())
+
+        RedactionFilter().filter(record)
+        line = StructuredFormatter("%(message)s").format(record)
+
+        assert "abc.def" not in line
+        assert "ValueError: upstream rejected Authorization: ***" in line
+
+
+class TestStructuredFormatter:
+    def test_appends_extra_fields(self):
+        formatter = StructuredFormatter("%(levelname)s %(message)s")
+
+        line = formatter.format(_record(msg="tool %s", args=("search",), server="s1", user_id=7))
+
+        assert line == "INFO tool search server=s1 user_id=7"
+
+    def test_plain_records_are_unchanged(self):
+        assert StructuredFormatter("%(message)s").format(_record()) == "hello"
+
+
+class TestParsing:
+    def test_parse_log_levels(self):
+        assert parse_log_levels(" registry.mcpgw=debug, httpx=WARNING ,") == {
+            "registry.mcpgw": "DEBUG",
+            "httpx": "WARNING",
+        }
+
+    def test_parse_sample_rates(self):
+        assert parse_sample_rates("a.b=0.1") == {"a.b": 0.1}
+        assert parse_sample_rates("") == {}
+
+    @pytest.mark.parametrize("spec", ["registry.mcpgw", "=DEBUG", "app=LOUD"])
+    def test_rejects_malformed_entries(self, spec):
+        with pytest.raises(ValueError):
+            parse_log_levels(spec)
+
+
+@pytest.mark.usefixtures("restore_logging")
+class TestConfigureLogging:
+    def test_queue_delivers_sampled_and_redacted_records(self):
+        stream = io.StringIO()
+        configure_logging("INFO", "%(name)s %(message)s", sample_rates={"hot": 0.5}, stream=stream)
+
+        for i in range(4):
+            logging.getLogger("hot").info("call %d token=%s", i, "t0k3n")
+        logging.getLogger("hot").warning("slow", extra={"ms": 12})
+        shutdown_logging()
+
+        assert stream.getvalue().splitlines() == [
+            "hot call 0 token=***",
+            "hot call 2 token=***",
+            "hot slow ms=12",
+        ]
+
+    def test_queue_redacts_logged_exceptions(self):
+        stream = io.StringIO()
+        configure_logging("INFO", "%(message)s", stream=stream)
+
+        try:
+            raise RuntimeError("token=t0k3n")
+        except RuntimeError:
+            logging.getLogger("app").exception("request failed")
+        shutdown_logging()
+
+        assert "t0k3n" not in stream.getvalue()
+        assert "RuntimeError: token=***" in stream.getvalue()
+
+    def test_synchronous_mode_writes_immediately(self):
+        stream = io.StringIO()
+        configure_logging("INFO", "%(message)s", use_queue=False, redact=False, stream=stream)
+
+        logging.getLogger("app").info("token=%s", "visible")
+
+        assert stream.getvalue() == "token=visible\n"
+
+    def test_update_logging_at_runtime(self):
+        configure_logging("INFO", levels={"noisy": "WARNING"}, stream=io.StringIO())
+
+        state = update_logging(level="DEBUG", levels={"noisy": "NOTSET", "chatty": "ERROR"}, sample_rates={"a": 0.1})
+
+        assert state == {"level": "DEBUG", "levels": {"chatty": "ERROR"}, "sample_rates": {"a": 0.1}}
+        assert logging.getLogger("noisy").level == logging.NOTSET
+        assert logging.getLogger("chatty").level == logging.ERROR
+
+    def test_invalid_update_changes_nothing(self):
+        configure_logging("INFO", stream=io.StringIO())
+
+        with pytest.raises(ValueError):
+            update_logging(level="DEBUG", levels={"app": "LOUD"})
+
+        assert get_logging_state()["level"] == "INFO"
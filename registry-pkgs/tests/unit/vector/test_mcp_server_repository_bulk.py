@@ -0,0 +1,81 @@
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.documents import Document
+
+from registry_pkgs.vector.repositories.mcp_server_repository import MCPServerRepository
+
+
+class FakeAdapter:
+    def __init__(self, fail_on: str | None = None):
+        self.fail_on = fail_on
+        self.batches: list[list[str]] = []
+        self.deleted_filters: list[dict] = []
+        self.indexed: list[Document] = []
+        self.filter_calls: list[dict] = []
+
+    def collection_exists(self, collection_name):
+        return True
+
+    def has_property(self, collection_name, property_name):
+        return True
+
+    def get_vector_store(self, collection_name):
+        return object()
+
+    def delete_by_filter(self, filters, collection_name=None):
+        self.deleted_filters.append(filters)
+        return 0
+
+    def filter_by_metadata(self, filters, limit, collection_name=None):
+        self.filter_calls.append(filters)
+        wanted = set(filters["server_id"]["$in"])
+        return [doc for doc in self.indexed if doc.metadata["server_id"] in wanted][:limit]
+
+    def add_documents(self, documents, collection_name=None):
+        names = [doc.metadata["server_name"] for doc in documents]
+        if self.fail_on in names:
+            raise RuntimeError("embedding provider error")
+        self.batches.append(names)
+        return [f"id-{i}" for i in range(len(documents))]
+
+
+def make_server(server_id: str, num_docs: int):
+    docs = [Document(page_content=f"{server_id} {i}", metadata={"server_name": server_id}) for i in range(num_docs)]
+    return SimpleNamespace(
+        id=server_id, serverName=server_id, vectorContentHash=None, vectorMetadataHash=None, to_documents=lambda: docs
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_sync_writes_documents_in_batches():
+    adapter = FakeAdapter()
+    repo = MCPServerRepository(SimpleNamespace(adapter=adapter))
+
+    result = await repo.bulk_sync_servers([make_server("a", 3), make_server("b", 2)], batch_size=2)
+
+    assert sorted(len(batch) for batch in adapter.batches) == [1, 2, 2]
+    assert adapter.deleted_filters == [{"server_id": {"$in": ["a", "b"]}}]
+    assert (result.total, result.successful, result.failed) == (2, 2, 0)
+
+
+@pytest.mark.asyncio
+async def test_bulk_sync_marks_servers_of_failed_batches():
+    adapter = FakeAdapter(fail_on="b")
+    repo = MCPServerRepository(SimpleNamespace(adapter=adapter))
+
+    result = await repo.bulk_sync_servers([make_server("a", 2), make_server("b", 1)], batch_size=2)
+
+    assert (result.successful, result.failed) == (1, 1)
+    assert result.errors[0]["server_name"] == "b"
+
+
+@pytest.mark.asyncio
+async def test_get_indexed_server_ids_uses_one_query():
+    adapter = FakeAdapter()
+    adapter.indexed = [Document(page_content="", metadata={"server_id": server_id}) for server_id in ("a", "c")]
+    repo = MCPServerRepository(SimpleNamespace(adapter=adapter))
+
+    assert await repo.get_indexed_server_ids(["a", "b", "c"]) == {"a", "c"}
+    assert await repo.get_indexed_server_ids([]) == set()
+    assert adapter.filter_calls == [{"server_id": {"$in": ["a", "b", "c"]}, "entity_type": "server"}]
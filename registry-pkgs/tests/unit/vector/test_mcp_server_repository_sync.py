@@ -0,0 +1,187 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from beanie import PydanticObjectId
+from langchain_core.documents import Document
+
+from registry_pkgs.models.extended_mcp_server import ExtendedMCPServer
+from registry_pkgs.vector.repositories.mcp_server_repository import MCPServerRepository
+
+
+class InMemoryAdapter:
+    def __init__(self):
+        self.docs: dict[str, Document] = {}
+        self.calls: list[str] = []
+
+    def collection_exists(self, collection_name):
+        return True
+
+    def get_vector_store(self, collection_name):
+        return object()
+
+    def filter_by_metadata(self, filters, limit=10, collection_name=None):
+        self.calls.append("filter_by_metadata")
+        return [doc for doc in self.docs.values() if all(doc.metadata.get(k) == v for k, v in filters.items())]
+
+    def add_documents(self, documents, collection_name=None):
+        self.calls.append("add_documents")
+        ids = []
+        for doc in documents:
+            doc_id = f"doc-{len(self.docs) + len(ids)}-{doc.metadata.get('tool_name') or 'server'}"
+            ids.append(doc_id)
+            self.docs[doc_id] = Document(page_content=doc.page_content, metadata=dict(doc.metadata), id=doc_id)
+        return ids
+
+    def delete(self, ids, collection_name=None):
+        self.calls.append("delete")
+        for doc_id in ids:
+            self.docs.pop(doc_id, None)
+
+    def update_metadata(self, doc_id, metadata, collection_name=None):
+        self.calls.append("update_metadata")
+        self.docs[doc_id].metadata.update(metadata)
+        return True
+
+
+def make_server(tool_description: str = "Search issues", status: str = "active") -> ExtendedMCPServer:
+    return ExtendedMCPServer.model_construct(
+        id=PydanticObjectId("65f000000000000000000001"),
+        serverName="github",
+        path="/github",
+        status=status,
+        tags=[],
+        author=PydanticObjectId(),
+        config={
+            "description": "GitHub tools",
+            "toolFunctions": {
+                "search_mcp_github": {
+                    "type": "function",
+                    "function": {"name": "search_mcp_github", "description": tool_description},
+                    "mcpToolName": "search",
+                },
+                "create_mcp_github": {
+                    "type": "function",
+                    "function": {"name": "create_mcp_github", "description": "Create issue"},
+                    "mcpToolName": "create",
+                },
+            },
+        },
+    )
+
+
+async def record_hashes(server, fields):
+    for name, value in fields.items():
+        setattr(server, name, value)
+
+
+@pytest.fixture
+def repo():
+    adapter = InMemoryAdapter()
+    with patch.object(ExtendedMCPServer, "set", autospec=True, side_effect=record_hashes):
+        yield MCPServerRepository(SimpleNamespace(adapter=adapter)), adapter
+
+
+@pytest.mark.asyncio
+async def test_smart_sync_skips_unchanged_server(repo):
+    repo, adapter = repo
+    server = make_server()
+
+    assert await repo.smart_sync(server) is True
+    assert len(adapter.docs) == 3
+    assert all(doc.metadata["content_hash"] for doc in adapter.docs.values())
+    assert server.vectorContentHash and server.vectorMetadataHash
+
+    # A health refresh that rewrites identical toolFunctions touches nothing.
+    refreshed = make_server()
+    refreshed.vectorContentHash = server.vectorContentHash
+    refreshed.vectorMetadataHash = server.vectorMetadataHash
+    adapter.calls.clear()
+
+    assert await repo.smart_sync(refreshed) is True
+    # Only the check that the server document is still there.
+    assert adapter.calls == ["filter_by_metadata"]
+
+
+@pytest.mark.asyncio
+async def test_smart_sync_updates_metadata_without_reembedding(repo):
+    repo, adapter = repo
+    server = make_server()
+    await repo.smart_sync(server)
+
+    disabled = make_server(status="inactive")
+    disabled.vectorContentHash = server.vectorContentHash
+    disabled.vectorMetadataHash = server.vectorMetadataHash
+    adapter.calls.clear()
+
+    assert await repo.smart_sync(disabled) is True
+    assert "add_documents" not in adapter.calls
+    assert "delete" not in adapter.calls
+    assert {doc.metadata["enabled"] for doc in adapter.docs.values()} == {False}
+    assert disabled.vectorMetadataHash != server.vectorMetadataHash
+
+
+@pytest.mark.asyncio
+async def test_smart_sync_reembeds_only_changed_documents(repo):
+    repo, adapter = repo
+    server = make_server()
+    await repo.smart_sync(server)
+
+    changed = make_server(tool_description="Search issues and pull requests")
+    changed.vectorContentHash = server.vectorContentHash
+    changed.vectorMetadataHash = server.vectorMetadataHash
+    added_before = set(adapter.docs)
+
+    assert await repo.smart_sync(changed) is True
+    added = [adapter.docs[doc_id] for doc_id in set(adapter.docs) - added_before]
+    assert [doc.metadata["tool_name"] for doc in added] == ["search"]
+    assert len(adapter.docs) == 3
+
+
+@pytest.mark.asyncio
+async def test_smart_sync_reindexes_when_vectors_are_gone(repo):
+    repo, adapter = repo
+    server = make_server()
+    await repo.smart_sync(server)
+
+    # Weaviate was reset, but MongoDB still holds the hashes of the last sync.
+    adapter.docs.clear()
+    refreshed = make_server()
+    refreshed.vectorContentHash = server.vectorContentHash
+    refreshed.vectorMetadataHash = server.vectorMetadataHash
+
+    assert await repo.smart_sync(refreshed) is True
+    assert len(adapter.docs) == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_write_clears_vector_hashes(repo):
+    repo, adapter = repo
+    server = make_server()
+    await repo.smart_sync(server)
+
+    changed = make_server(tool_description="Search issues and pull requests")
+    changed.vectorContentHash = server.vectorContentHash
+    changed.vectorMetadataHash = server.vectorMetadataHash
+    adapter.add_documents = lambda documents, collection_name=None: []
+
+    assert await repo.smart_sync(changed) is False
+    assert changed.vectorContentHash is None
+    assert changed.vectorMetadataHash is None
+
+
+@pytest.mark.asyncio
+async def test_bulk_sync_clears_hashes_of_failed_servers(repo):
+    repo, adapter = repo
+    server = make_server()
+    await repo.smart_sync(server)
+    adapter.has_property = lambda collection_name, name: False
+
+    def fail(documents, collection_name=None):
+        raise RuntimeError("weaviate unavailable")
+
+    adapter.add_documents = fail
+    result = await repo.bulk_sync_servers([server])
+
+    assert result.failed == 1
+    assert server.vectorContentHash is None
@@ -4,14 +4,22 @@ import logging
 
 from fastapi import APIRouter, HTTPException, status
 
+from registry_pkgs.core.logging_config import get_logging_state, update_logging
+
 from ..auth.dependencies import CurrentUser
 from ..schemas.management import (
+    GroupBulkCreateRequest,
+    GroupBulkDeleteRequest,
+    GroupBulkResponse,
+    GroupBulkResult,
     GroupCreateRequest,
     GroupDeleteResponse,
     GroupListResponse,
     HumanUserRequest,
     KeycloakGroupSummary,
     KeycloakUserSummary,
+    LoggingConfigResponse,
+    LoggingConfigUpdate,
     M2MAccountRequest,
     UserDeleteResponse,
     UserListResponse,
@@ -20,8 +28,10 @@ from ..utils.keycloak_manager import (
     KeycloakAdminError,
     create_human_user_account,
     create_keycloak_group,
+    create_keycloak_groups,
     create_service_account_client,
     delete_keycloak_group,
+    delete_keycloak_groups,
     delete_keycloak_user,
     list_keycloak_groups,
     list_keycloak_users,
@@ -221,3 +231,81 @@ async def management_delete_group(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail=f"Failed to delete group: {exc}",
         ) from exc
+
+
+def _bulk_response(outcomes: dict) -> GroupBulkResponse:
+    results = []
+    for name, outcome in outcomes.items():
+        if isinstance(outcome, BaseException):
+            results.append(GroupBulkResult(name=name, success=False, error=str(outcome)))
+        elif isinstance(outcome, dict):
+            group = KeycloakGroupSummary(
+                id=outcome.get("id", ""),
+                name=outcome.get("name", ""),
+                path=outcome.get("path", ""),
+                attributes=outcome.get("attributes"),
+            )
+            results.append(GroupBulkResult(name=name, success=True, group=group))
+        else:
+            results.append(GroupBulkResult(name=name, success=True))
+    succeeded = sum(1 for result in results if result.success)
+    return GroupBulkResponse(results=results, succeeded=succeeded, failed=len(results) - succeeded)
+
+
+@router.post("/iam/groups/bulk", response_model=GroupBulkResponse)
+async def management_bulk_create_groups(
+    payload: GroupBulkCreateRequest,
+    user_context: CurrentUser = None,
+):
+    """Create several Keycloak groups (admin only); failures are reported per group."""
+    _require_admin(user_context)
+    groups = {group.name: group.description or "" for group in payload.groups}
+    try:
+        outcomes = await create_keycloak_groups(groups)
+    except Exception as exc:
+        logger.error("Failed to create Keycloak groups: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Failed to create groups: {exc}",
+        ) from exc
+    return _bulk_response(outcomes)
+
+
+@router.post("/iam/groups/bulk-delete", response_model=GroupBulkResponse)
+async def management_bulk_delete_groups(
+    payload: GroupBulkDeleteRequest,
+    user_context: CurrentUser = None,
+):
+    """Delete several Keycloak groups by name (admin only); failures are reported per group."""
+    _require_admin(user_context)
+    try:
+        outcomes = await delete_keycloak_groups(list(dict.fromkeys(payload.names)))
+    except Exception as exc:
+        logger.error("Failed to delete Keycloak groups: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Failed to delete groups: {exc}",
+        ) from exc
+    return _bulk_response(outcomes)
+
+
+@router.get("/logging", response_model=LoggingConfigResponse)
+async def management_get_logging(user_context: CurrentUser = None):
+    """Show the log levels and sample rates of this process (admin only)."""
+    _require_admin(user_context)
+    return LoggingConfigResponse(**get_logging_state())
+
+
+@router.put("/logging", response_model=LoggingConfigResponse)
+async def management_update_logging(
+    payload: LoggingConfigUpdate,
+    user_context: CurrentUser = None,
+):
+    """Change log levels and sample rates without a restart (admin only); applies to this process only."""
+    _require_admin(user_context)
+    try:
+        state = update_logging(level=payload.level, levels=payload.levels, sample_rates=payload.sample_rates)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    logger.warning("Logging configuration changed by %s: %s", user_context.get("username"), state)
+    return LoggingConfigResponse(**state)
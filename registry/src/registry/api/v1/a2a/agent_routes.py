@@ -12,13 +12,13 @@ from typing import Annotated, Literal
 import httpx
 from a2a.client import A2ACardResolver
 from beanie import PydanticObjectId
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi import status as http_status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from registry.auth.dependencies import CurrentUser
 from registry.core.telemetry_decorators import track_registry_operation
-from registry.deps import get_a2a_agent_service, get_acl_service
+from registry.deps import get_a2a_agent_service, get_acl_service, get_bulk_import_service
 from registry.schemas.a2a_agent_api_schemas import (
     AgentCreateRequest,
     AgentDetailResponse,
@@ -41,6 +41,7 @@ from ....schemas.acl_schema import ResourcePermissions
 from ....schemas.errors import ErrorCode, create_error_detail
 from ....services.a2a_agent_service import A2AAgentService
 from ....services.access_control_service import ACLService
+from ....services.bulk_import_service import BulkImportService, encode_ndjson, read_ndjson
 
 logger = logging.getLogger(__name__)
 
@@ -324,6 +325,37 @@ async def create_agent(
         )
 
 
+@router.post(
+    "/agents/import",
+    summary="Bulk Create Agents",
+    description=(
+        "Register many A2A agents from an NDJSON body (one AgentCreateRequest per line). "
+        "Streams back one NDJSON result line per input line, then a summary line."
+    ),
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+@track_registry_operation("bulk_import", resource_type="agent")
+async def import_agents(
+    request: Request,
+    user_context: CurrentUser,
+    bulk_import_service: BulkImportService = Depends(get_bulk_import_service),
+):
+    """Bulk-register agents from an NDJSON stream"""
+    user_id = user_context.get("user_id")
+    try:
+        results = await bulk_import_service.import_agents(read_ndjson(request.stream()), user_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=http_status.HTTP_401_UNAUTHORIZED,
+            detail={
+                "error": "unauthorized",
+                "message": str(e),
+            },
+        )
+    return StreamingResponse(encode_ndjson(results), media_type="application/x-ndjson")
+
+
 @router.patch(
     "/agents/{agent_id}",
     response_model=AgentDetailResponse,
@@ -10,9 +10,11 @@ from ....auth.dependencies import CurrentUser
 from ....auth.oauth.reconnection import OAuthReconnectionManager
 from ....auth.oauth.types import ClientBranding
 from ....core.config import settings
+from ....core.http_client import HTTPClientManager
 from ....core.mcp_client import get_oauth_metadata_from_server
 from ....core.session_store import SessionStore
 from ....deps import (
+    get_http_client_manager,
     get_mcp_service,
     get_reconnection_manager,
     get_server_service,
@@ -39,6 +41,7 @@ router = APIRouter(prefix="/mcp", tags=["oauth"])
 @router.get("/oauth/discover", response_model=OAuthMetadataDiscoverResponse, response_model_by_alias=True)
 async def discover_oauth_metadata(
     url: str = Query(..., description="MCP server URL to discover OAuth metadata from"),
+    http_client_manager: HTTPClientManager = Depends(get_http_client_manager),
 ) -> OAuthMetadataDiscoverResponse:
     """
     Discover OAuth metadata from MCP server's well-known endpoints.
@@ -74,7 +77,7 @@ async def discover_oauth_metadata(
         logger.info(f"[OAuth Discovery] Discovering OAuth metadata for URL {url}")
 
         # Discover OAuth metadata
-        metadata = await get_oauth_metadata_from_server(url)
+        metadata = await get_oauth_metadata_from_server(url, http_client_manager=http_client_manager)
 
         if not metadata:
             logger.info(
@@ -268,16 +271,8 @@ async def oauth_callback(
 
                 elicitation_id = state_dict["meta"]["elicitation_id"]
 
-                session = session_store.pop(elicitation_id)
-
-                if session is not None:
-                    await session.send_elicit_complete(elicitation_id)
-
-                    logger.info(
-                        f"successfully scheduled sending elicitation/complete notification for elicitation_id {elicitation_id}"
-                    )
-                else:
-                    logger.info(f"could not find session object for elicitation_id {elicitation_id}")
+                # Delivered locally, or forwarded to the replica holding the client's MCP session.
+                await session_store.notify_elicitation_complete(elicitation_id)
         except Exception:
             logger.exception("failed to send elicitation/complete notification to client.")
 
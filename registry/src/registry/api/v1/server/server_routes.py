@@ -10,8 +10,9 @@ import math
 from typing import Any
 
 from beanie import PydanticObjectId
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi import status as http_status
+from fastapi.responses import StreamingResponse
 
 from registry_pkgs.database.decorators import use_transaction
 from registry_pkgs.models._generated import PrincipalType, ResourceType
@@ -20,7 +21,13 @@ from registry_pkgs.models.enums import RoleBits
 from ....auth.dependencies import CurrentUser
 from ....core.mcp_client import perform_health_check
 from ....core.telemetry_decorators import track_registry_operation
-from ....deps import get_acl_service, get_mcp_service, get_server_service, get_status_resolver
+from ....deps import (
+    get_acl_service,
+    get_bulk_import_service,
+    get_mcp_service,
+    get_server_service,
+    get_status_resolver,
+)
 from ....schemas.acl_schema import ResourcePermissions
 from ....schemas.enums import ConnectionState
 from ....schemas.server_api_schemas import (
@@ -37,6 +44,7 @@ from ....schemas.server_api_schemas import (
     convert_to_list_item,
 )
 from ....services.access_control_service import ACLService
+from ....services.bulk_import_service import BulkImportService, encode_ndjson, read_ndjson
 from ....services.oauth.connection_status_service import (
     get_servers_connection_status,
     get_single_server_connection_status,
@@ -127,14 +135,13 @@ async def list_servers(
             accessible_server_ids=accessible_ids,
         )
 
-        server_items = []
-        for server in servers:
-            perms = await acl_service.get_user_permissions_for_resource(
-                user_id=PydanticObjectId(user_id),
-                resource_type=ResourceType.MCPSERVER.value,
-                resource_id=server.id,
-            )
-            server_items.append(convert_to_list_item(server, acl_permission=perms))
+        # One ACL query for the whole page
+        permissions = await acl_service.get_user_permissions_for_resources(
+            user_id=PydanticObjectId(user_id),
+            resource_type=ResourceType.MCPSERVER.value,
+            resource_ids=[server.id for server in servers],
+        )
+        server_items = [convert_to_list_item(server, acl_permission=permissions[server.id]) for server in servers]
 
         # Get connection status and enrich server items
         try:
@@ -445,6 +452,37 @@ async def create_server(
         )
 
 
+@router.post(
+    "/servers/import",
+    summary="Bulk Register Servers",
+    description=(
+        "Register many MCP servers from an NDJSON body (one ServerCreateRequest per line). "
+        "Streams back one NDJSON result line per input line, then a summary line."
+    ),
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+@track_registry_operation("bulk_import", resource_type="server")
+async def import_servers(
+    request: Request,
+    user_context: dict = Depends(get_user_context),
+    bulk_import_service: BulkImportService = Depends(get_bulk_import_service),
+):
+    """Bulk-register servers from an NDJSON stream"""
+    user_id = user_context.get("user_id")
+    try:
+        results = await bulk_import_service.import_servers(read_ndjson(request.stream()), user_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=http_status.HTTP_401_UNAUTHORIZED,
+            detail={
+                "error": "unauthorized",
+                "message": str(e),
+            },
+        )
+    return StreamingResponse(encode_ndjson(results), media_type="application/x-ndjson")
+
+
 @router.patch(
     "/servers/{server_id}",
     response_model=ServerDetailResponse,
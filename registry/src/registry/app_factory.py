@@ -11,7 +11,8 @@ from fastapi.staticfiles import StaticFiles
 
 from .core.config import settings
 from .core.exception_handler import register_validation_exception_handler
-from .middleware import ScopePermissionMiddleware, UnifiedAuthMiddleware
+from .mcpgw.core.event_store import EventStoreSessionScope
+from .middleware import UnifiedAuthMiddleware
 from .routers import register_routers
 
 if TYPE_CHECKING:
@@ -66,7 +67,8 @@ def create_app(*, lifespan, gateway_mcp_app: FastMCP[McpAppContext]) -> FastAPI:
 
     # MCP app must be mounted before including any FastAPI router. This is so that requests to
     # `/proxy/mcpgw/mcp` will be routed to the MCP app instead of `proxy_router`, which has a catch-all route.
-    app.mount("/proxy/mcpgw", gateway_mcp_app.streamable_http_app())
+    # EventStoreSessionScope keeps each MCP session's resumable events apart.
+    app.mount("/proxy/mcpgw", EventStoreSessionScope(gateway_mcp_app.streamable_http_app()))
     register_routers(app)
     app.openapi = _build_openapi_factory(app)
 
@@ -74,8 +76,8 @@ def create_app(*, lifespan, gateway_mcp_app: FastMCP[McpAppContext]) -> FastAPI:
 
 
 def _configure_middleware(app: FastAPI) -> None:
-    app.add_middleware(ScopePermissionMiddleware)
-    app.add_middleware(UnifiedAuthMiddleware)
+    # One pure ASGI layer authenticates and enforces scopes.yml permissions.
+    app.add_middleware(UnifiedAuthMiddleware, enforce_scopes=True)
 
     # CORSMiddleware should be added late so that it executes first on incoming requests.
     app.add_middleware(
@@ -233,6 +233,24 @@ class FlowStateManager:
                 logger.warning(f"Flow not found in memory: {flow_id}")
             return flow
 
+    def get_flows(self, flow_ids: list[str]) -> dict[str, OAuthFlow]:
+        """
+        Retrieve several OAuth flows at once (one Redis round trip)
+
+        Args:
+            flow_ids: Flow identifiers
+
+        Returns:
+            Mapping of flow_id to OAuthFlow for the flows that exist
+        """
+        if self._use_redis and self._redis_storage:
+            try:
+                return self._redis_storage.get_flows(flow_ids)
+            except Exception as e:
+                logger.error(f"Error getting flows from Redis: {e}")
+                return {}
+        return {flow_id: self._memory_flows[flow_id] for flow_id in flow_ids if flow_id in self._memory_flows}
+
     def is_flow_expired(self, flow: OAuthFlow) -> bool:
         """
         Check if OAuth flow has expired
@@ -4,7 +4,7 @@ import time
 from typing import Any
 
 from ....schemas.enums import ConnectionState
-from ....schemas.oauth_schema import OAuthTokens
+from ....schemas.oauth_schema import OAuthFlow, OAuthTokens
 from ....services.server_service import ServerServiceV1
 from ..flow_state_manager import FlowStateManager
 
@@ -237,36 +237,63 @@ class OAuthReconnectionManager:
         try:
             flow_manager = self.flow_state_manager
             flow_id = flow_manager.generate_flow_id(user_id, server_id)
-            flow_state = flow_manager.get_flow(flow_id)
+            return self._classify_flow_state(flow_manager.get_flow(flow_id), server_id)
 
-            if not flow_state:
-                return None
+        except Exception as error:
+            logger.error(f"Error checking OAuth state for {server_id}: {error}")
+            return None
 
-            flow_age_seconds = time.time() - flow_state.created_at
-            flow_ttl_seconds = flow_manager._flow_ttl
+    async def get_oauth_state_overrides(self, user_id: str, server_ids: list[str]) -> dict[str, str | None]:
+        """
+        Get OAuth flow state overrides for several servers with a single flow-store lookup
 
-            # Check if failed or timed out
-            if flow_state.status == "failed" or flow_age_seconds > flow_ttl_seconds:
-                # Check if it was cancelled
-                was_cancelled = flow_state.error and "cancelled" in flow_state.error.lower()
-                if not was_cancelled:
-                    logger.debug(
-                        f"OAuth flow failed for {server_id}: status={flow_state.status}, age={flow_age_seconds}s"
-                    )
-                    return "failed"
-                return None
-
-            # Check if pending (active)
-            if flow_state.status == "pending":
-                logger.debug(f"OAuth flow active for {server_id}")
-                return "active"
+        Args:
+            user_id: User ID
+            server_ids: Server ids
 
-            return None
+        Returns:
+            Mapping of server_id to "active", "failed", or None
+        """
+        if not server_ids:
+            return {}
+
+        try:
+            flow_manager = self.flow_state_manager
+            flow_ids = {server_id: flow_manager.generate_flow_id(user_id, server_id) for server_id in server_ids}
+            flows = flow_manager.get_flows(list(flow_ids.values()))
+            return {
+                server_id: self._classify_flow_state(flows.get(flow_id), server_id)
+                for server_id, flow_id in flow_ids.items()
+            }
 
         except Exception as error:
-            logger.error(f"Error checking OAuth state for {server_id}: {error}")
+            logger.error(f"Error checking OAuth state for {len(server_ids)} servers: {error}")
+            return dict.fromkeys(server_ids)
+
+    def _classify_flow_state(self, flow_state: OAuthFlow | None, server_id: str) -> str | None:
+        """Map a stored OAuth flow to the "active"/"failed" override (None when it does not apply)"""
+        if not flow_state:
+            return None
+
+        flow_age_seconds = time.time() - flow_state.created_at
+        flow_ttl_seconds = self.flow_state_manager._flow_ttl
+
+        # Check if failed or timed out
+        if flow_state.status == "failed" or flow_age_seconds > flow_ttl_seconds:
+            # Check if it was cancelled
+            was_cancelled = flow_state.error and "cancelled" in flow_state.error.lower()
+            if not was_cancelled:
+                logger.debug(f"OAuth flow failed for {server_id}: status={flow_state.status}, age={flow_age_seconds}s")
+                return "failed"
             return None
 
+        # Check if pending (active)
+        if flow_state.status == "pending":
+            logger.debug(f"OAuth flow active for {server_id}")
+            return "active"
+
+        return None
+
     def is_flow_active(self, user_id: str, server_id: str) -> bool:
         """
         Check if OAuth flow is active
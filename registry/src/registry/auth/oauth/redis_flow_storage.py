@@ -83,38 +83,72 @@ class RedisFlowStorage:
             if not data:
                 return None
 
-            # Deserialize tokens
-            tokens = None
-            if data.get("tokens_json"):
-                tokens_dict = json.loads(data["tokens_json"])
-                tokens = OAuthTokens(**tokens_dict)
-
-            # Deserialize metadata
-            metadata = None
-            if data.get("metadata_json"):
-                metadata_dict = json.loads(data["metadata_json"])
-                metadata = MCPOAuthFlowMetadata(**metadata_dict)
-
-            # Reconstruct OAuthFlow
-            return OAuthFlow(
-                flow_id=data["flow_id"],
-                server_id=data["server_id"],
-                server_name=metadata.server_name,
-                user_id=data["user_id"],
-                code_verifier=data["code_verifier"],
-                state=data["state"],
-                status=OAuthFlowStatus(data["status"]),  # Convert string back to enum
-                created_at=float(data["created_at"]),
-                completed_at=float(data["completed_at"]) if data.get("completed_at") else None,
-                tokens=tokens,
-                error=data.get("error") or None,
-                metadata=metadata,
-            )
+            return self._deserialize_flow(data)
 
         except Exception as e:
             logger.error(f"Failed to get flow from Redis: {e}", exc_info=True)
             return None
 
+    def get_flows(self, flow_ids: list[str]) -> dict[str, OAuthFlow]:
+        """
+        Get several OAuth flows from Redis in one pipelined round trip
+
+        Returns:
+            Mapping of flow_id to OAuthFlow; missing or unreadable flows are omitted
+        """
+        if not flow_ids:
+            return {}
+
+        try:
+            pipe = self.redis.pipeline()
+            for flow_id in flow_ids:
+                pipe.hgetall(self._make_key(flow_id))
+            results = pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to get flows from Redis: {e}", exc_info=True)
+            return {}
+
+        flows = {}
+        for flow_id, data in zip(flow_ids, results, strict=True):
+            if not data:
+                continue
+            try:
+                flows[flow_id] = self._deserialize_flow(data)
+            except Exception as e:
+                logger.error(f"Failed to deserialize flow {flow_id} from Redis: {e}")
+        return flows
+
+    @staticmethod
+    def _deserialize_flow(data: dict[str, str]) -> OAuthFlow:
+        """Rebuild an OAuthFlow from its Redis hash"""
+        # Deserialize tokens
+        tokens = None
+        if data.get("tokens_json"):
+            tokens_dict = json.loads(data["tokens_json"])
+            tokens = OAuthTokens(**tokens_dict)
+
+        # Deserialize metadata
+        metadata = None
+        if data.get("metadata_json"):
+            metadata_dict = json.loads(data["metadata_json"])
+            metadata = MCPOAuthFlowMetadata(**metadata_dict)
+
+        # Reconstruct OAuthFlow
+        return OAuthFlow(
+            flow_id=data["flow_id"],
+            server_id=data["server_id"],
+            server_name=metadata.server_name,
+            user_id=data["user_id"],
+            code_verifier=data["code_verifier"],
+            state=data["state"],
+            status=OAuthFlowStatus(data["status"]),  # Convert string back to enum
+            created_at=float(data["created_at"]),
+            completed_at=float(data["completed_at"]) if data.get("completed_at") else None,
+            tokens=tokens,
+            error=data.get("error") or None,
+            metadata=metadata,
+        )
+
     def delete_flow(self, flow_id: str) -> bool:
         """
         Delete OAuth flow from Redis
@@ -6,19 +6,28 @@ from typing import TYPE_CHECKING
 
 from redis import Redis
 
+from registry_pkgs.models.a2a_agent import A2AAgent
+from registry_pkgs.models.extended_acl_entry import ExtendedAclEntry
+from registry_pkgs.models.extended_mcp_server import ExtendedMCPServer
 from registry_pkgs.vector.client import DatabaseClient
 from registry_pkgs.vector.repositories.a2a_agent_repository import A2AAgentRepository
 from registry_pkgs.vector.repositories.mcp_server_repository import MCPServerRepository
 
 from .auth.oauth.flow_state_manager import FlowStateManager
 from .auth.oauth.reconnection import OAuthReconnectionManager
+from .core.change_streams import ChangeStreamSubscriber
+from .core.http_client import HTTPClientManager
+from .core.leader_lease import LeaderLease
 from .core.mcp_client import MCPClientService
 from .core.session_store import SessionStore
+from .core.sse_connection import SSEConnectionManager
 from .health.service import HealthMonitoringService
+from .mcpgw.core.session_pool import DownstreamSessionPool
 from .services.a2a_agent_service import A2AAgentService
 from .services.access_control_service import ACLService
 from .services.agent_scanner import AgentScannerService
 from .services.agentcore_import_service import AgentCoreImportService
+from .services.bulk_import_service import BulkImportService
 from .services.federation_service import FederationService
 from .services.group_service import GroupService
 from .services.oauth.connection_service import MCPConnectionService
@@ -26,16 +35,35 @@ from .services.oauth.mcp_service import MCPService
 from .services.oauth.oauth_service import MCPOAuthService
 from .services.oauth.status_resolver import ConnectionStatusResolver
 from .services.oauth.token_service import TokenService
+from .services.scan_scheduler import RegistryScanTargets, SecurityScanScheduler
+from .services.scan_store import ScanJobQueue, ScanResultStore
 from .services.search.base import VectorSearchService
+from .services.search.index_sync import VectorIndexSync
 from .services.security_scanner import SecurityScannerService
 from .services.server_service import ServerServiceV1
 from .services.user_service import UserService
+from .utils.keycloak_manager import close_keycloak_admin_client
 
 if TYPE_CHECKING:
     from .core.config import Settings
 
 logger = logging.getLogger(__name__)
 
+# Documents whose changes are fanned out to in-process consumers.
+_WATCHED_MODELS = (ExtendedMCPServer, A2AAgent, ExtendedAclEntry)
+
+
+def _watched_collections() -> dict:
+    return {model.get_collection_name(): model.get_pymongo_collection() for model in _WATCHED_MODELS}
+
+
+def _resume_token_collection():
+    return ExtendedMCPServer.get_pymongo_collection().database["change_stream_tokens"]
+
+
+def _leader_lease_collection():
+    return ExtendedMCPServer.get_pymongo_collection().database["leader_leases"]
+
 
 class RegistryContainer:
     """App-scoped container for registry infrastructure and domain services.
@@ -59,13 +87,31 @@ class RegistryContainer:
     def a2a_agent_repo(self) -> A2AAgentRepository:
         return A2AAgentRepository(self.db_client)
 
+    @cached_property
+    def http_client_manager(self) -> HTTPClientManager:
+        """Shared per-origin connection pools for all outbound MCP, OAuth and A2A traffic."""
+        return HTTPClientManager.from_settings(self.settings)
+
     @cached_property
     def mcp_client_service(self) -> MCPClientService:
-        return MCPClientService(redis_client=self.redis_client)
+        return MCPClientService(redis_client=self.redis_client, http_client_manager=self.http_client_manager)
 
     @cached_property
     def session_store(self) -> SessionStore:
-        return SessionStore()
+        return SessionStore(
+            redis_client=self.redis_client,
+            key_prefix=f"{self.settings.redis_key_prefix}:mcpgw",
+        )
+
+    @cached_property
+    def mcp_session_pool(self) -> DownstreamSessionPool:
+        """Warm downstream MCP sessions reused by gateway tool calls."""
+        return DownstreamSessionPool.from_settings(self.settings, mcp_client_service=self.mcp_client_service)
+
+    @cached_property
+    def sse_connection_manager(self) -> SSEConnectionManager:
+        """Persistent, multiplexed downstream streams for SSE-type MCP servers."""
+        return SSEConnectionManager.from_settings(self.settings, http_client_manager=self.http_client_manager)
 
     @cached_property
     def vector_service(self) -> VectorSearchService:
@@ -78,16 +124,75 @@ class RegistryContainer:
             from .services.search.external_service import ExternalVectorSearchService
 
             logger.info("Initializing Weaviate-based vector search service for MCP tools")
-            return ExternalVectorSearchService(mcp_server_repo=self.mcp_server_repo)
+            return ExternalVectorSearchService(
+                mcp_server_repo=self.mcp_server_repo,
+                batch_size=self.settings.vector_index_batch_size,
+                max_concurrency=self.settings.vector_index_max_concurrency,
+            )
 
         from .services.search.embedded_service import EmbeddedFaissService
 
         logger.info("Initializing embedded FAISS vector search service")
         return EmbeddedFaissService(self.settings)
 
+    @cached_property
+    def vector_index_sync(self) -> VectorIndexSync:
+        return VectorIndexSync(mcp_server_repo=self.mcp_server_repo, a2a_agent_repo=self.a2a_agent_repo)
+
+    @cached_property
+    def vector_index_subscriber(self) -> ChangeStreamSubscriber:
+        """MongoDB change fan-out to the shared vector DB; runs only on the vector index lease holder."""
+        subscriber = ChangeStreamSubscriber.from_settings(
+            self.settings,
+            collections=_watched_collections,
+            token_collection=_resume_token_collection,
+            name_suffix="-vector-index",
+        )
+        subscriber.subscribe(ExtendedMCPServer.Settings.name, self.vector_index_sync.on_server_change)
+        subscriber.subscribe(A2AAgent.Settings.name, self.vector_index_sync.on_agent_change)
+        return subscriber
+
+    @cached_property
+    def vector_index_lease(self) -> LeaderLease:
+        return LeaderLease(
+            _leader_lease_collection,
+            f"{self.settings.change_stream_name}-vector-index",
+            on_acquired=self.vector_index_subscriber.start,
+            on_lost=self.vector_index_subscriber.stop,
+            ttl_seconds=self.settings.leader_lease_ttl_seconds,
+        )
+
+    @cached_property
+    def change_stream_subscriber(self) -> ChangeStreamSubscriber:
+        """MongoDB change fan-out to this replica's WebSocket clients and in-process caches."""
+        subscriber = ChangeStreamSubscriber.from_settings(
+            self.settings, collections=_watched_collections, token_collection=_resume_token_collection
+        )
+        servers = ExtendedMCPServer.Settings.name
+        subscriber.subscribe(servers, self.health_service.handle_server_change)
+        subscriber.subscribe(servers, self.mcp_session_pool.handle_server_change)
+        if self.settings.security_scan_scheduler_enabled:
+            subscriber.subscribe(servers, self.security_scan_scheduler.handle_server_change)
+            subscriber.subscribe(A2AAgent.Settings.name, self.security_scan_scheduler.handle_agent_change)
+        return subscriber
+
     @cached_property
     def health_service(self) -> HealthMonitoringService:
-        return HealthMonitoringService(server_service=self.server_service, mcp_client_service=self.mcp_client_service)
+        return HealthMonitoringService(
+            server_service=self.server_service,
+            mcp_client_service=self.mcp_client_service,
+            scheduler_enabled=self.settings.health_check_scheduler_enabled,
+        )
+
+    @cached_property
+    def health_check_lease(self) -> LeaderLease:
+        return LeaderLease(
+            _leader_lease_collection,
+            f"{self.settings.change_stream_name}-health-checks",
+            on_acquired=self.health_service.scheduler.start,
+            on_lost=self.health_service.scheduler.stop,
+            ttl_seconds=self.settings.leader_lease_ttl_seconds,
+        )
 
     @cached_property
     def federation_service(self) -> FederationService:
@@ -148,11 +253,13 @@ class RegistryContainer:
             token_service=self.token_service,
             oauth_service=self.oauth_service,
             mcp_server_repo=self.mcp_server_repo,
+            http_client_manager=self.http_client_manager,
+            sync_vectors_inline=self.settings.change_stream_mode == "off",
         )
 
     @cached_property
     def a2a_agent_service(self) -> A2AAgentService:
-        return A2AAgentService()
+        return A2AAgentService(http_client_manager=self.http_client_manager)
 
     @cached_property
     def agentcore_import_service(self) -> AgentCoreImportService:
@@ -162,15 +269,50 @@ class RegistryContainer:
             user_service_instance=self.user_service,
             mcp_server_repo=self.mcp_server_repo,
             a2a_agent_repo=self.a2a_agent_repo,
+            http_client_manager=self.http_client_manager,
+            sync_vectors_inline=self.settings.change_stream_mode == "off",
+        )
+
+    @cached_property
+    def bulk_import_service(self) -> BulkImportService:
+        return BulkImportService.from_settings(
+            self.settings,
+            server_service=self.server_service,
+            a2a_agent_service=self.a2a_agent_service,
+            acl_service=self.acl_service,
+            user_service=self.user_service,
+            mcp_server_repo=self.mcp_server_repo,
         )
 
+    @cached_property
+    def scan_result_store(self) -> ScanResultStore:
+        return ScanResultStore()
+
     @cached_property
     def security_scanner_service(self) -> SecurityScannerService:
-        return SecurityScannerService(server_service=self.server_service)
+        return SecurityScannerService(server_service=self.server_service, result_store=self.scan_result_store)
 
     @cached_property
     def agent_scanner_service(self) -> AgentScannerService:
-        return AgentScannerService()
+        return AgentScannerService(result_store=self.scan_result_store)
+
+    @cached_property
+    def security_scan_scheduler(self) -> SecurityScanScheduler:
+        """Bounded worker pool over the durable scan job queue shared by all replicas."""
+        targets = RegistryScanTargets(
+            server_service=self.server_service,
+            a2a_agent_service=self.a2a_agent_service,
+            security_scanner=self.security_scanner_service,
+            agent_scanner=self.agent_scanner_service,
+            rules_version=self.settings.security_scan_rules_version,
+        )
+        return SecurityScanScheduler.from_settings(
+            self.settings,
+            queue=ScanJobQueue(),
+            results=self.scan_result_store,
+            resolve=targets,
+            discover=targets.list_targets,
+        )
 
     async def startup(self) -> None:
         """Warm services that need async initialization before the app can serve traffic."""
@@ -186,6 +328,9 @@ class RegistryContainer:
 
         logger.info("Initializing health monitoring service...")
         await self.health_service.initialize()
+        if self.health_service.scheduler:
+            # One replica at a time pings servers and records their status.
+            await self.health_check_lease.start()
 
         logger.info("Initializing MCP connection service...")
         await self.connection_service.initialize_app_connections()
@@ -196,10 +341,50 @@ class RegistryContainer:
         logger.info("Initializing federation service...")
         self._initialize_federation()
 
+        logger.info("Starting elicitation completion listener...")
+        await self.session_store.start()
+
+        if self.settings.security_scan_scheduler_enabled:
+            logger.info("Starting security scan scheduler...")
+            await self.security_scan_scheduler.start()
+
+        logger.info("Starting MongoDB change stream subscriber...")
+        await self.change_stream_subscriber.start()
+        if self.vector_index_subscriber.enabled:
+            # One replica at a time applies changes to the shared vector DB.
+            await self.vector_index_lease.start()
+
     async def shutdown(self) -> None:
         """Shutdown services that hold background tasks or external resources."""
+        if "vector_index_lease" in self.__dict__:
+            await self.vector_index_lease.stop()
+        if "health_check_lease" in self.__dict__:
+            await self.health_check_lease.stop()
+
+        if "change_stream_subscriber" in self.__dict__:
+            await self.change_stream_subscriber.stop()
+
+        if "security_scan_scheduler" in self.__dict__:
+            await self.security_scan_scheduler.stop()
+
         await self.health_service.shutdown()
 
+        if "vector_service" in self.__dict__:
+            # Persists any index changes still waiting for a write-behind flush.
+            await self.vector_service.cleanup()
+
+        if "session_store" in self.__dict__:
+            await self.session_store.stop()
+
+        if "sse_connection_manager" in self.__dict__:
+            await self.sse_connection_manager.aclose()
+
+        await close_keycloak_admin_client()
+
+        # Only close the pools if something actually created them.
+        if "http_client_manager" in self.__dict__:
+            await self.http_client_manager.aclose()
+
     def _initialize_federation(self) -> None:
         """Run optional federation sync on startup without failing the whole application."""
         federation_service = self.federation_service
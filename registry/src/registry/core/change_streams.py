@@ -0,0 +1,300 @@
+"""
+MongoDB Change Stream Subscriber
+
+Watches registry collections and fans every insert, update, replace and delete out
+to registered consumers, so derived state (vector index, WebSocket dashboards,
+in-process caches) follows the database instead of each service call remembering
+to update it. Every replica runs its own subscriber, so each replica's caches see
+every write regardless of which replica made it. Consumers that act on shared state
+(the vector index) go on a separately named subscriber that only the replica holding
+a LeaderLease runs.
+
+Resume tokens are persisted per (subscriber name, collection); after a restart the
+stream resumes after the last persisted event. Standalone MongoDB servers (tests,
+local development) have no change streams, so there the subscriber polls each
+collection and diffs document fingerprints instead. In "auto" mode the same
+fallback applies whenever a stream cannot be opened at all (e.g. the user lacks
+the changeStream privilege), since services rely on the subscriber for vector
+sync and would otherwise stop indexing silently.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import logging
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from bson import json_util
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+CHANGE_STREAM_MODES = ("auto", "change_stream", "polling", "off")
+
+# "The $changeStream stage is only supported on replica sets"
+_CHANGE_STREAM_UNSUPPORTED = 40573
+# The resume token is no longer in the oplog.
+_CHANGE_STREAM_HISTORY_LOST = 286
+
+# Resume tokens are written at most this often per collection (and always on stop).
+_TOKEN_SAVE_INTERVAL_SECONDS = 1.0
+_RESTART_DELAY_SECONDS = 5.0
+
+
+@dataclass
+class ChangeEvent:
+    """One change to a watched collection."""
+
+    collection: str
+    operation: str  # insert, update, replace or delete
+    document_id: str
+    document: dict[str, Any] | None = None  # the document after the change; None for deletes
+    updated_fields: set[str] | None = None  # top-level fields an update touched; None when unknown
+
+    @property
+    def is_delete(self) -> bool:
+        return self.operation == "delete"
+
+    def touches(self, *fields: str) -> bool:
+        """False only for updates known not to touch any of ``fields``."""
+        return self.updated_fields is None or not self.updated_fields.isdisjoint(fields)
+
+
+ChangeConsumer = Callable[[ChangeEvent], Awaitable[None]]
+
+
+def _fingerprint(document: dict[str, Any]) -> str:
+    return hashlib.sha1(json_util.dumps(document).encode(), usedforsecurity=False).hexdigest()
+
+
+class ChangeStreamSubscriber:
+    """App-scoped fan-out of MongoDB changes to in-process consumers."""
+
+    def __init__(
+        self,
+        collections: Callable[[], Mapping[str, Any]],
+        *,
+        mode: str = "auto",
+        name: str = "registry",
+        poll_interval_seconds: float = 5.0,
+        token_collection: Callable[[], Any] | None = None,
+    ):
+        """
+        Args:
+            collections: Returns the watchable async pymongo collections by name; resolved on start
+            mode: "change_stream", "polling", "auto" (change streams, polling where they cannot be opened) or "off"
+            name: Replicas sharing a name share resume tokens
+            poll_interval_seconds: Interval between collection scans in polling mode
+            token_collection: Returns the collection resume tokens are persisted in; None keeps them in memory
+        """
+        if mode not in CHANGE_STREAM_MODES:
+            raise ValueError(f"Invalid change stream mode: {mode}. Must be one of {', '.join(CHANGE_STREAM_MODES)}")
+        self.mode = mode
+        self.name = name
+        self.poll_interval_seconds = poll_interval_seconds
+        self._resolve_collections = collections
+        self._resolve_token_collection = token_collection
+        self._token_collection = None
+        self._consumers: dict[str, list[ChangeConsumer]] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._modes: dict[str, str] = {}
+        self._tokens: dict[str, Any] = {}
+        self._saved_tokens: dict[str, Any] = {}
+        self._events: dict[str, int] = {}
+        self._consumer_errors = 0
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings,
+        collections: Callable[[], Mapping[str, Any]],
+        token_collection: Callable[[], Any] | None = None,
+        name_suffix: str = "",
+    ) -> ChangeStreamSubscriber:
+        return cls(
+            collections,
+            mode=settings.change_stream_mode,
+            name=f"{settings.change_stream_name}{name_suffix}",
+            poll_interval_seconds=settings.change_stream_poll_interval_seconds,
+            token_collection=token_collection,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def subscribe(self, collection: str, consumer: ChangeConsumer) -> None:
+        """Deliver changes of ``collection`` to ``consumer``. Register before ``start``."""
+        self._consumers.setdefault(collection, []).append(consumer)
+
+    async def start(self) -> None:
+        """Start one watcher per subscribed collection."""
+        if not self.enabled or self._tasks:
+            return
+        collections = self._resolve_collections()
+        if self._resolve_token_collection is not None:
+            self._token_collection = self._resolve_token_collection()
+            # Another replica may have advanced the shared tokens since this one last ran.
+            self._tokens.clear()
+            self._saved_tokens.clear()
+        for name in self._consumers:
+            collection = collections.get(name)
+            if collection is None:
+                logger.warning(f"Change stream consumers registered for unknown collection '{name}'")
+                continue
+            self._tasks[name] = asyncio.create_task(self._run(name, collection))
+        logger.info(f"Change stream subscriber '{self.name}' watching: {', '.join(self._tasks) or 'nothing'}")
+
+    async def stop(self) -> None:
+        """Stop all watchers and persist the latest resume tokens."""
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        for name in list(self._tokens):
+            await self._save_token(name)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "collections": dict(self._modes),
+            "events": dict(self._events),
+            "consumer_errors": self._consumer_errors,
+        }
+
+    async def _run(self, name: str, collection: Any) -> None:
+        use_polling = self.mode == "polling"
+        while True:
+            try:
+                if use_polling:
+                    await self._poll(name, collection)
+                else:
+                    await self._watch(name, collection)
+            except asyncio.CancelledError:
+                raise
+            except OperationFailure as e:
+                if e.code == _CHANGE_STREAM_HISTORY_LOST:
+                    logger.warning(f"Resume token for '{name}' is no longer in the oplog, watching from now")
+                    self._tokens.pop(name, None)
+                    await self._delete_token(name)
+                    continue
+                if self.mode == "auto" and not use_polling and self._modes.get(name) != "change_stream":
+                    # The stream never opened, so retrying will not help: poll rather than starve consumers.
+                    if e.code == _CHANGE_STREAM_UNSUPPORTED:
+                        logger.info(f"Change streams unavailable for '{name}' (standalone server), polling instead")
+                    else:
+                        logger.warning(f"Cannot open a change stream for '{name}' ({e}), polling instead")
+                    use_polling = True
+                    continue
+                logger.error(f"Change stream for '{name}' failed: {e}", exc_info=True)
+            except Exception as e:
+                logger.error(f"Change stream for '{name}' failed: {e}", exc_info=True)
+            await asyncio.sleep(_RESTART_DELAY_SECONDS)
+
+    async def _watch(self, name: str, collection: Any) -> None:
+        resume_after = self._tokens.get(name) or await self._load_token(name)
+        last_saved = time.monotonic()
+        async with await collection.watch(full_document="updateLookup", resume_after=resume_after) as stream:
+            self._modes[name] = "change_stream"
+            async for change in stream:
+                event = self._to_event(name, change)
+                if event is not None:
+                    await self._dispatch(event)
+                self._tokens[name] = change["_id"]
+                if time.monotonic() - last_saved >= _TOKEN_SAVE_INTERVAL_SECONDS:
+                    await self._save_token(name)
+                    last_saved = time.monotonic()
+
+    def _to_event(self, name: str, change: Mapping[str, Any]) -> ChangeEvent | None:
+        operation = change.get("operationType")
+        if operation not in ("insert", "update", "replace", "delete"):
+            # drop / rename / invalidate end the stream; it is reopened from the last token.
+            logger.info(f"Change stream for '{name}' received '{operation}'")
+            return None
+        updated_fields = None
+        if operation == "update":
+            description = change.get("updateDescription") or {}
+            touched = list(description.get("updatedFields") or {}) + list(description.get("removedFields") or [])
+            updated_fields = {field.split(".", 1)[0] for field in touched}
+        return ChangeEvent(
+            collection=name,
+            operation=operation,
+            document_id=str(change["documentKey"]["_id"]),
+            document=change.get("fullDocument"),
+            updated_fields=updated_fields,
+        )
+
+    async def _poll(self, name: str, collection: Any) -> None:
+        self._modes[name] = "polling"
+        known = {document_id: fingerprint for document_id, (fingerprint, _) in (await self._scan(collection)).items()}
+        while True:
+            await asyncio.sleep(self.poll_interval_seconds)
+            current = await self._scan(collection)
+            for document_id, (fingerprint, document) in current.items():
+                previous = known.get(document_id)
+                if previous != fingerprint:
+                    operation = "insert" if previous is None else "replace"
+                    await self._dispatch(ChangeEvent(name, operation, document_id, document))
+            for document_id in known.keys() - current.keys():
+                await self._dispatch(ChangeEvent(name, "delete", document_id))
+            known = {document_id: fingerprint for document_id, (fingerprint, _) in current.items()}
+
+    async def _scan(self, collection: Any) -> dict[str, tuple[str, dict[str, Any]]]:
+        documents = {}
+        async for document in collection.find({}):
+            documents[str(document["_id"])] = (_fingerprint(document), document)
+        return documents
+
+    async def _dispatch(self, event: ChangeEvent) -> None:
+        """Run every consumer of the collection; one failing consumer does not stop the others."""
+        self._events[event.collection] = self._events.get(event.collection, 0) + 1
+        consumers = self._consumers.get(event.collection, [])
+        results = await asyncio.gather(*(consumer(event) for consumer in consumers), return_exceptions=True)
+        for consumer, result in zip(consumers, results, strict=True):
+            if isinstance(result, Exception):
+                self._consumer_errors += 1
+                logger.error(
+                    f"Change consumer {getattr(consumer, '__qualname__', consumer)} failed for "
+                    f"{event.operation} on {event.collection}/{event.document_id}: {result}",
+                    exc_info=result,
+                )
+
+    def _token_key(self, name: str) -> str:
+        return f"{self.name}:{name}"
+
+    async def _load_token(self, name: str) -> Any:
+        if self._token_collection is None:
+            return None
+        try:
+            stored = await self._token_collection.find_one({"_id": self._token_key(name)})
+        except Exception as e:
+            logger.warning(f"Failed to load resume token for '{name}': {e}")
+            return None
+        return stored.get("token") if stored else None
+
+    async def _save_token(self, name: str) -> None:
+        token = self._tokens.get(name)
+        if self._token_collection is None or token is None or self._saved_tokens.get(name) == token:
+            return
+        try:
+            await self._token_collection.update_one(
+                {"_id": self._token_key(name)}, {"$set": {"token": token}}, upsert=True
+            )
+            self._saved_tokens[name] = token
+        except Exception as e:
+            logger.warning(f"Failed to save resume token for '{name}': {e}")
+
+    async def _delete_token(self, name: str) -> None:
+        self._saved_tokens.pop(name, None)
+        if self._token_collection is None:
+            return
+        with contextlib.suppress(Exception):
+            await self._token_collection.delete_one({"_id": self._token_key(name)})
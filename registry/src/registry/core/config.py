@@ -15,6 +15,7 @@ from registry_pkgs.core.config import (
     TelemetryConfig,
     VectorConfig,
 )
+from registry_pkgs.core.logging_config import configure_logging, parse_log_levels, parse_sample_rates
 from registry_pkgs.vector.config import BackendConfig
 
 MCP_CLIENT_INFO = {
@@ -68,6 +69,10 @@ class Settings(BaseSettings):
     anthropic_api_default_limit: int = 100
     anthropic_api_max_limit: int = 1000
 
+    # ==================== Bulk Import ====================
+    bulk_import_chunk_size: int = 100  # NDJSON records validated, checked and inserted together
+    bulk_import_discovery_concurrency: int = 8  # concurrent health checks / agent card fetches per chunk
+
     # ==================== Local Embeddings ====================
     local_embeddings_model_name: str = "all-MiniLM-L6-v2"
     local_embeddings_model_dimensions: int = 384
@@ -75,16 +80,48 @@ class Settings(BaseSettings):
     # ==================== Search Defaults ====================
     tool_discovery_mode: str = "external"
     external_vector_search_url: str = "http://localhost:8000/mcp"
+    vector_index_batch_size: int = 64  # texts (or documents) per embedding call when bulk indexing
+    vector_index_max_concurrency: int = 2
+
+    # ==================== Embedded FAISS ====================
+    faiss_flush_interval_seconds: float = 2.0
+    faiss_flush_max_pending: int = 256
+    faiss_journal_compact_threshold: int = 1000
+    faiss_search_overfetch_factor: int = 2
+    faiss_index_type: str = "flat"  # flat | hnsw | ivf_flat | ivf_pq
+    faiss_metric: str = "l2"  # l2 | cosine
+    faiss_hnsw_m: int = 32
+    faiss_hnsw_ef_construction: int = 80
+    faiss_hnsw_ef_search: int = 64
+    faiss_ivf_nlist: int = 256
+    faiss_ivf_nprobe: int = 16
+    faiss_pq_m: int = 16
+    faiss_pq_nbits: int = 8
+    faiss_tool_keyword_boost: float = 0.1  # weight of exact-term tool matches; 0 disables the keyword index
 
     # ==================== Health ====================
     health_check_interval_seconds: int = 300
     health_check_timeout_seconds: int = 2
+    health_check_scheduler_enabled: bool = False  # one replica at a time runs it, under a lease
+    health_check_max_concurrency: int = 10
+    health_check_jitter_ratio: float = 0.1  # intervals vary by +/- this fraction
+    health_check_recheck_seconds: int = 30  # confirm a status flip this soon
+    health_check_max_interval_seconds: int = 3600  # back-off cap for failing servers
+
+    # ==================== Outbound HTTP ====================
+    http_client_max_connections_per_origin: int = 100
+    http_client_max_keepalive_per_origin: int = 20
+    http_client_keepalive_expiry_seconds: float = 30.0
+    http_client_http2_enabled: bool = True
+    http_client_connect_retries: int = 0
+    http_client_max_origins: int = 256  # least recently used idle pools are closed beyond this
 
     # ==================== WebSocket ====================
     max_websocket_connections: int = 100
     websocket_send_timeout_seconds: float = 2.0
     websocket_broadcast_interval_ms: int = 10
     websocket_max_batch_size: int = 20
+    websocket_client_queue_size: int = 32  # per-client backlog before it is coalesced into one catch-up delta
     websocket_cache_ttl_seconds: int = 1
 
     # ==================== Well-Known ====================
@@ -96,6 +133,22 @@ class Settings(BaseSettings):
     mcpgw_allowed_hosts: str = "jarvis-demo.ascendingdc.com,jarvis-demo.ascendingdc.com:*"
     mcpgw_allowed_origins: str = "https://jarvis-demo.ascendingdc.com,https://jarvis-demo.ascendingdc.com:*"
 
+    # ==================== Gateway Sessions ====================
+    mcpgw_session_idle_ttl_seconds: float = 600.0
+    mcpgw_session_pool_max_sessions: int = 1000
+    mcpgw_sse_max_in_flight_per_connection: int = 32
+    mcpgw_sse_heartbeat_interval_seconds: float = 30.0
+    mcpgw_sse_idle_ttl_seconds: float = 600.0
+    mcpgw_sse_max_connections: int = 500
+
+    # ==================== Gateway Event Store ====================
+    # "memory" keeps resumable stream events in the replica's heap; "redis" keeps them in Redis Streams.
+    # Either way a session only resumes on the replica that owns it, so multi-replica setups need sticky routing.
+    mcpgw_event_store_backend: str = "memory"
+    mcpgw_event_store_max_events_per_stream: int = 50
+    mcpgw_event_store_max_streams: int = 500
+    mcpgw_event_store_stream_ttl_seconds: int = 3600
+
     # ==================== Server Security Scanning ====================
     security_scan_enabled: bool = True
     security_scan_on_registration: bool = True
@@ -105,6 +158,14 @@ class Settings(BaseSettings):
     security_add_pending_tag: bool = True
     mcp_scanner_llm_api_key: str | None = None
 
+    # ==================== Security Scan Scheduler ====================
+    # Works through the MongoDB scan job queue; new servers and agents are queued on registration.
+    security_scan_scheduler_enabled: bool = False
+    security_scan_max_concurrency: int = 4  # scanner processes per replica
+    security_scan_job_lease_seconds: int = 900  # a job is handed out again if its worker stops this long
+    security_scan_sweep_on_start: bool = False  # queue every enabled server and agent on startup
+    security_scan_rules_version: str = ""  # change after a scanner rules update so unchanged targets are rescanned
+
     # ==================== Agent Security Scanning ====================
     agent_security_scan_enabled: bool = True
     agent_security_scan_on_registration: bool = True
@@ -126,6 +187,16 @@ class Settings(BaseSettings):
     mongodb_username: str = ""
     mongodb_password: str = ""
 
+    # ==================== Change Streams ====================
+    # "auto" watches MongoDB change streams and polls where one cannot be opened (standalone server, missing
+    # changeStream privilege); "change_stream", "polling" or "off"
+    change_stream_mode: str = "auto"
+    change_stream_name: str = "registry"  # replicas sharing a name share resume tokens
+    change_stream_poll_interval_seconds: float = 5.0
+    leader_lease_ttl_seconds: float = (
+        30.0  # single-replica jobs (vector index sync, health checks) fail over after this long
+    )
+
     # ==================== Telemetry ====================
     otel_metrics_config_path: str = ""
     otel_exporter_otlp_endpoint: str = "http://otel-collector:4318"
@@ -179,6 +250,10 @@ class Settings(BaseSettings):
     # ==================== Logging ====================
     log_level: str = "INFO"
     log_format: str = "%(asctime)s,p%(process)s,{%(name)s:%(lineno)d},%(levelname)s,%(message)s"
+    log_levels: str = ""  # per-logger levels, e.g. "registry.mcpgw=DEBUG,httpx=WARNING"
+    log_sampling: str = ""  # INFO/DEBUG sample rates, e.g. "registry.mcpgw.tools.proxied=0.1"
+    log_async: bool = True  # write log records from a background thread
+    log_redact: bool = True  # mask credentials in log messages and extra fields
 
     # ==================== Encryption ====================
     creds_key: str | None = None
@@ -190,6 +265,8 @@ class Settings(BaseSettings):
     keycloak_admin_password: str | None = None
     keycloak_m2m_client_id: str = "mcp-gateway-m2m"
     keycloak_m2m_client_secret: str | None = None
+    keycloak_admin_cache_ttl_seconds: float = 60.0  # Cache lifetime of group name / client UUID lookups
+    keycloak_admin_max_concurrency: int = 8  # Concurrent Admin API calls in bulk and listing operations
 
     # ==================== Federation ====================
     federation_config_path: str = "/app/config/federation.json"
@@ -215,6 +292,46 @@ class Settings(BaseSettings):
                 f"Invalid tool_discovery_mode: {self.tool_discovery_mode}. Must be 'embedded' or 'external'"
             )
 
+        if self.faiss_index_type not in {"flat", "hnsw", "ivf_flat", "ivf_pq"}:
+            raise ValueError(
+                f"Invalid faiss_index_type: {self.faiss_index_type}. Must be 'flat', 'hnsw', 'ivf_flat' or 'ivf_pq'"
+            )
+
+        if self.faiss_metric not in {"l2", "cosine"}:
+            raise ValueError(f"Invalid faiss_metric: {self.faiss_metric}. Must be 'l2' or 'cosine'")
+
+        if self.health_check_max_concurrency < 1:
+            raise ValueError("health_check_max_concurrency must be at least 1")
+
+        if not 0 <= self.health_check_jitter_ratio < 1:
+            raise ValueError("health_check_jitter_ratio must be in [0, 1)")
+
+        if self.bulk_import_chunk_size < 1 or self.bulk_import_discovery_concurrency < 1:
+            raise ValueError("bulk_import_chunk_size and bulk_import_discovery_concurrency must be at least 1")
+
+        if self.security_scan_max_concurrency < 1:
+            raise ValueError("security_scan_max_concurrency must be at least 1")
+
+        if self.security_scan_job_lease_seconds <= max(self.security_scan_timeout, self.agent_security_scan_timeout):
+            raise ValueError("security_scan_job_lease_seconds must be longer than the security scan timeouts")
+
+        if self.leader_lease_ttl_seconds <= 0:
+            raise ValueError("leader_lease_ttl_seconds must be positive")
+
+        if self.keycloak_admin_max_concurrency < 1:
+            raise ValueError("keycloak_admin_max_concurrency must be at least 1")
+
+        parse_log_levels(self.log_levels)
+        for name, rate in parse_sample_rates(self.log_sampling).items():
+            if not 0 <= rate <= 1:
+                raise ValueError(f"LOG_SAMPLING rate for '{name}' must be in [0, 1], got {rate}")
+
+        if self.change_stream_mode not in {"auto", "change_stream", "polling", "off"}:
+            raise ValueError(
+                f"Invalid change_stream_mode: {self.change_stream_mode}. "
+                "Must be 'auto', 'change_stream', 'polling' or 'off'"
+            )
+
     @cached_property
     def is_local_dev(self) -> bool:
         return not Path("/app").exists()
@@ -265,6 +382,14 @@ class Settings(BaseSettings):
     def faiss_metadata_path(self) -> Path:
         return self.servers_dir / "service_index_metadata.json"
 
+    @cached_property
+    def faiss_journal_path(self) -> Path:
+        return self.servers_dir / "service_index_metadata.journal"
+
+    @cached_property
+    def faiss_tool_index_path(self) -> Path:
+        return self.servers_dir / "tool_index.faiss"
+
     @cached_property
     def dotenv_path(self) -> Path:
         if self.is_local_dev:
@@ -338,9 +463,23 @@ class Settings(BaseSettings):
     def vector_backend_config(self) -> BackendConfig:
         return BackendConfig.from_vector_config(self.vector_config)
 
+    @cached_property
+    def log_level_overrides(self) -> dict[str, str]:
+        return parse_log_levels(self.log_levels)
+
+    @cached_property
+    def log_sample_rates(self) -> dict[str, float]:
+        return parse_sample_rates(self.log_sampling)
+
     def configure_logging(self) -> None:
-        numeric_level = getattr(logging, self.log_level.upper(), logging.INFO)
-        logging.basicConfig(level=numeric_level, format=self.log_format, force=True)
+        configure_logging(
+            getattr(logging, self.log_level.upper(), logging.INFO),
+            self.log_format,
+            levels=self.log_level_overrides,
+            sample_rates=self.log_sample_rates,
+            redact=self.log_redact,
+            use_queue=self.log_async,
+        )
 
     @cached_property
     def scopes_config(self) -> dict[str, Any]:
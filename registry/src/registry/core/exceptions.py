@@ -24,6 +24,12 @@ class UrlElicitationRequiredException(McpGatewayException):
 class DownstreamHttpFailureException(McpGatewayException):
     """Raised on >=300 downstream HTTP responses from proxied MCP calls."""
 
+    status_code: int | None
+
+    def __init__(self, msg: str, /, *, status_code: int | None = None):
+        super().__init__(msg)
+        self.status_code = status_code
+
 
 class MisimplementedSpecException(McpGatewayException):
     """Raised when a downstream server violates the MCP protocol contract."""
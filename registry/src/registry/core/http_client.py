@@ -0,0 +1,312 @@
+"""
+Outbound HTTP Client Manager
+
+Central owner of the connection pools used for all outbound MCP traffic
+(discovery, health checks, OAuth metadata, A2A cards and the gateway proxy).
+
+Each origin (scheme://host:port) gets its own pooled transport so that limits
+are enforced per downstream server and keep-alive connections (and the TCP/TLS
+handshakes behind them) are reused across calls. Callers receive lightweight
+``httpx.AsyncClient`` views bound to those pools; closing a view never closes
+the shared connections.
+
+Because the views use a custom transport, httpx no longer applies HTTP_PROXY /
+HTTPS_PROXY / ALL_PROXY / NO_PROXY itself; each origin's pool is created with the
+proxy the environment selects for it instead. Pools of origins that have not been
+used for a while are closed once more than ``max_origins`` are open.
+"""
+
+import importlib.util
+import logging
+import urllib.request
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from ..utils.otel_metrics import record_http_client_request
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional ``h2`` package (``httpx[http2]``); fall back to HTTP/1.1 without it.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _origin_of(url: httpx.URL) -> str:
+    """Return the pool key for a request URL."""
+    port = url.port or _DEFAULT_PORTS.get(url.scheme)
+    return f"{url.scheme}://{url.host}:{port}"
+
+
+def _environment_proxy(url: httpx.URL, proxies: dict[str, str]) -> str | None:
+    """The proxy for ``url`` under ``proxies`` (from the *_PROXY variables), honouring NO_PROXY."""
+    if not proxies:
+        return None
+    host = f"{url.host}:{url.port}" if url.port else url.host
+    if urllib.request.proxy_bypass_environment(host, proxies):
+        return None
+    return proxies.get(url.scheme) or proxies.get("all")
+
+
+@dataclass
+class OriginPoolStats:
+    """Counters for one origin's connection pool."""
+
+    requests: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    connections_opened: int = 0
+    tls_handshakes: int = 0
+
+    def to_dict(self, max_connections: int) -> dict[str, Any]:
+        reused = max(self.requests - self.connections_opened, 0)
+        return {
+            "requests": self.requests,
+            "in_use": self.in_flight,
+            "waiting": max(self.in_flight - max_connections, 0),
+            "peak_in_use": self.peak_in_flight,
+            "connections_opened": self.connections_opened,
+            "tls_handshakes": self.tls_handshakes,
+            "reuse_ratio": round(reused / self.requests, 4) if self.requests else 0.0,
+        }
+
+
+class _TrackedResponseStream(httpx.AsyncByteStream):
+    """Response stream wrapper that releases the in-flight slot when the body is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, stats: OriginPoolStats):
+        self._stream = stream
+        self._stats = stats
+        self._released = False
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._stats.in_flight -= 1
+
+
+class _OriginRoutingTransport(httpx.AsyncBaseTransport):
+    """Transport shared by every client view; dispatches each request to its origin's pool."""
+
+    def __init__(self, manager: "HTTPClientManager"):
+        self._manager = manager
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._manager._handle_request(request)
+
+    async def aclose(self) -> None:
+        # Pools are owned by the manager and closed in HTTPClientManager.aclose().
+        return None
+
+
+class HTTPClientManager:
+    """App-scoped manager of per-origin outbound HTTP connection pools."""
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        retries: int = 0,
+        max_origins: int = 256,
+        trust_env: bool = True,
+    ):
+        """
+        Args:
+            max_connections: Maximum concurrent connections per origin
+            max_keepalive_connections: Maximum idle keep-alive connections kept per origin
+            keepalive_expiry: Seconds an idle connection is kept before being closed
+            http2: Negotiate HTTP/2 via ALPN when the server supports it (requires ``h2``)
+            retries: Connection-level retries on connect errors
+            max_origins: Pools kept open; the least recently used idle pools are closed beyond this
+            trust_env: Route requests through the proxies named by HTTP_PROXY / HTTPS_PROXY / ALL_PROXY
+                (except hosts matching NO_PROXY), as httpx does by default
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and HTTP2_AVAILABLE
+        if http2 and not HTTP2_AVAILABLE:
+            logger.info("HTTP/2 requested for outbound pools but 'h2' is not installed; using HTTP/1.1")
+        self.retries = retries
+        self.max_origins = max(1, max_origins)
+        self._proxies = urllib.request.getproxies_environment() if trust_env else {}
+
+        # A single SSL context shared by all pools: CA bundles are loaded once instead of per client.
+        self._ssl_context = httpx.create_ssl_context()
+        self._pools: OrderedDict[str, httpx.AsyncHTTPTransport] = OrderedDict()  # least recently used first
+        self._stats: dict[str, OriginPoolStats] = {}
+        self._router = _OriginRoutingTransport(self)
+        self._closed = False
+
+    @classmethod
+    def from_settings(cls, settings) -> "HTTPClientManager":
+        return cls(
+            max_connections=settings.http_client_max_connections_per_origin,
+            max_keepalive_connections=settings.http_client_max_keepalive_per_origin,
+            keepalive_expiry=settings.http_client_keepalive_expiry_seconds,
+            http2=settings.http_client_http2_enabled,
+            retries=settings.http_client_connect_retries,
+            max_origins=settings.http_client_max_origins,
+        )
+
+    def get_client(
+        self,
+        *,
+        headers: dict[str, str] | None = None,
+        timeout: Any = 30.0,
+        auth: httpx.Auth | None = None,
+        follow_redirects: bool = False,
+    ) -> httpx.AsyncClient:
+        """
+        Return an ``httpx.AsyncClient`` backed by the shared per-origin pools.
+
+        The client carries its own headers, timeout and auth, so it can be used
+        as ``async with manager.get_client(...) as client:`` exactly like a
+        freshly created client. Closing it leaves the pooled connections open.
+        """
+        if self._closed:
+            raise RuntimeError("HTTPClientManager is closed")
+        return httpx.AsyncClient(
+            transport=self._router,
+            headers=headers,
+            timeout=timeout,
+            auth=auth,
+            follow_redirects=follow_redirects,
+        )
+
+    async def _get_pool(self, origin: str, url: httpx.URL) -> httpx.AsyncHTTPTransport:
+        pool = self._pools.get(origin)
+        if pool is not None:
+            self._pools.move_to_end(origin)
+            return pool
+        proxy = _environment_proxy(url, self._proxies)
+        pool = httpx.AsyncHTTPTransport(
+            verify=self._ssl_context,
+            http2=self.http2,
+            limits=self.limits,
+            retries=self.retries,
+            proxy=proxy,
+        )
+        self._pools[origin] = pool
+        self._stats[origin] = OriginPoolStats()
+        logger.debug(f"Created outbound connection pool for {origin}" + (" via proxy" if proxy else ""))
+        await self._evict_idle_pools(keep=origin)
+        return pool
+
+    async def _evict_idle_pools(self, keep: str) -> None:
+        """Close the least recently used pools with nothing in flight until at most max_origins remain."""
+        excess = len(self._pools) - self.max_origins
+        if excess <= 0:
+            return
+        evicted = []
+        for origin in list(self._pools):
+            if len(evicted) == excess:
+                break
+            if origin != keep and self._stats[origin].in_flight == 0:
+                evicted.append((origin, self._pools.pop(origin)))
+                del self._stats[origin]
+        for origin, pool in evicted:
+            try:
+                await pool.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing outbound connection pool for {origin}: {e}")
+        if evicted:
+            logger.debug(f"Closed {len(evicted)} idle outbound connection pool(s)")
+
+    async def _handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self._closed:
+            raise RuntimeError("HTTPClientManager is closed")
+        origin = _origin_of(request.url)
+        pool = await self._get_pool(origin, request.url)
+        stats = self._stats[origin]
+        new_connection = False
+
+        caller_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            nonlocal new_connection
+            if event_name == "connection.connect_tcp.started":
+                new_connection = True
+                stats.connections_opened += 1
+            elif event_name == "connection.start_tls.started":
+                stats.tls_handshakes += 1
+            if caller_trace is not None:
+                await caller_trace(event_name, info)
+
+        request.extensions = {**request.extensions, "trace": trace}
+
+        stats.requests += 1
+        stats.in_flight += 1
+        stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+        try:
+            response = await pool.handle_async_request(request)
+        except BaseException:
+            stats.in_flight -= 1
+            raise
+
+        record_http_client_request(origin, reused=not new_connection)
+        if response.is_closed:
+            # Body already buffered by the transport; there is nothing left to release later.
+            stats.in_flight -= 1
+        else:
+            response.stream = _TrackedResponseStream(response.stream, stats)
+        return response
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get pool statistics: per-origin in-use/waiting counts and connection reuse ratio."""
+        max_connections = self.limits.max_connections or 0
+        origins = {origin: stats.to_dict(max_connections) for origin, stats in self._stats.items()}
+        total_requests = sum(stats.requests for stats in self._stats.values())
+        total_opened = sum(stats.connections_opened for stats in self._stats.values())
+        return {
+            "http2_enabled": self.http2,
+            "origins": len(origins),
+            "requests": total_requests,
+            "connections_opened": total_opened,
+            "tls_handshakes": sum(stats.tls_handshakes for stats in self._stats.values()),
+            "in_use": sum(stats.in_flight for stats in self._stats.values()),
+            "waiting": sum(item["waiting"] for item in origins.values()),
+            "reuse_ratio": (
+                round(max(total_requests - total_opened, 0) / total_requests, 4) if total_requests else 0.0
+            ),
+            "per_origin": origins,
+        }
+
+    async def aclose(self) -> None:
+        """Close every pooled connection. Called once during application shutdown."""
+        self._closed = True
+        pools = list(self._pools.values())
+        self._pools.clear()
+        for pool in pools:
+            try:
+                await pool.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing outbound connection pool: {e}")
+        logger.info(f"Closed {len(pools)} outbound connection pools")
+
+
+def open_http_client(http_client_manager: HTTPClientManager | None, **client_kwargs: Any) -> httpx.AsyncClient:
+    """
+    Return a pooled client when a manager is available, otherwise a standalone ``httpx.AsyncClient``.
+
+    Lets module-level helpers accept an optional manager while keeping their
+    ``async with ... as client`` shape for callers (and tests) without one.
+    """
+    if http_client_manager is not None:
+        return http_client_manager.get_client(**client_kwargs)
+    return httpx.AsyncClient(**client_kwargs)
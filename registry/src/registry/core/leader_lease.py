@@ -0,0 +1,130 @@
+"""
+Leader Lease
+
+Some background work must run once per deployment rather than once per replica:
+applying change events to the shared vector DB, or pinging downstream servers on a
+schedule. A LeaderLease lets replicas race for a named lease document in MongoDB;
+the holder renews it every third of its TTL and the others take over once it has
+not been renewed for a full TTL (e.g. the holder crashed).
+
+Leases rely on the replicas' clocks roughly agreeing; the TTL should be well above
+any expected skew.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import socket
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+from pymongo.errors import DuplicateKeyError
+
+logger = logging.getLogger(__name__)
+
+
+def default_holder_id() -> str:
+    """Identify this process in lease documents (host, pid and a random suffix)."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+
+class LeaderLease:
+    """Runs ``on_acquired``/``on_lost`` as this replica gains and loses a named lease."""
+
+    def __init__(
+        self,
+        collection: Callable[[], Any],
+        name: str,
+        *,
+        on_acquired: Callable[[], Awaitable[None]],
+        on_lost: Callable[[], Awaitable[None]],
+        ttl_seconds: float = 30.0,
+        holder_id: str | None = None,
+    ):
+        """
+        Args:
+            collection: Returns the async pymongo collection lease documents are kept in; resolved on start
+            name: Lease name; replicas competing for the same work use the same name
+            on_acquired: Called when this replica becomes the holder
+            on_lost: Called when this replica stops being the holder (including on stop)
+            ttl_seconds: A lease that has not been renewed for this long can be taken over
+            holder_id: Identifies this replica; generated when omitted
+        """
+        self._resolve_collection = collection
+        self._collection = None
+        self.name = name
+        self.on_acquired = on_acquired
+        self.on_lost = on_lost
+        self.ttl_seconds = ttl_seconds
+        self.holder_id = holder_id or default_holder_id()
+        self.is_leader = False
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Start competing for the lease in the background."""
+        if self._task is not None:
+            return
+        self._collection = self._resolve_collection()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop competing, step down and hand the lease back so another replica can take over at once."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+        await self._step_down()
+        try:
+            await self._collection.delete_one({"_id": self.name, "holder": self.holder_id})
+        except Exception as e:
+            logger.warning(f"Failed to release lease '{self.name}': {e}")
+
+    async def try_acquire(self) -> bool:
+        """Take or renew the lease; False while another replica holds an unexpired lease."""
+        now = datetime.now(UTC)
+        try:
+            await self._collection.update_one(
+                {"_id": self.name, "$or": [{"holder": self.holder_id}, {"expiresAt": {"$lt": now}}]},
+                {"$set": {"holder": self.holder_id, "expiresAt": now + timedelta(seconds=self.ttl_seconds)}},
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            # The filter missed (held by someone else), so the upsert collided with their document.
+            return False
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                held = await self.try_acquire()
+            except Exception as e:
+                # Without a renewal another replica may take over once the TTL passes; step down now.
+                logger.warning(f"Failed to renew lease '{self.name}': {e}")
+                held = False
+            if held and not self.is_leader:
+                self.is_leader = True
+                logger.info(f"Acquired lease '{self.name}' as {self.holder_id}")
+                try:
+                    await self.on_acquired()
+                except Exception as e:
+                    logger.error(f"Starting work for lease '{self.name}' failed: {e}", exc_info=True)
+            elif not held:
+                await self._step_down()
+            await asyncio.sleep(self.ttl_seconds / 3)
+
+    async def _step_down(self) -> None:
+        if not self.is_leader:
+            return
+        self.is_leader = False
+        logger.info(f"Lost lease '{self.name}'")
+        try:
+            await self.on_lost()
+        except Exception as e:
+            logger.error(f"Stopping work for lease '{self.name}' failed: {e}", exc_info=True)
@@ -6,6 +6,7 @@ Refactored with centralized configuration and strategy pattern.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import re
@@ -24,8 +25,10 @@ from mcp.client.sse import sse_client
 from mcp.client.streamable_http import streamable_http_client
 from redis import Redis
 
+from ..schemas.enums import HealthStatus
 from .config import settings
 from .exceptions import MisimplementedSpecException
+from .http_client import HTTPClientManager, open_http_client
 
 # Internal imports
 from .mcp_config import MCPClientConfig
@@ -326,7 +329,10 @@ def _clear_session(session_key: str, redis_client: Redis | None = None) -> None:
 
 
 async def initialize_mcp(
-    target_url: str, headers: dict[str, str] = None, transport_type: str = "streamable-http"
+    target_url: str,
+    headers: dict[str, str] = None,
+    transport_type: str = "streamable-http",
+    http_client_manager: HTTPClientManager | None = None,
 ) -> Any | None:
     """
     Perform MCP initialization using MCP client library and return the init_result.
@@ -339,6 +345,7 @@ async def initialize_mcp(
         target_url: MCP server URL
         headers: HTTP headers (optional, defaults to standard MCP headers)
         transport_type: Transport type ("streamable-http" or "sse")
+        http_client_manager: Shared connection pools to use instead of a one-off client
 
     Returns:
         InitializeResult object from MCP library, or None if initialization failed
@@ -360,7 +367,7 @@ async def initialize_mcp(
     try:
         if transport_type == "streamable-http":
             # streamable_http_client supports injecting a custom httpx client.
-            async with httpx.AsyncClient(headers=headers, timeout=30.0) as http_client:
+            async with open_http_client(http_client_manager, headers=headers, timeout=30.0) as http_client:
                 async with streamable_http_client(url=mcp_url, http_client=http_client) as (read, write, _):
                     async with ClientSession(read, write) as session:
                         # Perform MCP initialization
@@ -488,12 +495,108 @@ async def perform_health_check(
         return False, "unhealthy: invalid initialize response", response_time_ms, None
 
 
+@dataclass
+class MCPProbeResult:
+    """Outcome of a lightweight liveness probe."""
+
+    healthy: bool
+    status_message: str
+    response_time_ms: int | None = None
+    # Hash of server version, capabilities and tool list; None when the server could not be listed (e.g. 401)
+    fingerprint: str | None = None
+
+
+def _probe_fingerprint(init_result: Any, tools_response: Any) -> str:
+    server_info = getattr(init_result, "serverInfo", None)
+    payload = {
+        "server": [getattr(server_info, "name", None), getattr(server_info, "version", None)],
+        "protocol": getattr(init_result, "protocolVersion", None),
+        "capabilities": _extract_capabilities(init_result),
+        "tools": _extract_tool_details(tools_response),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+async def probe_mcp_server(
+    target_url: str,
+    headers: dict[str, str] | None = None,
+    transport_type: str = "streamable-http",
+    timeout: float = MCPClientConfig.INIT_TIMEOUT,
+    http_client_manager: HTTPClientManager | None = None,
+) -> MCPProbeResult:
+    """
+    Cheap health probe: initialize, ping and list tools over one session.
+
+    Unlike get_tools_and_capabilities_from_server this skips resources and prompts and
+    returns only a fingerprint of what it saw, so callers can re-read the full server
+    state only when the fingerprint changes.
+
+    Args:
+        target_url: MCP server URL
+        headers: Pre-built HTTP headers (including authentication)
+        transport_type: Transport type ("streamable-http" or "sse")
+        timeout: Overall deadline for the probe in seconds
+        http_client_manager: Shared connection pools used for streamable-http transport
+
+    Returns:
+        MCPProbeResult; 401/403 responses count as reachable without a fingerprint
+    """
+    if headers is None:
+        headers = MCPClientConfig.DEFAULT_HEADERS.copy()
+    if transport_type == MCPClientConfig.TRANSPORT_STDIO:
+        return MCPProbeResult(True, "healthy (stdio transport skipped)")
+
+    strategy = get_server_strategy({"type": transport_type})
+    mcp_url = strategy.modify_url(target_url)
+
+    async def run(session: ClientSession) -> str:
+        init_result = await session.initialize()
+        await session.send_ping()
+        tools_response = await session.list_tools()
+        return _probe_fingerprint(init_result, tools_response)
+
+    start_time = datetime.now(UTC)
+
+    def elapsed_ms() -> int:
+        return int((datetime.now(UTC) - start_time).total_seconds() * 1000)
+
+    try:
+        async with asyncio.timeout(timeout):
+            if transport_type == "sse":
+                async with sse_client(mcp_url, headers=headers) as (read, write):
+                    async with ClientSession(read, write) as session:
+                        fingerprint = await run(session)
+            elif transport_type == "streamable-http":
+                async with open_http_client(http_client_manager, headers=headers, timeout=timeout) as http_client:
+                    async with streamable_http_client(url=mcp_url, http_client=http_client) as (read, write, _):
+                        async with ClientSession(read, write) as session:
+                            fingerprint = await run(session)
+            else:
+                return MCPProbeResult(False, f"Unsupported transport type: {transport_type}")
+    except TimeoutError:
+        return MCPProbeResult(False, HealthStatus.UNHEALTHY_TIMEOUT, elapsed_ms())
+    except Exception as e:
+        errors = e.exceptions if isinstance(e, ExceptionGroup) else (e,)
+        for error in errors:
+            if (
+                isinstance(error, httpx.HTTPStatusError)
+                and error.response.status_code in MCPClientConfig.AUTH_REQUIRED_STATUS_CODES
+            ):
+                return MCPProbeResult(True, "connected (initialize requires authentication)", elapsed_ms())
+        detail = _format_exception_group(e) if isinstance(e, ExceptionGroup) else f"{type(e).__name__} - {e}"
+        logger.debug(f"Health probe failed for {mcp_url}: {detail}")
+        return MCPProbeResult(False, f"unhealthy: {detail}", elapsed_ms())
+
+    return MCPProbeResult(True, HealthStatus.HEALTHY, elapsed_ms(), fingerprint)
+
+
 async def _initialize_mcp_session(
     target_url: str,
     headers: dict[str, str],
     session_key: str,
     transport_type: str = "streamable-http",
     redis_client: Redis | None = None,
+    http_client_manager: HTTPClientManager | None = None,
 ) -> str | None:
     """
     Perform MCP initialization handshake using raw JSON-RPC for streamable-http transport.
@@ -522,6 +625,7 @@ async def _initialize_mcp_session(
                 init_request=init_request,
                 initialized_notification=initialized_notification,
                 redis_client=redis_client,
+                http_client_manager=http_client_manager,
             )
 
         logger.warning(
@@ -543,10 +647,11 @@ async def _initialize_mcp_session_http(
     init_request: dict,
     initialized_notification: dict,
     redis_client: Redis | None = None,
+    http_client_manager: HTTPClientManager | None = None,
 ) -> str | None:
     """Perform MCP initialization handshake for streamable-http transport."""
     # streamable-http: POST initialize directly to the endpoint
-    async with httpx.AsyncClient(headers=headers, timeout=30.0) as http_client:
+    async with open_http_client(http_client_manager, headers=headers, timeout=30.0) as http_client:
         logger.info("📤 Sending initialize request")
         response = await http_client.post(target_url, json=init_request)
         response.raise_for_status()
@@ -786,6 +891,7 @@ async def _get_from_streamable_http(
     include_resources: bool = True,
     include_prompts: bool = True,
     httpx_auth: Any = None,
+    http_client_manager: HTTPClientManager | None = None,
 ) -> MCPServerData:
     """
     Consolidated method to get tools, resources, prompts, and optionally capabilities using streamable-http transport.
@@ -800,6 +906,7 @@ async def _get_from_streamable_http(
         include_capabilities: Whether to retrieve and validate capabilities
         include_resources: Whether to retrieve resources
         include_prompts: Whether to retrieve prompts
+        http_client_manager: Shared connection pools to use instead of a one-off client
 
     Returns:
         MCPServerData containing tools, resources, prompts, and capabilities
@@ -819,11 +926,9 @@ async def _get_from_streamable_http(
 
     logger.info(f"Connecting to MCP server: {mcp_url}")
 
-    # Import httpx for custom client
-
     try:
-        # Create custom httpx client with headers
-        async with httpx.AsyncClient(headers=headers, timeout=30.0, auth=httpx_auth) as http_client:
+        # Create custom httpx client with headers (pooled per origin when a manager is provided)
+        async with open_http_client(http_client_manager, headers=headers, timeout=30.0, auth=httpx_auth) as http_client:
             async with streamable_http_client(url=mcp_url, http_client=http_client) as (read, write, get_session_id):
                 async with ClientSession(read, write) as session:
                     init_result = await asyncio.wait_for(session.initialize(), timeout=MCPClientConfig.INIT_TIMEOUT)
@@ -1260,6 +1365,7 @@ async def get_tools_and_capabilities_from_server(
     include_resources: bool = True,
     include_prompts: bool = True,
     httpx_auth: Any = None,
+    http_client_manager: HTTPClientManager | None = None,
 ) -> MCPServerData:
     """
     Get tools, resources, prompts, and capabilities from server.
@@ -1272,6 +1378,7 @@ async def get_tools_and_capabilities_from_server(
         transport_type: Transport type ("streamable-http" or "sse"), auto-detected if None
         include_resources: Whether to retrieve resources (default: True)
         include_prompts: Whether to retrieve prompts (default: True)
+        http_client_manager: Shared connection pools used for streamable-http transport
 
     Returns:
         MCPServerData containing:
@@ -1302,6 +1409,7 @@ async def get_tools_and_capabilities_from_server(
                 include_resources=include_resources,
                 include_prompts=include_prompts,
                 httpx_auth=httpx_auth,
+                http_client_manager=http_client_manager,
             )
         elif transport_type == MCPClientConfig.TRANSPORT_SSE or transport_type == "sse":
             return await _get_from_sse(
@@ -1324,7 +1432,9 @@ async def get_tools_and_capabilities_from_server(
         return MCPServerData(None, None, None, None, f"Failed to get server data: {type(e).__name__} - {e}")
 
 
-async def get_oauth_metadata_from_server(base_url: str) -> dict | None:
+async def get_oauth_metadata_from_server(
+    base_url: str, http_client_manager: HTTPClientManager | None = None
+) -> dict | None:
     """
     Get OAuth metadata from MCP server's well-known endpoint using RFC 8414 discovery.
 
@@ -1336,7 +1446,7 @@ async def get_oauth_metadata_from_server(base_url: str) -> dict | None:
 
     Args:
         base_url: The base URL of the MCP server (e.g., http://localhost:8000).
-        server_info: Optional server configuration dict (unused, kept for compatibility)
+        http_client_manager: Shared connection pools to use instead of a one-off client
 
     Returns:
         OAuth metadata dictionary or None if failed/not available
@@ -1370,7 +1480,8 @@ async def get_oauth_metadata_from_server(base_url: str) -> dict | None:
 
     try:
         # Create httpx client with timeout and headers for better compatibility
-        async with httpx.AsyncClient(
+        async with open_http_client(
+            http_client_manager,
             timeout=30.0,
             headers={
                 "User-Agent": settings.registry_app_name,
@@ -1455,8 +1566,9 @@ async def get_oauth_metadata_from_server(base_url: str) -> dict | None:
 class MCPClientService:
     """Service wrapper for MCP client helpers and session persistence."""
 
-    def __init__(self, redis_client: Redis | None = None):
+    def __init__(self, redis_client: Redis | None = None, http_client_manager: HTTPClientManager | None = None):
         self.redis_client = redis_client
+        self.http_client_manager = http_client_manager
 
     def get_session(self, session_key: str) -> tuple[str, bool] | None:
         return _get_session(session_key, redis_client=self.redis_client)
@@ -1480,6 +1592,7 @@ class MCPClientService:
             session_key,
             transport_type,
             redis_client=self.redis_client,
+            http_client_manager=self.http_client_manager,
         )
 
     async def get_tools_from_server_with_server_info(
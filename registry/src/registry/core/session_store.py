@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
-from collections import deque
+import os
+import socket
+from collections import OrderedDict
+from uuid import uuid4
 
 from mcp.server.session import ServerSession
+from redis import Redis
+
+from ..utils.otel_metrics import record_elicitation_notification
 
 logger = logging.getLogger(__name__)
 
@@ -15,16 +23,32 @@ class SessionStore:
     When the /oauth/callback route receives the callback request, on success, it retrieves the session object
     via elicitation_id (passed via the "state" parameter) and uses the session to make a best-effort notification
     to client on elicitation completion.
+
+    With a Redis client, the store also records which replica owns each elicitation. A callback that lands on a
+    different replica publishes the completion on a pub/sub channel and the owning replica delivers it.
     """
 
     _max_session_count: int
-    _mapping: dict[str, ServerSession]
-    _elicitation_order: deque[str]
+    _mapping: OrderedDict[str, ServerSession]
 
-    def __init__(self, max_session_count: int = 100):
+    def __init__(
+        self,
+        max_session_count: int = 100,
+        *,
+        redis_client: Redis | None = None,
+        key_prefix: str = "mcpgw",
+        owner_ttl_seconds: int = 600,
+        replica_id: str | None = None,
+    ):
         self._max_session_count = max_session_count
-        self._mapping = {}
-        self._elicitation_order = deque(maxlen=self._max_session_count)
+        # Insertion ordered: the oldest elicitation is first, and any entry can be removed in O(1).
+        self._mapping = OrderedDict()
+        self._redis = redis_client
+        self._owner_key_prefix = f"{key_prefix}:elicitation_owner:"
+        self._channel = f"{key_prefix}:elicitation_complete"
+        self._owner_ttl_seconds = owner_ttl_seconds
+        self.replica_id = replica_id or f"{socket.gethostname()}-{os.getpid()}-{uuid4().hex[:8]}"
+        self._listener_task: asyncio.Task | None = None
 
     def append(self, elicitation_id: str, session: ServerSession):
         # The elicitation_id to session mapping cannot be updated once set.
@@ -35,17 +59,139 @@ class SessionStore:
 
         # If we are at max capacity, pop the oldest elicitation_id and its corresponding session.
         if len(self._mapping) >= self._max_session_count:
-            oldest_id = self._elicitation_order.popleft()
-            self._mapping.pop(oldest_id, None)
+            self._mapping.popitem(last=False)
 
         self._mapping[elicitation_id] = session
-        self._elicitation_order.append(elicitation_id)
+
+        if self._redis is not None:
+            try:
+                self._redis.setex(f"{self._owner_key_prefix}{elicitation_id}", self._owner_ttl_seconds, self.replica_id)
+            except Exception as e:
+                logger.error(f"Failed to record owner replica for elicitation_id {elicitation_id}: {e}")
 
     def pop(self, elicitation_id: str) -> ServerSession | None:
+        session = self._mapping.pop(elicitation_id, None)
+        if session is None:
+            logger.debug(f"elicitation_id {elicitation_id} is not held by this replica.")
+        return session
+
+    async def notify_elicitation_complete(self, elicitation_id: str) -> bool:
+        """
+        Best-effort delivery of notifications/elicitation/complete to the client that started the elicitation.
+
+        Returns:
+            True if the notification was sent locally or handed to the owning replica, False if it was dropped.
+        """
+        session = self.pop(elicitation_id)
+        if session is not None:
+            return await self._send(elicitation_id, session, route="local")
+
+        owner = self._get_owner(elicitation_id)
+        if owner is None or owner == self.replica_id:
+            logger.info(f"could not find session object for elicitation_id {elicitation_id}")
+            record_elicitation_notification("dropped", route="local")
+            return False
+
+        try:
+            payload = json.dumps({"elicitation_id": elicitation_id, "owner": owner})
+            await asyncio.to_thread(self._redis.publish, self._channel, payload)
+        except Exception as e:
+            logger.error(f"Failed to forward elicitation/complete for {elicitation_id} to replica {owner}: {e}")
+            record_elicitation_notification("dropped", route="remote")
+            return False
+
+        logger.info(f"forwarded elicitation/complete for elicitation_id {elicitation_id} to replica {owner}")
+        record_elicitation_notification("forwarded", route="remote")
+        return True
+
+    async def start(self) -> None:
+        """Start listening for completions forwarded by other replicas (no-op without Redis)."""
+        if self._redis is None or self._listener_task is not None:
+            return
+        self._listener_task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener_task is None:
+            return
+        self._listener_task.cancel()
+        try:
+            await self._listener_task
+        except asyncio.CancelledError:
+            pass
+        self._listener_task = None
+
+    async def _send(self, elicitation_id: str, session: ServerSession, *, route: str) -> bool:
+        self._clear_owner(elicitation_id)
+        try:
+            await session.send_elicit_complete(elicitation_id)
+        except Exception:
+            logger.exception(f"failed to send elicitation/complete notification for {elicitation_id}.")
+            record_elicitation_notification("dropped", route=route)
+            return False
+
+        logger.info(
+            f"successfully scheduled sending elicitation/complete notification for elicitation_id {elicitation_id}"
+        )
+        record_elicitation_notification("delivered", route=route)
+        return True
+
+    async def _handle_forwarded(self, data: str) -> None:
         try:
-            self._elicitation_order.remove(elicitation_id)
+            message = json.loads(data)
+            elicitation_id = message["elicitation_id"]
+            owner = message["owner"]
+        except (json.JSONDecodeError, KeyError, TypeError):
+            logger.warning(f"Ignoring malformed elicitation/complete message: {data}")
+            return
+
+        if owner != self.replica_id:
+            return
+
+        session = self.pop(elicitation_id)
+        if session is None:
+            record_elicitation_notification("dropped", route="remote")
+            return
+        await self._send(elicitation_id, session, route="remote")
+
+    async def _listen(self) -> None:
+        backoff = 1.0
+        while True:
+            pubsub = None
+            try:
+                pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+                await asyncio.to_thread(pubsub.subscribe, self._channel)
+                logger.info(f"Listening for forwarded elicitation completions as replica {self.replica_id}")
+                backoff = 1.0
+                while True:
+                    message = await asyncio.to_thread(pubsub.get_message, timeout=1.0)
+                    if message and message.get("type") == "message":
+                        await self._handle_forwarded(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Elicitation pub/sub listener failed, retrying in {backoff:.0f}s: {e}")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+    def _get_owner(self, elicitation_id: str) -> str | None:
+        if self._redis is None:
+            return None
+        try:
+            return self._redis.get(f"{self._owner_key_prefix}{elicitation_id}")
         except Exception as e:
-            logger.error(f"Failed to remove {elicitation_id}: {e}")
-            logger.exception(f"trying to remove elicitation_id {elicitation_id} that doesn't exist in the deque.")
+            logger.error(f"Failed to look up owner replica for elicitation_id {elicitation_id}: {e}")
+            return None
 
-        return self._mapping.pop(elicitation_id, None)
+    def _clear_owner(self, elicitation_id: str) -> None:
+        if self._redis is None:
+            return
+        try:
+            self._redis.delete(f"{self._owner_key_prefix}{elicitation_id}")
+        except Exception as e:
+            logger.debug(f"Failed to clear owner replica for elicitation_id {elicitation_id}: {e}")
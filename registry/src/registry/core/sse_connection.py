@@ -0,0 +1,541 @@
+"""
+Persistent SSE Connections for SSE-type MCP Servers
+
+The legacy SSE transport keeps one long-lived ``GET /sse`` stream per MCP
+session and delivers every JSON-RPC response on it. Instead of opening a
+stream, discovering the messages endpoint and initializing for every tool call
+(``call_tool_via_sse_ephemeral``), the gateway keeps one ``SSEConnection`` per
+(user, server) and multiplexes concurrent requests over it:
+
+- Each request is sent with a connection-unique JSON-RPC id and its response is
+  routed back to the waiting caller by id; the caller's original id is restored.
+- Notifications are forwarded to the caller they belong to (progress token or
+  the only in-flight request).
+- A per-connection semaphore bounds in-flight requests (backpressure).
+- Idle connections send MCP ``ping`` heartbeats; a failed heartbeat or a closed
+  stream marks the connection dead so the next call reconnects.
+- The long-lived GET streams use their own connection pools, sized for
+  ``max_connections`` streams, so open streams never use up the per-origin
+  connections that request POSTs (and all other outbound traffic) depend on.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlparse
+
+import httpx
+from httpx_sse import EventSource
+
+from ..utils.otel_metrics import record_mcp_gateway_session
+from .exceptions import MisimplementedSpecException
+from .http_client import HTTPClientManager, open_http_client
+from .mcp_client import _MCP_INITIALIZE_REQUEST, _MCP_INITIALIZED_NOTIFICATION
+
+logger = logging.getLogger(__name__)
+
+NotificationHandler = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class SSEConnectionLostError(ConnectionError):
+    """Raised when a request could not be delivered because the SSE connection is gone."""
+
+
+def _resolve_messages_url(sse_url: str, endpoint: str) -> str:
+    endpoint = endpoint.strip()
+    if endpoint.startswith("/"):
+        parsed = urlparse(sse_url)
+        return f"{parsed.scheme}://{parsed.netloc}{endpoint}"
+    return endpoint
+
+
+def _raise_for_rpc_error(response_obj: dict[str, Any], action: str) -> None:
+    error_obj = response_obj.get("error")
+    if isinstance(error_obj, dict):
+        raise ConnectionError(
+            f"Downstream SSE MCP {action} failed: {json.dumps(error_obj, default=str, sort_keys=True)}"
+        )
+
+
+@dataclass
+class _PendingRequest:
+    future: asyncio.Future[dict[str, Any]]
+    on_notification: NotificationHandler | None = None
+    progress_token: Any = None
+
+
+@dataclass
+class _ConnectionStats:
+    requests: int = 0
+    waiting: int = 0
+    heartbeats: int = 0
+    notifications: int = 0
+
+
+class SSEConnection:
+    """One long-lived downstream SSE stream shared by all requests of a (user, server) pair."""
+
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient,
+        sse_url: str,
+        *,
+        stream_client: httpx.AsyncClient | None = None,
+        max_in_flight: int = 32,
+        heartbeat_interval_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.http_client = http_client
+        self.stream_client = stream_client or http_client
+        self.sse_url = sse_url
+        self.heartbeat_interval_seconds = heartbeat_interval_seconds
+        self.messages_url: str | None = None
+        self.closed = False
+        self._clock = clock
+        self.last_used_at = clock()
+        self._last_event_at = clock()
+        self._ids = itertools.count(1)
+        self._pending: dict[str, _PendingRequest] = {}
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._headers: dict[str, str] = {}
+        self._pump_task: asyncio.Task | None = None
+        self._heartbeat_task: asyncio.Task | None = None
+        self.stats = _ConnectionStats()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    async def connect(self, headers: dict[str, str], timeout_seconds: float = 30.0) -> None:
+        """Open the SSE stream, wait for the messages endpoint and run the initialize handshake."""
+        self._headers = dict(headers)
+        endpoint_ready: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        endpoint_ready.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._pump_task = asyncio.create_task(self._pump(endpoint_ready))
+
+        try:
+            self.messages_url = await asyncio.wait_for(asyncio.shield(endpoint_ready), timeout=timeout_seconds)
+
+            init_response = await self.request(
+                deepcopy(_MCP_INITIALIZE_REQUEST), headers, timeout_seconds=timeout_seconds
+            )
+            _raise_for_rpc_error(init_response, "initialize")
+            await self._post(deepcopy(_MCP_INITIALIZED_NOTIFICATION), headers, timeout_seconds)
+        except BaseException:
+            await self.aclose()
+            raise
+
+        if self.heartbeat_interval_seconds > 0:
+            self._heartbeat_task = asyncio.create_task(self._heartbeat())
+
+    async def request(
+        self,
+        body: dict[str, Any],
+        headers: dict[str, str],
+        on_notification: NotificationHandler | None = None,
+        timeout_seconds: float = 30.0,
+    ) -> dict[str, Any]:
+        """
+        Send one JSON-RPC request over the shared stream and wait for its response.
+
+        Raises:
+            SSEConnectionLostError: The connection is closed or the POST could not be delivered
+            ConnectionError: The downstream server rejected the POST
+            TimeoutError: No response arrived within ``timeout_seconds``
+        """
+        self.stats.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.stats.waiting -= 1
+
+        try:
+            if self.closed:
+                raise SSEConnectionLostError("Downstream SSE connection is closed.")
+
+            self.last_used_at = self._clock()
+            self._headers = dict(headers)
+            wire_id = f"gw-{next(self._ids)}"
+            params = body.get("params")
+            meta = params.get("_meta") if isinstance(params, dict) else None
+            pending = _PendingRequest(
+                future=asyncio.get_running_loop().create_future(),
+                on_notification=on_notification,
+                progress_token=meta.get("progressToken") if isinstance(meta, dict) else None,
+            )
+            pending.future.add_done_callback(lambda f: f.cancelled() or f.exception())
+            self._pending[wire_id] = pending
+            self.stats.requests += 1
+            try:
+                await self._post({**body, "id": wire_id}, headers, timeout_seconds)
+                response = await asyncio.wait_for(pending.future, timeout=timeout_seconds)
+            finally:
+                self._pending.pop(wire_id, None)
+        finally:
+            self._semaphore.release()
+
+        # Hand the caller back the id it sent, not the connection-local one.
+        return {**response, "id": body.get("id")}
+
+    async def aclose(self) -> None:
+        """Close the stream and fail every in-flight request."""
+        self._mark_closed(SSEConnectionLostError("Downstream SSE connection closed."))
+        for task in (self._heartbeat_task, self._pump_task):
+            if task is not None and not task.done() and task is not asyncio.current_task():
+                task.cancel()
+                try:
+                    await task
+                except BaseException:
+                    pass
+
+    async def _post(self, body: dict[str, Any], headers: dict[str, str], timeout_seconds: float) -> None:
+        if self.messages_url is None or self.closed:
+            raise SSEConnectionLostError("Downstream SSE connection is closed.")
+
+        try:
+            async with self.http_client.stream(
+                "POST",
+                self.messages_url,
+                json=body,
+                headers=headers,
+                timeout=httpx.Timeout(timeout_seconds),
+            ) as resp:
+                if resp.status_code in (404, 410):
+                    # The server forgot the SSE session behind this messages URL.
+                    raise SSEConnectionLostError(f"Downstream SSE session is gone (status={resp.status_code}).")
+                if not resp.is_success:
+                    raw_body = await resp.aread()
+                    raise ConnectionError(
+                        "Error calling downstream MCP server over SSE: "
+                        f"status code: {resp.status_code}, body: {raw_body.decode('utf-8', errors='replace')}"
+                    )
+                if "id" in body and resp.headers.get("content-type", "").startswith("application/json"):
+                    raise MisimplementedSpecException(
+                        "Downstream SSE MCP server responded with application/json instead of delivering "
+                        "the JSON-RPC response on the SSE stream."
+                    )
+        except httpx.TransportError as exc:
+            raise SSEConnectionLostError(f"Error delivering request to downstream SSE MCP server: {exc}") from exc
+
+    async def _pump(self, endpoint_ready: asyncio.Future[str]) -> None:
+        sse_headers = dict(self._headers)
+        sse_headers["Accept"] = "text/event-stream"
+        sse_headers.pop("Content-Type", None)
+        error: BaseException = SSEConnectionLostError("Downstream SSE stream ended.")
+
+        try:
+            # No read timeout on the long-lived stream; liveness is checked by the heartbeat instead.
+            async with self.stream_client.stream(
+                "GET", self.sse_url, headers=sse_headers, timeout=httpx.Timeout(30.0, read=None)
+            ) as sse_resp:
+                if not sse_resp.is_success:
+                    raw = await sse_resp.aread()
+                    raise ConnectionError(
+                        "Error opening downstream SSE stream: "
+                        f"status={sse_resp.status_code}, body={raw.decode('utf-8', errors='replace')}"
+                    )
+
+                async for event in EventSource(sse_resp).aiter_sse():
+                    self._last_event_at = self._clock()
+                    if event.event == "endpoint":
+                        if not endpoint_ready.done():
+                            endpoint_ready.set_result(_resolve_messages_url(self.sse_url, event.data))
+                        continue
+                    if event.event != "message":
+                        continue
+
+                    try:
+                        obj = event.json()
+                    except (json.JSONDecodeError, ValueError, TypeError):
+                        logger.info("Ignoring malformed SSE message event with non-JSON payload.")
+                        continue
+                    if not isinstance(obj, dict) or obj.get("jsonrpc") != "2.0":
+                        logger.info("Ignoring malformed SSE message: %s", obj)
+                        continue
+
+                    await self._dispatch(obj)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            error = exc
+            logger.warning(f"Downstream SSE stream for {self.sse_url} failed: {exc}")
+        finally:
+            if not endpoint_ready.done():
+                endpoint_ready.set_exception(error)
+            self._mark_closed(error)
+
+    async def _dispatch(self, obj: dict[str, Any]) -> None:
+        method = obj.get("method")
+        if isinstance(method, str) and method.startswith("notifications/"):
+            self.stats.notifications += 1
+            pending = self._notification_target(obj)
+            if pending is not None and pending.on_notification is not None:
+                await pending.on_notification(obj)
+            return
+
+        if not (isinstance(obj.get("result"), dict) or isinstance(obj.get("error"), dict)):
+            return
+
+        response_id = obj.get("id")
+        pending = self._pending.get(str(response_id)) if response_id is not None else None
+        if pending is None:
+            logger.info(f"Ignoring SSE response for unknown request id: {response_id}")
+            return
+        if not pending.future.done():
+            pending.future.set_result(obj)
+
+    def _notification_target(self, obj: dict[str, Any]) -> _PendingRequest | None:
+        params = obj.get("params")
+        if isinstance(params, dict):
+            token = params.get("progressToken")
+            if token is not None:
+                for pending in self._pending.values():
+                    if pending.progress_token == token:
+                        return pending
+        if len(self._pending) == 1:
+            return next(iter(self._pending.values()))
+        return None
+
+    async def _heartbeat(self) -> None:
+        while not self.closed:
+            await asyncio.sleep(self.heartbeat_interval_seconds)
+            if self.closed:
+                return
+            if self._pending or self._clock() - self._last_event_at < self.heartbeat_interval_seconds:
+                continue
+            try:
+                self.stats.heartbeats += 1
+                await self.request(
+                    {"jsonrpc": "2.0", "id": "ping", "method": "ping"},
+                    self._headers,
+                    timeout_seconds=self.heartbeat_interval_seconds,
+                )
+            except Exception as exc:
+                logger.info(f"Heartbeat failed for downstream SSE stream {self.sse_url}: {exc}")
+                await self.aclose()
+                return
+
+    def _mark_closed(self, error: BaseException) -> None:
+        self.closed = True
+        for pending in self._pending.values():
+            if not pending.future.done():
+                pending.future.set_exception(error)
+
+
+class SSEConnectionManager:
+    """App-scoped owner of persistent downstream SSE connections keyed by (user, server)."""
+
+    def __init__(
+        self,
+        *,
+        http_client_manager: HTTPClientManager | None = None,
+        max_in_flight_per_connection: int = 32,
+        heartbeat_interval_seconds: float = 30.0,
+        idle_ttl_seconds: float = 600.0,
+        max_connections: int = 500,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            http_client_manager: Shared outbound pools for request POSTs; a standalone client is used when None
+            max_in_flight_per_connection: Concurrent requests multiplexed on one stream before callers queue
+            heartbeat_interval_seconds: Idle time after which a ping checks the stream is alive (0 disables)
+            idle_ttl_seconds: Connections unused for longer than this are closed
+            max_connections: Upper bound on open streams; least recently used idle ones are closed first
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.http_client_manager = http_client_manager
+        self.max_in_flight_per_connection = max_in_flight_per_connection
+        self.heartbeat_interval_seconds = heartbeat_interval_seconds
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.max_connections = max_connections
+        self._clock = clock
+        self._http_client: httpx.AsyncClient | None = None
+        self._stream_pools: HTTPClientManager | None = None
+        self._stream_client: httpx.AsyncClient | None = None
+        self._connections: OrderedDict[str, SSEConnection] = OrderedDict()
+        self._connecting: dict[str, asyncio.Future[SSEConnection]] = {}
+        self._reconnects = 0
+
+    @classmethod
+    def from_settings(cls, settings, http_client_manager: HTTPClientManager | None = None) -> SSEConnectionManager:
+        return cls(
+            http_client_manager=http_client_manager,
+            max_in_flight_per_connection=settings.mcpgw_sse_max_in_flight_per_connection,
+            heartbeat_interval_seconds=settings.mcpgw_sse_heartbeat_interval_seconds,
+            idle_ttl_seconds=settings.mcpgw_sse_idle_ttl_seconds,
+            max_connections=settings.mcpgw_sse_max_connections,
+        )
+
+    async def call_tool(
+        self,
+        key: str,
+        sse_url: str,
+        headers: dict[str, str],
+        request_body: dict[str, Any],
+        on_notification: NotificationHandler | None = None,
+        timeout_seconds: float = 30.0,
+        server_name: str = "unknown",
+    ) -> dict[str, Any]:
+        """
+        Execute one tool call over the persistent connection for ``key``, connecting on first use.
+
+        A request that could not be delivered on a reused connection is retried once
+        on a fresh connection; once the POST was accepted it is never resent.
+
+        Raises:
+            ConnectionError: Stream or POST failures, or a JSON-RPC error response
+            TimeoutError: No response within ``timeout_seconds``
+            MisimplementedSpecException: The server answered outside the SSE stream
+        """
+        if request_body.get("id") is None:
+            raise MisimplementedSpecException("SSE tool call request must include a JSON-RPC id.")
+
+        connection, reused = await self._get_connection(key, sse_url, headers, timeout_seconds, server_name)
+        try:
+            response = await connection.request(request_body, headers, on_notification, timeout_seconds)
+        except SSEConnectionLostError:
+            await self._discard(key, connection, server_name)
+            if not reused:
+                raise
+            self._reconnects += 1
+            connection, _ = await self._get_connection(key, sse_url, headers, timeout_seconds, server_name)
+            response = await connection.request(request_body, headers, on_notification, timeout_seconds)
+
+        _raise_for_rpc_error(response, "tool call")
+        return response
+
+    async def aclose(self) -> None:
+        """Close every open stream. Called once during application shutdown."""
+        connections = list(self._connections.values())
+        self._connections.clear()
+        for connection in connections:
+            await connection.aclose()
+        if self._http_client is not None and self.http_client_manager is None:
+            await self._http_client.aclose()
+        self._http_client = None
+        if self._stream_client is not None:
+            await self._stream_client.aclose()
+        if self._stream_pools is not None:
+            await self._stream_pools.aclose()
+        self._stream_client = self._stream_pools = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get connection statistics: open streams, multiplexed in-flight requests and queued callers."""
+        connections = [connection for connection in self._connections.values() if not connection.closed]
+        return {
+            "connections": len(connections),
+            "connecting": len(self._connecting),
+            "in_flight": sum(connection.in_flight for connection in connections),
+            "waiting": sum(connection.stats.waiting for connection in connections),
+            "requests": sum(connection.stats.requests for connection in connections),
+            "heartbeats": sum(connection.stats.heartbeats for connection in connections),
+            "reconnects": self._reconnects,
+            "max_in_flight_per_connection": self.max_in_flight_per_connection,
+            "max_connections": self.max_connections,
+        }
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        if self._http_client is None:
+            self._http_client = open_http_client(self.http_client_manager, timeout=30.0, follow_redirects=True)
+        return self._http_client
+
+    def _get_stream_client(self) -> httpx.AsyncClient:
+        """Client for the GET streams, whose pools hold up to max_connections streams per origin."""
+        if self._stream_client is None:
+            if self.http_client_manager is not None:
+                # HTTP/1.1 so every stream gets its own connection instead of queuing behind the
+                # server's HTTP/2 concurrent-stream limit; nothing to keep alive once a stream ends.
+                self._stream_pools = HTTPClientManager(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=0,
+                    http2=False,
+                    retries=self.http_client_manager.retries,
+                )
+                self._stream_client = self._stream_pools.get_client(timeout=30.0, follow_redirects=True)
+            else:
+                limits = httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=0)
+                self._stream_client = httpx.AsyncClient(timeout=30.0, follow_redirects=True, limits=limits)
+        return self._stream_client
+
+    async def _get_connection(
+        self,
+        key: str,
+        sse_url: str,
+        headers: dict[str, str],
+        timeout_seconds: float,
+        server_name: str,
+    ) -> tuple[SSEConnection, bool]:
+        await self._evict_idle()
+
+        connection = self._connections.get(key)
+        if connection is not None and not connection.closed and connection.sse_url == sse_url:
+            self._connections.move_to_end(key)
+            record_mcp_gateway_session(server_name, "warm")
+            return connection, True
+        if connection is not None:
+            await self._discard(key, connection, server_name)
+
+        connecting = self._connecting.get(key)
+        if connecting is not None:
+            record_mcp_gateway_session(server_name, "joined")
+            return await asyncio.shield(connecting), True
+
+        future: asyncio.Future[SSEConnection] = asyncio.get_running_loop().create_future()
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._connecting[key] = future
+        try:
+            connection = SSEConnection(
+                self._get_http_client(),
+                sse_url,
+                stream_client=self._get_stream_client(),
+                max_in_flight=self.max_in_flight_per_connection,
+                heartbeat_interval_seconds=self.heartbeat_interval_seconds,
+                clock=self._clock,
+            )
+            await connection.connect(headers, timeout_seconds)
+        except BaseException as exc:
+            future.set_exception(exc)
+            record_mcp_gateway_session(server_name, "failed")
+            raise
+        finally:
+            self._connecting.pop(key, None)
+
+        future.set_result(connection)
+        self._connections[key] = connection
+        record_mcp_gateway_session(server_name, "handshake")
+        logger.info(f"Opened persistent downstream SSE connection for {key}")
+        return connection, False
+
+    async def _discard(self, key: str, connection: SSEConnection, server_name: str) -> None:
+        if self._connections.get(key) is connection:
+            del self._connections[key]
+            record_mcp_gateway_session(server_name, "expired")
+        await connection.aclose()
+
+    async def _evict_idle(self) -> None:
+        now = self._clock()
+        stale = [
+            key
+            for key, connection in self._connections.items()
+            if connection.closed or (not connection.in_flight and now - connection.last_used_at > self.idle_ttl_seconds)
+        ]
+        overflow = len(self._connections) - len(stale) - self.max_connections + 1
+        if overflow > 0:
+            # Oldest first: the dict is kept in last-used order.
+            idle = [key for key, c in self._connections.items() if key not in stale and not c.in_flight]
+            stale.extend(idle[:overflow])
+        for key in stale:
+            connection = self._connections.pop(key)
+            await connection.aclose()
+        if stale:
+            logger.debug(f"Closed {len(stale)} idle downstream SSE connections")
@@ -6,11 +6,13 @@ from registry_pkgs.vector.repositories.mcp_server_repository import MCPServerRep
 
 from .auth.oauth.reconnection import OAuthReconnectionManager
 from .container import RegistryContainer
+from .core.http_client import HTTPClientManager
 from .core.session_store import SessionStore
 from .health.service import HealthMonitoringService
 from .services.a2a_agent_service import A2AAgentService
 from .services.access_control_service import ACLService
 from .services.agentcore_import_service import AgentCoreImportService
+from .services.bulk_import_service import BulkImportService
 from .services.federation_service import FederationService
 from .services.group_service import GroupService
 from .services.oauth.connection_service import MCPConnectionService
@@ -31,6 +33,10 @@ def get_vector_service(container: RegistryContainer = Depends(get_container)) ->
     return container.vector_service
 
 
+def get_http_client_manager(container: RegistryContainer = Depends(get_container)) -> HTTPClientManager:
+    return container.http_client_manager
+
+
 def get_mcp_server_repo(container: RegistryContainer = Depends(get_container)) -> MCPServerRepository:
     return container.mcp_server_repo
 
@@ -93,3 +99,7 @@ def get_a2a_agent_service(container: RegistryContainer = Depends(get_container))
 
 def get_agentcore_import_service(container: RegistryContainer = Depends(get_container)) -> AgentCoreImportService:
     return container.agentcore_import_service
+
+
+def get_bulk_import_service(container: RegistryContainer = Depends(get_container)) -> BulkImportService:
+    return container.bulk_import_service
@@ -109,3 +109,21 @@ async def health_status_http(request: Request):
 async def websocket_stats(request: Request):
     """Get WebSocket performance statistics for monitoring."""
     return request.app.state.container.health_service.get_websocket_stats()
+
+
+@router.get("/http_pool/stats")
+async def http_pool_stats(request: Request):
+    """Get outbound HTTP connection pool statistics (in-use, waiting, reuse ratio) for monitoring."""
+    return request.app.state.container.http_client_manager.get_stats()
+
+
+@router.get("/mcp_sessions/stats")
+async def mcp_session_pool_stats(request: Request):
+    """Get gateway downstream MCP session pool statistics (warm sessions, handshake avoidance) for monitoring."""
+    return request.app.state.container.mcp_session_pool.get_stats()
+
+
+@router.get("/sse_connections/stats")
+async def sse_connection_stats(request: Request):
+    """Get persistent downstream SSE connection statistics (open streams, in-flight, queued) for monitoring."""
+    return request.app.state.container.sse_connection_manager.get_stats()
@@ -0,0 +1,214 @@
+"""
+Health Check Scheduler
+
+Runs per-server health checks from a priority queue keyed by next-due time rather
+than sweeping every server on a fixed tick. At most ``max_concurrency`` checks run at
+once, intervals are jittered so servers registered together do not stay in lockstep,
+failing servers back off exponentially, and a server whose state just flipped is
+re-checked quickly to confirm the transition.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# A check returns True (healthy), False (unhealthy) or None when the server should no longer be checked.
+HealthCheck = Callable[[str], Awaitable[bool | None]]
+ServerDiscovery = Callable[[], Awaitable[Iterable[str]]]
+
+
+@dataclass
+class _ServerState:
+    healthy: bool | None = None
+    failures: int = 0
+    checks: int = 0
+
+
+class HealthCheckScheduler:
+    """Priority-queue scheduler for bounded-concurrency, adaptive health checks."""
+
+    def __init__(
+        self,
+        check: HealthCheck,
+        discover: ServerDiscovery,
+        *,
+        interval_seconds: float = 300,
+        max_interval_seconds: float = 3600,
+        recheck_seconds: float = 30,
+        max_concurrency: int = 10,
+        jitter_ratio: float = 0.1,
+    ):
+        """
+        Args:
+            check: Checks one server by id
+            discover: Returns the ids of all servers that should be checked; re-run every interval
+            interval_seconds: Interval between checks of a healthy server
+            max_interval_seconds: Upper bound of the back-off interval for failing servers
+            recheck_seconds: Delay before confirming a server whose health just changed
+            max_concurrency: Maximum number of checks in flight
+            jitter_ratio: Intervals are randomised by +/- this fraction
+        """
+        self.check = check
+        self.discover = discover
+        self.interval_seconds = interval_seconds
+        self.max_interval_seconds = max(max_interval_seconds, interval_seconds)
+        self.recheck_seconds = recheck_seconds
+        self.jitter_ratio = jitter_ratio
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._queue: list[tuple[float, int, str]] = []
+        self._due: dict[str, float] = {}  # server id -> due time of its live queue entry
+        self._servers: dict[str, _ServerState] = {}
+        self._in_flight: set[asyncio.Task] = set()
+        self._sequence = 0
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._next_discovery = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    async def start(self) -> None:
+        if self._task is None:
+            # Servers may have changed while another replica held the health check lease; rediscover first.
+            self._next_discovery = 0.0
+            self._task = asyncio.create_task(self._run())
+            logger.info(
+                f"Health check scheduler started (interval={self.interval_seconds}s, "
+                f"max_concurrency={self.max_concurrency})"
+            )
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        tasks = [task, *self._in_flight] if task else list(self._in_flight)
+        for pending in tasks:
+            pending.cancel()
+        for pending in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await pending
+        self._in_flight.clear()
+
+    def schedule(self, server_id: str, delay: float = 0.0) -> None:
+        """Check ``server_id`` after ``delay`` seconds, or earlier if it is already due sooner."""
+        self._servers.setdefault(server_id, _ServerState())
+        self._push(server_id, delay)
+
+    def remove(self, server_id: str) -> None:
+        """Stop checking ``server_id``; an in-flight check finishes but is not rescheduled."""
+        self._servers.pop(server_id, None)
+        self._due.pop(server_id, None)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "servers": len(self._servers),
+            "queued": len(self._due),
+            "in_flight": len(self._in_flight),
+            "unhealthy": sum(1 for state in self._servers.values() if state.healthy is False),
+        }
+
+    def sync(self, server_ids: Iterable[str]) -> None:
+        """Track exactly ``server_ids``; new servers are spread over the first interval."""
+        wanted = set(server_ids)
+        for server_id in self._servers.keys() - wanted:
+            self.remove(server_id)
+        for server_id in wanted - self._servers.keys():
+            self.schedule(server_id, random.uniform(0, self.interval_seconds))
+
+    def next_delay(self, state: _ServerState, previous: bool | None) -> float:
+        """Delay until the next check of a server given its latest result."""
+        if previous is not None and state.healthy != previous:
+            delay = self.recheck_seconds
+        elif state.healthy:
+            delay = self.interval_seconds
+        else:
+            # Consecutive failures: interval, 2x, 4x ... capped.
+            delay = min(self.interval_seconds * 2 ** min(max(state.failures - 1, 0), 16), self.max_interval_seconds)
+        return delay * random.uniform(1 - self.jitter_ratio, 1 + self.jitter_ratio)
+
+    def _push(self, server_id: str, delay: float) -> None:
+        due = time.monotonic() + max(delay, 0.0)
+        current = self._due.get(server_id)
+        if current is not None and current <= due:
+            return
+        self._due[server_id] = due
+        self._sequence += 1
+        heapq.heappush(self._queue, (due, self._sequence, server_id))
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                now = time.monotonic()
+                if now >= self._next_discovery:
+                    await self._discover()
+                    self._next_discovery = now + self.interval_seconds
+
+                wait = self._next_discovery - now
+                if self._queue:
+                    due, _, server_id = self._queue[0]
+                    if self._due.get(server_id) != due:
+                        heapq.heappop(self._queue)  # superseded or removed
+                        continue
+                    if due <= now:
+                        heapq.heappop(self._queue)
+                        del self._due[server_id]
+                        await self._semaphore.acquire()
+                        task = asyncio.create_task(self._check(server_id))
+                        self._in_flight.add(task)
+                        task.add_done_callback(self._check_done)
+                        continue
+                    wait = min(wait, due - now)
+
+                self._wakeup.clear()
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=max(wait, 0.0))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in health check scheduler: {e}", exc_info=True)
+                await asyncio.sleep(1)
+
+    def _check_done(self, task: asyncio.Task) -> None:
+        self._in_flight.discard(task)
+        self._semaphore.release()
+
+    async def _discover(self) -> None:
+        try:
+            self.sync(await self.discover())
+        except Exception as e:
+            logger.warning(f"Failed to list servers for health checks: {e}")
+
+    async def _check(self, server_id: str) -> None:
+        try:
+            healthy = await self.check(server_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Health check for server {server_id} failed: {e}")
+            healthy = False
+
+        state = self._servers.get(server_id)
+        if state is None:
+            return
+        if healthy is None:
+            self.remove(server_id)
+            return
+
+        previous = state.healthy
+        state.healthy = healthy
+        state.failures = 0 if healthy else state.failures + 1
+        state.checks += 1
+        if previous is not None and previous != healthy:
+            logger.info(f"Server {server_id} is now {'healthy' if healthy else 'unhealthy'}")
+        self._push(server_id, self.next_delay(state, previous))
@@ -2,21 +2,48 @@ import asyncio
 import contextlib
 import json
 import logging
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from time import time
+from time import monotonic, time
 
 import httpx
 from fastapi import WebSocket
 
+from ..core.change_streams import ChangeEvent
 from ..core.config import settings
 from ..schemas.enums import HealthStatus
+from ..utils.otel_metrics import record_websocket_backpressure, record_websocket_send
 from ..utils.utils import normalize_headers
+from .scheduler import HealthCheckScheduler
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _ClientChannel:
+    """Per-connection send queue; a dedicated writer task drains it so slow clients never block a broadcast."""
+
+    websocket: WebSocket
+    version: int  # last health state version this client has been sent
+    queue: deque[tuple[int, str, float]] = field(default_factory=deque)  # (version, message, enqueued_at)
+    resync: bool = False  # backlog was dropped; send everything newer than ``version`` in one message
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+    task: asyncio.Task | None = None
+
+
 class HighPerformanceWebSocketManager:
-    """High-performance WebSocket manager for 400-1000+ concurrent connections."""
+    """
+    High-performance WebSocket manager for 400-1000+ concurrent connections.
+
+    Health state is versioned per service path. Each broadcast carries only the paths
+    that changed (``{path: health_data}``, ``None`` for a removed service), is JSON
+    encoded once and the same string is queued for every client. A removed service is
+    kept as a ``None`` tombstone only until every connected client has been sent it. Every client has a
+    bounded queue drained by its own writer task; when a client falls behind and its
+    queue overflows, the backlog is dropped oldest-first and replaced by a single
+    catch-up delta of everything newer than the last version that client received.
+    """
 
     def __init__(self, health_service=None):
         self.health_service = health_service
@@ -24,10 +51,18 @@ class HighPerformanceWebSocketManager:
         self.connection_metadata: dict[WebSocket, dict] = {}
 
         # Rate limiting and batching
-        self.pending_updates: dict[str, dict] = {}  # service_path -> latest_data
+        self.pending_updates: dict[str, dict | None] = {}  # service_path -> latest_data
         self.last_broadcast_time = 0
         self.min_broadcast_interval = settings.websocket_broadcast_interval_ms / 1000.0
         self.max_batch_size = settings.websocket_max_batch_size
+        self.max_queue_size = settings.websocket_client_queue_size
+        self._flush_task: asyncio.Task | None = None
+
+        # Versioned health state: service_path -> (version it last changed at, health data or None if removed)
+        self.version = 0
+        self.state: dict[str, tuple[int, dict | None]] = {}
+        self.removed: dict[str, int] = {}  # service_path -> version of its tombstone in ``state``
+        self.channels: dict[WebSocket, _ClientChannel] = {}
 
         # Connection health tracking
         self.failed_connections: set[WebSocket] = set()
@@ -36,6 +71,9 @@ class HighPerformanceWebSocketManager:
         # Performance metrics
         self.broadcast_count = 0
         self.failed_send_count = 0
+        self.dropped_message_count = 0
+        self.resync_count = 0
+        self._recent_lag: deque[float] = deque(maxlen=256)
 
     async def add_connection(self, websocket: WebSocket) -> bool:
         """Add a new WebSocket connection with connection limits."""
@@ -56,8 +94,11 @@ class HighPerformanceWebSocketManager:
 
             logger.debug(f"WebSocket connected: {len(self.connections)} total connections")
 
-            # Send initial status efficiently
+            # Send initial status efficiently; deltas continue from the current version
+            channel = self._channel(websocket)
             await self._send_initial_status_optimized(websocket)
+            if websocket in self.connections:
+                channel.task = asyncio.create_task(self._drain(channel))
             return True
 
         except Exception as e:
@@ -69,14 +110,33 @@ class HighPerformanceWebSocketManager:
         self.connections.discard(websocket)
         self.connection_metadata.pop(websocket, None)
         self.failed_connections.discard(websocket)
+        channel = self.channels.pop(websocket, None)
+        if channel and channel.task and channel.task is not asyncio.current_task():
+            channel.task.cancel()
+        self._prune_removed()
 
         logger.debug(f"WebSocket disconnected: {len(self.connections)} total connections")
 
+    async def close(self):
+        """Stop the flush and writer tasks."""
+        tasks = [channel.task for channel in self.channels.values() if channel.task]
+        if self._flush_task:
+            tasks.append(self._flush_task)
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self.channels.clear()
+
     async def _send_initial_status_optimized(self, websocket: WebSocket):
         """Send initial status using cached data to avoid blocking."""
         try:
             # Use cached health data to avoid blocking on service calls
-            cached_data = self.health_service._get_cached_health_data() if self.health_service is not None else {}
+            if self.health_service is not None:
+                cached_data = self.health_service._get_cached_health_data()
+            else:
+                cached_data = {path: data for path, (_, data) in self.state.items() if data is not None}
             if cached_data:
                 await websocket.send_text(json.dumps(cached_data))
         except Exception as e:
@@ -84,71 +144,123 @@ class HighPerformanceWebSocketManager:
             await self.remove_connection(websocket)
 
     async def broadcast_update(self, service_path: str | None = None, health_data: dict | None = None):
-        """High-performance broadcasting with batching and rate limiting."""
-        if not self.connections:
-            return
-
-        current_time = time()
-
-        # Rate limiting: prevent too frequent broadcasts
-        if current_time - self.last_broadcast_time < self.min_broadcast_interval:
-            # Queue the update for later batch processing
-            if service_path and health_data:
-                self.pending_updates[service_path] = health_data
-            return
-
-        # Prepare broadcast data
+        """Record a change and broadcast it, coalescing changes that arrive within the broadcast interval."""
         if service_path and health_data:
             # Single service update
-            broadcast_data = {service_path: health_data}
+            self.pending_updates[service_path] = health_data
+        elif not self.pending_updates and self.health_service is not None:
+            # Full status update: diff against the versioned state so only real changes go out
+            for path, data in self.health_service._get_cached_health_data().items():
+                self.pending_updates[path] = data
+        self._schedule_flush()
+
+    async def remove_service(self, service_path: str):
+        """Tell clients a service is gone; they receive ``{service_path: null}``."""
+        self.pending_updates[service_path] = None
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        if not self.pending_updates or (self._flush_task and not self._flush_task.done()):
+            return
+        delay = self.min_broadcast_interval - (time() - self.last_broadcast_time)
+        if delay <= 0:
+            self._flush()
         else:
-            # Batch updates or full status
-            if self.pending_updates:
-                # Send pending updates in batches
-                batch_data = dict(list(self.pending_updates.items())[: self.max_batch_size])
-                broadcast_data = batch_data
-                # Remove sent items from pending
-                for key in batch_data:
-                    self.pending_updates.pop(key, None)
-            else:
-                # Full status update (avoid this when possible)
-                broadcast_data = (
-                    self.health_service._get_cached_health_data() if self.health_service is not None else {}
-                )
-
-        if broadcast_data:
-            await self._send_to_connections_optimized(broadcast_data)
-            self.last_broadcast_time = current_time
-
-    async def _send_to_connections_optimized(self, data: dict):
-        """Optimized concurrent sending with automatic cleanup."""
+            self._flush_task = asyncio.create_task(self._flush_later(delay))
+
+    async def _flush_later(self, delay: float):
+        await asyncio.sleep(delay)
+        self._flush()
+
+    def _flush(self):
+        """Turn pending updates into versioned deltas of at most ``max_batch_size`` services each."""
+        pending, self.pending_updates = self.pending_updates, {}
+        changed = [(path, data) for path, data in pending.items() if self.state.get(path, (0, None))[1] != data]
+        for i in range(0, len(changed), self.max_batch_size):
+            delta = dict(changed[i : i + self.max_batch_size])
+            self.version += 1
+            for path, data in delta.items():
+                self.state[path] = (self.version, data)
+                if data is None:
+                    self.removed[path] = self.version
+                else:
+                    self.removed.pop(path, None)
+            self._send_to_connections_optimized(delta)
+        self._prune_removed()
+        self.last_broadcast_time = time()
+
+    def _prune_removed(self):
+        """Forget tombstones every connected client has been sent; new clients never need them."""
+        if not self.removed:
+            return
+        acknowledged = min((channel.version for channel in self.channels.values()), default=self.version)
+        for path, version in list(self.removed.items()):
+            if version <= acknowledged:
+                del self.removed[path]
+                del self.state[path]
+
+    def _send_to_connections_optimized(self, data: dict):
+        """Encode a delta once and queue the shared message for every connection."""
         if not self.connections:
             return
 
         message = json.dumps(data)
-        connections_list = list(self.connections)  # Snapshot for safe iteration
+        enqueued_at = monotonic()
+        for connection in list(self.connections):
+            self._enqueue(self._channel(connection), self.version, message, enqueued_at)
 
-        # Split into chunks for better memory management with many connections
-        chunk_size = 100  # Process 100 connections at a time
-
-        for i in range(0, len(connections_list), chunk_size):
-            chunk = connections_list[i : i + chunk_size]
-
-            # Send to chunk concurrently
-            tasks = [self._safe_send_message(conn, message) for conn in chunk]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Track failed connections
-            for conn, result in zip(chunk, results, strict=False):
-                if isinstance(result, Exception):
-                    self.failed_connections.add(conn)
-                    self.failed_send_count += 1
+        self.broadcast_count += 1
 
-        # Cleanup failed connections in batch (non-blocking)
-        if self.failed_connections:
-            asyncio.create_task(self._cleanup_failed_connections())
+    def _channel(self, websocket: WebSocket) -> _ClientChannel:
+        channel = self.channels.get(websocket)
+        if channel is None:
+            channel = self.channels[websocket] = _ClientChannel(websocket=websocket, version=self.version)
+        return channel
+
+    def _enqueue(self, channel: _ClientChannel, version: int, message: str, enqueued_at: float):
+        if channel.resync:
+            pass  # the pending catch-up delta will include this change
+        elif len(channel.queue) >= self.max_queue_size:
+            # Drop the backlog oldest-first and coalesce it into one catch-up delta.
+            self.dropped_message_count += len(channel.queue)
+            record_websocket_backpressure(dropped=len(channel.queue))
+            channel.queue.clear()
+            channel.resync = True
+            self.resync_count += 1
+        else:
+            channel.queue.append((version, message, enqueued_at))
+        channel.wakeup.set()
 
-        self.broadcast_count += 1
+    async def _drain(self, channel: _ClientChannel):
+        """Writer task of one connection."""
+        while True:
+            await channel.wakeup.wait()
+            channel.wakeup.clear()
+            while channel.resync or channel.queue:
+                if channel.resync:
+                    channel.resync = False
+                    version, enqueued_at = self.version, monotonic()
+                    delta = {
+                        path: data for path, (changed_at, data) in self.state.items() if changed_at > channel.version
+                    }
+                    message = json.dumps(delta) if delta else None
+                else:
+                    version, message, enqueued_at = channel.queue.popleft()
+                    if version <= channel.version:
+                        continue
+
+                if message is not None:
+                    depth = len(channel.queue)
+                    result = await self._safe_send_message(channel.websocket, message)
+                    if result is not True:
+                        self.failed_send_count += 1
+                        self.failed_connections.add(channel.websocket)
+                        self.cleanup_task = asyncio.create_task(self._cleanup_failed_connections())
+                        return
+                    lag = monotonic() - enqueued_at
+                    self._recent_lag.append(lag)
+                    record_websocket_send(lag_seconds=lag, queue_depth=depth)
+                channel.version = version
 
     async def _safe_send_message(self, connection: WebSocket, message: str):
         """Send message with timeout and error handling."""
@@ -174,19 +286,28 @@ class HighPerformanceWebSocketManager:
 
     def get_stats(self) -> dict:
         """Get performance statistics."""
+        depths = [len(channel.queue) for channel in self.channels.values()]
+        lags = list(self._recent_lag)
         return {
             "active_connections": len(self.connections),
             "pending_updates": len(self.pending_updates),
             "total_broadcasts": self.broadcast_count,
             "failed_sends": self.failed_send_count,
             "failed_connections": len(self.failed_connections),
+            "state_version": self.version,
+            "queue_depth_total": sum(depths),
+            "queue_depth_max": max(depths, default=0),
+            "dropped_messages": self.dropped_message_count,
+            "resyncs": self.resync_count,
+            "send_lag_avg_ms": round(sum(lags) / len(lags) * 1000, 2) if lags else 0.0,
+            "send_lag_max_ms": round(max(lags) * 1000, 2) if lags else 0.0,
         }
 
 
 class HealthMonitoringService:
     """Optimized health monitoring service for high-scale WebSocket operations."""
 
-    def __init__(self, server_service, mcp_client_service):
+    def __init__(self, server_service, mcp_client_service, scheduler_enabled: bool = False):
         self.server_health_status: dict[str, str] = {}
         self.server_last_check_time: dict[str, datetime] = {}
         self.server_service = server_service
@@ -197,27 +318,45 @@ class HealthMonitoringService:
 
         # Background task management
         self.health_check_task: asyncio.Task | None = None
+        self.scheduler: HealthCheckScheduler | None = None
+        if scheduler_enabled:
+            self.scheduler = HealthCheckScheduler(
+                check=self._scheduled_check,
+                discover=self.server_service.list_health_check_targets,
+                interval_seconds=settings.health_check_interval_seconds,
+                max_interval_seconds=settings.health_check_max_interval_seconds,
+                recheck_seconds=settings.health_check_recheck_seconds,
+                max_concurrency=settings.health_check_max_concurrency,
+                jitter_ratio=settings.health_check_jitter_ratio,
+            )
 
         # Performance optimizations
         self._cached_health_data: dict = {}
         self._cache_timestamp = 0
         self._cache_ttl = settings.websocket_cache_ttl_seconds
+        # Server id -> path, so change stream deletes (which carry only the id) can be resolved.
+        self._server_paths: dict[str, str] = {}
+        # Server id -> (enabled, url, type) last seen, so only reachability changes trigger a re-check.
+        self._server_configs: dict[str, tuple] = {}
 
     async def initialize(self):
         """Initialize the health monitoring service."""
         logger.info("Initializing health monitoring service...")
 
-        # DEPRECATED: Background health checks disabled in favor of MongoDB-based monitoring
-        # TODO: Refactor to support WebSocket updates from MongoDB change streams
-        # Start background health checks
+        # DEPRECATED: The fixed-tick sweep below is replaced by the per-server HealthCheckScheduler,
+        # which writes results to MongoDB; they reach WebSocket clients through handle_server_change.
         # self.health_check_task = asyncio.create_task(self._run_health_checks())
-        logger.info("Background health checks DISABLED - using MongoDB for health monitoring")
+        # The scheduler itself is started by whichever replica holds the health check lease (see container).
+        if not self.scheduler:
+            logger.info("Scheduled health checks DISABLED - using MongoDB for health monitoring")
 
         logger.info("Health monitoring service initialized!")
 
     async def shutdown(self):
         """Shutdown the health monitoring service."""
         # Cancel background tasks
+        if self.scheduler:
+            await self.scheduler.stop()
         if self.health_check_task:
             self.health_check_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
@@ -232,6 +371,7 @@ class HealthMonitoringService:
 
         if close_tasks:
             await asyncio.gather(*close_tasks, return_exceptions=True)
+        await self.websocket_manager.close()
 
         logger.info("Health monitoring service shutdown complete")
 
@@ -288,6 +428,81 @@ class HealthMonitoringService:
         self._cache_timestamp = current_time
         return data
 
+    async def handle_server_change(self, event: ChangeEvent) -> None:
+        """Keep cached health data in step with server documents changed on any replica, and push the change."""
+        if self.scheduler and self.scheduler.running:
+            self._reschedule(event)
+        if event.is_delete:
+            service_path = self._server_paths.pop(event.document_id, None)
+            if service_path:
+                self.server_health_status.pop(service_path, None)
+                self.server_last_check_time.pop(service_path, None)
+                self._cached_health_data.pop(service_path, None)
+                await self.websocket_manager.remove_service(service_path)
+            return
+        document = event.document
+        if not document or not document.get("path"):
+            return
+
+        service_path = document["path"]
+        previous_path = self._server_paths.get(event.document_id)
+        if previous_path and previous_path != service_path:
+            self._cached_health_data.pop(previous_path, None)
+            await self.websocket_manager.remove_service(previous_path)
+        self._server_paths[event.document_id] = service_path
+
+        health_data = self._get_health_data_from_document(document)
+        if self._cached_health_data.get(service_path) == health_data:
+            return
+        self.server_health_status[service_path] = health_data["status"]
+        last_connected = document.get("lastConnected")
+        if isinstance(last_connected, datetime):
+            self.server_last_check_time[service_path] = last_connected
+        self._cached_health_data[service_path] = health_data
+        await self.websocket_manager.broadcast_update(service_path, health_data)
+
+    def _reschedule(self, event: ChangeEvent) -> None:
+        """Check new and re-enabled or re-pointed servers right away; stop checking deleted or disabled ones."""
+        config = (event.document or {}).get("config") or {}
+        if event.is_delete or config.get("enabled") is False:
+            self.scheduler.remove(event.document_id)
+            self._server_configs.pop(event.document_id, None)
+        elif event.operation == "insert" or event.touches("config"):
+            previous = self._server_configs.get(event.document_id)
+            target = (config.get("enabled"), config.get("url"), config.get("type"))
+            self._server_configs[event.document_id] = target
+            if previous != target:
+                self.scheduler.schedule(event.document_id)
+
+    async def _scheduled_check(self, server_id: str) -> bool | None:
+        """Run one scheduled check; None drops servers that were deleted or disabled meanwhile."""
+        server = await self.server_service.get_server_by_id(server_id)
+        if server is None or (server.config or {}).get("enabled") is False:
+            return None
+        healthy, status_message = await self.server_service.check_server_health(
+            server, timeout=settings.health_check_timeout_seconds
+        )
+        if server.path:
+            self.server_health_status[server.path] = HealthStatus.HEALTHY if healthy else status_message
+            self.server_last_check_time[server.path] = datetime.now(UTC)
+        return healthy
+
+    def _get_health_data_from_document(self, document: dict) -> dict:
+        """Build the health payload of a server straight from its MongoDB document."""
+        config = document.get("config") or {}
+        if config.get("enabled") is False:
+            status = "disabled"
+        elif document.get("status") == "error":
+            status = HealthStatus.UNHEALTHY_ENDPOINT_CHECK_FAILED
+        elif document.get("lastConnected"):
+            status = HealthStatus.HEALTHY
+        else:
+            status = HealthStatus.UNKNOWN
+
+        last_connected = document.get("lastConnected")
+        last_checked_iso = last_connected.isoformat() if isinstance(last_connected, datetime) else None
+        return {"status": str(status), "last_checked_iso": last_checked_iso, "num_tools": document.get("numTools", 0)}
+
     def get_websocket_stats(self) -> dict:
         """Get WebSocket performance statistics."""
         return self.websocket_manager.get_stats()
@@ -1,9 +1,109 @@
-from collections import deque
-from dataclasses import dataclass
+import asyncio
+import bisect
+import logging
+from collections import OrderedDict
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from uuid import uuid4
 
-from mcp.server.streamable_http import EventCallback, EventId, EventMessage, EventStore, StreamId
+from mcp.server.streamable_http import (
+    MCP_SESSION_ID_HEADER,
+    EventCallback,
+    EventId,
+    EventMessage,
+    EventStore,
+    StreamId,
+)
 from mcp.types import JSONRPCMessage
+from redis import Redis
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# The SDK's stream ids are per-session JSON-RPC request ids ("1", "_GET_stream"), and one store serves
+# every session. Events are therefore kept under a random stream key per (session, stream id), and event
+# ids are "<stream key>:<position>": unguessable, and enough to find the stream without a session lookup.
+_EVENT_ID_SEPARATOR = ":"
+
+# Session the current request belongs to; set by EventStoreSessionScope.
+_session_scope: ContextVar[str] = ContextVar("mcpgw_event_session_scope", default="")
+
+
+def _new_stream_key() -> str:
+    return uuid4().hex
+
+
+def _make_event_id(stream_key: str, position: str) -> EventId:
+    return f"{stream_key}{_EVENT_ID_SEPARATOR}{position}"
+
+
+def _split_event_id(event_id: EventId) -> tuple[str, str] | None:
+    stream_key, separator, position = event_id.partition(_EVENT_ID_SEPARATOR)
+    if not separator or not stream_key or not position:
+        return None
+    return stream_key, position
+
+
+def bind_event_session(scope_key: str) -> None:
+    """Attribute events stored from the current context (and tasks it starts) to ``scope_key``."""
+    _session_scope.set(scope_key)
+
+
+def _stream_owner(stream_id: StreamId) -> tuple[str, StreamId]:
+    return _session_scope.get(), stream_id
+
+
+class EventStoreSessionScope:
+    """
+    ASGI wrapper for the gateway's streamable HTTP app that scopes stored events to MCP sessions.
+
+    The session id is only assigned while the first request of a session is handled, and that
+    request's context is the one the SDK's per-session message router inherits. So the first
+    request gets a fresh scope, which is remembered under the session id from the response
+    headers; later requests carrying that session id reuse it.
+
+    Scopes are kept in process, like the SDK's sessions themselves: the gateway runs stateful,
+    so a session (and resuming its streams) only works on the replica that created it.
+    """
+
+    def __init__(self, app: ASGIApp, max_sessions: int = 10000):
+        self.app = app
+        self.max_sessions = max_sessions
+        self._scopes: OrderedDict[str, str] = OrderedDict()  # mcp-session-id -> scope key
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        session_id = Headers(scope=scope).get(MCP_SESSION_ID_HEADER)
+        if session_id is not None:
+            if scope["method"] == "DELETE":
+                scope_key = self._scopes.pop(session_id, session_id)
+            else:
+                scope_key = self._scopes.get(session_id, session_id)
+            bind_event_session(scope_key)
+            await self.app(scope, receive, send)
+            return
+
+        scope_key = _new_stream_key()
+
+        async def send_with_scope(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                assigned = Headers(raw=message.get("headers", [])).get(MCP_SESSION_ID_HEADER)
+                if assigned:
+                    self._remember(assigned, scope_key)
+            await send(message)
+
+        bind_event_session(scope_key)
+        await self.app(scope, receive, send_with_scope)
+
+    def _remember(self, session_id: str, scope_key: str) -> None:
+        if len(self._scopes) >= self.max_sessions:
+            self._scopes.popitem(last=False)
+        self._scopes[session_id] = scope_key
 
 
 @dataclass
@@ -13,83 +113,207 @@ class EventEntry:
     message: JSONRPCMessage | None
 
 
+@dataclass
+class _StreamEvents:
+    """Events of one stream in sequence order; ``seqs`` mirrors ``entries`` for bisect lookups."""
+
+    stream_id: StreamId
+    owner: tuple[str, StreamId]  # (session scope, stream id)
+    next_seq: int = 1
+    seqs: list[int] = field(default_factory=list)
+    entries: list[EventEntry] = field(default_factory=list)
+
+
 class InMemoryEventStore(EventStore):
+    """
+    Process-local event store with per-stream monotonic sequence ids.
+
+    Streams are scoped to their MCP session (see EventStoreSessionScope) and kept in an
+    OrderedDict in least-recently-used order (O(1) touch and eviction); replay locates the
+    resume point with bisect (O(log n)). Events the client confirmed by resuming after them
+    are reclaimed immediately.
+    """
+
     def __init__(self, max_events_per_stream: int = 100, max_streams: int = 1000):
         self.max_events_per_stream = max_events_per_stream
         self.max_streams = max_streams
-        self.streams: dict[StreamId, deque[EventEntry]] = {}
-        self.event_index: dict[EventId, EventEntry] = {}
-        self.stream_order: deque[StreamId] = deque()  # LRU tracking - oldest at front
+        self.streams: OrderedDict[str, _StreamEvents] = OrderedDict()  # stream key -> events, LRU - oldest first
+        self._stream_keys: dict[tuple[str, StreamId], str] = {}
 
     async def store_event(self, stream_id: StreamId, message: JSONRPCMessage | None) -> EventId:
-        event_id = str(uuid4())
-        event_entry = EventEntry(event_id=event_id, stream_id=stream_id, message=message)
-
-        # If we're at capacity and this is a new stream, evict the oldest stream
-        if stream_id not in self.streams and len(self.streams) >= self.max_streams:
-            oldest_stream_id = self.stream_order.popleft()
-            # Clean up all events from the oldest stream
-            if oldest_stream_id in self.streams:
-                for event in self.streams[oldest_stream_id]:
-                    self.event_index.pop(event.event_id, None)
-                del self.streams[oldest_stream_id]
-
-        if stream_id not in self.streams:
-            self.streams[stream_id] = deque(maxlen=self.max_events_per_stream)
-            self.stream_order.append(stream_id)
+        owner = _stream_owner(stream_id)
+        key = self._stream_keys.get(owner)
+        stream = self.streams.get(key) if key is not None else None
+        if stream is None:
+            # If we're at capacity, evict the least recently used stream
+            if len(self.streams) >= self.max_streams:
+                _, evicted = self.streams.popitem(last=False)
+                self._stream_keys.pop(evicted.owner, None)
+            key = self._stream_keys[owner] = _new_stream_key()
+            stream = self.streams[key] = _StreamEvents(stream_id=stream_id, owner=owner)
         else:
-            # Move to end (most recently used)
-            self.stream_order.remove(stream_id)
-            self.stream_order.append(stream_id)
+            self.streams.move_to_end(key)
 
-        # Remove oldest event from index if deque is full
-        if len(self.streams[stream_id]) == self.max_events_per_stream:
-            oldest_event = self.streams[stream_id][0]
-            self.event_index.pop(oldest_event.event_id, None)
+        seq = stream.next_seq
+        stream.next_seq += 1
+        event_id = _make_event_id(key, str(seq))
+        stream.seqs.append(seq)
+        stream.entries.append(EventEntry(event_id=event_id, stream_id=stream_id, message=message))
 
-        self.streams[stream_id].append(event_entry)
-        self.event_index[event_id] = event_entry
+        overflow = len(stream.entries) - self.max_events_per_stream
+        if overflow > 0:
+            del stream.seqs[:overflow]
+            del stream.entries[:overflow]
         return event_id
 
     async def replay_events_after(self, last_event_id: EventId, send_callback: EventCallback) -> StreamId | None:
-        if last_event_id not in self.event_index:
+        parsed = _split_event_id(last_event_id)
+        if parsed is None or not parsed[1].isdigit():
+            return None
+        key, position = parsed
+        seq = int(position)
+
+        stream = self.streams.get(key)
+        if stream is None:
             return None
 
-        last_event = self.event_index[last_event_id]
-        stream_id = last_event.stream_id
-        stream_events = self.streams.get(stream_id, deque())
+        index = bisect.bisect_left(stream.seqs, seq)
+        if index == len(stream.seqs) or stream.seqs[index] != seq:
+            # Unknown or already evicted: events after it may be lost, so do not pretend to resume.
+            return None
 
         # Update LRU on replay access
-        if stream_id in self.stream_order:
-            self.stream_order.remove(stream_id)
-            self.stream_order.append(stream_id)
-
-        # Collect events to remove (confirmed delivered) and events to replay
-        events_to_remove: list[EventEntry] = []
-        events_to_replay: list[tuple[EventId, JSONRPCMessage]] = []
-        found_last = False
-
-        for event in stream_events:
-            if not found_last:
-                if event.event_id == last_event_id:
-                    found_last = True
-                    # Keep the anchor event (last_event_id) for future replays
-                else:
-                    # These events are before last_event_id - client has them, can remove
-                    events_to_remove.append(event)
-            else:
-                # These are events AFTER last_event_id - need to replay
-                if event.message is not None:
-                    events_to_replay.append((event.event_id, event.message))
-
-        # Send events to replay
-        for event_id, message in events_to_replay:
-            await send_callback(EventMessage(message, event_id))
-
-        # Clean up confirmed-delivered events
-        for event in events_to_remove:
-            self.event_index.pop(event.event_id, None)
-            # Note: Can't efficiently remove from deque middle, but they'll be evicted by maxlen
-            # If you need efficient removal, consider using a different data structure
+        self.streams.move_to_end(key)
+
+        # Events before last_event_id were delivered; keep the anchor for future replays. The stream
+        # belongs to a single session, so this never touches another session's events.
+        del stream.seqs[:index]
+        del stream.entries[:index]
+
+        for event in stream.entries[1:]:
+            if event.message is not None:
+                await send_callback(EventMessage(event.message, event.event_id))
+
+        return stream.stream_id
+
+
+class RedisEventStore(EventStore):
+    """
+    Event store on Redis Streams.
+
+    Each MCP stream of a session maps to one Redis stream under a random key (XADD with
+    approximate MAXLEN and an idle TTL); entries carry the SDK stream id, and replay reads
+    them back with XRANGE. Buffered events live in Redis rather than the replica's heap.
+    Resuming still needs the replica that owns the MCP session (sticky routing); others
+    answer 404 for the session before the store is consulted.
+    Falls back to an in-memory store while no Redis client is available.
+    """
+
+    def __init__(
+        self,
+        redis_client_provider: Callable[[], Redis | None],
+        *,
+        key_prefix: str = "mcpgw:events:",
+        max_events_per_stream: int = 100,
+        max_streams: int = 1000,
+        stream_ttl_seconds: int = 3600,
+        fallback: EventStore | None = None,
+    ):
+        """
+        Args:
+            redis_client_provider: Returns the shared Redis client (None until the container is up)
+            key_prefix: Prefix for the per-stream Redis keys
+            max_events_per_stream: Approximate number of events kept per stream
+            max_streams: Streams this replica keeps appending to; older ones are left to expire
+            stream_ttl_seconds: Streams without new events expire after this long
+            fallback: Store used when Redis is unavailable (in-memory by default)
+        """
+        self._redis_client_provider = redis_client_provider
+        self.key_prefix = key_prefix
+        self.max_events_per_stream = max_events_per_stream
+        self.stream_ttl_seconds = stream_ttl_seconds
+        self.max_streams = max_streams
+        self._stream_keys: OrderedDict[tuple[str, StreamId], str] = OrderedDict()  # LRU - oldest first
+        self._fallback = fallback or InMemoryEventStore(
+            max_events_per_stream=max_events_per_stream, max_streams=max_streams
+        )
+        self._warned_unavailable = False
+
+    def _redis(self) -> Redis | None:
+        client = self._redis_client_provider()
+        if client is None and not self._warned_unavailable:
+            logger.warning("Redis unavailable for the gateway event store, using in-memory events")
+            self._warned_unavailable = True
+        return client
+
+    def _key(self, stream_key: str) -> str:
+        return f"{self.key_prefix}{stream_key}"
+
+    def _stream_key(self, stream_id: StreamId) -> str:
+        owner = _stream_owner(stream_id)
+        stream_key = self._stream_keys.get(owner)
+        if stream_key is not None:
+            self._stream_keys.move_to_end(owner)
+            return stream_key
+        if len(self._stream_keys) >= self.max_streams:
+            # Events of a forgotten stream stay replayable in Redis until they expire.
+            self._stream_keys.popitem(last=False)
+        stream_key = self._stream_keys[owner] = _new_stream_key()
+        return stream_key
+
+    async def store_event(self, stream_id: StreamId, message: JSONRPCMessage | None) -> EventId:
+        client = self._redis()
+        if client is None:
+            return await self._fallback.store_event(stream_id, message)
+
+        payload = message.model_dump_json(by_alias=True, exclude_none=True) if message is not None else ""
+        stream_key = self._stream_key(stream_id)
+        key = self._key(stream_key)
+
+        def _store() -> str:
+            pipe = client.pipeline()
+            pipe.xadd(key, {"s": stream_id, "m": payload}, maxlen=self.max_events_per_stream, approximate=True)
+            pipe.expire(key, self.stream_ttl_seconds)
+            return pipe.execute()[0]
+
+        redis_id = await asyncio.to_thread(_store)
+        return _make_event_id(stream_key, redis_id)
+
+    async def replay_events_after(self, last_event_id: EventId, send_callback: EventCallback) -> StreamId | None:
+        client = self._redis()
+        if client is None:
+            return await self._fallback.replay_events_after(last_event_id, send_callback)
+
+        parsed = _split_event_id(last_event_id)
+        if parsed is None:
+            return None
+        stream_key, redis_id = parsed
+        key = self._key(stream_key)
+
+        def _read() -> tuple[StreamId, list[tuple[str, dict[str, str]]]] | None:
+            anchor = client.xrange(key, min=redis_id, max=redis_id, count=1)
+            if not anchor:
+                # Unknown, expired or trimmed: events after it may be lost.
+                return None
+            events = client.xrange(key, min=f"({redis_id}", max="+")
+            try:
+                # Events up to the anchor were delivered; reclaim them. The Redis stream belongs to a
+                # single session, so this never touches another session's events.
+                client.xtrim(key, minid=redis_id)
+            except Exception as e:
+                logger.debug(f"Failed to trim confirmed events from {key}: {e}")
+            return anchor[0][1]["s"], events
+
+        result = await asyncio.to_thread(_read)
+        if result is None:
+            return None
+        stream_id, events = result
+
+        for redis_event_id, fields in events:
+            payload = fields.get("m")
+            if not payload:
+                continue
+            message = JSONRPCMessage.model_validate_json(payload)
+            await send_callback(EventMessage(message, _make_event_id(stream_key, redis_event_id)))
 
         return stream_id
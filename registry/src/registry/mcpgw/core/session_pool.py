@@ -0,0 +1,269 @@
+"""
+Downstream MCP Session Pool
+
+Keeps initialized downstream MCP sessions warm per (user, server) so that
+steady-state tool calls through the gateway cost exactly one downstream round
+trip instead of initialize + notifications/initialized + tools/call.
+
+Lookup order on acquire:
+  1. Local warm session (in-process, LRU bounded, idle-evicted)
+  2. Initialized session shared via Redis by another replica
+  3. A fresh initialize handshake - concurrent acquirers for the same key
+     join the in-flight handshake instead of starting their own
+
+Sessions that the downstream server reports as expired (HTTP 404 on a request
+carrying ``Mcp-Session-Id``) are invalidated by the caller and re-acquired once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from ...utils.otel_metrics import record_mcp_gateway_session
+
+if TYPE_CHECKING:
+    from ...core.change_streams import ChangeEvent
+    from ...core.mcp_client import MCPClientService
+
+logger = logging.getLogger(__name__)
+
+SessionInitializer = Callable[[], Awaitable[str | None]]
+
+# Acquire outcomes, used for stats and the mcp_gateway_session_events_total counter.
+OUTCOME_WARM = "warm"
+OUTCOME_SHARED = "shared"
+OUTCOME_JOINED = "joined"
+OUTCOME_HANDSHAKE = "handshake"
+OUTCOME_FAILED = "failed"
+OUTCOME_EXPIRED = "expired"
+
+
+def session_pool_key(user_id: str, server_id: str) -> str:
+    """Build the pool key; matches the Redis session key format used by MCPClientService."""
+    return f"{user_id}:{server_id}"
+
+
+@dataclass
+class PooledSession:
+    """An initialized downstream session held by the pool."""
+
+    session_id: str
+    created_at: float
+    last_used_at: float
+
+
+class DownstreamSessionPool:
+    """App-scoped pool of initialized downstream MCP sessions keyed by (user, server)."""
+
+    def __init__(
+        self,
+        *,
+        mcp_client_service: MCPClientService | None = None,
+        idle_ttl_seconds: float = 600.0,
+        max_sessions: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            mcp_client_service: Used to share sessions with other replicas through Redis
+            idle_ttl_seconds: Sessions unused for longer than this are evicted (keep below the downstream timeout)
+            max_sessions: Upper bound on warm sessions kept in-process; least recently used are dropped first
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.mcp_client_service = mcp_client_service
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.max_sessions = max_sessions
+        self._clock = clock
+        self._sessions: OrderedDict[str, PooledSession] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[str | None]] = {}
+        self._last_sweep = clock()
+        self._counts: dict[str, int] = {
+            OUTCOME_WARM: 0,
+            OUTCOME_SHARED: 0,
+            OUTCOME_JOINED: 0,
+            OUTCOME_HANDSHAKE: 0,
+            OUTCOME_FAILED: 0,
+            OUTCOME_EXPIRED: 0,
+        }
+        self._evicted = 0
+
+    @classmethod
+    def from_settings(cls, settings, mcp_client_service: MCPClientService | None = None) -> DownstreamSessionPool:
+        return cls(
+            mcp_client_service=mcp_client_service,
+            idle_ttl_seconds=settings.mcpgw_session_idle_ttl_seconds,
+            max_sessions=settings.mcpgw_session_pool_max_sessions,
+        )
+
+    async def acquire(self, key: str, initialize: SessionInitializer, server_name: str = "unknown") -> str | None:
+        """
+        Return an initialized session id for ``key``, running ``initialize`` only when no session is available.
+
+        Args:
+            key: Pool key from ``session_pool_key(user_id, server_id)``
+            initialize: Coroutine factory performing the initialize handshake; returns the session id or None
+            server_name: Downstream server name, used as a metric attribute
+
+        Returns:
+            Session id, or None when the handshake did not yield one
+        """
+        self._maybe_sweep()
+
+        session_id = self._get_warm(key)
+        if session_id:
+            self._record(OUTCOME_WARM, server_name)
+            return session_id
+
+        session_id = self._get_shared(key)
+        if session_id:
+            self._put(key, session_id)
+            self._record(OUTCOME_SHARED, server_name)
+            return session_id
+
+        while (inflight := self._inflight.get(key)) is not None:
+            self._record(OUTCOME_JOINED, server_name)
+            # wait() neither cancels the shared future when this caller is cancelled nor raises when it is.
+            await asyncio.wait({inflight})
+            if not inflight.cancelled():
+                return inflight.result()
+            # The leading caller was cancelled mid-handshake; retry, possibly as the new leader.
+
+        future: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+        # Retrieve the exception if nobody joined, so a failed handshake does not log "never retrieved".
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            session_id = await initialize()
+        except Exception as exc:
+            future.set_exception(exc)
+            self._record(OUTCOME_FAILED, server_name)
+            raise
+        except BaseException:
+            # Only real handshake failures are shared; joined callers retry after a cancellation.
+            future.cancel()
+            raise
+        else:
+            future.set_result(session_id)
+            if session_id:
+                self._put(key, session_id)
+                self._record(OUTCOME_HANDSHAKE, server_name)
+            else:
+                self._record(OUTCOME_FAILED, server_name)
+            return session_id
+        finally:
+            self._inflight.pop(key, None)
+
+    def invalidate(self, key: str, session_id: str | None = None, server_name: str = "unknown") -> None:
+        """
+        Drop a session the downstream server no longer recognizes.
+
+        When ``session_id`` is given, only that session is dropped, so a stale caller
+        cannot evict a session another caller has already re-initialized.
+        """
+        entry = self._sessions.get(key)
+        if entry is not None and (session_id is None or entry.session_id == session_id):
+            del self._sessions[key]
+        if self.mcp_client_service is not None:
+            shared = self.mcp_client_service.get_session(key)
+            if shared and (session_id is None or shared[0] == session_id):
+                self.mcp_client_service.clear_session(key)
+        self._record(OUTCOME_EXPIRED, server_name)
+        logger.info(f"Invalidated downstream MCP session for {key}")
+
+    def invalidate_server(self, server_id: str) -> int:
+        """Drop the warm sessions of every user for a server that was deleted or disabled. Returns the number dropped."""
+        suffix = f":{server_id}"
+        keys = [key for key in self._sessions if key.endswith(suffix)]
+        for key in keys:
+            del self._sessions[key]
+        if keys:
+            logger.info(f"Dropped {len(keys)} warm downstream MCP session(s) for server {server_id}")
+        return len(keys)
+
+    async def handle_server_change(self, event: ChangeEvent) -> None:
+        """Change stream consumer: forget sessions of servers deleted or disabled on any replica."""
+        if event.is_delete or ((event.document or {}).get("config") or {}).get("enabled") is False:
+            self.invalidate_server(event.document_id)
+
+    def evict_idle(self) -> int:
+        """Evict sessions idle for longer than ``idle_ttl_seconds``. Returns the number evicted."""
+        now = self._clock()
+        self._last_sweep = now
+        evicted = 0
+        # Entries are kept in last-used order, so the idle ones are at the front.
+        while self._sessions:
+            key, entry = next(iter(self._sessions.items()))
+            if now - entry.last_used_at <= self.idle_ttl_seconds:
+                break
+            del self._sessions[key]
+            evicted += 1
+        if evicted:
+            self._evicted += evicted
+            logger.debug(f"Evicted {evicted} idle downstream MCP sessions")
+        return evicted
+
+    def clear(self) -> None:
+        """Drop every warm session (in-flight handshakes are left to finish)."""
+        self._sessions.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get pool statistics, including how many acquires avoided an initialize handshake."""
+        avoided = self._counts[OUTCOME_WARM] + self._counts[OUTCOME_SHARED] + self._counts[OUTCOME_JOINED]
+        acquires = avoided + self._counts[OUTCOME_HANDSHAKE] + self._counts[OUTCOME_FAILED]
+        return {
+            "warm_sessions": len(self._sessions),
+            "inflight_handshakes": len(self._inflight),
+            "acquires": acquires,
+            "handshakes": self._counts[OUTCOME_HANDSHAKE],
+            "handshakes_avoided": avoided,
+            "handshake_avoidance_ratio": round(avoided / acquires, 4) if acquires else 0.0,
+            "outcomes": dict(self._counts),
+            "evicted_idle": self._evicted,
+            "idle_ttl_seconds": self.idle_ttl_seconds,
+            "max_sessions": self.max_sessions,
+        }
+
+    def _get_warm(self, key: str) -> str | None:
+        entry = self._sessions.get(key)
+        if entry is None:
+            return None
+        now = self._clock()
+        if now - entry.last_used_at > self.idle_ttl_seconds:
+            del self._sessions[key]
+            self._evicted += 1
+            return None
+        entry.last_used_at = now
+        self._sessions.move_to_end(key)
+        return entry.session_id
+
+    def _get_shared(self, key: str) -> str | None:
+        if self.mcp_client_service is None:
+            return None
+        session_info = self.mcp_client_service.get_session(key)
+        if not session_info:
+            return None
+        session_id, initialized = session_info
+        return session_id if initialized and session_id else None
+
+    def _put(self, key: str, session_id: str) -> None:
+        now = self._clock()
+        self._sessions[key] = PooledSession(session_id=session_id, created_at=now, last_used_at=now)
+        self._sessions.move_to_end(key)
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+            self._evicted += 1
+
+    def _maybe_sweep(self) -> None:
+        # Sweep lazily from the request path instead of running a background task.
+        if self._clock() - self._last_sweep >= self.idle_ttl_seconds:
+            self.evict_idle()
+
+    def _record(self, outcome: str, server_name: str) -> None:
+        self._counts[outcome] += 1
+        record_mcp_gateway_session(server_name, outcome)
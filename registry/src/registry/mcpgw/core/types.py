@@ -6,8 +6,10 @@ from registry_pkgs.vector.repositories.mcp_server_repository import MCPServerRep
 
 from ...core.mcp_client import MCPClientService
 from ...core.session_store import SessionStore
+from ...core.sse_connection import SSEConnectionManager
 from ...services.oauth.oauth_service import MCPOAuthService
 from ...services.server_service import ServerServiceV1
+from .session_pool import DownstreamSessionPool
 
 
 @dataclass
@@ -20,3 +22,5 @@ class McpAppContext:
     mcp_client_service: MCPClientService
     oauth_service: MCPOAuthService
     session_store: SessionStore
+    session_pool: DownstreamSessionPool
+    sse_connections: SSEConnectionManager
@@ -4,12 +4,13 @@ from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING
 
-from httpx import AsyncClient, Limits, Timeout
+from httpx import Timeout
 from mcp.server.fastmcp import FastMCP
+from mcp.server.streamable_http import EventStore
 from mcp.server.transport_security import TransportSecuritySettings
 
 from ..core.config import settings
-from .core.event_store import InMemoryEventStore
+from .core.event_store import InMemoryEventStore, RedisEventStore
 from .core.types import McpAppContext
 from .tools import proxied, search
 
@@ -73,6 +74,33 @@ TOOL-RESULT EXAMPLE:
 """
 
 
+def _create_event_store(container_provider: Callable[[], RegistryContainer | None]) -> EventStore:
+    """
+    Build the resumable-stream event store selected by ``mcpgw_event_store_backend``.
+
+    The streamable HTTP app is stateful, so replay only happens on the replica that owns the
+    MCP session; deployments with several replicas need sticky routing on Mcp-Session-Id.
+    """
+    if settings.mcpgw_event_store_backend == "redis":
+        # The container (and its Redis client) only exists once the registry lifespan has started.
+        def _redis_client():
+            container = container_provider()
+            return container.redis_client if container is not None else None
+
+        return RedisEventStore(
+            _redis_client,
+            key_prefix=f"{settings.redis_key_prefix}:mcpgw:events:",
+            max_events_per_stream=settings.mcpgw_event_store_max_events_per_stream,
+            max_streams=settings.mcpgw_event_store_max_streams,
+            stream_ttl_seconds=settings.mcpgw_event_store_stream_ttl_seconds,
+        )
+
+    return InMemoryEventStore(
+        max_events_per_stream=settings.mcpgw_event_store_max_events_per_stream,
+        max_streams=settings.mcpgw_event_store_max_streams,
+    )
+
+
 def create_mcp_app(*, container_provider: Callable[[], RegistryContainer | None]) -> FastMCP[McpAppContext]:
     """
     Factory function to create a stateless FastMCP application instance.
@@ -89,10 +117,10 @@ def create_mcp_app(*, container_provider: Callable[[], RegistryContainer | None]
         if container is None:
             raise RuntimeError("Registry container is not initialized")
 
-        async with AsyncClient(
+        # Proxy traffic shares the registry's per-origin pools instead of owning a separate client.
+        async with container.http_client_manager.get_client(
             timeout=Timeout(30.0, read=60.0),
             follow_redirects=True,
-            limits=Limits(max_connections=100, max_keepalive_connections=20),
         ) as proxy_client:
             yield McpAppContext(
                 proxy_client=proxy_client,
@@ -101,6 +129,8 @@ def create_mcp_app(*, container_provider: Callable[[], RegistryContainer | None]
                 mcp_client_service=container.mcp_client_service,
                 oauth_service=container.oauth_service,
                 session_store=container.session_store,
+                session_pool=container.mcp_session_pool,
+                sse_connections=container.sse_connection_manager,
             )
 
     # Configure transport security settings from environment variables
@@ -113,7 +143,7 @@ def create_mcp_app(*, container_provider: Callable[[], RegistryContainer | None]
     mcp = FastMCP(
         "JarvisRegistry",
         lifespan=mcp_lifespan,
-        event_store=InMemoryEventStore(max_events_per_stream=50, max_streams=500),
+        event_store=_create_event_store(container_provider),
         instructions=_SYSTEM_INSTRUCTIONS,
         transport_security=transport_security_settings,
     )
@@ -40,6 +40,7 @@ from ...core.exceptions import (
 )
 from ...core.mcp_client import call_tool_via_sse_ephemeral
 from ...utils.otel_metrics import record_server_request
+from ..core.session_pool import session_pool_key
 from ..core.types import McpAppContext
 from .types import get_meta_field
 from .utils import build_authenticated_headers, build_target_url, forward_notification, parse_data_field
@@ -59,6 +60,10 @@ def _get_mcp_client_service(ctx: Context[ServerSession, McpAppContext]):
     return ctx.request_context.lifespan_context.mcp_client_service
 
 
+def _get_session_pool(ctx: Context[ServerSession, McpAppContext]):
+    return ctx.request_context.lifespan_context.session_pool
+
+
 async def _downstream_tool_call(
     ctx: Context[ServerSession, McpAppContext],
     url: str,
@@ -66,6 +71,8 @@ async def _downstream_tool_call(
     headers: dict[str, str],
     transport_type: str = "streamable-http",
     sse_url: str | None = None,
+    session_key: str | None = None,
+    server_name: str = "unknown",
 ) -> dict:
     """
     Make a tool call to downstream MCP. This function only handles making the HTTP POST request and parsing the response,
@@ -76,6 +83,11 @@ async def _downstream_tool_call(
         url: Downstream MCP URL
         body: The raw JSON-RPC request body for the tool call
         headers: All HTTP headers for the tool call POST request
+        transport_type: Downstream transport ("streamable-http" or "sse")
+        sse_url: SSE endpoint URL, required for the "sse" transport
+        session_key: "user_id:server_id" key of the persistent SSE connection to multiplex the call on.
+            Without it an SSE call falls back to a one-off stream.
+        server_name: Downstream server name, used as a metric attribute
 
     Returns: A Python dictionary parsed from the JSON-RPC response to the tool call.
 
@@ -97,6 +109,17 @@ async def _downstream_tool_call(
                 await forward_notification(ctx.session, obj, related_request_id=ctx.request_id)
 
             try:
+                if session_key is not None:
+                    return await ctx.request_context.lifespan_context.sse_connections.call_tool(
+                        session_key,
+                        sse_url,
+                        headers,
+                        body,
+                        on_notification=_on_notification,
+                        timeout_seconds=30,
+                        server_name=server_name,
+                    )
+
                 return await call_tool_via_sse_ephemeral(
                     http_client=client,
                     sse_url=sse_url,
@@ -123,7 +146,9 @@ async def _downstream_tool_call(
                     f"Error calling downstream MCP: status code: {resp.status_code}, body: {raw_body.decode('utf-8')}"
                 )
 
-                raise DownstreamHttpFailureException("Error calling downstream MCP server.")
+                raise DownstreamHttpFailureException(
+                    "Error calling downstream MCP server.", status_code=resp.status_code
+                )
             elif resp.headers.get("content-type", "").startswith("application/json"):
                 # If content-type is application/json, read the whole response body and return the parsed dictionary.
                 raw_body = await resp.aread()
@@ -296,7 +321,7 @@ async def execute_tool_impl(
 
         username = user_context.get("username", "unknown")
         user_id = user_context.get("user_id", "unknown")
-        logger.info(f"Tool execution from user '{username}:{user_id}': {tool_name} on {server_id}")
+        logger.info("Tool execution: %s on %s", tool_name, server_id, extra={"username": username, "user_id": user_id})
 
         server = await _get_server_service(ctx).get_server_by_id(server_id)
         if server is None:
@@ -325,43 +350,37 @@ async def execute_tool_impl(
         state_metadata = _get_state_metadata(ctx.session.client_params)
 
         # Session management logic - only for streamable-http when initialization is required.
-        # For SSE we intentionally do not persist/reuse session IDs or messages URLs.
-        # Each SSE tool call opens a fresh stream and completes within _downstream_tool_call.
+        # SSE sessions live on a persistent stream per (user, server) owned by the SSE connection manager,
+        # so no session id is tracked here for them.
+        session_pool = _get_session_pool(ctx)
+        session_key = session_pool_key(user_id, server_id)
+        session_id: str | None = None
+
+        async def _initialize_session() -> str | None:
+            init_headers = await build_authenticated_headers(
+                oauth_service=ctx.request_context.lifespan_context.oauth_service,
+                server=server,
+                auth_context=user_context,
+                additional_headers=additional_headers,
+                state_metadata=state_metadata,
+            )
+            return await _get_mcp_client_service(ctx).initialize_mcp_session(
+                target_url,
+                init_headers,
+                session_key,
+                transport_type,
+            )
+
         if requires_init and transport_type != "sse":
-            # Key format: "user_id:server_id" to track per-user, per-server sessions
-            session_key = f"{user_id}:{server_id}"
-            session_info = _get_mcp_client_service(ctx).get_session(session_key)
-            stored_session_id = None
-
-            if session_info:
-                # Existing session found - check if it's initialized
-                stored_session_id, session_initialized = session_info
-
-                if session_initialized:
-                    additional_headers["mcp-Session-Id"] = stored_session_id
-                    logger.info(f"Reusing initialized session for {server.serverName}: {stored_session_id}")
-
-            if not stored_session_id:
-                init_headers = await build_authenticated_headers(
-                    oauth_service=ctx.request_context.lifespan_context.oauth_service,
-                    server=server,
-                    auth_context=user_context,
-                    additional_headers=additional_headers,
-                    state_metadata=state_metadata,
-                )
-                session_id = await _get_mcp_client_service(ctx).initialize_mcp_session(
-                    target_url,
-                    init_headers,
-                    session_key,
-                    transport_type,
-                )
+            # Warm sessions are reused per (user, server); only a miss pays for the initialize handshake.
+            session_id = await session_pool.acquire(session_key, _initialize_session, server_name=server.serverName)
 
-                if session_id:
-                    additional_headers["mcp-Session-Id"] = session_id
-                else:
-                    logger.warning("Failed to initialize session, will attempt tool call without session")
+            if session_id:
+                additional_headers["mcp-Session-Id"] = session_id
+            else:
+                logger.warning("Failed to initialize session, will attempt tool call without session")
         elif transport_type == "sse":
-            logger.debug("SSE transport selected: using per-call ephemeral downstream session")
+            logger.debug("SSE transport selected: multiplexing over the persistent downstream SSE connection")
         else:
             logger.debug("Stateless server (requiresInit=False), skipping session management")
 
@@ -381,16 +400,40 @@ async def execute_tool_impl(
             "method": "tools/call",
             "params": {"name": tool_name, "arguments": arguments},
         }
-        logger.info(f"MCP JSON-RPC request body: {json.dumps(mcp_request_body, indent=2)}")
-
-        resp_obj = await _downstream_tool_call(
-            ctx,
-            target_url,
-            mcp_request_body,
-            headers,
-            transport_type=transport_type,
-            sse_url=target_url if transport_type == "sse" else None,
-        )
+        # Holds the full tool arguments: DEBUG only, and formatted only if a handler keeps the record.
+        logger.debug("MCP JSON-RPC request body: %s", mcp_request_body)
+
+        try:
+            resp_obj = await _downstream_tool_call(
+                ctx,
+                target_url,
+                mcp_request_body,
+                headers,
+                transport_type=transport_type,
+                sse_url=target_url if transport_type == "sse" else None,
+                session_key=session_key,
+                server_name=server.serverName,
+            )
+        except DownstreamHttpFailureException as exc:
+            # Per the streamable-http spec, a server answers 404 to a request carrying a session id it has expired.
+            # Re-initialize once and retry; any other failure (or a second 404) propagates unchanged.
+            if session_id is None or exc.status_code != 404:
+                raise
+
+            logger.info(f"Downstream session expired for {server.serverName}, re-initializing and retrying once")
+            session_pool.invalidate(session_key, session_id, server_name=server.serverName)
+            additional_headers.pop("mcp-Session-Id", None)
+            session_id = await session_pool.acquire(session_key, _initialize_session, server_name=server.serverName)
+            if not session_id:
+                raise
+
+            resp_obj = await _downstream_tool_call(
+                ctx,
+                target_url,
+                mcp_request_body,
+                {**headers, "mcp-Session-Id": session_id},
+                transport_type=transport_type,
+            )
 
         if "error" in resp_obj:
             error_data = ErrorData.model_validate(resp_obj["error"])
@@ -1,10 +1,11 @@
 import logging
+from functools import lru_cache
 
 from fastapi import Request
 from fastapi.responses import JSONResponse
 from jwt import ExpiredSignatureError, InvalidTokenError
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.routing import compile_path
+from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from registry_pkgs.core.jwt_utils import decode_jwt, get_token_kid
 from registry_pkgs.core.scopes import map_groups_to_scopes
@@ -13,11 +14,28 @@ from ..auth.dependencies import UserContextDict
 from ..core.config import settings
 from ..core.telemetry_decorators import AuthMetricsContext
 from ..utils.crypto_utils import verify_access_token
+from .path_trie import PathTrie
+from .rbac import ScopePermissionMiddleware
 
 logger = logging.getLogger(__name__)
 
 
-class UnifiedAuthMiddleware(BaseHTTPMiddleware):
+@lru_cache(maxsize=1024)
+def _scopes_for_groups(groups: tuple[str, ...]) -> tuple[str, ...]:
+    """
+    Map token groups to scopes, cached per group set.
+
+    scopes.yml is loaded once per process, so the mapping for a given set of groups
+    never changes while the process runs.
+    """
+    return tuple(map_groups_to_scopes(list(groups), settings.scopes_file_config))
+
+
+def _map_groups_to_scopes(groups: list[str]) -> list[str]:
+    return list(_scopes_for_groups(tuple(groups)))
+
+
+class UnifiedAuthMiddleware:
     """
     A unified authentication middleware that encapsulates the functionality of `enhanced_auth` and `nginx_proxied_auth`.
 
@@ -25,14 +43,14 @@ class UnifiedAuthMiddleware(BaseHTTPMiddleware):
 
     Path Matching Logic:
     --------------------
-    1. public_paths_compiled: Paths that are PUBLICLY accessible (no authentication required)
+    1. public_paths: Paths that are PUBLICLY accessible (no authentication required)
        - These act as EXCEPTIONS to authenticated paths via double-check logic
        - Use specific patterns to carve out public endpoints from broader authenticated patterns
        - Example: "/api/{versions}/mcp/{server_name}/oauth/callback" is public despite matching broader MCP pattern
 
     How to Define Paths:
     --------------------
-    public_paths_compiled:
+    public_paths:
       - Define SPECIFIC patterns that should be accessible without auth
       - These override authenticated patterns via double-check
       - Use more specific paths to carve out exceptions
@@ -40,10 +58,16 @@ class UnifiedAuthMiddleware(BaseHTTPMiddleware):
         * "/api/{versions}/mcp/{server_name}/oauth/callback" - Specific OAuth callback (public)
         * "/.well-known/{path:path}" - OAuth discovery endpoints (must be public per RFC)
         * "/health" - Health check endpoint (public)
+
+    This is a pure ASGI middleware: requests are handed to the app with the original
+    ``receive``/``send``, so streaming responses (MCP streamable HTTP, SSE) pass
+    through without being buffered or copied into an extra task. With
+    ``enforce_scopes=True`` it also runs the ScopePermissionMiddleware check right
+    after authentication, so a single middleware layer handles both.
     """
 
-    def __init__(self, app):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, enforce_scopes: bool = False):
+        self.app = app
         # Paths that require authentication (checked before public paths)
         # self.authenticated_paths_compiled = self._compile_patterns([
         #     "/api/auth/me",
@@ -53,7 +77,7 @@ class UnifiedAuthMiddleware(BaseHTTPMiddleware):
         #     "/api/{versions}/mcp/{path:path}",
         #     "/api/search/{path:path}",
         # ])
-        self.public_paths_compiled = self._compile_patterns(
+        self.public_paths = self._compile_patterns(
             [
                 "/",
                 "/login",
@@ -70,36 +94,54 @@ class UnifiedAuthMiddleware(BaseHTTPMiddleware):
             ]
         )
 
-        logger.info(f"Auth middleware initialized with Starlette routing: {len(self.public_paths_compiled)} public.")
+        logger.info(f"Auth middleware initialized with path trie: {len(self.public_paths)} public.")
 
         # Pre-load scopes config once for performance (cached at module level)
         self.scopes_config = settings.scopes_config
         logger.info(f"Scopes config loaded with {len(self.scopes_config.get('group_mappings', {}))} group mappings")
 
-    def _compile_patterns(self, patterns: list[str]) -> list[tuple]:
+        self.scope_permissions = ScopePermissionMiddleware(app) if enforce_scopes else None
+
+    def _compile_patterns(self, patterns: list[str]) -> PathTrie[str]:
         """
-        Compile path patterns into Starlette route matchers
+        Compile path patterns into a path trie
         """
-        compiled = []
+        compiled: PathTrie[str] = PathTrie()
         for pattern in patterns:
             try:
-                path_regex, path_format, param_convertors = compile_path(pattern)
-                compiled.append((pattern, path_regex, path_format, param_convertors))
-                logger.debug(f"Compiled pattern: {pattern} -> {path_regex.pattern}")
+                compiled.add(pattern, pattern)
+                logger.debug(f"Compiled pattern: {pattern}")
             except Exception as e:
                 logger.error(f"Failed to compile pattern '{pattern}': {e}")
         return compiled
 
-    async def dispatch(self, request: Request, call_next):
-        path = request.url.path
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Check authenticated paths first (these override public patterns)
-        if self._match_path(path, self.public_paths_compiled):
+        path = scope["path"]
+        if self._match_path(path, self.public_paths):
             logger.debug(f"Public path: {path}")
-            return await call_next(request)
-        else:
-            logger.debug(f"Authenticated path: {path}")
-            # Continue to authentication logic below
+            await self.app(scope, receive, send)
+            return
+        logger.debug(f"Authenticated path: {path}")
+
+        response = await self._authenticate_request(Request(scope, receive))
+        if response is None and self.scope_permissions is not None:
+            response = self.scope_permissions.forbidden_response(scope)
+        if response is not None:
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+    async def _authenticate_request(self, request: Request) -> Response | None:
+        """
+        Authenticate the request and store the result in `request.state`.
+
+        Returns the error response to send, or None when the request is authenticated.
+        """
+        path = request.url.path
 
         # Use context manager for clean metrics tracking
         async with AuthMetricsContext() as auth_ctx:
@@ -115,7 +157,7 @@ class UnifiedAuthMiddleware(BaseHTTPMiddleware):
                 auth_ctx.set_success(True)
 
                 logger.info(f"User {user_context.get('username')} authenticated via {auth_source}")
-                return await call_next(request)
+                return None
 
             except AuthenticationError as e:
                 auth_ctx.set_success(False)
@@ -144,15 +186,14 @@ class UnifiedAuthMiddleware(BaseHTTPMiddleware):
                 logger.error(f"Auth error for {path}: {e}")
                 return JSONResponse(status_code=500, content={"detail": "Authentication error"})
 
-    def _match_path(self, path: str, compiled_patterns: list[tuple]) -> bool:
+    def _match_path(self, path: str, compiled_patterns: PathTrie[str]) -> bool:
         """
-        Match path using Starlette route matcher
+        Match path using the compiled path trie
         """
-        for original_pattern, path_regex, _path_format, _param_convertors in compiled_patterns:
-            match = path_regex.match(path)
-            if match:
-                logger.debug(f"Path '{path}' matched pattern '{original_pattern}'")
-                return True
+        matched = compiled_patterns.match(path)
+        if matched:
+            logger.debug(f"Path '{path}' matched pattern '{matched[0]}'")
+            return True
         return False
 
     async def _authenticate(self, request: Request) -> UserContextDict:
@@ -239,7 +280,7 @@ class UnifiedAuthMiddleware(BaseHTTPMiddleware):
 
             # If no scopes but has groups, map groups to scopes
             if not scopes and groups:
-                scopes = map_groups_to_scopes(groups, settings.scopes_file_config)
+                scopes = _map_groups_to_scopes(groups)
                 logger.info(f"Mapped JWT groups {groups} to scopes: {scopes}")
 
             # Verify we have at least some scopes
@@ -300,7 +341,7 @@ class UnifiedAuthMiddleware(BaseHTTPMiddleware):
 
             # If no scopes but has groups, map groups to scopes
             if not scopes and groups:
-                scopes = map_groups_to_scopes(groups, settings.scopes_file_config)
+                scopes = _map_groups_to_scopes(groups)
                 logger.info(f"Mapped session groups {groups} to scopes: {scopes}")
 
             logger.debug(f"JWT access token valid for user {username} (user_id: {user_id})")
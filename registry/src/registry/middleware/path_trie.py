@@ -0,0 +1,96 @@
+"""
+Segment trie for matching request paths against Starlette path patterns.
+
+Patterns are split on "/" into static segments, single-segment parameters
+(``{name}``) and a trailing path parameter (``{name:path}``), so a lookup costs one
+dict probe per path segment instead of one regex per pattern. Patterns the trie
+cannot express (typed convertors, parameters embedded in a segment, ``:path`` before
+the last segment) are kept as compiled regexes and checked after the walk, so every
+pattern ``compile_path`` accepts matches exactly as it would in a Starlette route.
+"""
+
+import re
+
+from starlette.routing import compile_path
+
+_PARAM_SEGMENT = re.compile(r"\{[a-zA-Z_][a-zA-Z0-9_]*(:(str|path))?\}")
+
+
+class _Node[T]:
+    __slots__ = ("static", "param", "rest", "values")
+
+    def __init__(self) -> None:
+        self.static: dict[str, _Node[T]] = {}
+        self.param: _Node[T] | None = None  # {name}: any non-empty segment
+        self.rest: list[T] = []  # {name:path}: the remainder of the path, slashes included
+        self.values: list[T] = []  # patterns ending exactly here
+
+
+class PathTrie[T]:
+    """Map path patterns to values and find every value whose pattern matches a path."""
+
+    def __init__(self) -> None:
+        self._root: _Node[T] = _Node()
+        self._fallback: list[tuple[re.Pattern[str], T]] = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, pattern: str, value: T) -> None:
+        self._size += 1
+        segments = pattern.split("/")
+        if not pattern.startswith("/") or not self._is_supported(segments[1:]):
+            self._fallback.append((compile_path(pattern)[0], value))
+            return
+
+        node = self._root
+        for position, segment in enumerate(segments[1:], start=1):
+            if not segment.startswith("{"):
+                node = node.static.setdefault(segment, _Node())
+            elif segment.endswith(":path}"):
+                node.rest.append(value)
+                return
+            else:
+                if node.param is None:
+                    node.param = _Node()
+                node = node.param
+            if position == len(segments) - 1:
+                node.values.append(value)
+
+    def match(self, path: str) -> list[T]:
+        """Values of all patterns matching ``path``, in no particular order."""
+        matched: list[T] = []
+        if path.startswith("/"):
+            segments = path.split("/")
+            stack: list[tuple[_Node[T], int]] = [(self._root, 1)]
+            while stack:
+                node, position = stack.pop()
+                if position == len(segments):
+                    matched.extend(node.values)
+                    continue
+                matched.extend(node.rest)
+                segment = segments[position]
+                child = node.static.get(segment)
+                if child is not None:
+                    stack.append((child, position + 1))
+                if node.param is not None and segment:
+                    stack.append((node.param, position + 1))
+        for regex, value in self._fallback:
+            if regex.match(path):
+                matched.append(value)
+        return matched
+
+    def matches(self, path: str) -> bool:
+        return bool(self.match(path))
+
+    @staticmethod
+    def _is_supported(segments: list[str]) -> bool:
+        for position, segment in enumerate(segments):
+            if "{" not in segment and "}" not in segment:
+                continue
+            if not _PARAM_SEGMENT.fullmatch(segment):
+                return False
+            if segment.endswith(":path}") and position != len(segments) - 1:
+                return False
+        return True
@@ -1,18 +1,22 @@
 import logging
 import re
 from collections.abc import Iterable
+from functools import lru_cache
 from typing import Any
 
-from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.routing import compile_path
+from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from ..auth.dependencies import effective_scopes_from_context
 from ..core.config import settings
+from .path_trie import PathTrie
 
 logger = logging.getLogger(__name__)
 
+# (normalized path, method) pairs whose matching rule is memoized per middleware instance.
+_RULE_CACHE_SIZE = 4096
+
 
 def _normalize_path(path: str) -> str:
     """
@@ -63,7 +67,7 @@ def _parse_methods(method_value: str) -> set[str] | None:
     return set(parts)
 
 
-class ScopePermissionMiddleware(BaseHTTPMiddleware):
+class ScopePermissionMiddleware:
     """
     Enforce endpoint/method permissions based on scopes.yml.
 
@@ -71,20 +75,39 @@ class ScopePermissionMiddleware(BaseHTTPMiddleware):
     one scope whose rules intersect (method + endpoint).
 
     Notes:
-      - Rules are loaded at initialization for optimal performance.
+      - Rules are loaded at initialization and indexed in a path trie, so finding
+        the rule for a request walks the path segments instead of trying every
+        rule's regex. The rule found for a (path, method) pair is memoized.
       - Path matching is done against normalized candidates so both /api/*
         and /api/{version} prefixes work.
       - Auth middleware filters public paths, so all authenticated requests
         reaching this middleware should be checked for permissions.
+      - This is a pure ASGI middleware: allowed requests are handed to the app with
+        the original ``receive``/``send``, so streaming responses are not buffered.
+        UnifiedAuthMiddleware can run the same check inline via ``forbidden_response``.
     """
 
-    def __init__(self, app):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp):
+        self.app = app
         self._rules: list[dict[str, Any]] = []
+        self._rule_index: PathTrie[int] = PathTrie()
+        self._wildcard_rules: list[int] = []
         # Load rules at initialization instead of lazily
         self._load_rules()
+        self._find_rule = lru_cache(maxsize=_RULE_CACHE_SIZE)(self._lookup_rule)
         logger.info("ScopePermissionMiddleware initialized with %d rules", len(self._rules))
 
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response = self.forbidden_response(scope)
+        if response is not None:
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
     def _load_rules(self) -> None:
         """
         Load and compile rules from scopes.yml into in-memory structures.
@@ -105,25 +128,26 @@ class ScopePermissionMiddleware(BaseHTTPMiddleware):
                 if not endpoint:
                     continue
 
-                if endpoint == "*":
-                    compiled = None
-                else:
-                    pattern = _normalize_endpoint_pattern(endpoint)
-                    compiled = compile_path(pattern)[0]
-
                 methods = _parse_methods(method)
                 rules.append(
                     {
                         "scope": scope_name,
                         "methods": methods,
                         "endpoint": endpoint,
-                        "compiled": compiled,
+                        "pattern": None if endpoint == "*" else _normalize_endpoint_pattern(endpoint),
                     }
                 )
 
         # Sort by specificity (static paths before parameterized paths)
         rules.sort(key=self._rule_specificity)
 
+        # Index rules by position so the most specific match is the smallest position.
+        for position, rule in enumerate(rules):
+            if rule["pattern"] is None:
+                self._wildcard_rules.append(position)
+            else:
+                self._rule_index.add(rule["pattern"], position)
+
         self._rules = rules
         logger.debug("Loaded %d permission rules from scopes.yml (sorted by specificity)", len(rules))
 
@@ -138,25 +162,16 @@ class ScopePermissionMiddleware(BaseHTTPMiddleware):
         segment_count = len(endpoint.split("/"))
         return param_count, -segment_count, endpoint
 
-    def _rule_matches(self, rule: dict[str, Any], path: str, method: str) -> bool:
-        """
-        Check if a rule matches by both method and endpoint.
-        """
-        # method match
-        methods = rule["methods"]
-        if methods is not None and method not in methods:
-            return False
-
-        # endpoint match
-        return self._endpoint_matches(rule, path)
-
-    def _endpoint_matches(self, rule: dict[str, Any], path: str) -> bool:
+    def _lookup_rule(self, path: str, method: str) -> dict[str, Any] | None:
         """
-        Check if the path matches the rule's endpoint pattern.
+        Return the most specific rule matching both the path and the method.
         """
-        if rule["compiled"] is None:
-            return True
-        return rule["compiled"].match(path) is not None
+        for position in sorted(self._rule_index.match(path) + self._wildcard_rules):
+            rule = self._rules[position]
+            methods = rule["methods"]
+            if methods is None or method in methods:
+                return rule
+        return None
 
     def _has_permission(self, user_scopes: Iterable[str], path: str, method: str) -> bool:
         """
@@ -166,47 +181,41 @@ class ScopePermissionMiddleware(BaseHTTPMiddleware):
         1. Find the first rule that matches (rules are sorted by specificity)
         2. Check if user has the required scope for that rule
         """
-        user_scope_set = set(user_scopes)
-
-        # Find the first matching rule (most specific due to sorting)
-        for rule in self._rules:
-            if self._rule_matches(rule, path, method):
-                required_scope = rule["scope"]
-                has_scope = required_scope in user_scope_set
-
-                if has_scope:
-                    logger.debug(f"Permission granted: user has '{required_scope}' for {method} {path}")
-                else:
-                    logger.debug(f"Permission denied: user lacks '{required_scope}' for {method} {path}")
-
-                return has_scope
+        rule = self._find_rule(path, method)
+        if rule is None:
+            # No rules match - deny (authenticated paths must have explicit permissions)
+            logger.debug(f"No rules match path={path}, method={method} - denying")
+            return False
 
-        # No rules match - deny (authenticated paths must have explicit permissions)
-        logger.debug(f"No rules match path={path}, method={method} - denying")
-        return False
+        required_scope = rule["scope"]
+        has_scope = required_scope in set(user_scopes)
+        if has_scope:
+            logger.debug(f"Permission granted: user has '{required_scope}' for {method} {path}")
+        else:
+            logger.debug(f"Permission denied: user lacks '{required_scope}' for {method} {path}")
+        return has_scope
 
-    async def dispatch(self, request: Request, call_next):
+    def forbidden_response(self, scope: Scope) -> Response | None:
         """
-        Enforce scope permissions for authenticated requests.
+        Enforce scope permissions for an authenticated request.
 
+        Returns the 403 response to send, or None when the request may proceed.
         Since auth middleware already filters public paths, any authenticated
-        request reaching this middleware should be checked for permissions.
+        request reaching this check is checked for permissions; requests the auth
+        middleware did not authenticate (public routes) pass through.
         """
-        # If auth middleware didn't set user, allow through (public routes).
-        if not getattr(request.state, "is_authenticated", False):
-            return await call_next(request)
+        state = scope.get("state") or {}
+        if not state.get("is_authenticated", False):
+            return None
 
-        method = request.method.upper()
-        normalized_path = _normalize_path(request.url.path)
+        method = scope["method"].upper()
+        normalized_path = _normalize_path(scope["path"])
         logger.debug(f"RBAC check - path: {normalized_path}, method: {method}")
 
-        user_context = getattr(request.state, "user", {}) or {}
+        user_context = state.get("user") or {}
         user_scopes = effective_scopes_from_context(user_context)
 
-        if not user_scopes:
-            return JSONResponse(status_code=403, content={"detail": "Insufficient permissions"})
-
-        if self._has_permission(user_scopes, normalized_path, method):
-            return await call_next(request)
+        if user_scopes and self._has_permission(user_scopes, normalized_path, method):
+            return None
 
         return JSONResponse(status_code=403, content={"detail": "Insufficient permissions"})
@@ -0,0 +1,35 @@
+"""
+Schemas for the NDJSON bulk import endpoints.
+
+The request body holds one JSON record per line (a ServerCreateRequest or an
+AgentCreateRequest). The response streams one BulkImportItemResult line per
+input line, in input order, followed by a single BulkImportSummary line.
+"""
+
+from typing import Literal
+
+from pydantic import Field
+
+from .case_conversion import APIBaseModel
+
+
+class BulkImportItemResult(APIBaseModel):
+    """Outcome for one NDJSON record."""
+
+    type: Literal["result"] = "result"
+    line: int = Field(description="1-based line number of the record in the request body")
+    status: Literal["created", "failed"]
+    id: str | None = Field(default=None, description="ID of the created server or agent")
+    path: str | None = None
+    name: str | None = Field(default=None, description="Server name or agent name")
+    error: str | None = None
+
+
+class BulkImportSummary(APIBaseModel):
+    """Totals, sent as the last line of the response."""
+
+    type: Literal["summary"] = "summary"
+    total: int
+    created: int
+    failed: int
+    durationSeconds: float
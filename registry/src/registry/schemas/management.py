@@ -78,3 +78,48 @@ class GroupDeleteResponse(BaseModel):
 
     name: str
     deleted: bool = True
+
+
+class GroupBulkCreateRequest(BaseModel):
+    """Payload for creating several Keycloak groups at once."""
+
+    groups: list[GroupCreateRequest] = Field(..., min_length=1)
+
+
+class GroupBulkDeleteRequest(BaseModel):
+    """Payload for deleting several Keycloak groups at once."""
+
+    names: list[str] = Field(..., min_length=1)
+
+
+class GroupBulkResult(BaseModel):
+    """Outcome for one group of a bulk operation."""
+
+    name: str
+    success: bool
+    group: KeycloakGroupSummary | None = None
+    error: str | None = None
+
+
+class GroupBulkResponse(BaseModel):
+    """Response for bulk group operations; one result per requested group."""
+
+    results: list[GroupBulkResult] = Field(default_factory=list)
+    succeeded: int
+    failed: int
+
+
+class LoggingConfigResponse(BaseModel):
+    """Current logging configuration of this registry process."""
+
+    level: str
+    levels: dict[str, str] = Field(default_factory=dict, description="Per-logger level overrides")
+    sample_rates: dict[str, float] = Field(default_factory=dict, description="INFO/DEBUG sample rates per logger")
+
+
+class LoggingConfigUpdate(BaseModel):
+    """Runtime logging changes; omitted fields are left as they are."""
+
+    level: str | None = Field(None, description="Root log level, e.g. DEBUG")
+    levels: dict[str, str] | None = Field(None, description="Per-logger levels to set; NOTSET removes an override")
+    sample_rates: dict[str, float] | None = Field(None, description="Replaces all sample rates; {} turns sampling off")
@@ -17,6 +17,7 @@ from beanie import PydanticObjectId
 
 from registry_pkgs.models.a2a_agent import STATUS_ACTIVE, A2AAgent
 
+from ..core.http_client import HTTPClientManager, open_http_client
 from ..schemas.a2a_agent_api_schemas import AgentCreateRequest, AgentUpdateRequest
 
 logger = logging.getLogger(__name__)
@@ -25,6 +26,9 @@ logger = logging.getLogger(__name__)
 class A2AAgentService:
     """Service for A2A Agent operations"""
 
+    def __init__(self, http_client_manager: HTTPClientManager | None = None):
+        self.http_client_manager = http_client_manager
+
     async def _fetch_agent_card_from_url(self, url: str) -> AgentCard:
         """
         Fetch and validate agent card from URL using SDK.
@@ -42,7 +46,7 @@ class A2AAgentService:
             logger.info(f"Fetching agent card from {url} using SDK")
 
             timeout = httpx.Timeout(15.0)
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with open_http_client(self.http_client_manager, timeout=timeout) as client:
                 resolver = A2ACardResolver(
                     base_url=url,
                     httpx_client=client,
@@ -219,42 +223,7 @@ class A2AAgentService:
             if existing:
                 raise ValueError(f"Agent with path '{data.path}' already exists")
 
-            # Fetch agent card from URL using SDK
-            logger.info(f"Fetching agent card from URL for new agent: {data.url}")
-            agent_card = await self._fetch_agent_card_from_url(str(data.url))
-
-            # Override name and description from request if provided
-            # This allows user to customize these fields in registry
-            card_data = agent_card.model_dump(by_alias=False)
-            card_data["name"] = data.name
-            card_data["description"] = data.description or agent_card.description
-            card_data["url"] = str(data.url)  # Ensure URL matches the request
-
-            # Recreate agent card with overridden values
-            agent_card = AgentCard(**card_data)
-
-            # Create agent document with wellKnown config
-            agent = A2AAgent(
-                path=data.path,
-                card=agent_card,
-                tags=[],  # Initialize as empty list - tags are registry metadata, not derived from skills
-                isEnabled=False,  # Default to disabled for safety
-                status=STATUS_ACTIVE,
-                author=PydanticObjectId(user_id),
-                registeredBy=None,
-                registeredAt=datetime.now(UTC),
-            )
-
-            # Configure wellKnown for future syncs
-            from registry_pkgs.models.a2a_agent import WellKnownConfig
-
-            agent.wellKnown = WellKnownConfig(
-                enabled=True,
-                url=str(data.url),
-                lastSyncAt=datetime.now(UTC),
-                lastSyncStatus="success",
-                lastSyncVersion=agent_card.version,
-            )
+            agent = await self.build_agent(data, user_id)
 
             # Save to database
             await agent.insert()
@@ -269,6 +238,55 @@ class A2AAgentService:
             logger.error(f"Error creating agent: {e}", exc_info=True)
             raise ValueError(f"Failed to create agent: {str(e)}")
 
+    async def build_agent(self, data: AgentCreateRequest, user_id: str) -> A2AAgent:
+        """
+        Build (without saving) the document for a new agent from its fetched agent card.
+
+        Args:
+            data: Agent creation data (path, name, description, url)
+            user_id: User ID who creates the agent
+
+        Returns:
+            Unsaved agent document
+        """
+        # Fetch agent card from URL using SDK
+        logger.info(f"Fetching agent card from URL for new agent: {data.url}")
+        agent_card = await self._fetch_agent_card_from_url(str(data.url))
+
+        # Override name and description from request if provided
+        # This allows user to customize these fields in registry
+        card_data = agent_card.model_dump(by_alias=False)
+        card_data["name"] = data.name
+        card_data["description"] = data.description or agent_card.description
+        card_data["url"] = str(data.url)  # Ensure URL matches the request
+
+        # Recreate agent card with overridden values
+        agent_card = AgentCard(**card_data)
+
+        # Create agent document with wellKnown config
+        agent = A2AAgent(
+            path=data.path,
+            card=agent_card,
+            tags=[],  # Initialize as empty list - tags are registry metadata, not derived from skills
+            isEnabled=False,  # Default to disabled for safety
+            status=STATUS_ACTIVE,
+            author=PydanticObjectId(user_id),
+            registeredBy=None,
+            registeredAt=datetime.now(UTC),
+        )
+
+        # Configure wellKnown for future syncs
+        from registry_pkgs.models.a2a_agent import WellKnownConfig
+
+        agent.wellKnown = WellKnownConfig(
+            enabled=True,
+            url=str(data.url),
+            lastSyncAt=datetime.now(UTC),
+            lastSyncStatus="success",
+            lastSyncVersion=agent_card.version,
+        )
+        return agent
+
     async def update_agent(self, agent_id: str, data: AgentUpdateRequest) -> A2AAgent:
         """
         Update an existing agent. If URL is updated, automatically fetches new agent card.
@@ -455,7 +473,7 @@ class A2AAgentService:
 
             timeout = httpx.Timeout(10.0)
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with open_http_client(self.http_client_manager, timeout=timeout) as client:
                 resolver = A2ACardResolver(
                     base_url=str(agent.wellKnown.url).rsplit("/.well-known", 1)[0],
                     httpx_client=client,
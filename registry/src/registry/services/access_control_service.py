@@ -154,6 +154,54 @@ class ACLService:
             logger.error(f"Error upserting ACL entry: {e}")
             raise ValueError(f"Error upserting ACL permissions: {e}")
 
+    async def grant_permissions_for_new_resources(
+        self,
+        principal_type: str,
+        principal_id: PydanticObjectId | str | None,
+        resource_type: str,
+        resource_ids: list[PydanticObjectId],
+        perm_bits: int,
+    ) -> int:
+        """
+        Grant one principal the same permission on many just-created resources with a single insert.
+
+        Unlike grant_permission this does not look for existing entries, so it must only be
+        used for resources that have none yet (e.g. right after a bulk import).
+
+        Returns:
+            int: Number of ACL entries created.
+
+        Raises:
+            ValueError: If principal_id is missing for a user/group principal.
+        """
+        if principal_type in ["user", "group"] and not principal_id:
+            raise ValueError("principal_id must be set for user/group principal_type")
+        if not resource_ids:
+            return 0
+
+        try:
+            session = get_current_session()
+        except RuntimeError:
+            session = None
+
+        now = datetime.now(UTC)
+        entries = [
+            IAclEntry(
+                principalType=principal_type,
+                principalId=principal_id,
+                resourceType=resource_type,
+                resourceId=resource_id,
+                roleId=None,
+                permBits=perm_bits,
+                grantedAt=now,
+                createdAt=now,
+                updatedAt=now,
+            )
+            for resource_id in resource_ids
+        ]
+        await IAclEntry.insert_many(entries, session=session)
+        return len(entries)
+
     async def delete_acl_entries_for_resource(
         self, resource_type: str, resource_id: PydanticObjectId, perm_bits_to_delete: int | None = None
     ) -> int:
@@ -305,6 +353,62 @@ class ACLService:
             logger.error(f"Error fetching permissions for user {user_id} on {resource_type}/{resource_id}: {e}")
             return ResourcePermissions()
 
+    async def get_user_permissions_for_resources(
+        self,
+        user_id: PydanticObjectId,
+        resource_type: str,
+        resource_ids: list[PydanticObjectId],
+    ) -> dict[PydanticObjectId, ResourcePermissions]:
+        """
+        Get the resolved permissions for a single user on many resources.
+
+        Bulk variant of ``get_user_permissions_for_resource``: one MongoDB query
+        with ``$in`` over the resource IDs. For each resource the entry with the
+        highest permBits wins, exactly as in the single-resource lookup.
+
+        Args:
+                user_id: The user's ID.
+                resource_type: The resource type string.
+                resource_ids: The resource document IDs.
+
+        Returns:
+                Mapping of every requested resource ID to its ResourcePermissions
+                (all False when the user has no matching entry or on error).
+        """
+        permissions = {resource_id: ResourcePermissions() for resource_id in resource_ids}
+        if not resource_ids:
+            return permissions
+
+        try:
+            acl_entries = await IAclEntry.find(
+                {
+                    "resourceType": resource_type,
+                    "resourceId": {"$in": list(permissions)},
+                    "$or": [
+                        {"principalType": PrincipalType.USER.value, "principalId": user_id},
+                        {"principalType": PrincipalType.PUBLIC.value, "principalId": None},
+                    ],
+                }
+            ).to_list()
+
+            best_bits: dict[PydanticObjectId, int] = {}
+            for entry in acl_entries:
+                bits = int(entry.permBits)
+                if bits > best_bits.get(entry.resourceId, -1):
+                    best_bits[entry.resourceId] = bits
+
+            for resource_id, bits in best_bits.items():
+                permissions[resource_id] = ResourcePermissions(
+                    VIEW=bool(bits & PermissionBits.VIEW),
+                    EDIT=bool(bits & PermissionBits.EDIT),
+                    DELETE=bool(bits & PermissionBits.DELETE),
+                    SHARE=bool(bits & PermissionBits.SHARE),
+                )
+            return permissions
+        except Exception as e:
+            logger.error(f"Error fetching permissions for user {user_id} on {len(resource_ids)} {resource_type}s: {e}")
+            return {resource_id: ResourcePermissions() for resource_id in resource_ids}
+
     async def check_user_permission(
         self,
         user_id: PydanticObjectId,
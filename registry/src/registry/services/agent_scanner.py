@@ -3,10 +3,9 @@ Agent Scanner Service
 
 This service provides security scanning functionality for A2A agents during registration.
 It wraps the CLI A2A scanner and makes it available to API endpoints with proper
-configuration and error handling.
+configuration and error handling. Scan results are stored in MongoDB (see scan_store).
 """
 
-import asyncio
 import json
 import logging
 import os
@@ -14,29 +13,21 @@ import re
 import subprocess  # nosec B404 - controlled CLI invocation for the bundled scanner tool
 import tempfile
 from datetime import UTC, datetime
-from pathlib import Path
 
 from ..core.config import settings
 from ..schemas.agent_security import AgentSecurityScanConfig, AgentSecurityScanResult
+from .scan_store import TARGET_AGENT, ScanResultStore
+from .security_scanner import run_scanner_command
 
 logger = logging.getLogger(__name__)
 
-# Constants
-PROJECT_ROOT = Path(__file__).parent.parent.parent
-OUTPUT_DIR = PROJECT_ROOT / "agent_security_scans"
-
 
 class AgentScannerService:
     """Service for scanning A2A agents for security vulnerabilities."""
 
-    def __init__(self):
+    def __init__(self, result_store: ScanResultStore | None = None):
         """Initialize the agent scanner service."""
-        self._ensure_output_directory()
-
-    def _ensure_output_directory(self) -> Path:
-        """Ensure output directory exists."""
-        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-        return OUTPUT_DIR
+        self.result_store = result_store
 
     def get_scan_config(self) -> AgentSecurityScanConfig:
         """Get agent security scan configuration from settings."""
@@ -57,6 +48,7 @@ class AgentScannerService:
         analyzers: str | None = None,
         api_key: str | None = None,
         timeout: int | None = None,
+        fingerprint: str | None = None,
     ) -> AgentSecurityScanResult:
         """
         Scan an A2A agent for security vulnerabilities.
@@ -67,6 +59,7 @@ class AgentScannerService:
             analyzers: Comma-separated list of analyzers to use (overrides config)
             api_key: Azure OpenAI API key for LLM-based analysis (overrides config)
             timeout: Scan timeout in seconds (overrides config)
+            fingerprint: Content fingerprint stored with the result, see scan_scheduler
 
         Returns:
             AgentSecurityScanResult containing scan results
@@ -87,9 +80,7 @@ class AgentScannerService:
         logger.info(f"Starting agent security scan for {agent_path} with analyzers: {analyzers}")
 
         try:
-            # Run the scan in a thread pool to avoid blocking
-            raw_output = await asyncio.to_thread(
-                self._run_a2a_scanner,
+            raw_output = await self._run_a2a_scanner(
                 agent_card=agent_card,
                 agent_path=agent_path,
                 analyzers=analyzers,
@@ -100,9 +91,6 @@ class AgentScannerService:
             # Analyze results
             is_safe, critical, high, medium, low = self._analyze_scan_results(raw_output)
 
-            # Save detailed output
-            output_file = self._save_scan_output(agent_path, raw_output)
-
             # Get agent URL if available
             agent_url = agent_card.get("url")
 
@@ -118,7 +106,6 @@ class AgentScannerService:
                 low_severity=low,
                 analyzers_used=analyzers.split(","),
                 raw_output=raw_output,
-                output_file=output_file,
                 scan_failed=False,
             )
 
@@ -127,6 +114,7 @@ class AgentScannerService:
                 f"Safe: {is_safe}, Critical: {critical}, High: {high}, Medium: {medium}, Low: {low}"
             )
 
+            await self._save_scan_result(agent_path, result, fingerprint)
             return result
 
         except Exception as e:
@@ -139,11 +127,8 @@ class AgentScannerService:
                 "scan_failed": True,
             }
 
-            # Save error output
-            output_file = self._save_scan_output(agent_path, raw_output)
-
             # Return error result
-            return AgentSecurityScanResult(
+            result = AgentSecurityScanResult(
                 agent_path=agent_path,
                 agent_url=agent_card.get("url"),
                 scan_timestamp=datetime.now(UTC).isoformat().replace("+00:00", "Z"),
@@ -154,12 +139,13 @@ class AgentScannerService:
                 low_severity=0,
                 analyzers_used=analyzers.split(",") if analyzers else [],
                 raw_output=raw_output,
-                output_file=output_file,
                 scan_failed=True,
                 error_message=str(e),
             )
+            await self._save_scan_result(agent_path, result, fingerprint)
+            return result
 
-    def _run_a2a_scanner(
+    async def _run_a2a_scanner(
         self,
         agent_card: dict,
         agent_path: str,
@@ -170,7 +156,7 @@ class AgentScannerService:
         """
         Run a2a-scanner command and return raw output.
 
-        This is a synchronous method that runs in a thread pool.
+        The scanner runs as a child process; the event loop is not blocked while it runs.
         """
         logger.info(f"Running A2A security scan on: {agent_path}")
         logger.info(f"Using analyzers: {analyzers}")
@@ -199,20 +185,13 @@ class AgentScannerService:
 
             # Run scanner with timeout
             try:
-                result = subprocess.run(  # nosec B603 - command is built from fixed args and validated inputs
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                    env=env,
-                    timeout=timeout,
-                )
+                stdout = await run_scanner_command(cmd, env=env, timeout=timeout)
 
                 # Log raw output for debugging
-                logger.debug(f"Raw A2A scanner stdout:\n{result.stdout[:500]}")
+                logger.debug(f"Raw A2A scanner stdout:\n{stdout[:500]}")
 
                 # Parse JSON output - scanner outputs JSON
-                stdout = result.stdout.strip()
+                stdout = stdout.strip()
 
                 # Remove ANSI color codes
                 ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
@@ -317,78 +296,41 @@ class AgentScannerService:
 
         return is_safe, critical_count, high_count, medium_count, low_count
 
-    def _save_scan_output(self, agent_path: str, raw_output: dict) -> str:
+    async def _save_scan_result(
+        self, agent_path: str, result: AgentSecurityScanResult, fingerprint: str | None = None
+    ) -> None:
         """
-        Save detailed scan output to JSON file.
-
-        Saves in two locations:
-        1. agent_security_scans/YYYY-MM-DD/scan_<agent>_<timestamp>.json (archived)
-        2. agent_security_scans/scan_<agent>_latest.json (always current)
+        Store a scan result in MongoDB.
 
-        Returns:
-            Path to saved output file (latest version)
+        A storage failure is logged but does not fail the scan.
         """
-        output_dir = self._ensure_output_directory()
-
-        # Generate safe filename from agent path
-        safe_path = agent_path.replace("/", "_").strip("_")
-
-        # Create date-based subdirectory for archival
-        timestamp = datetime.now(UTC)
-        date_folder = timestamp.strftime("%Y-%m-%d")
-        archive_dir = output_dir / date_folder
-        archive_dir.mkdir(exist_ok=True)
-
-        # Save timestamped version in date folder (archived)
-        timestamp_str = timestamp.strftime("%Y%m%d_%H%M%S")
-        archived_filename = f"scan_{safe_path}_{timestamp_str}.json"
-        archived_file = archive_dir / archived_filename
-
-        with open(archived_file, "w") as f:
-            json.dump(raw_output, f, indent=2, default=str)
-
-        logger.info(f"Archived agent scan output saved to: {archived_file}")
-
-        # Save latest version in root agent_security_scans folder (always current)
-        latest_filename = f"{safe_path}.json"
-        latest_file = output_dir / latest_filename
-
-        with open(latest_file, "w") as f:
-            json.dump(raw_output, f, indent=2, default=str)
-
-        logger.info(f"Latest agent scan output saved to: {latest_file}")
-
-        return str(latest_file)
+        if self.result_store is None:
+            return
+        try:
+            await self.result_store.save(TARGET_AGENT, agent_path, result.model_dump(), fingerprint)
+            logger.info(f"Agent security scan result stored for {agent_path}")
+        except Exception as e:
+            logger.error(f"Failed to store agent security scan result for {agent_path}: {e}")
 
-    def get_scan_result(self, agent_path: str) -> dict | None:
+    async def get_scan_result(self, agent_path: str) -> dict | None:
         """
         Get the latest scan result for an agent.
 
-        Looks for scan files in the agent_security_scans directory using
-        the agent path to locate the latest scan file.
-
         Args:
             agent_path: Agent path (e.g., /code-reviewer)
 
         Returns:
-            Dictionary containing scan results, or None if no scan found
+            Dictionary containing the raw scanner output of the latest scan, or None if no scan found
         """
-        output_dir = self._ensure_output_directory()
-
-        # Generate safe filename from agent path
-        safe_path = agent_path.replace("/", "_").strip("_")
-        latest_filename = f"{safe_path}.json"
-        latest_file = output_dir / latest_filename
-
-        # Check if file exists
-        if not latest_file.exists():
-            logger.warning(f"No scan results found for agent: {agent_path}")
+        if self.result_store is None:
             return None
-
         try:
-            with open(latest_file) as f:
-                scan_data = json.load(f)
-            return scan_data
+            document = await self.result_store.latest(TARGET_AGENT, agent_path)
         except Exception as e:
             logger.error(f"Failed to read scan results for agent {agent_path}: {e}")
             return None
+
+        if document is None:
+            logger.warning(f"No scan results found for agent: {agent_path}")
+            return None
+        return document["result"].get("raw_output", {})
@@ -13,6 +13,7 @@ from registry_pkgs.vector.repositories.a2a_agent_repository import A2AAgentRepos
 from registry_pkgs.vector.repositories.mcp_server_repository import MCPServerRepository
 
 from ..core.config import settings
+from ..core.http_client import HTTPClientManager
 from ..schemas.server_api_schemas import ServerCreateRequest
 from .access_control_service import ACLService
 from .federation.agentcore_client import AgentCoreFederationClient
@@ -44,8 +45,12 @@ class AgentCoreImportService:
         federation_client: AgentCoreFederationClient | None = None,
         agentcore_client_provider: AgentCoreClientProvider | None = None,
         runtime_invoker: AgentCoreRuntimeInvoker | None = None,
+        http_client_manager: HTTPClientManager | None = None,
+        sync_vectors_inline: bool = True,
     ):
+        """With sync_vectors_inline=False the vector DB is left to the change stream subscriber."""
         self.acl_service = acl_service_instance
+        self.sync_vectors_inline = sync_vectors_inline
         self.server_service = server_service
         self.user_service = user_service_instance
         self.mcp_server_repo = mcp_server_repo
@@ -58,6 +63,7 @@ class AgentCoreImportService:
             get_runtime_client=client_provider.get_runtime_client,
             get_runtime_credentials_provider=client_provider.get_runtime_credentials_provider,
             extract_region_from_arn=AgentCoreFederationClient.extract_region_from_arn,
+            http_client_manager=http_client_manager,
         )
         self.federation_client = federation_client or AgentCoreFederationClient(
             region=client_provider.default_region,
@@ -425,7 +431,8 @@ class AgentCoreImportService:
             dry_run=False,
         )
 
-        await self.mcp_server_repo.sync_server_to_vector_db(created_server)
+        if self.sync_vectors_inline:
+            await self.mcp_server_repo.sync_server_to_vector_db(created_server)
         return created_server
 
     async def _import_single_a2a_agent(
@@ -529,7 +536,8 @@ class AgentCoreImportService:
             viewer_id=viewer_id,
             dry_run=False,
         )
-        await self.a2a_agent_repo.sync_agent_to_vector_db(discovered_agent, is_delete=False)
+        if self.sync_vectors_inline:
+            await self.a2a_agent_repo.sync_agent_to_vector_db(discovered_agent, is_delete=False)
         return discovered_agent
 
     async def _update_a2a_agent(
@@ -554,7 +562,7 @@ class AgentCoreImportService:
         existing.federationMetadata = new_data.federationMetadata
         existing.updatedAt = datetime.now(UTC)
         await existing.save(session=self._get_current_session_or_none())
-        if detected_changes:
+        if detected_changes and self.sync_vectors_inline:
             await self.a2a_agent_repo.sync_agent_to_vector_db(existing, is_delete=True)
         return detected_changes
 
@@ -590,7 +598,7 @@ class AgentCoreImportService:
 
         await existing.save(session=self._get_current_session_or_none())
 
-        if detected_changes:
+        if detected_changes and self.sync_vectors_inline:
             await self.mcp_server_repo.sync_server_to_vector_db(existing, is_delete=True)
 
         return detected_changes
@@ -0,0 +1,525 @@
+"""
+Bulk Import Service
+
+Registers many MCP servers or A2A agents from an NDJSON stream. Records are read
+one line at a time and handled in chunks:
+
+1. Each record is validated as a ServerCreateRequest / AgentCreateRequest.
+2. Duplicates are found with a single ``$in`` query per chunk, plus a check
+   against the records already accepted in the same import.
+3. Discovery (server health check and capabilities, agent card fetch) runs
+   concurrently for the whole chunk.
+4. The documents and their owner ACL entries are written with one insert_many
+   each, in a single transaction.
+5. Servers and agents are indexed by the change stream like any other insert.
+   With change streams off, the vector documents of the chunk's servers are
+   instead built with one MCPServerRepository.bulk_sync_servers call in the
+   background, and each server's vector hashes are recorded only once its
+   documents have been written.
+
+Results are yielded chunk by chunk, so callers can stream them back while the
+rest of the body is still being read.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import Counter
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from beanie import PydanticObjectId
+from pydantic import BaseModel, ValidationError
+from pymongo import UpdateOne
+
+from registry_pkgs.database.decorators import get_current_session, use_transaction
+from registry_pkgs.models import A2AAgent, ExtendedMCPServer
+from registry_pkgs.models._generated import PrincipalType, ResourceType
+from registry_pkgs.models.enums import RoleBits
+from registry_pkgs.vector.repositories.mcp_server_repository import MCPServerRepository
+
+from ..core.config import Settings
+from ..schemas.a2a_agent_api_schemas import AgentCreateRequest
+from ..schemas.bulk_import_schemas import BulkImportItemResult, BulkImportSummary
+from ..schemas.server_api_schemas import ServerCreateRequest
+from ..utils.utils import generate_server_name_from_title
+from .a2a_agent_service import A2AAgentService
+from .access_control_service import ACLService
+from .server_service import ServerServiceV1
+from .user_service import UserService
+
+logger = logging.getLogger(__name__)
+
+# Longest accepted NDJSON line; longer lines are reported as failed instead of buffered.
+MAX_LINE_BYTES = 1024 * 1024
+
+
+@dataclass
+class NDJSONRecord:
+    """One non-blank line of an NDJSON body: the parsed object, or why it could not be parsed."""
+
+    line: int
+    data: dict[str, Any] | None = None
+    error: str | None = None
+
+
+@dataclass
+class _SeenKeys:
+    """Keys of the records accepted so far in one import, for duplicates within the stream."""
+
+    names: set[str] = field(default_factory=set)
+    locations: set[tuple[str, str | None]] = field(default_factory=set)
+    paths: set[str] = field(default_factory=set)
+
+
+def _parse_line(line: int, raw: bytes, max_line_bytes: int) -> NDJSONRecord | None:
+    if not raw.strip():
+        return None
+    if len(raw) > max_line_bytes:
+        return NDJSONRecord(line=line, error=f"Line exceeds {max_line_bytes} bytes")
+    try:
+        data = json.loads(raw)
+    except ValueError as e:
+        return NDJSONRecord(line=line, error=f"Invalid JSON: {e}")
+    if not isinstance(data, dict):
+        return NDJSONRecord(line=line, error="Expected a JSON object")
+    return NDJSONRecord(line=line, data=data)
+
+
+async def read_ndjson(
+    chunks: AsyncIterable[bytes], max_line_bytes: int = MAX_LINE_BYTES
+) -> AsyncIterator[NDJSONRecord]:
+    """
+    Split a streamed body into NDJSON records, holding at most one line in memory.
+
+    Blank lines are skipped but still counted, so line numbers match the input.
+
+    Args:
+        chunks: Body chunks as received (e.g. ``request.stream()``)
+        max_line_bytes: Lines longer than this are discarded and reported as failed
+
+    Yields:
+        One NDJSONRecord per non-blank line
+    """
+    buffer = bytearray()
+    line = 0
+    oversized = False
+    async for chunk in chunks:
+        buffer.extend(chunk)
+        while (newline := buffer.find(b"\n")) >= 0:
+            raw = bytes(buffer[:newline])
+            del buffer[: newline + 1]
+            line += 1
+            if oversized:
+                oversized = False
+                yield NDJSONRecord(line=line, error=f"Line exceeds {max_line_bytes} bytes")
+            elif record := _parse_line(line, raw, max_line_bytes):
+                yield record
+        if len(buffer) > max_line_bytes:
+            # Drop the rest of this line as it arrives instead of buffering it.
+            oversized = True
+            buffer.clear()
+
+    if oversized:
+        yield NDJSONRecord(line=line + 1, error=f"Line exceeds {max_line_bytes} bytes")
+    elif record := _parse_line(line + 1, bytes(buffer), max_line_bytes):
+        yield record
+
+
+async def encode_ndjson(results: AsyncIterable[BaseModel]) -> AsyncIterator[bytes]:
+    """Serialize import results as NDJSON lines for a streaming response."""
+    async for result in results:
+        yield result.model_dump_json(exclude_none=True).encode() + b"\n"
+
+
+async def _chunked[T](items: AsyncIterable[T], size: int) -> AsyncIterator[list[T]]:
+    chunk: list[T] = []
+    async for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _validate[RequestT: BaseModel](record: NDJSONRecord, model: type[RequestT]) -> tuple[RequestT | None, str | None]:
+    if record.error:
+        return None, record.error
+    try:
+        return model.model_validate(record.data), None
+    except ValidationError as e:
+        details = "; ".join(
+            f"{'.'.join(str(part) for part in error['loc']) or 'record'}: {error['msg']}" for error in e.errors()
+        )
+        return None, f"Validation failed: {details}"
+
+
+def _failed(record: NDJSONRecord, error: str, **fields: Any) -> BulkImportItemResult:
+    return BulkImportItemResult(line=record.line, status="failed", error=error, **fields)
+
+
+class BulkImportService:
+    """Chunked import of servers and agents from NDJSON records."""
+
+    def __init__(
+        self,
+        server_service: ServerServiceV1,
+        a2a_agent_service: A2AAgentService,
+        acl_service: ACLService,
+        user_service: UserService,
+        mcp_server_repo: MCPServerRepository,
+        chunk_size: int = 100,
+        discovery_concurrency: int = 8,
+        vector_batch_size: int = 64,
+        vector_max_concurrency: int = 2,
+        sync_vectors_inline: bool = True,
+    ):
+        """
+        Args:
+            chunk_size: Records validated, checked and inserted together
+            discovery_concurrency: Maximum concurrent health checks / agent card fetches
+            vector_batch_size: Documents per embedding call when indexing a chunk's servers
+            vector_max_concurrency: Maximum concurrent embedding calls per chunk
+            sync_vectors_inline: Index imported servers here; False leaves them to the change stream
+        """
+        self.server_service = server_service
+        self.a2a_agent_service = a2a_agent_service
+        self.acl_service = acl_service
+        self.user_service = user_service
+        self.mcp_server_repo = mcp_server_repo
+        self.chunk_size = chunk_size
+        self.discovery_concurrency = discovery_concurrency
+        self.vector_batch_size = vector_batch_size
+        self.vector_max_concurrency = vector_max_concurrency
+        self.sync_vectors_inline = sync_vectors_inline
+        self._index_tasks: set[asyncio.Task] = set()
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: Settings,
+        server_service: ServerServiceV1,
+        a2a_agent_service: A2AAgentService,
+        acl_service: ACLService,
+        user_service: UserService,
+        mcp_server_repo: MCPServerRepository,
+    ) -> "BulkImportService":
+        return cls(
+            server_service=server_service,
+            a2a_agent_service=a2a_agent_service,
+            acl_service=acl_service,
+            user_service=user_service,
+            mcp_server_repo=mcp_server_repo,
+            chunk_size=settings.bulk_import_chunk_size,
+            discovery_concurrency=settings.bulk_import_discovery_concurrency,
+            vector_batch_size=settings.vector_index_batch_size,
+            vector_max_concurrency=settings.vector_index_max_concurrency,
+            sync_vectors_inline=settings.change_stream_mode == "off",
+        )
+
+    async def import_servers(
+        self, records: AsyncIterable[NDJSONRecord], user_id: str
+    ) -> AsyncIterator[BulkImportItemResult | BulkImportSummary]:
+        """
+        Start registering servers from ServerCreateRequest records.
+
+        Each server gets the post-registration health check and capability discovery;
+        servers that fail the health check are rejected (as create_server does).
+
+        The user is checked before anything is read, so the caller can reject the
+        request before it starts streaming results.
+
+        Args:
+            records: Parsed NDJSON records (see read_ndjson)
+            user_id: User registering the servers; becomes their owner
+
+        Returns:
+            Iterator of one BulkImportItemResult per record in input order, then a BulkImportSummary
+
+        Raises:
+            ValueError: If the user does not exist
+        """
+        author = await self.user_service.get_user_by_user_id(user_id)
+        if not author:
+            raise ValueError(f"Authentication required: User {user_id} not found")
+
+        seen = _SeenKeys()
+        return self._run(records, lambda chunk: self._import_server_chunk(chunk, author.id, seen))
+
+    async def import_agents(
+        self, records: AsyncIterable[NDJSONRecord], user_id: str
+    ) -> AsyncIterator[BulkImportItemResult | BulkImportSummary]:
+        """
+        Start registering agents from AgentCreateRequest records, fetching each agent card.
+
+        The user is checked before anything is read, as in import_servers.
+
+        Args:
+            records: Parsed NDJSON records (see read_ndjson)
+            user_id: User registering the agents; becomes their owner
+
+        Returns:
+            Iterator of one BulkImportItemResult per record in input order, then a BulkImportSummary
+
+        Raises:
+            ValueError: If the user does not exist
+        """
+        owner = await self.user_service.get_user_by_user_id(user_id)
+        if not owner:
+            raise ValueError(f"Authentication required: User {user_id} not found")
+
+        seen = _SeenKeys()
+        return self._run(records, lambda chunk: self._import_agent_chunk(chunk, user_id, owner.id, seen))
+
+    async def _run(
+        self,
+        records: AsyncIterable[NDJSONRecord],
+        import_chunk: Callable[[list[NDJSONRecord]], Awaitable[list[BulkImportItemResult]]],
+    ) -> AsyncIterator[BulkImportItemResult | BulkImportSummary]:
+        started = time.perf_counter()
+        counts: Counter[str] = Counter()
+        async for chunk in _chunked(records, self.chunk_size):
+            for result in await import_chunk(chunk):
+                counts[result.status] += 1
+                yield result
+        yield BulkImportSummary(
+            total=counts.total(),
+            created=counts["created"],
+            failed=counts["failed"],
+            durationSeconds=round(time.perf_counter() - started, 3),
+        )
+
+    async def _import_server_chunk(
+        self,
+        chunk: list[NDJSONRecord],
+        author_id: PydanticObjectId,
+        seen: _SeenKeys,
+    ) -> list[BulkImportItemResult]:
+        results: dict[int, BulkImportItemResult] = {}
+        candidates: list[tuple[NDJSONRecord, ServerCreateRequest, str]] = []
+        for record in chunk:
+            data, error = _validate(record, ServerCreateRequest)
+            if error:
+                results[record.line] = _failed(record, error)
+            else:
+                candidates.append((record, data, generate_server_name_from_title(data.title)))
+
+        taken_names: set[str] = set()
+        taken_locations: set[tuple[str, str | None]] = set()
+        if candidates:
+            existing = await ExtendedMCPServer.find(
+                {
+                    "$or": [
+                        {"serverName": {"$in": [name for _, _, name in candidates]}},
+                        {"path": {"$in": [data.path for _, data, _ in candidates]}},
+                    ]
+                }
+            ).to_list()
+            taken_names = {server.serverName for server in existing}
+            taken_locations = {(server.path, (server.config or {}).get("url")) for server in existing}
+
+        pending: list[tuple[NDJSONRecord, ServerCreateRequest, ExtendedMCPServer]] = []
+        chunk_lines: dict[Any, int] = {}
+        for record, data, name in candidates:
+            location = (data.path, data.url)
+            fields = {"path": data.path, "name": name}
+            if location in taken_locations or location in seen.locations:
+                error = f"Server with path '{data.path}' and URL '{data.url}' already exists"
+                results[record.line] = _failed(record, error, **fields)
+                continue
+            if name in taken_names or name in seen.names:
+                results[record.line] = _failed(record, f"Server with name '{name}' already exists", **fields)
+                continue
+            duplicate_of = chunk_lines.get(name) or chunk_lines.get(location)
+            if duplicate_of:
+                results[record.line] = _failed(record, f"Duplicate of line {duplicate_of}", **fields)
+                continue
+            chunk_lines[name] = chunk_lines[location] = record.line
+
+            try:
+                server = self.server_service.build_server_document(data, server_name=name, author_id=author_id)
+            except ValueError as e:
+                results[record.line] = _failed(record, str(e), **fields)
+                continue
+            server.id = PydanticObjectId()
+            pending.append((record, data, server))
+
+        errors = await self._gather_bounded(self._discover_server(server, data) for _, data, server in pending)
+        for (record, data, server), error in zip(pending, errors, strict=True):
+            if error:
+                results[record.line] = _failed(record, error, path=data.path, name=server.serverName)
+        pending = [entry for entry, error in zip(pending, errors, strict=True) if not error]
+
+        servers = [server for _, _, server in pending]
+        insert_error = await self._insert_chunk(servers, author_id, ResourceType.MCPSERVER) if servers else None
+
+        for record, data, server in pending:
+            fields = {"path": data.path, "name": server.serverName}
+            if insert_error:
+                results[record.line] = _failed(record, insert_error, **fields)
+            else:
+                seen.names.add(server.serverName)
+                seen.locations.add((data.path, data.url))
+                results[record.line] = BulkImportItemResult(
+                    line=record.line, status="created", id=str(server.id), **fields
+                )
+        if servers and not insert_error and self.sync_vectors_inline:
+            self._schedule_indexing(servers)
+
+        return [results[record.line] for record in chunk]
+
+    async def _import_agent_chunk(
+        self, chunk: list[NDJSONRecord], user_id: str, owner_id: PydanticObjectId, seen: _SeenKeys
+    ) -> list[BulkImportItemResult]:
+        results: dict[int, BulkImportItemResult] = {}
+        candidates: list[tuple[NDJSONRecord, AgentCreateRequest]] = []
+        for record in chunk:
+            data, error = _validate(record, AgentCreateRequest)
+            if error:
+                results[record.line] = _failed(record, error)
+            else:
+                candidates.append((record, data))
+
+        taken_paths: set[str] = set()
+        if candidates:
+            existing = await A2AAgent.find({"path": {"$in": [data.path for _, data in candidates]}}).to_list()
+            taken_paths = {agent.path for agent in existing}
+
+        accepted: list[tuple[NDJSONRecord, AgentCreateRequest]] = []
+        chunk_lines: dict[str, int] = {}
+        for record, data in candidates:
+            fields = {"path": data.path, "name": data.name}
+            if data.path in taken_paths or data.path in seen.paths:
+                results[record.line] = _failed(record, f"Agent with path '{data.path}' already exists", **fields)
+            elif duplicate_of := chunk_lines.get(data.path):
+                results[record.line] = _failed(record, f"Duplicate of line {duplicate_of}", **fields)
+            else:
+                chunk_lines[data.path] = record.line
+                accepted.append((record, data))
+
+        built = await self._gather_bounded(self._build_agent(data, user_id) for _, data in accepted)
+        pending: list[tuple[NDJSONRecord, A2AAgent]] = []
+        for (record, data), (agent, error) in zip(accepted, built, strict=True):
+            if error:
+                results[record.line] = _failed(record, error, path=data.path, name=data.name)
+            else:
+                agent.id = PydanticObjectId()
+                pending.append((record, agent))
+
+        agents = [agent for _, agent in pending]
+        insert_error = await self._insert_chunk(agents, owner_id, ResourceType.AGENT) if agents else None
+
+        for record, agent in pending:
+            fields = {"path": agent.path, "name": agent.card.name}
+            if insert_error:
+                results[record.line] = _failed(record, insert_error, **fields)
+            else:
+                seen.paths.add(agent.path)
+                results[record.line] = BulkImportItemResult(
+                    line=record.line, status="created", id=str(agent.id), **fields
+                )
+
+        return [results[record.line] for record in chunk]
+
+    async def _gather_bounded[T](self, coroutines: Iterable[Awaitable[T]]) -> list[T]:
+        semaphore = asyncio.Semaphore(self.discovery_concurrency)
+
+        async def run(coroutine: Awaitable[T]) -> T:
+            async with semaphore:
+                return await coroutine
+
+        return await asyncio.gather(*(run(coroutine) for coroutine in coroutines))
+
+    async def _discover_server(self, server: ExtendedMCPServer, data: ServerCreateRequest) -> str | None:
+        """Run the post-registration checks on an unsaved server; returns why it was rejected, if it was."""
+        if not data.url:
+            return None
+        try:
+            await self.server_service.discover_server_capabilities(server, data)
+        except ValueError as e:
+            return str(e)
+        except Exception as e:
+            logger.error(f"Capability discovery failed for server {server.serverName}: {e}", exc_info=True)
+            return f"Capability discovery failed: {e}"
+        return None
+
+    async def _build_agent(self, data: AgentCreateRequest, user_id: str) -> tuple[A2AAgent | None, str | None]:
+        try:
+            return await self.a2a_agent_service.build_agent(data, user_id), None
+        except ValueError as e:
+            return None, str(e)
+        except Exception as e:
+            logger.error(f"Failed to build agent {data.path}: {e}", exc_info=True)
+            return None, f"Failed to create agent: {e}"
+
+    async def _insert_chunk(
+        self,
+        documents: list[ExtendedMCPServer] | list[A2AAgent],
+        owner_id: PydanticObjectId,
+        resource_type: ResourceType,
+    ) -> str | None:
+        """Insert a chunk of documents with their owner ACL entries; returns the error if the chunk was rolled back."""
+        try:
+            await self._insert_chunk_in_transaction(documents, owner_id, resource_type)
+        except Exception as e:
+            logger.error(f"Bulk import of {len(documents)} {resource_type} document(s) failed: {e}", exc_info=True)
+            return f"Insert failed: {e}"
+        logger.info(f"Bulk imported {len(documents)} {resource_type} document(s)")
+        return None
+
+    @use_transaction
+    async def _insert_chunk_in_transaction(
+        self,
+        documents: list[ExtendedMCPServer] | list[A2AAgent],
+        owner_id: PydanticObjectId,
+        resource_type: ResourceType,
+    ) -> None:
+        document_type = type(documents[0])
+        await document_type.insert_many(documents, session=get_current_session())
+        await self.acl_service.grant_permissions_for_new_resources(
+            PrincipalType.USER,
+            owner_id,
+            resource_type,
+            [document.id for document in documents],
+            RoleBits.OWNER,
+        )
+
+    def _schedule_indexing(self, servers: list[ExtendedMCPServer]) -> None:
+        task = asyncio.create_task(self._index_servers(servers))
+        self._index_tasks.add(task)
+        task.add_done_callback(self._index_tasks.discard)
+
+    async def _index_servers(self, servers: list[ExtendedMCPServer]) -> None:
+        """
+        Build the vector documents of newly imported servers in batches.
+
+        The vector hashes are recorded only for servers whose documents were written,
+        so the others are indexed in full by their next sync.
+        """
+        try:
+            result = await self.mcp_server_repo.bulk_sync_servers(
+                servers, batch_size=self.vector_batch_size, max_concurrency=self.vector_max_concurrency
+            )
+        except Exception as e:
+            logger.error(f"Vector indexing of {len(servers)} imported server(s) failed: {e}", exc_info=True)
+            return
+        failed = {error["server_name"] for error in result.errors if error.get("server_name")}
+        if failed:
+            logger.warning(f"Vector indexing failed for {len(failed)} imported server(s)")
+
+        updates = []
+        for server in servers:
+            if server.serverName not in failed:
+                content_hash, metadata_hash = server.compute_vector_hashes()
+                hashes = {"vectorContentHash": content_hash, "vectorMetadataHash": metadata_hash}
+                updates.append(UpdateOne({"_id": server.id}, {"$set": hashes}))
+        if not updates:
+            return
+        try:
+            await ExtendedMCPServer.get_pymongo_collection().bulk_write(updates, ordered=False)
+        except Exception as e:
+            # The next sync falls back to comparing documents, so this only costs a Weaviate round trip.
+            logger.warning(f"Failed to record vector hashes for {len(updates)} imported server(s): {e}")
@@ -10,6 +10,7 @@ from botocore.auth import SigV4Auth
 from botocore.awsrequest import AWSRequest
 
 from ...core.config import settings
+from ...core.http_client import HTTPClientManager, open_http_client
 from ...core.mcp_client import MCPServerData, get_tools_and_capabilities_from_server
 
 logger = logging.getLogger(__name__)
@@ -61,11 +62,13 @@ class AgentCoreRuntimeInvoker:
         get_runtime_client: Callable[[str], Any],
         get_runtime_credentials_provider: Callable[[str], Any],
         extract_region_from_arn: Callable[[str, str], str],
+        http_client_manager: HTTPClientManager | None = None,
     ):
         self.default_region = default_region
         self.get_runtime_client = get_runtime_client
         self.get_runtime_credentials_provider = get_runtime_credentials_provider
         self.extract_region_from_arn = extract_region_from_arn
+        self.http_client_manager = http_client_manager
         self._runtime_init_retry_attempts = max(1, int(settings.agentcore_runtime_init_retry_attempts or 4))
         self._runtime_init_retry_delay_seconds = float(settings.agentcore_runtime_init_retry_delay_seconds or 5.0)
         self._a2a_card_retry_attempts = max(1, int(settings.agentcore_a2a_card_retry_attempts or 3))
@@ -173,7 +176,7 @@ class AgentCoreRuntimeInvoker:
             metadata=metadata,
             runtime_detail=runtime_detail,
         )
-        async with httpx.AsyncClient(timeout=20.0, headers=headers, auth=httpx_auth) as client:
+        async with open_http_client(self.http_client_manager, timeout=20.0, headers=headers, auth=httpx_auth) as client:
             response = await client.get(card_url)
             response.raise_for_status()
             return response.json()
@@ -197,6 +200,7 @@ class AgentCoreRuntimeInvoker:
             include_resources=True,
             include_prompts=True,
             httpx_auth=httpx_auth,
+            http_client_manager=self.http_client_manager,
         )
 
     async def _fetch_mcp_payloads_via_http_with_retry(
@@ -26,8 +26,9 @@ async def get_servers_connection_status(
     app_connections = mcp_service.connection_service.app_connections
     user_connections = mcp_service.connection_service.get_user_connections(user_id)
 
-    # Retrieve statuses
+    # Build contexts, then resolve every status in one pass (OAuth flow state is fetched in bulk)
     connection_status = {}
+    contexts: list[ConnectionStateContext] = []
     for server in servers:
         server_name = server.serverName
         server_id = str(server.id)
@@ -39,31 +40,42 @@ async def get_servers_connection_status(
             connection = app_connections.get(server_id) or user_connections.get(server_id)
 
             # Build the context
-            context = ConnectionStateContext(
-                user_id=user_id,
-                server_name=server_name,
-                server_id=server_id,
-                server_config=server.config,
-                connection=connection,
-                is_oauth_server=requires_oauth,
-                idle_timeout=idle_timeout_seconds,
+            contexts.append(
+                ConnectionStateContext(
+                    user_id=user_id,
+                    server_name=server_name,
+                    server_id=server_id,
+                    server_config=server.config,
+                    connection=connection,
+                    is_oauth_server=requires_oauth,
+                    idle_timeout=idle_timeout_seconds,
+                )
             )
 
-            # Resolve the status
-            server_status = await status_resolver.resolve_status(context)
-            connection_status[server_id] = server_status
-
         except Exception as e:
             logger.error(f"Failed to retrieve connection status for {server_name}: {e}", exc_info=True)
-            connection_status[server_id] = {
-                "connection_state": ConnectionState.ERROR.value,
-                "requires_oauth": requires_oauth,
-                "error": f"Failed to retrieve connection status: {str(e)}",
-            }
+            connection_status[server_id] = _error_status(requires_oauth, e)
+
+    try:
+        statuses = await status_resolver.resolve_statuses(contexts)
+    except Exception as e:
+        logger.error(f"Failed to retrieve connection status for {len(contexts)} servers: {e}", exc_info=True)
+        statuses = [_error_status(context.is_oauth_server, e) for context in contexts]
+
+    for context, server_status in zip(contexts, statuses, strict=True):
+        connection_status[context.server_id] = server_status
 
     return connection_status
 
 
+def _error_status(requires_oauth: bool, error: Exception) -> dict[str, Any]:
+    return {
+        "connection_state": ConnectionState.ERROR.value,
+        "requires_oauth": requires_oauth,
+        "error": f"Failed to retrieve connection status: {str(error)}",
+    }
+
+
 async def get_single_server_connection_status(
     user_id: str,
     server_id: str,
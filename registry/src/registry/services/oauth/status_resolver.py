@@ -49,6 +49,39 @@ class ConnectionStatusResolver:
             "connection_state": final_state,
         }
 
+    async def resolve_statuses(self, contexts: list[ConnectionStateContext]) -> list[dict[str, Any]]:
+        """
+        Resolve connection status for many servers of one user
+
+        Same rules as resolve_status, but the OAuth flow state of every disconnected
+        OAuth server is fetched in a single lookup instead of one per server.
+
+        Args:
+            contexts: Connection state contexts (all for the same user)
+
+        Returns:
+            Status dicts in the same order as contexts
+        """
+        base_states = [
+            self._get_base_connection_state(context.connection, self._check_staleness(context)) for context in contexts
+        ]
+
+        # Only disconnected OAuth servers are subject to overrides
+        override_candidates = [
+            context
+            for context, base_state in zip(contexts, base_states, strict=True)
+            if context.is_oauth_server and base_state == ConnectionState.DISCONNECTED.value
+        ]
+        overrides = await self._get_oauth_overrides(override_candidates)
+
+        return [
+            {
+                "requires_oauth": context.is_oauth_server,
+                "connection_state": overrides.get(context.server_id, base_state),
+            }
+            for context, base_state in zip(contexts, base_states, strict=True)
+        ]
+
     def _check_staleness(self, context: ConnectionStateContext) -> bool:
         """
         Check if the connection is stale or missing
@@ -113,15 +146,58 @@ class ConnectionStatusResolver:
             # 2. Check flow state
             if self.reconnection_manager:
                 oauth_state = await self.reconnection_manager.get_oauth_state_override(user_id, server_id)
-
-                if oauth_state == "failed":
-                    logger.debug(f"OAuth flow failed for: {server_id}")
-                    return ConnectionState.ERROR.value
-                elif oauth_state == "active":  # ps: Once OAuth begins, it is considered ConnectionState.CONNECTING!
-                    logger.debug(f"OAuth flow active for: {server_id}")
-                    return ConnectionState.CONNECTING.value
+                return self._state_for_oauth_override(server_id, oauth_state) or base_state
 
         except Exception as e:
             logger.error(f"Error applying OAuth overrides for {server_id}: {e}", exc_info=True)
 
         return base_state
+
+    async def _get_oauth_overrides(self, contexts: list[ConnectionStateContext]) -> dict[str, str]:
+        """
+        Bulk variant of _apply_oauth_overrides
+
+        Returns:
+            Mapping of server_id to the overridden state, only for servers whose state changes
+        """
+        if not contexts or not self.reconnection_manager:
+            return {}
+
+        overrides: dict[str, str] = {}
+        try:
+            # 1. Reconnection in progress (process-local tracker, no I/O)
+            pending: list[ConnectionStateContext] = []
+            for context in contexts:
+                if self.reconnection_manager.is_reconnecting(context.user_id, context.server_id):
+                    logger.debug(f"Server is reconnecting: {context.server_id}")
+                    overrides[context.server_id] = ConnectionState.CONNECTING.value
+                else:
+                    pending.append(context)
+
+            # 2. Flow state for the rest, in one lookup per user
+            server_ids_by_user: dict[str, list[str]] = {}
+            for context in pending:
+                server_ids_by_user.setdefault(context.user_id, []).append(context.server_id)
+
+            for user_id, server_ids in server_ids_by_user.items():
+                oauth_states = await self.reconnection_manager.get_oauth_state_overrides(user_id, server_ids)
+                for server_id, oauth_state in oauth_states.items():
+                    state = self._state_for_oauth_override(server_id, oauth_state)
+                    if state:
+                        overrides[server_id] = state
+
+        except Exception as e:
+            logger.error(f"Error applying OAuth overrides for {len(contexts)} servers: {e}", exc_info=True)
+
+        return overrides
+
+    @staticmethod
+    def _state_for_oauth_override(server_id: str, oauth_state: str | None) -> str | None:
+        """Map an OAuth flow override to a connection state (None keeps the base state)"""
+        if oauth_state == "failed":
+            logger.debug(f"OAuth flow failed for: {server_id}")
+            return ConnectionState.ERROR.value
+        elif oauth_state == "active":  # ps: Once OAuth begins, it is considered ConnectionState.CONNECTING!
+            logger.debug(f"OAuth flow active for: {server_id}")
+            return ConnectionState.CONNECTING.value
+        return None
@@ -0,0 +1,371 @@
+"""
+Security Scan Scheduler
+
+Works through the durable scan job queue (see scan_store.ScanJobQueue) with at
+most ``max_concurrency`` scanner processes at once. Jobs are taken highest
+priority first, so newly registered servers and agents are scanned before a
+catalog-wide sweep. Before scanning, the target's content fingerprint (URL, tool
+definitions or agent card, analyzers and the rules version) is compared with the
+one of its last completed scan; unchanged targets are skipped. get_stats()
+reports this replica's totals.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import socket
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from registry_pkgs.models.a2a_agent import A2AAgent
+
+from ..core.change_streams import ChangeEvent
+from .scan_store import (
+    JOB_CANCELLED,
+    JOB_DONE,
+    JOB_FAILED,
+    JOB_SKIPPED,
+    TARGET_AGENT,
+    TARGET_SERVER,
+    ScanJobQueue,
+    ScanResultStore,
+)
+
+if TYPE_CHECKING:
+    from ..core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+# Job priorities; higher runs first.
+PRIORITY_REGISTRATION = 100
+PRIORITY_MANUAL = 75
+PRIORITY_UPDATE = 50
+PRIORITY_SWEEP = 0
+
+
+def compute_fingerprint(content: dict[str, Any]) -> str:
+    """Stable hash of the parts of a target that affect its scan result."""
+    canonical = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class ScanTarget:
+    """A resolved job target: what to compare against the last scan and how to scan it."""
+
+    path: str
+    fingerprint: str
+    scan: Callable[[], Awaitable[Any]]  # returns a result with scan_failed and error_message
+
+
+# Resolves (target_type, target_id) to a ScanTarget, or None if it should no longer be scanned.
+ScanTargetResolver = Callable[[str, str], Awaitable[ScanTarget | None]]
+# Returns the (target_type, target_id) pairs a sweep should queue.
+ScanTargetDiscovery = Callable[[], Awaitable[Iterable[tuple[str, str]]]]
+
+
+class SecurityScanScheduler:
+    """Bounded-concurrency worker pool over the durable security scan job queue."""
+
+    def __init__(
+        self,
+        queue: ScanJobQueue,
+        results: ScanResultStore,
+        resolve: ScanTargetResolver,
+        discover: ScanTargetDiscovery | None = None,
+        *,
+        max_concurrency: int = 4,
+        lease_seconds: float = 900,
+        poll_interval_seconds: float = 5.0,
+        max_attempts: int = 3,
+        sweep_on_start: bool = False,
+    ):
+        """
+        Args:
+            queue: Durable job queue shared by all replicas
+            results: Scan results, used for the unchanged-target check
+            resolve: Loads a job's target
+            discover: Lists every target for sweeps
+            max_concurrency: Maximum number of scans (scanner processes) in flight
+            lease_seconds: A claimed job is handed out again if not completed within this time
+            poll_interval_seconds: How often an idle scheduler checks the queue for jobs queued by other replicas
+            max_attempts: Jobs whose lease expired this many times are failed
+            sweep_on_start: Queue every target at sweep priority on start (unchanged targets are skipped)
+        """
+        self.queue = queue
+        self.results = results
+        self.resolve = resolve
+        self.discover = discover
+        self.max_concurrency = max_concurrency
+        self.lease_seconds = lease_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+        self.max_attempts = max_attempts
+        self.sweep_on_start = sweep_on_start
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._running_targets: set[str] = set()
+        self._in_flight: set[asyncio.Task] = set()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._counts: Counter[str] = Counter()
+        self._next_maintenance = 0.0
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: Settings,
+        *,
+        queue: ScanJobQueue,
+        results: ScanResultStore,
+        resolve: ScanTargetResolver,
+        discover: ScanTargetDiscovery | None = None,
+    ) -> SecurityScanScheduler:
+        return cls(
+            queue,
+            results,
+            resolve,
+            discover,
+            max_concurrency=settings.security_scan_max_concurrency,
+            lease_seconds=settings.security_scan_job_lease_seconds,
+            sweep_on_start=settings.security_scan_sweep_on_start,
+        )
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"Security scan scheduler started (max_concurrency={self.max_concurrency})")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        tasks = [task, *self._in_flight] if task else list(self._in_flight)
+        for pending in tasks:
+            pending.cancel()
+        for pending in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await pending
+        self._in_flight.clear()
+
+    async def enqueue(
+        self,
+        target_type: str,
+        target_id: str,
+        priority: int = PRIORITY_MANUAL,
+        *,
+        force: bool = False,
+        reason: str = "",
+    ) -> None:
+        """Queue a scan of one server or agent."""
+        await self.queue.enqueue(target_type, target_id, priority, force=force, reason=reason)
+        self._counts["queued"] += 1
+        self._wakeup.set()
+
+    async def sweep(self, priority: int = PRIORITY_SWEEP, *, force: bool = False) -> int:
+        """
+        Queue every target returned by ``discover``, e.g. after a scanner rules update.
+
+        Returns:
+            Number of targets queued
+        """
+        if self.discover is None:
+            return 0
+        targets = list(await self.discover())
+        for target_type, target_id in targets:
+            await self.enqueue(target_type, target_id, priority, force=force, reason="sweep")
+        logger.info(f"Queued {len(targets)} security scan(s) for sweep")
+        return len(targets)
+
+    def get_stats(self) -> dict[str, int]:
+        """Totals since start: queued, started, done, skipped, failed and cancelled, plus the scans in flight."""
+        return {**self._counts, "in_flight": len(self._running_targets)}
+
+    async def handle_server_change(self, event: ChangeEvent) -> None:
+        """Scan new servers first, and re-check servers whose config changed."""
+        await self._handle_change(TARGET_SERVER, event, "config")
+
+    async def handle_agent_change(self, event: ChangeEvent) -> None:
+        """Scan new agents first, and re-check agents whose card changed."""
+        await self._handle_change(TARGET_AGENT, event, "card")
+
+    async def _handle_change(self, target_type: str, event: ChangeEvent, content_field: str) -> None:
+        if event.is_delete:
+            return
+        if event.operation == "insert":
+            await self.enqueue(target_type, event.document_id, PRIORITY_REGISTRATION, reason="registered")
+        elif event.touches(content_field):
+            # The fingerprint check skips the scan if nothing that matters changed.
+            await self.enqueue(target_type, event.document_id, PRIORITY_UPDATE, reason="updated")
+
+    async def _maintain(self) -> None:
+        now = time.monotonic()
+        if now < self._next_maintenance:
+            return
+        self._next_maintenance = now + self.lease_seconds / 4
+        try:
+            await self.queue.release_expired(self.max_attempts)
+        except Exception as e:
+            logger.warning(f"Failed to release expired security scan jobs: {e}")
+
+    async def _run(self) -> None:
+        if self.sweep_on_start:
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.error(f"Security scan sweep failed: {e}", exc_info=True)
+
+        while True:
+            try:
+                await self._maintain()
+                await self._semaphore.acquire()
+                self._wakeup.clear()
+                try:
+                    job = await self.queue.claim(self.worker_id, self.lease_seconds, self._running_targets)
+                except BaseException:
+                    self._semaphore.release()
+                    raise
+                if job is None:
+                    self._semaphore.release()
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval_seconds)
+                    continue
+
+                self._running_targets.add(job["targetId"])
+                task = asyncio.create_task(self._process(job))
+                self._in_flight.add(task)
+                task.add_done_callback(lambda done, target_id=job["targetId"]: self._process_done(done, target_id))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in security scan scheduler: {e}", exc_info=True)
+                await asyncio.sleep(1)
+
+    def _process_done(self, task: asyncio.Task, target_id: str) -> None:
+        self._in_flight.discard(task)
+        self._running_targets.discard(target_id)
+        self._semaphore.release()
+        self._wakeup.set()
+
+    async def _process(self, job: dict[str, Any]) -> None:
+        target_type, target_id = job["targetType"], job["targetId"]
+        path = None
+        error = None
+        try:
+            target = await self.resolve(target_type, target_id)
+            if target is None:
+                status = JOB_CANCELLED
+                error = "target no longer exists or cannot be scanned"
+            else:
+                path = target.path
+                if not job.get("force") and (
+                    await self.results.latest_fingerprint(target_type, target.path) == target.fingerprint
+                ):
+                    status = JOB_SKIPPED
+                else:
+                    self._counts["started"] += 1
+                    result = await target.scan()
+                    if getattr(result, "scan_failed", False):
+                        status = JOB_FAILED
+                        error = getattr(result, "error_message", None)
+                    else:
+                        status = JOB_DONE
+                        error = None
+                        if getattr(result, "is_safe", True) is False:
+                            logger.warning(f"Security scan flagged {target_type} {path} as unsafe")
+        except asyncio.CancelledError:
+            # Shutting down mid-scan: hand the job back instead of waiting for its lease to expire.
+            with contextlib.suppress(Exception):
+                await self.queue.requeue(job["_id"])
+            raise
+        except Exception as e:
+            logger.error(f"Security scan job for {target_type} {target_id} failed: {e}", exc_info=True)
+            status = JOB_FAILED
+            error = str(e)
+
+        try:
+            await self.queue.complete(job["_id"], status, error)
+        except Exception as e:
+            logger.warning(f"Failed to record security scan job result for {target_type} {target_id}: {e}")
+        self._counts[status] += 1
+
+
+class RegistryScanTargets:
+    """Resolves queued jobs to registry servers and agents, and lists them for sweeps."""
+
+    def __init__(self, server_service, a2a_agent_service, security_scanner, agent_scanner, rules_version: str = ""):
+        """
+        Args:
+            server_service: Loads servers and lists the enabled ones
+            a2a_agent_service: Loads agents
+            security_scanner: SecurityScannerService used to scan servers
+            agent_scanner: AgentScannerService used to scan agents
+            rules_version: Part of every fingerprint; changing it makes every target due for a rescan
+        """
+        self.server_service = server_service
+        self.a2a_agent_service = a2a_agent_service
+        self.security_scanner = security_scanner
+        self.agent_scanner = agent_scanner
+        self.rules_version = rules_version
+
+    async def __call__(self, target_type: str, target_id: str) -> ScanTarget | None:
+        if target_type == TARGET_SERVER:
+            return await self._server_target(target_id)
+        if target_type == TARGET_AGENT:
+            return await self._agent_target(target_id)
+        logger.warning(f"Unknown security scan target type: {target_type}")
+        return None
+
+    async def list_targets(self) -> list[tuple[str, str]]:
+        """Enabled, network-reachable servers and enabled agents."""
+        targets = [(TARGET_SERVER, server_id) for server_id in await self.server_service.list_health_check_targets()]
+        agents = await A2AAgent.find({"isEnabled": True}).to_list()
+        targets.extend((TARGET_AGENT, str(agent.id)) for agent in agents)
+        return targets
+
+    async def _server_target(self, server_id: str) -> ScanTarget | None:
+        server = await self.server_service.get_server_by_id(server_id)
+        if server is None:
+            return None
+        config = server.config or {}
+        server_url = config.get("url")
+        if not server_url or config.get("type") == "stdio":
+            return None
+
+        analyzers = self.security_scanner.get_scan_config().analyzers
+        fingerprint = compute_fingerprint(
+            {
+                "url": server_url,
+                "type": config.get("type"),
+                "tools": config.get("toolFunctions"),
+                "analyzers": analyzers,
+                "rules": self.rules_version,
+            }
+        )
+        return ScanTarget(
+            path=server.path,
+            fingerprint=fingerprint,
+            scan=lambda: self.security_scanner.scan_server(
+                server_url, analyzers=analyzers, server_path=server.path, fingerprint=fingerprint
+            ),
+        )
+
+    async def _agent_target(self, agent_id: str) -> ScanTarget | None:
+        try:
+            agent = await self.a2a_agent_service.get_agent_by_id(agent_id)
+        except ValueError:
+            return None
+
+        card = agent.card.model_dump(mode="json", by_alias=True, exclude_none=True)
+        analyzers = self.agent_scanner.get_scan_config().analyzers
+        fingerprint = compute_fingerprint({"card": card, "analyzers": analyzers, "rules": self.rules_version})
+        return ScanTarget(
+            path=agent.path,
+            fingerprint=fingerprint,
+            scan=lambda: self.agent_scanner.scan_agent(card, agent.path, analyzers=analyzers, fingerprint=fingerprint),
+        )
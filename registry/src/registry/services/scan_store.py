@@ -0,0 +1,253 @@
+"""
+Security Scan Store
+
+MongoDB persistence for security scanning: the results of server and agent scans,
+and the durable queue of scan jobs the SecurityScanScheduler works through. Both
+use plain pymongo collections resolved on first use, so they can be created before
+the database connection is initialized.
+"""
+
+import logging
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from registry_pkgs.models.extended_mcp_server import ExtendedMCPServer
+
+logger = logging.getLogger(__name__)
+
+SCAN_RESULTS_COLLECTION = "security_scans"
+SCAN_JOBS_COLLECTION = "security_scan_jobs"
+
+TARGET_SERVER = "server"
+TARGET_AGENT = "agent"
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_SKIPPED = "skipped"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+# Finished jobs are kept this long for inspection, then removed by a TTL index.
+FINISHED_JOB_RETENTION_SECONDS = 7 * 24 * 3600
+
+
+def _collection_resolver(name: str) -> Callable[[], Any]:
+    return lambda: ExtendedMCPServer.get_pymongo_collection().database[name]
+
+
+class ScanResultStore:
+    """Scan results, one document per scan, newest first per target."""
+
+    def __init__(self, collection: Callable[[], Any] | None = None):
+        """
+        Args:
+            collection: Returns the async pymongo collection; defaults to ``security_scans`` in the registry database
+        """
+        self._collection = collection or _collection_resolver(SCAN_RESULTS_COLLECTION)
+        self._indexed = False
+
+    async def _get_collection(self):
+        collection = self._collection()
+        if not self._indexed:
+            await collection.create_index([("targetType", 1), ("targetPath", 1), ("createdAt", -1)])
+            self._indexed = True
+        return collection
+
+    async def save(
+        self,
+        target_type: str,
+        target_path: str,
+        result: dict[str, Any],
+        fingerprint: str | None = None,
+    ) -> None:
+        """
+        Store one scan result.
+
+        Args:
+            target_type: TARGET_SERVER or TARGET_AGENT
+            target_path: Registry path of the server or agent (or the URL for ad hoc scans)
+            result: The scan result as a dict (SecurityScanResult / AgentSecurityScanResult dump)
+            fingerprint: Content fingerprint of the target the scan ran against
+        """
+        collection = await self._get_collection()
+        await collection.insert_one(
+            {
+                "targetType": target_type,
+                "targetPath": target_path,
+                "fingerprint": fingerprint,
+                "isSafe": result.get("is_safe", False),
+                "scanFailed": result.get("scan_failed", False),
+                "result": result,
+                "createdAt": datetime.now(UTC),
+            }
+        )
+
+    async def latest(self, target_type: str, target_path: str) -> dict[str, Any] | None:
+        """Most recent scan result document for a target, or None if it was never scanned."""
+        collection = await self._get_collection()
+        return await collection.find_one(
+            {"targetType": target_type, "targetPath": target_path},
+            sort=[("createdAt", -1)],
+        )
+
+    async def latest_fingerprint(self, target_type: str, target_path: str) -> str | None:
+        """Fingerprint of the most recent scan of a target that completed."""
+        collection = await self._get_collection()
+        document = await collection.find_one(
+            {"targetType": target_type, "targetPath": target_path, "scanFailed": False},
+            sort=[("createdAt", -1)],
+            projection={"fingerprint": 1},
+        )
+        return document.get("fingerprint") if document else None
+
+
+class ScanJobQueue:
+    """
+    Durable priority queue of scan jobs.
+
+    A target has at most one pending job; enqueueing it again raises the job's
+    priority instead of adding a duplicate. Workers claim the highest-priority,
+    oldest pending job under a lease; jobs whose worker died are handed out again
+    once the lease expires.
+    """
+
+    def __init__(self, collection: Callable[[], Any] | None = None):
+        """
+        Args:
+            collection: Returns the async pymongo collection; defaults to ``security_scan_jobs`` in the registry database
+        """
+        self._collection = collection or _collection_resolver(SCAN_JOBS_COLLECTION)
+        self._indexed = False
+
+    async def _get_collection(self):
+        collection = self._collection()
+        if not self._indexed:
+            await collection.create_index(
+                [("targetType", 1), ("targetId", 1)],
+                unique=True,
+                partialFilterExpression={"status": JOB_PENDING},
+                name="one_pending_job_per_target",
+            )
+            await collection.create_index([("status", 1), ("priority", -1), ("enqueuedAt", 1)])
+            await collection.create_index("finishedAt", expireAfterSeconds=FINISHED_JOB_RETENTION_SECONDS)
+            self._indexed = True
+        return collection
+
+    async def enqueue(
+        self, target_type: str, target_id: str, priority: int, *, force: bool = False, reason: str = ""
+    ) -> None:
+        """
+        Add a pending job for a target, or raise the priority of its existing one.
+
+        Args:
+            target_type: TARGET_SERVER or TARGET_AGENT
+            target_id: Document id of the server or agent
+            priority: Higher runs first
+            force: Scan even if the target is unchanged since its last scan
+            reason: Why the job was queued (e.g. "registered"), for inspection
+        """
+        collection = await self._get_collection()
+        query = {"targetType": target_type, "targetId": target_id, "status": JOB_PENDING}
+        update = {
+            "$max": {"priority": priority, "force": force},
+            "$setOnInsert": {"enqueuedAt": datetime.now(UTC), "attempts": 0, "reason": reason},
+        }
+        try:
+            await collection.update_one(query, update, upsert=True)
+        except DuplicateKeyError:
+            # Another replica inserted the same pending job first; merge into it.
+            await collection.update_one(query, update)
+
+    async def claim(
+        self, worker_id: str, lease_seconds: float, exclude_target_ids: Iterable[str] = ()
+    ) -> dict[str, Any] | None:
+        """
+        Take the next pending job and mark it running under a lease.
+
+        Args:
+            worker_id: Identifies the claiming scheduler
+            lease_seconds: The job is handed out again if not completed within this time
+            exclude_target_ids: Targets this worker is already scanning
+
+        Returns:
+            The claimed job document, or None if nothing is pending
+        """
+        collection = await self._get_collection()
+        now = datetime.now(UTC)
+        query: dict[str, Any] = {"status": JOB_PENDING}
+        excluded = list(exclude_target_ids)
+        if excluded:
+            query["targetId"] = {"$nin": excluded}
+        return await collection.find_one_and_update(
+            query,
+            {
+                "$set": {
+                    "status": JOB_RUNNING,
+                    "workerId": worker_id,
+                    "startedAt": now,
+                    "leaseExpiresAt": now + timedelta(seconds=lease_seconds),
+                },
+                "$inc": {"attempts": 1},
+            },
+            sort=[("priority", -1), ("enqueuedAt", 1)],
+            return_document=ReturnDocument.AFTER,
+        )
+
+    async def complete(self, job_id: Any, status: str, error: str | None = None) -> None:
+        """Record the final status of a claimed job."""
+        collection = await self._get_collection()
+        await collection.update_one(
+            {"_id": job_id},
+            {
+                "$set": {"status": status, "error": error, "finishedAt": datetime.now(UTC)},
+                "$unset": {"leaseExpiresAt": ""},
+            },
+        )
+
+    async def requeue(self, job_id: Any) -> None:
+        """Return a claimed job to the queue, e.g. when its worker shuts down mid-scan."""
+        collection = await self._get_collection()
+        try:
+            await collection.update_one(
+                {"_id": job_id, "status": JOB_RUNNING},
+                {"$set": {"status": JOB_PENDING}, "$unset": {"leaseExpiresAt": "", "workerId": ""}},
+            )
+        except DuplicateKeyError:
+            # The target was queued again meanwhile; that job supersedes this one.
+            await self.complete(job_id, JOB_CANCELLED, "superseded by a newer job")
+
+    async def release_expired(self, max_attempts: int) -> int:
+        """
+        Re-queue running jobs whose lease expired, failing those that used up their attempts.
+
+        Returns:
+            Number of jobs released or failed
+        """
+        collection = await self._get_collection()
+        expired = await collection.find(
+            {"status": JOB_RUNNING, "leaseExpiresAt": {"$lt": datetime.now(UTC)}}, projection={"attempts": 1}
+        ).to_list(None)
+        for job in expired:
+            if job.get("attempts", 0) >= max_attempts:
+                await self.complete(job["_id"], JOB_FAILED, f"lease expired {job['attempts']} times")
+            else:
+                await self.requeue(job["_id"])
+        if expired:
+            logger.warning(f"Released {len(expired)} security scan job(s) whose worker stopped responding")
+        return len(expired)
+
+    async def count_by_status(self) -> dict[str, int]:
+        """Number of queued and running jobs by status."""
+        collection = await self._get_collection()
+        counts = await collection.aggregate(
+            [
+                {"$match": {"status": {"$in": [JOB_PENDING, JOB_RUNNING]}}},
+                {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+            ]
+        )
+        return {document["_id"]: document["count"] async for document in counts}
@@ -37,6 +37,18 @@ class VectorSearchService(ABC):
         """
         pass
 
+    async def add_or_update_many(self, items: list[tuple[str, dict[str, Any], bool]]):
+        """
+        Add or update many services in the search index.
+
+        Backends override this to embed and write in batches; the default indexes one service at a time.
+
+        Args:
+            items: (service_path, server_info, is_enabled) tuples
+        """
+        for service_path, server_info, is_enabled in items:
+            await self.add_or_update_service(service_path, server_info, is_enabled)
+
     @abstractmethod
     async def remove_service(self, service_path: str):
         """
@@ -6,9 +6,13 @@ Requires heavy dependencies: torch, sentence-transformers, faiss-cpu.
 """
 
 import asyncio
+import base64
+import hashlib
 import json
 import logging
+import os
 import re
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any
 
@@ -49,6 +53,89 @@ class _PydanticAwareJSONEncoder(json.JSONEncoder):
         return super().default(o)
 
 
+_IVF_TYPES = ("ivf_flat", "ivf_pq")
+
+# Snapshots written before index settings existed hold an IndexIDMap(IndexFlatL2).
+_LEGACY_INDEX_CONFIG = {"type": "flat", "metric": "l2"}
+
+# HNSW graphs cannot drop single vectors; rebuild once this share of the index is dead.
+_REBUILD_DELETED_RATIO = 0.1
+
+
+def _keywords(text: str) -> set[str]:
+    """Lowercased terms of text; identifiers like get_weather also yield their parts."""
+    return {token for token in re.split(r"[\W_]+", text.lower()) if len(token) > 1}
+
+
+def _content_hash(*texts: str) -> str:
+    """Stable hash of the texts behind one or more vectors."""
+    digest = hashlib.sha256()
+    for text in texts:
+        digest.update(text.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def _factory_string(config: dict[str, Any]) -> str:
+    """faiss.index_factory description for an index config."""
+    if config["type"] == "hnsw":
+        return f"IDMap2,HNSW{config['m']}"
+    if config["type"] == "ivf_flat":
+        return f"IVF{config['nlist']},Flat"
+    if config["type"] == "ivf_pq":
+        return f"IVF{config['nlist']},PQ{config['pq_m']}x{config['pq_nbits']}"
+    return "IDMap2,Flat"
+
+
+class _ReadWriteLock:
+    """Many concurrent readers (searches in worker threads) or one writer (an in-place index change)."""
+
+    def __init__(self):
+        self._condition = asyncio.Condition()
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    @asynccontextmanager
+    async def read(self):
+        async with self._condition:
+            # Waiting writers go first so a steady stream of searches cannot starve them.
+            await self._condition.wait_for(lambda: not self._writer and not self._writers_waiting)
+            self._readers += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._readers -= 1
+                self._condition.notify_all()
+
+    @asynccontextmanager
+    async def write(self):
+        async with self._condition:
+            self._writers_waiting += 1
+            try:
+                await self._condition.wait_for(lambda: not self._writer and not self._readers)
+            finally:
+                self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._writer = False
+                self._condition.notify_all()
+
+
+def _write_atomic(path, write):
+    """Write a file via a temporary sibling and rename it into place, so readers never see a partial file."""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
 class EmbeddedFaissService(VectorSearchService):
     """Embedded vector search using FAISS and sentence-transformers."""
 
@@ -68,9 +155,43 @@ class EmbeddedFaissService(VectorSearchService):
 
         self.settings = settings
         self.embedding_model: SentenceTransformer | None = None
-        self.faiss_index: faiss.IndexIDMap | None = None
+        self.faiss_index: faiss.Index | None = None
         self.metadata_store: dict[str, dict[str, Any]] = {}
         self.next_id_counter: int = 0
+        # Reverse of metadata_store[path]["id"], so search hits resolve in O(1).
+        self._id_to_path: dict[int, str] = {}
+        # Ids of removed services whose vectors are still in the index until the next compaction.
+        self._deleted_ids: set[int] = set()
+
+        # Index type/metric the current index was built with, and the one the settings ask for.
+        self._index_config: dict[str, Any] = dict(_LEGACY_INDEX_CONFIG)
+        self._desired_index_config = self._configured_index_config()
+        # Searches run in worker threads; in-place index changes must not overlap them.
+        self._index_rw = _ReadWriteLock()
+        # Server vectors already added to the index whose entries are not registered in _id_to_path yet.
+        self._adding_ids: set[int] = set()
+        # While an index is rebuilt from a snapshot ("server" or "tool"), the (ids, vectors) added to
+        # the live index since; they are replayed into the new index before it is swapped in.
+        self._rebuild_journal: dict[str, list[tuple[Any, Any]]] = {}
+
+        # Tools, resources and prompts get their own vectors in a second (flat) index. tool_store maps
+        # a tool id to its description and owning server; each server entry lists its "tool_ids".
+        self.tool_index: faiss.Index | None = None
+        self.tool_store: dict[int, dict[str, Any]] = {}
+        self.next_tool_id: int = 0
+        self._deleted_tool_ids: set[int] = set()
+        self._tool_index_config: dict[str, Any] = {"type": "flat", "metric": self._desired_index_config["metric"]}
+        # Inverted keyword index (term -> tool ids) for exact-term boosts; empty when disabled.
+        self._keyword_index: dict[str, set[int]] = {}
+
+        # Write-behind persistence: changed paths (with their new vector, if re-embedded) wait here
+        # until the next flush appends them to the journal. A snapshot compacts the journal.
+        self._dirty: dict[str, Any] = {}
+        self._dirty_tools: dict[str, list[tuple[int, Any]]] = {}
+        self._journal_records: int = 0
+        self._journal_seq: int = 0
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task | None = None
 
     async def initialize(self):
         """Initialize the FAISS service - load model and index."""
@@ -122,7 +243,8 @@ class EmbeddedFaissService(VectorSearchService):
             raise
 
     async def _load_faiss_data(self):
-        """Load existing FAISS index and metadata or create new ones."""
+        """Load the last FAISS snapshot (or create a new index), then replay the metadata journal."""
+        snapshot_seq = 0
         if self.settings.faiss_index_path.exists() and self.settings.faiss_metadata_path.exists():
             try:
                 logger.info(f"Loading FAISS index from {self.settings.faiss_index_path}")
@@ -133,6 +255,10 @@ class EmbeddedFaissService(VectorSearchService):
                     loaded_metadata = json.load(f)
                     self.metadata_store = loaded_metadata.get("metadata", {})
                     self.next_id_counter = loaded_metadata.get("next_id", 0)
+                    self._index_config = loaded_metadata.get("index_config", dict(_LEGACY_INDEX_CONFIG))
+                    self._deleted_ids = set(loaded_metadata.get("deleted_ids", []))
+                    snapshot_seq = loaded_metadata.get("journal_seq", 0)
+                self._load_tool_index(loaded_metadata)
 
                 logger.info(
                     f"FAISS data loaded. Index size: {self.faiss_index.ntotal if self.faiss_index else 0}. Next ID: {self.next_id_counter}"
@@ -144,46 +270,509 @@ class EmbeddedFaissService(VectorSearchService):
                         f"Loaded FAISS index dimension ({self.faiss_index.d}) differs from expected ({self.settings.local_embeddings_model_dimensions}). Re-initializing."
                     )
                     self._initialize_new_index()
+                    snapshot_seq = 0
+                else:
+                    self._apply_search_params(self.faiss_index, self._index_config)
 
             except Exception as e:
                 logger.error(f"Error loading FAISS data: {e}. Re-initializing.", exc_info=True)
                 self._initialize_new_index()
+                snapshot_seq = 0
         else:
             logger.info("FAISS index or metadata not found. Initializing new.")
             self._initialize_new_index()
 
+        self._journal_seq = snapshot_seq
+        self._replay_journal(snapshot_seq)
+        self._id_to_path = {entry["id"]: path for path, entry in self.metadata_store.items()}
+        backfilled = await self._backfill_tool_index()
+
+        # Compacts replayed deletions and migrates the index if its settings changed.
+        await self.flush(snapshot=backfilled)
+
+    def _load_tool_index(self, loaded_metadata: dict[str, Any]):
+        """Restore the tool index from the snapshot; older snapshots without one are backfilled after replay."""
+        tools = loaded_metadata.get("tools")
+        if tools is not None and self.settings.faiss_tool_index_path.exists():
+            try:
+                self.tool_index = faiss.read_index(str(self.settings.faiss_tool_index_path))
+            except Exception as e:
+                logger.error(f"Error loading FAISS tool index: {e}. Re-embedding tools.", exc_info=True)
+                tools = None
+        else:
+            tools = None
+        if tools is None or self.tool_index.d != self.settings.local_embeddings_model_dimensions:
+            self._reset_tool_index()
+            for entry in self.metadata_store.values():
+                entry.pop("tool_ids", None)
+            return
+
+        self.tool_store = {}
+        self._keyword_index = {}
+        for tool_id, tool in tools.items():
+            self._store_tool(int(tool_id), tool)
+        self.next_tool_id = loaded_metadata.get("next_tool_id", 0)
+        self._deleted_tool_ids = set(loaded_metadata.get("deleted_tool_ids", []))
+        self._tool_index_config = loaded_metadata.get("tool_index_config", self._tool_index_config)
+
+    def _reset_tool_index(self):
+        self._tool_index_config = {"type": "flat", "metric": self._desired_index_config["metric"]}
+        self.tool_index = self._create_index(self._tool_index_config)
+        self.tool_store = {}
+        self.next_tool_id = 0
+        self._deleted_tool_ids = set()
+        self._keyword_index = {}
+
+    async def _backfill_tool_index(self) -> bool:
+        """Embed the tools of servers indexed before tool vectors existed. Returns True if any were added."""
+        if self.embedding_model is None or self.tool_index is None:
+            return False
+
+        pending = [
+            (entry, self._tool_entries(service_path, entry.get("full_server_info", {})))
+            for service_path, entry in self.metadata_store.items()
+            if "tool_ids" not in entry and entry.get("entity_type", "mcp_server") == "mcp_server"
+        ]
+        vectors = await self._embed_texts([item["text"] for _, items in pending for item in items])
+
+        embedded_items, embedded_vectors = [], []
+        offset = 0
+        for entry, items in pending:
+            entry_vectors = vectors[offset : offset + len(items)]
+            offset += len(items)
+            # Entries whose batch failed keep no "tool_ids" and are retried on the next start.
+            if all(vector is not None for vector in entry_vectors):
+                embedded_items.extend(items)
+                embedded_vectors.extend(entry_vectors)
+                entry["tool_ids"] = []
+
+        if not embedded_items:
+            return False
+        try:
+            tool_ids, _ = await self._add_tool_vectors(embedded_items, embedded_vectors)
+        except Exception as e:
+            logger.error(f"Error adding backfilled tool vectors: {e}", exc_info=True)
+            for entry, _ in pending:
+                entry.pop("tool_ids", None)
+            return False
+
+        tool_ids_by_path: dict[str, list[int]] = {}
+        for tool_id, item in zip(tool_ids, embedded_items, strict=True):
+            tool_ids_by_path.setdefault(item["server_path"], []).append(tool_id)
+        for service_path, ids in tool_ids_by_path.items():
+            self.metadata_store[service_path]["tool_ids"] = ids
+        logger.info(f"Backfilled {len(tool_ids)} tool vector(s) into the FAISS tool index")
+        return True
+
     def _initialize_new_index(self):
         """Initialize a new FAISS index."""
-        self.faiss_index = faiss.IndexIDMap(faiss.IndexFlatL2(self.settings.local_embeddings_model_dimensions))
+        self._index_config = self._target_index_config(0)
+        self.faiss_index = self._create_index(self._index_config)
         self.metadata_store = {}
         self.next_id_counter = 0
+        self._id_to_path = {}
+        self._deleted_ids = set()
+        self._journal_seq = 0
+        self._reset_tool_index()
+
+    def _configured_index_config(self) -> dict[str, Any]:
+        """Index config requested by the settings."""
+        settings = self.settings
+        index_type = settings.faiss_index_type
+        if index_type == "ivf_pq" and settings.local_embeddings_model_dimensions % settings.faiss_pq_m:
+            logger.warning(
+                f"faiss_pq_m={settings.faiss_pq_m} does not divide the embedding dimension "
+                f"{settings.local_embeddings_model_dimensions}; using ivf_flat instead of ivf_pq."
+            )
+            index_type = "ivf_flat"
+
+        config: dict[str, Any] = {"type": index_type, "metric": settings.faiss_metric}
+        if index_type == "hnsw":
+            config.update(m=settings.faiss_hnsw_m, ef_construction=settings.faiss_hnsw_ef_construction)
+        elif index_type in _IVF_TYPES:
+            config["nlist"] = settings.faiss_ivf_nlist
+            if index_type == "ivf_pq":
+                config.update(pq_m=settings.faiss_pq_m, pq_nbits=settings.faiss_pq_nbits)
+        return config
+
+    def _target_index_config(self, num_vectors: int) -> dict[str, Any]:
+        """
+        The configured index, or a flat index with the same metric while there are
+        too few vectors to train its IVF quantizer (and PQ codebooks).
+        """
+        config = self._desired_index_config
+        if config["type"] in _IVF_TYPES:
+            min_train = config["nlist"]
+            if config["type"] == "ivf_pq":
+                min_train = max(min_train, 2 ** config["pq_nbits"])
+            if num_vectors < min_train:
+                return {"type": "flat", "metric": config["metric"]}
+        return config
+
+    def _create_index(self, config: dict[str, Any], vectors: Any = None, ids: Any = None):
+        """Build an index for config, training and filling it from vectors. Runs in a worker thread on rebuilds."""
+        metric = faiss.METRIC_INNER_PRODUCT if config["metric"] == "cosine" else faiss.METRIC_L2
+        index = faiss.index_factory(self.settings.local_embeddings_model_dimensions, _factory_string(config), metric)
+        if config["type"] == "hnsw":
+            faiss.downcast_index(index.index).hnsw.efConstruction = config["ef_construction"]
+        elif config["type"] in _IVF_TYPES:
+            # IVF indexes take external ids directly; the hashtable lets them reconstruct by id.
+            index.set_direct_map_type(faiss.DirectMap.Hashtable)
+
+        if vectors is not None and len(vectors):
+            if not index.is_trained:
+                index.train(vectors)
+            index.add_with_ids(vectors, ids)
+
+        self._apply_search_params(index, config)
+        return index
+
+    def _apply_search_params(self, index, config: dict[str, Any]):
+        if config["type"] == "hnsw":
+            faiss.downcast_index(index.index).hnsw.efSearch = self.settings.faiss_hnsw_ef_search
+        elif config["type"] in _IVF_TYPES:
+            faiss.extract_index_ivf(index).nprobe = self.settings.faiss_ivf_nprobe
+
+    def _extract_vectors(self, index, ids):
+        """Read the stored vectors for ids back out of an index."""
+        if len(ids) == 0:
+            return np.empty((0, index.d), dtype=np.float32)
+        try:
+            return index.reconstruct_batch(ids)
+        except RuntimeError:
+            # IndexIDMap snapshots from older versions have no reverse map: read storage in insertion order.
+            stored_ids = faiss.vector_to_array(index.id_map)
+            position = {int(faiss_id): i for i, faiss_id in enumerate(stored_ids)}
+            stored = index.index.reconstruct_n(0, index.ntotal)
+            return stored[[position[int(faiss_id)] for faiss_id in ids]]
+
+    def _build_index(self, config: dict[str, Any], vectors, ids):
+        if config["metric"] == "cosine":
+            faiss.normalize_L2(vectors)
+        return self._create_index(config, vectors, ids)
+
+    async def _rebuild(self, kind: str, config: dict[str, Any]):
+        """
+        Rebuild the server or tool index as config from the vectors of its live entries.
+
+        Only copying the vectors out (read lock) and swapping the new index in (write lock) hold
+        the index lock; training and filling run in a worker thread in between, so searches and
+        writes carry on. Vectors added meanwhile are replayed into the new index before the swap.
+        Returns the ids of the vectors in the new index.
+        """
+        journal: list[tuple[Any, Any]] = []
+        try:
+            async with self._index_rw.read():
+                if kind == "tool":
+                    index, live = self.tool_index, set(self.tool_store)
+                else:
+                    index, live = self.faiss_index, set(self._id_to_path) | self._adding_ids
+                live_ids = np.array(sorted(live), dtype=np.int64)
+                self._rebuild_journal[kind] = journal
+                vectors = await asyncio.to_thread(self._extract_vectors, index, live_ids)
+            new_index = await asyncio.to_thread(self._build_index, config, vectors, live_ids)
+
+            async with self._index_rw.write():
+                in_index = set(live_ids.tolist())
+                for ids, matrix in journal:
+                    matrix = np.array(matrix, dtype=np.float32)
+                    if config["metric"] == "cosine":
+                        faiss.normalize_L2(matrix)
+                    new_index.add_with_ids(matrix, ids)
+                    in_index.update(ids.tolist())
+                if kind == "tool":
+                    self.tool_index, self._tool_index_config = new_index, config
+                else:
+                    self.faiss_index, self._index_config = new_index, config
+        finally:
+            self._rebuild_journal.pop(kind, None)
+        return in_index
+
+    def _journal_added(self, kind: str, ids, matrix):
+        """Remember vectors added to the live index for a rebuild running on a snapshot of it."""
+        journal = self._rebuild_journal.get(kind)
+        if journal is not None:
+            journal.append((ids, matrix))
+
+    async def _rebuild_index(self, config: dict[str, Any]) -> bool:
+        """Rebuild the server index as config from the vectors of live entries."""
+        logger.info(f"Rebuilding FAISS index ({self._index_config} -> {config}) with {len(self._id_to_path)} vector(s)")
+        try:
+            in_index = await self._rebuild("server", config)
+        except Exception as e:
+            logger.error(f"Error rebuilding FAISS index as {config}: {e}", exc_info=True)
+            return False
+        # Only ids retired while the rebuild ran still have vectors in the new index.
+        self._deleted_ids &= in_index
+        return True
+
+    def _replay_journal(self, snapshot_seq: int = 0):
+        """Apply changes journaled after the last snapshot."""
+        journal_path = self.settings.faiss_journal_path
+        if not journal_path.exists():
+            return
+
+        replayed = 0
+        try:
+            with open(journal_path, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn final line from a crash mid-append; everything before it is intact.
+                        logger.warning(f"Skipping unreadable FAISS journal record in {journal_path}")
+                        continue
+                    seq = record.get("seq", 0)
+                    if seq and seq <= snapshot_seq:
+                        # Already in the snapshot (crash between snapshot and journal truncation).
+                        continue
+                    self._journal_seq = max(self._journal_seq, seq)
+                    self._apply_journal_record(record)
+                    replayed += 1
+        except Exception as e:
+            logger.error(f"Error replaying FAISS journal {journal_path}: {e}", exc_info=True)
+
+        self._journal_records = replayed
+        logger.info(f"Replayed {replayed} FAISS journal record(s). Index size: {self.faiss_index.ntotal}")
+
+    def _apply_journal_record(self, record: dict[str, Any]):
+        service_path = record["path"]
+        if record["op"] == "del":
+            entry = self.metadata_store.pop(service_path, None)
+            if entry is not None:
+                self._deleted_ids.add(entry["id"])
+                self._retire_tools(entry.get("tool_ids", []))
+            return
+
+        entry = record["entry"]
+        faiss_id = int(entry["id"])
+        previous = self.metadata_store.get(service_path)
+        if previous is not None:
+            kept_tool_ids = set(entry.get("tool_ids", []))
+            self._retire_tools([tool_id for tool_id in previous.get("tool_ids", []) if tool_id not in kept_tool_ids])
+        for tool in record.get("tools", []):
+            self._apply_journaled_tool(tool)
+
+        already_indexed = previous is not None and previous["id"] == faiss_id
+        if previous is not None and not already_indexed:
+            # Re-embedded, or removed and re-added, since the snapshot.
+            self._deleted_ids.add(previous["id"])
+        if record.get("vector") and not already_indexed:
+            vector = np.frombuffer(base64.b64decode(record["vector"]), dtype=np.float32)
+            if vector.shape[0] != self.faiss_index.d:
+                logger.warning(f"Skipping journaled vector for '{service_path}' with dimension {vector.shape[0]}")
+                return
+            self.faiss_index.add_with_ids(vector.reshape(1, -1), np.array([faiss_id], dtype=np.int64))
+
+        self.metadata_store[service_path] = entry
+        self.next_id_counter = max(self.next_id_counter, faiss_id + 1)
+
+    def _apply_journaled_tool(self, record: dict[str, Any]):
+        tool_id = int(record["id"])
+        self.next_tool_id = max(self.next_tool_id, tool_id + 1)
+        if tool_id in self.tool_store:
+            # Already in the snapshot.
+            return
+        vector = np.frombuffer(base64.b64decode(record["vector"]), dtype=np.float32)
+        if vector.shape[0] != self.tool_index.d:
+            logger.warning(f"Skipping journaled tool vector with dimension {vector.shape[0]}")
+            return
+        self.tool_index.add_with_ids(vector.reshape(1, -1), np.array([tool_id], dtype=np.int64))
+        self._store_tool(tool_id, record["tool"])
+
+    async def _compact_index(self):
+        """Drop the vectors of removed services from the index in one batch."""
+        if not self._deleted_ids or self.faiss_index is None:
+            return
+
+        deleted_ids = np.array(sorted(self._deleted_ids), dtype=np.int64)
+        try:
+            async with self._index_rw.write():
+                num_removed = self.faiss_index.remove_ids(deleted_ids)
+        except RuntimeError:
+            # HNSW cannot remove in place; searches skip dead ids until enough pile up to rebuild.
+            if len(deleted_ids) >= self.faiss_index.ntotal * _REBUILD_DELETED_RATIO:
+                await self._rebuild_index(self._index_config)
+            return
+        except Exception as e:
+            logger.error(f"Error removing {len(deleted_ids)} deleted vector(s) from FAISS index: {e}", exc_info=True)
+            return
+
+        logger.info(f"Compacted FAISS index: removed {num_removed} vector(s) of deleted services.")
+        self._deleted_ids.clear()
+
+    async def _compact_tool_index(self):
+        """Drop the vectors of removed or re-embedded tools from the tool index in one batch."""
+        if not self._deleted_tool_ids or self.tool_index is None:
+            return
+
+        deleted_ids = np.array(sorted(self._deleted_tool_ids), dtype=np.int64)
+        try:
+            async with self._index_rw.write():
+                self.tool_index.remove_ids(deleted_ids)
+        except Exception as e:
+            logger.error(f"Error removing {len(deleted_ids)} deleted tool vector(s): {e}", exc_info=True)
+            return
+        self._deleted_tool_ids.clear()
+
+    def _retire_id(self, faiss_id: int):
+        """Stop resolving faiss_id; its vector is dropped at the next compaction."""
+        self._id_to_path.pop(faiss_id, None)
+        self._deleted_ids.add(faiss_id)
+
+    def _mark_dirty(self, service_path: str, vector: Any = None, tools: list[tuple[int, Any]] | None = None):
+        """Record that service_path changed; new vectors replace any earlier unflushed ones."""
+        if vector is not None:
+            self._dirty[service_path] = vector
+        else:
+            self._dirty.setdefault(service_path, None)
+        if tools is not None:
+            self._dirty_tools[service_path] = tools
+
+    async def _schedule_flush(self):
+        """Flush now if enough changes are pending, otherwise within faiss_flush_interval_seconds."""
+        if len(self._dirty) >= self.settings.faiss_flush_max_pending:
+            await self.flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.settings.faiss_flush_interval_seconds)
+        await self.flush()
+
+    async def flush(self, snapshot: bool = False):
+        """
+        Persist pending changes.
+
+        Changed entries are appended to the metadata journal; once the journal holds
+        faiss_journal_compact_threshold records (or when snapshot=True) the full index
+        and metadata are snapshotted and the journal is truncated.
+        """
+        async with self._flush_lock:
+            if self.faiss_index is None:
+                return
+
+            await self._compact_index()
+            await self._compact_tool_index()
+            if (
+                self.tool_index is not None
+                and self._tool_index_config["metric"] != self._desired_index_config["metric"]
+            ):
+                await self._rebuild_tool_index()
+
+            if self._index_config != self._desired_index_config:
+                # Settings changed, or an IVF index finally has enough vectors to be trained.
+                target = self._target_index_config(len(self._id_to_path))
+                if target != self._index_config and await self._rebuild_index(target):
+                    snapshot = True
+
+            dirty, self._dirty = self._dirty, {}
+            dirty_tools, self._dirty_tools = self._dirty_tools, {}
+            records = []
+            for service_path, vector in dirty.items():
+                self._journal_seq += 1
+                entry = self.metadata_store.get(service_path)
+                if entry is None:
+                    records.append({"op": "del", "seq": self._journal_seq, "path": service_path})
+                    continue
+                record = {"op": "put", "seq": self._journal_seq, "path": service_path, "entry": entry, "vector": vector}
+                tools = [
+                    {"id": tool_id, "tool": self.tool_store[tool_id], "vector": tool_vector}
+                    for tool_id, tool_vector in dirty_tools.get(service_path, [])
+                    if tool_id in self.tool_store
+                ]
+                if tools:
+                    record["tools"] = tools
+                records.append(record)
+
+            if records:
+                try:
+                    await asyncio.to_thread(self._append_journal, records)
+                    self._journal_records += len(records)
+                except Exception as e:
+                    logger.error(f"Error appending {len(records)} record(s) to FAISS journal: {e}", exc_info=True)
+                    # Keep the changes for the next attempt without clobbering newer ones.
+                    for service_path, vector in dirty.items():
+                        if service_path not in self._dirty:
+                            self._dirty[service_path] = vector
+                    for service_path, tools in dirty_tools.items():
+                        self._dirty_tools.setdefault(service_path, tools)
+                    return
+
+            if snapshot or self._journal_records >= self.settings.faiss_journal_compact_threshold:
+                await self._save_data()
+
+    def _append_journal(self, records: list[dict[str, Any]]):
+        def encode(vector):
+            return base64.b64encode(np.asarray(vector, dtype=np.float32).tobytes()).decode("ascii")
+
+        lines = []
+        for record in records:
+            vector = record.pop("vector", None)
+            if vector is not None:
+                record["vector"] = encode(vector)
+            for tool in record.get("tools", []):
+                tool["vector"] = encode(tool["vector"])
+            lines.append(json.dumps(record, separators=(",", ":"), cls=_PydanticAwareJSONEncoder))
+
+        self.settings.servers_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.settings.faiss_journal_path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
 
     async def _save_data(self):
-        """Save FAISS index and metadata to disk."""
+        """Snapshot the FAISS index and metadata to disk (atomic rename) and truncate the journal."""
         if self.faiss_index is None:
             logger.error("FAISS index is not initialized. Cannot save.")
             return
 
         try:
-            # Ensure directory exists
-            self.settings.servers_dir.mkdir(parents=True, exist_ok=True)
-
-            logger.info(f"Saving FAISS index to {self.settings.faiss_index_path} (Size: {self.faiss_index.ntotal})")
-            faiss.write_index(self.faiss_index, str(self.settings.faiss_index_path))
-
-            logger.info(f"Saving FAISS metadata to {self.settings.faiss_metadata_path}")
-            with open(self.settings.faiss_metadata_path, "w") as f:
-                json.dump(
-                    {"metadata": self.metadata_store, "next_id": self.next_id_counter},
-                    f,
-                    indent=2,
-                    cls=_PydanticAwareJSONEncoder,
+            # Copy state on the event loop: in-place index changes also happen on the loop, so none can overlap.
+            index_bytes = faiss.serialize_index(self.faiss_index)
+            tool_index_bytes = faiss.serialize_index(self.tool_index) if self.tool_index is not None else None
+            payload = {
+                "metadata": dict(self.metadata_store),
+                "next_id": self.next_id_counter,
+                "index_config": self._index_config,
+                "deleted_ids": sorted(self._deleted_ids),
+                "journal_seq": self._journal_seq,
+            }
+            if tool_index_bytes is not None:
+                payload.update(
+                    tools=dict(self.tool_store),
+                    next_tool_id=self.next_tool_id,
+                    deleted_tool_ids=sorted(self._deleted_tool_ids),
+                    tool_index_config=self._tool_index_config,
                 )
 
+            logger.info(f"Saving FAISS snapshot to {self.settings.faiss_index_path} (Size: {self.faiss_index.ntotal})")
+            await asyncio.to_thread(self._write_snapshot, index_bytes, payload, tool_index_bytes)
+            self._journal_records = 0
+
             logger.info("FAISS data saved successfully.")
         except Exception as e:
             logger.error(f"Error saving FAISS data: {e}", exc_info=True)
 
+    def _write_snapshot(self, index_bytes: Any, payload: dict[str, Any], tool_index_bytes: Any = None):
+        self.settings.servers_dir.mkdir(parents=True, exist_ok=True)
+
+        _write_atomic(self.settings.faiss_index_path, lambda f: f.write(index_bytes))
+        if tool_index_bytes is not None:
+            _write_atomic(self.settings.faiss_tool_index_path, lambda f: f.write(tool_index_bytes))
+        _write_atomic(
+            self.settings.faiss_metadata_path,
+            lambda f: f.write(
+                json.dumps(payload, separators=(",", ":"), cls=_PydanticAwareJSONEncoder).encode("utf-8")
+            ),
+        )
+
+        # Everything journaled so far is in the snapshot.
+        self.settings.faiss_journal_path.unlink(missing_ok=True)
+
     def _get_text_for_embedding(self, server_info: dict[str, Any]) -> str:
         """Prepare text string from server info (including tools) for embedding."""
         name = server_info.get("server_name", "")
@@ -203,6 +792,122 @@ class EmbeddedFaissService(VectorSearchService):
         tools_section = "\n".join(tool_snippets)
         return (f"Name: {name}\nDescription: {description}\nTags: {tag_string}\nTools:\n{tools_section}").strip()
 
+    def _tool_entries(self, service_path: str, server_info: dict[str, Any]) -> list[dict[str, Any]]:
+        """Searchable tools, resources and prompts of a server, each with the text to embed."""
+        server_name = server_info.get("server_name", "")
+        items = []
+
+        def add(kind: str, name: str, description: str, args: str = ""):
+            if not name:
+                return
+            items.append(
+                {
+                    "server_path": service_path,
+                    "kind": kind,
+                    "tool_name": name,
+                    "description": description,
+                    "match_context": (description or args or "")[:180],
+                    "text": f"{kind.capitalize()}: {name}\nServer: {server_name}\nDescription: {description}\nArgs: {args}",
+                }
+            )
+
+        for tool in server_info.get("tool_list") or []:
+            parsed_description = tool.get("parsed_description", {}) or {}
+            tool_desc = (
+                parsed_description.get("main") or tool.get("description") or parsed_description.get("summary") or ""
+            )
+            add("tool", tool.get("name", ""), tool_desc, parsed_description.get("args", ""))
+        for resource in server_info.get("resources") or []:
+            if isinstance(resource, dict):
+                add("resource", resource.get("name") or resource.get("uri", ""), resource.get("description") or "")
+        for prompt in server_info.get("prompts") or []:
+            if isinstance(prompt, dict):
+                args = ", ".join(arg.get("name", "") for arg in prompt.get("arguments") or [] if isinstance(arg, dict))
+                add("prompt", prompt.get("name", ""), prompt.get("description") or "", args)
+        return items
+
+    def _store_tool(self, tool_id: int, tool: dict[str, Any]):
+        self.tool_store[tool_id] = tool
+        if self.settings.faiss_tool_keyword_boost > 0:
+            for term in _keywords(f"{tool['tool_name']} {tool['description']}"):
+                self._keyword_index.setdefault(term, set()).add(tool_id)
+
+    def _retire_tools(self, tool_ids: list[int]):
+        """Forget tools; their vectors are dropped at the next compaction."""
+        for tool_id in tool_ids:
+            tool = self.tool_store.pop(tool_id, None)
+            if tool is None:
+                continue
+            self._deleted_tool_ids.add(tool_id)
+            for term in _keywords(f"{tool['tool_name']} {tool['description']}"):
+                ids = self._keyword_index.get(term)
+                if ids is not None:
+                    ids.discard(tool_id)
+                    if not ids:
+                        del self._keyword_index[term]
+
+    def _stored_content_hash(self, entry: dict[str, Any]) -> str:
+        """Hash of the text embedded for a metadata entry (computed for entries written before content_hash)."""
+        return entry.get("content_hash") or _content_hash(entry.get("text_for_embedding", ""))
+
+    def _stored_tools_hash(self, entry: dict[str, Any] | None) -> str:
+        """Hash of the tool texts indexed for a metadata entry (computed for entries written before tools_hash)."""
+        if entry is None:
+            return _content_hash()
+        if entry.get("tools_hash"):
+            return entry["tools_hash"]
+        return _content_hash(
+            *(self.tool_store.get(tool_id, {}).get("text", "") for tool_id in entry.get("tool_ids", []))
+        )
+
+    async def _embed_texts(self, texts: list[str]) -> list[Any]:
+        """
+        Encode texts in batches of vector_index_batch_size, with at most
+        vector_index_max_concurrency batches in flight. A batch that fails to
+        encode yields None for each of its texts.
+        """
+        batch_size = max(1, self.settings.vector_index_batch_size)
+        semaphore = asyncio.Semaphore(max(1, self.settings.vector_index_max_concurrency))
+
+        async def encode(batch: list[str]) -> list[Any]:
+            async with semaphore:
+                try:
+                    matrix = np.array(await asyncio.to_thread(self.embedding_model.encode, batch), dtype=np.float32)
+                    return [matrix[i] for i in range(len(batch))]
+                except Exception as e:
+                    logger.error(f"Error encoding a batch of {len(batch)} text(s): {e}", exc_info=True)
+                    return [None] * len(batch)
+
+        batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+        results = await asyncio.gather(*(encode(batch) for batch in batches))
+        return [vector for result in results for vector in result]
+
+    async def _add_tool_vectors(self, items: list[dict[str, Any]], vectors: list[Any]) -> tuple[list[int], list]:
+        """Add embedded tools to the tool index in one call. Returns their new ids and stored vectors."""
+        matrix = np.array(vectors, dtype=np.float32)
+        if self._tool_index_config["metric"] == "cosine":
+            faiss.normalize_L2(matrix)
+
+        tool_ids = list(range(self.next_tool_id, self.next_tool_id + len(items)))
+        self.next_tool_id += len(items)
+        ids = np.array(tool_ids, dtype=np.int64)
+        async with self._index_rw.write():
+            self.tool_index.add_with_ids(matrix, ids)
+        self._journal_added("tool", ids, matrix)
+        for tool_id, item in zip(tool_ids, items, strict=True):
+            self._store_tool(tool_id, item)
+        return tool_ids, [matrix[i] for i in range(len(items))]
+
+    async def _rebuild_tool_index(self):
+        """Rebuild the tool index with the configured metric from its stored vectors."""
+        config = {"type": "flat", "metric": self._desired_index_config["metric"]}
+        try:
+            in_index = await self._rebuild("tool", config)
+        except Exception as e:
+            logger.error(f"Error rebuilding FAISS tool index as {config}: {e}", exc_info=True)
+            return
+        self._deleted_tool_ids &= in_index
+
     def _get_text_for_agent(self, agent_card) -> str:
         """
         DEPRECATED: Prepare text string from agent card for embedding.
@@ -214,84 +919,169 @@ class EmbeddedFaissService(VectorSearchService):
 
     async def add_or_update_service(self, service_path: str, server_info: dict[str, Any], is_enabled: bool = False):
         """Add or update a service in the FAISS index."""
+        await self.add_or_update_many([(service_path, server_info, is_enabled)])
+
+    async def add_or_update_many(self, items: list[tuple[str, dict[str, Any], bool]]):
+        """
+        Add or update many services in the FAISS index.
+
+        The server and tool texts that changed are gathered across all items and
+        embedded in batches; the new vectors are added to each index in one call.
+        """
         if self.embedding_model is None or self.faiss_index is None:
             logger.error("Embedding model or FAISS index not initialized. Cannot add/update service in FAISS.")
             return
 
-        logger.info(f"Attempting to add/update service '{service_path}' in FAISS.")
-        text_to_embed = self._get_text_for_embedding(server_info)
-
-        current_faiss_id = -1
-        needs_new_embedding = True
-
-        existing_entry = self.metadata_store.get(service_path)
-
-        if existing_entry:
-            current_faiss_id = existing_entry["id"]
-            if existing_entry.get("text_for_embedding") == text_to_embed:
-                needs_new_embedding = False
-                logger.info(
-                    f"Text for embedding for '{service_path}' has not changed. Will update metadata store only if server_info differs."
-                )
-            else:
+        # Later items for the same path win.
+        items = list({service_path: (service_path, info, enabled) for service_path, info, enabled in items}.values())
+        logger.info(f"Attempting to add/update {len(items)} service(s) in FAISS.")
+
+        plans = []
+        texts: list[str] = []
+        for service_path, server_info, is_enabled in items:
+            existing_entry = self.metadata_store.get(service_path)
+            text = self._get_text_for_embedding(server_info)
+            plan = {
+                "path": service_path,
+                "server_info": server_info,
+                "is_enabled": is_enabled,
+                "existing": existing_entry,
+                "text": text,
+                "content_hash": _content_hash(text),
+                "text_at": None,
+                "tools": None,
+                "tools_at": None,
+                "tools_hash": None,
+            }
+            if existing_entry is None:
+                logger.info(f"New service '{service_path}'.")
+                plan["text_at"] = len(texts)
+                texts.append(plan["text"])
+            elif self._stored_content_hash(existing_entry) != plan["content_hash"]:
                 logger.info(f"Text for embedding for '{service_path}' has changed. Re-embedding required.")
-        else:
-            # New service
-            current_faiss_id = self.next_id_counter
+                plan["text_at"] = len(texts)
+                texts.append(plan["text"])
+
+            if self.tool_index is not None:
+                tool_items = self._tool_entries(service_path, server_info)
+                plan["tools_hash"] = _content_hash(*(item["text"] for item in tool_items))
+                if self._stored_tools_hash(existing_entry) != plan["tools_hash"]:
+                    plan["tools"] = tool_items
+                    plan["tools_at"] = len(texts)
+                    texts.extend(item["text"] for item in tool_items)
+            plans.append(plan)
+
+        vectors = await self._embed_texts(texts)
+
+        # Server vectors: a new or re-embedded entry gets a fresh id and a re-embedded entry's old
+        # vector is dropped at the next compaction, which also works for index types that cannot
+        # remove in place (HNSW).
+        embedded = []
+        for plan in plans:
+            plan["new_vector"] = None
+            if plan["text_at"] is None:
+                plan["id"] = plan["existing"]["id"]
+                continue
+            vector = vectors[plan["text_at"]]
+            if vector is None:
+                logger.error(f"Error encoding embedding for '{plan['path']}'; skipping it.")
+                plan["failed"] = True
+                continue
+            plan["id"] = self.next_id_counter
             self.next_id_counter += 1
-            logger.info(f"New service '{service_path}'. Assigning new FAISS ID: {current_faiss_id}.")
-            needs_new_embedding = True
+            embedded.append((plan, vector))
 
-        if needs_new_embedding:
+        if embedded:
+            matrix = np.array([vector for _, vector in embedded], dtype=np.float32)
+            if self._index_config["metric"] == "cosine":
+                faiss.normalize_L2(matrix)
+            ids = np.array([plan["id"] for plan, _ in embedded], dtype=np.int64)
             try:
-                # Run model encoding in a separate thread
-                embedding = await asyncio.to_thread(self.embedding_model.encode, [text_to_embed])
-                embedding_np = np.array([embedding[0]], dtype=np.float32)
-
-                ids_to_remove = np.array([current_faiss_id])
-                if existing_entry:
-                    try:
-                        num_removed = self.faiss_index.remove_ids(ids_to_remove)
-                        if num_removed > 0:
-                            logger.info(
-                                f"Removed {num_removed} old vector(s) for FAISS ID {current_faiss_id} ({service_path})."
-                            )
-                        else:
-                            logger.info(
-                                f"No old vector found for FAISS ID {current_faiss_id} ({service_path}) during update, or ID not in index."
-                            )
-                    except Exception as e_remove:
-                        logger.warning(
-                            f"Issue removing FAISS ID {current_faiss_id} for {service_path}: {e_remove}. Proceeding to add."
-                        )
-
-                self.faiss_index.add_with_ids(embedding_np, np.array([current_faiss_id]))
-                logger.info(f"Added/Updated vector for '{service_path}' with FAISS ID {current_faiss_id}.")
+                async with self._index_rw.write():
+                    self.faiss_index.add_with_ids(matrix, ids)
             except Exception as e:
-                logger.error(f"Error encoding or adding embedding for '{service_path}': {e}", exc_info=True)
+                logger.error(f"Error adding {len(embedded)} embedding(s) to FAISS: {e}", exc_info=True)
                 return
+            self._journal_added("server", ids, matrix)
+            self._adding_ids.update(ids.tolist())
+            for i, (plan, _) in enumerate(embedded):
+                plan["new_vector"] = matrix[i]
+                if plan["existing"]:
+                    self._retire_id(plan["existing"]["id"])
+            logger.info(f"Added/Updated {len(embedded)} vector(s) in FAISS.")
+
+        # Tool vectors; on failure a server keeps its previous tool vectors.
+        tool_plans = []
+        for plan in plans:
+            plan["new_tools"] = None
+            if plan.get("failed") or plan["tools"] is None:
+                continue
+            tool_vectors = vectors[plan["tools_at"] : plan["tools_at"] + len(plan["tools"])]
+            if any(vector is None for vector in tool_vectors):
+                logger.error(f"Error encoding tools of '{plan['path']}'; keeping their previous vectors.")
+                continue
+            tool_plans.append((plan, tool_vectors))
 
-        # Update metadata store
-        enriched_server_info = server_info.copy()
-        enriched_server_info["is_enabled"] = is_enabled
-
-        if (
-            existing_entry is None
-            or needs_new_embedding
-            or existing_entry.get("full_server_info") != enriched_server_info
-        ):
-            self.metadata_store[service_path] = {
-                "id": current_faiss_id,
-                "text_for_embedding": text_to_embed,
-                "full_server_info": enriched_server_info,
-                "entity_type": server_info.get("entity_type", "mcp_server"),
-            }
-            logger.debug(f"Updated faiss_metadata_store for '{service_path}'.")
-            await self._save_data()
-        else:
-            logger.debug(
-                f"No changes to FAISS vector or enriched full_server_info for '{service_path}'. Skipping save."
-            )
+        if tool_plans:
+            try:
+                tool_ids, tool_vectors = await self._add_tool_vectors(
+                    [item for plan, _ in tool_plans for item in plan["tools"]],
+                    [vector for _, plan_vectors in tool_plans for vector in plan_vectors],
+                )
+            except Exception as e:
+                logger.error(f"Error adding tool embeddings to FAISS: {e}", exc_info=True)
+            else:
+                offset = 0
+                for plan, _ in tool_plans:
+                    count = len(plan["tools"])
+                    plan["new_tools"] = list(
+                        zip(tool_ids[offset : offset + count], tool_vectors[offset : offset + count], strict=True)
+                    )
+                    offset += count
+                    if plan["existing"]:
+                        self._retire_tools(plan["existing"].get("tool_ids", []))
+
+        changed = False
+        for plan in plans:
+            if plan.get("failed"):
+                continue
+            service_path, server_info, existing_entry = plan["path"], plan["server_info"], plan["existing"]
+            enriched_server_info = server_info.copy()
+            enriched_server_info["is_enabled"] = plan["is_enabled"]
+
+            if (
+                existing_entry is None
+                or plan["new_vector"] is not None
+                or plan["new_tools"] is not None
+                or existing_entry.get("full_server_info") != enriched_server_info
+            ):
+                if plan["new_tools"] is not None:
+                    tool_ids = [tool_id for tool_id, _ in plan["new_tools"]]
+                    tools_hash = plan["tools_hash"]
+                else:
+                    tool_ids = existing_entry.get("tool_ids", []) if existing_entry else []
+                    tools_hash = existing_entry.get("tools_hash") if existing_entry else None
+                self.metadata_store[service_path] = {
+                    "id": plan["id"],
+                    "text_for_embedding": plan["text"],
+                    "content_hash": plan["content_hash"],
+                    "tools_hash": tools_hash,
+                    "full_server_info": enriched_server_info,
+                    "entity_type": server_info.get("entity_type", "mcp_server"),
+                    "tool_ids": tool_ids,
+                }
+                self._id_to_path[plan["id"]] = service_path
+                self._adding_ids.discard(plan["id"])
+                logger.debug(f"Updated faiss_metadata_store for '{service_path}'.")
+                self._mark_dirty(service_path, plan["new_vector"], plan["new_tools"])
+                changed = True
+            else:
+                logger.debug(
+                    f"No changes to FAISS vector or enriched full_server_info for '{service_path}'. Skipping save."
+                )
+
+        if changed:
+            await self._schedule_flush()
 
     async def remove_service(self, service_path: str):
         """Remove a service from the FAISS index and metadata store."""
@@ -301,20 +1091,15 @@ class EmbeddedFaissService(VectorSearchService):
                 logger.warning(f"Service '{service_path}' not found in FAISS metadata store")
                 return
 
-            # Get the FAISS ID for this service
-            service_id = self.metadata_store[service_path].get("id")
-            if service_id is not None and self.faiss_index:
-                # Remove from FAISS index
-                # Note: FAISS doesn't support direct removal, but we can remove from metadata
-                # The vector will remain in the index but won't be accessible via metadata
-                logger.info(f"Removing service '{service_path}' with FAISS ID {service_id} from index")
-
-            # Remove from metadata store
-            del self.metadata_store[service_path]
-            logger.info(f"Removed service '{service_path}' from FAISS metadata store")
+            # The vector is removed from the index at the next compaction (on flush);
+            # until then the id no longer resolves, so searches skip it.
+            entry = self.metadata_store.pop(service_path)
+            self._retire_id(entry["id"])
+            self._retire_tools(entry.get("tool_ids", []))
+            logger.info(f"Removed service '{service_path}' with FAISS ID {entry['id']} from FAISS")
 
-            # Save the updated metadata
-            await self._save_data()
+            self._mark_dirty(service_path)
+            await self._schedule_flush()
 
         except Exception as e:
             logger.error(f"Failed to remove service '{service_path}' from FAISS: {e}", exc_info=True)
@@ -439,56 +1224,68 @@ class EmbeddedFaissService(VectorSearchService):
 
         return combined[:max_results]
 
-    def _distance_to_relevance(self, distance: float) -> float:
-        """Convert FAISS L2 distance to a normalized relevance score (0-1)."""
+    def _overfetch_k(self, wanted: int, total_vectors: int, num_deleted: int | None = None) -> int:
+        """
+        Number of neighbours to request so that `wanted` usable hits remain after
+        dropping removed services and entity-type filtering.
+        """
+        factor = max(1, self.settings.faiss_search_overfetch_factor)
+        if num_deleted is None:
+            num_deleted = len(self._deleted_ids)
+        return min(total_vectors, wanted * factor + num_deleted)
+
+    async def _search_index(self, query_np, k: int, tools: bool = False):
+        """Run a FAISS query (on the server or tool index) in a worker thread so the event loop stays free."""
+        index, config = (self.tool_index, self._tool_index_config) if tools else (self.faiss_index, self._index_config)
+        if config["metric"] == "cosine":
+            faiss.normalize_L2(query_np)
+        async with self._index_rw.read():
+            return await asyncio.to_thread(index.search, query_np, k)
+
+    def _distance_to_relevance(self, distance: float, metric: str | None = None) -> float:
+        """Convert a FAISS L2 distance (or cosine similarity) to a normalized relevance score (0-1)."""
         try:
-            relevance = 1.0 / (1.0 + float(distance))
+            if (metric or self._index_config["metric"]) == "cosine":
+                relevance = float(distance)
+            else:
+                relevance = 1.0 / (1.0 + float(distance))
             return max(0.0, min(1.0, relevance))
         except Exception:
             return 0.0
 
-    def _extract_matching_tools(self, query: str, server_info: dict[str, Any]) -> list[dict[str, Any]]:
-        """Extract tool matches using simple keyword overlap."""
-        tools = server_info.get("tool_list") or []
-        if not tools:
+    def _keyword_boosts(self, query: str) -> dict[int, float]:
+        """Exact-term boost per tool id from the inverted keyword index."""
+        weight = self.settings.faiss_tool_keyword_boost
+        terms = _keywords(query)
+        if weight <= 0 or not terms:
+            return {}
+
+        hits: dict[int, int] = {}
+        for term in terms:
+            for tool_id in self._keyword_index.get(term, ()):
+                hits[tool_id] = hits.get(tool_id, 0) + 1
+        return {tool_id: weight * count / len(terms) for tool_id, count in hits.items()}
+
+    async def _search_tools(self, query: str, query_np, wanted: int) -> list[dict[str, Any]]:
+        """Rank tools, resources and prompts by vector similarity plus exact-term boosts."""
+        total_vectors = self.tool_index.ntotal if self.tool_index is not None else 0
+        if total_vectors == 0:
             return []
 
-        tokens = [token for token in re.split(r"\W+", query.lower()) if token]
-        if not tokens:
-            return []
+        k = self._overfetch_k(wanted, total_vectors, len(self._deleted_tool_ids))
+        distances, tool_ids = await self._search_index(query_np, k, tools=True)
+        boosts = self._keyword_boosts(query)
 
-        matches: list[tuple[float, dict[str, Any]]] = []
-        for tool in tools:
-            tool_name = tool.get("name", "")
-            parsed_description = tool.get("parsed_description", {}) or {}
-            tool_desc = (
-                parsed_description.get("main") or tool.get("description") or parsed_description.get("summary") or ""
-            )
-            tool_args = parsed_description.get("args", "")
-            searchable_text = f"{tool_name} {tool_desc} {tool_args}".lower()
-            if not searchable_text.strip():
-                continue
-
-            matches_found = sum(1 for token in tokens if token in searchable_text)
-            if matches_found == 0:
+        matches = []
+        for distance, tool_id in zip(distances[0], tool_ids[0], strict=False):
+            tool = self.tool_store.get(int(tool_id))
+            if tool is None:
                 continue
+            relevance = self._distance_to_relevance(distance, self._tool_index_config["metric"])
+            matches.append({**tool, "relevance_score": min(1.0, relevance + boosts.get(int(tool_id), 0.0))})
 
-            coverage = matches_found / len(tokens)
-            matches.append(
-                (
-                    coverage,
-                    {
-                        "tool_name": tool_name,
-                        "description": tool_desc,
-                        "match_context": (tool_desc or tool_args or "")[:180],
-                        "schema": tool.get("schema", {}),
-                        "raw_score": coverage,
-                    },
-                )
-            )
-
-        matches.sort(key=lambda item: item[0], reverse=True)
-        return [match for _, match in matches]
+        matches.sort(key=lambda item: item["relevance_score"], reverse=True)
+        return matches
 
     async def search_mixed(
         self,
@@ -524,25 +1321,44 @@ class EmbeddedFaissService(VectorSearchService):
         if total_vectors == 0:
             return {"servers": [], "tools": [], "agents": []}
 
-        top_k = min(max_results, total_vectors)
+        top_k = self._overfetch_k(max_results, total_vectors)
         query_embedding = await asyncio.to_thread(self.embedding_model.encode, [query.strip()])
         query_np = np.array([query_embedding[0]], dtype=np.float32)
 
-        distances, indices = self.faiss_index.search(query_np, top_k)
+        distances, indices = await self._search_index(query_np, top_k)
         distance_row = distances[0]
         id_row = indices[0]
 
-        id_to_path = {entry.get("id"): path for path, entry in self.metadata_store.items()}
-
         server_results: list[dict[str, Any]] = []
         tool_results: list[dict[str, Any]] = []
         agent_results: list[dict[str, Any]] = []
 
+        tools_by_server: dict[str, list[dict[str, Any]]] = {}
+        if "tool" in entity_filter:
+            for tool in await self._search_tools(query, query_np, max_results):
+                server_entry = self.metadata_store.get(tool["server_path"])
+                if server_entry is None:
+                    continue
+                tools_by_server.setdefault(tool["server_path"], []).append(tool)
+                server_info = server_entry.get("full_server_info", {})
+                tool_results.append(
+                    {
+                        "entity_type": "tool",
+                        "kind": tool["kind"],
+                        "server_path": tool["server_path"],
+                        "server_name": server_info.get("server_name", tool["server_path"].strip("/")),
+                        "tool_name": tool["tool_name"],
+                        "description": tool["description"],
+                        "match_context": tool["match_context"],
+                        "relevance_score": tool["relevance_score"],
+                    }
+                )
+
         for distance, faiss_id in zip(distance_row, id_row, strict=False):
             if faiss_id == -1:
                 continue
 
-            path = id_to_path.get(int(faiss_id))
+            path = self._id_to_path.get(int(faiss_id))
             if not path:
                 continue
 
@@ -559,9 +1375,7 @@ class EmbeddedFaissService(VectorSearchService):
                     server_info.get("description") or ", ".join(server_info.get("tags", [])) or server_info.get("path")
                 )
 
-                matching_tools: list[dict[str, Any]] = []
-                if "tool" in entity_filter:
-                    matching_tools = self._extract_matching_tools(query, server_info)[:5]
+                matching_tools = tools_by_server.get(path, [])[:5]
 
                 if "mcp_server" in entity_filter:
                     server_results.append(
@@ -577,30 +1391,16 @@ class EmbeddedFaissService(VectorSearchService):
                             "match_context": match_context,
                             "matching_tools": [
                                 {
-                                    "tool_name": tool.get("tool_name", ""),
-                                    "description": tool.get("description", ""),
-                                    "relevance_score": min(1.0, (relevance + tool.get("raw_score", 0)) / 2),
-                                    "match_context": tool.get("match_context", ""),
+                                    "tool_name": tool["tool_name"],
+                                    "description": tool["description"],
+                                    "relevance_score": tool["relevance_score"],
+                                    "match_context": tool["match_context"],
                                 }
                                 for tool in matching_tools
                             ],
                         }
                     )
 
-                if "tool" in entity_filter and matching_tools:
-                    for tool in matching_tools:
-                        tool_results.append(
-                            {
-                                "entity_type": "tool",
-                                "server_path": path,
-                                "server_name": server_info.get("server_name", path.strip("/")),
-                                "tool_name": tool.get("tool_name", ""),
-                                "description": tool.get("description", ""),
-                                "match_context": tool.get("match_context", ""),
-                                "relevance_score": min(1.0, (relevance + tool.get("raw_score", 0)) / 2),
-                            }
-                        )
-
             elif entity_type == "a2a_agent":
                 if "a2a_agent" not in entity_filter:
                     continue
@@ -678,10 +1478,9 @@ class EmbeddedFaissService(VectorSearchService):
                 query_embedding_np = np.array(query_embedding, dtype=np.float32)
 
                 # Search FAISS
-                distances, faiss_ids = await asyncio.to_thread(
-                    self.faiss_index.search,
+                distances, faiss_ids = await self._search_index(
                     query_embedding_np,
-                    min(top_k, self.faiss_index.ntotal) if self.faiss_index.ntotal > 0 else 1,
+                    self._overfetch_k(top_k, self.faiss_index.ntotal) if self.faiss_index.ntotal > 0 else 1,
                 )
 
                 # Convert results
@@ -689,23 +1488,24 @@ class EmbeddedFaissService(VectorSearchService):
                     if faiss_id < 0:  # Invalid ID
                         continue
 
-                    # Find service by FAISS ID
-                    for service_path, entry in self.metadata_store.items():
-                        if entry["id"] == int(faiss_id):
-                            results.append(
-                                {
-                                    "service_path": service_path,
-                                    "server_info": entry.get("full_server_info", {}),
-                                    "score": float(1.0 / (1.0 + distance)),  # Convert distance to similarity
-                                }
-                            )
-                            break
+                    service_path = self._id_to_path.get(int(faiss_id))
+                    if service_path is None:  # Removed, awaiting compaction
+                        continue
+                    results.append(
+                        {
+                            "service_path": service_path,
+                            "server_info": self.metadata_store[service_path].get("full_server_info", {}),
+                            "score": self._distance_to_relevance(distance),
+                        }
+                    )
             except Exception as e:
                 logger.error(f"FAISS search failed: {e}", exc_info=True)
 
         return results[:top_k]
 
     async def cleanup(self):
-        """Save data and cleanup resources."""
-        await self._save_data()
+        """Flush pending changes to a final snapshot and cleanup resources."""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        await self.flush(snapshot=True)
         logger.info("Embedded FAISS service cleanup complete")
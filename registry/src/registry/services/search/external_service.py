@@ -21,6 +21,8 @@ class ExternalVectorSearchService(VectorSearchService):
         enable_rerank: bool = True,
         search_type: SearchType = SearchType.HYBRID,
         reranker_model: str = "ms-marco-TinyBERT-L-2-v2",
+        batch_size: int = 64,
+        max_concurrency: int = 2,
     ):
         """
         Initialize vector search service with rerank support.
@@ -29,10 +31,14 @@ class ExternalVectorSearchService(VectorSearchService):
             enable_rerank: Enable reranking (default: True)
             search_type: Default search type (NEAR_TEXT, BM25, HYBRID)
             reranker_model: FlashRank model name
+            batch_size: Documents per embedding call when bulk indexing
+            max_concurrency: Concurrent embedding calls when bulk indexing
         """
         self.enable_rerank = enable_rerank
         self.search_type = search_type
         self.reranker_model = reranker_model
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
 
         self.client = mcp_server_repo.db_client
         self.mcp_server_repo = mcp_server_repo
@@ -127,6 +133,28 @@ class ExternalVectorSearchService(VectorSearchService):
             logger.error(f"Failed to add/update service: {e}", exc_info=True)
             return {"indexed_tools": 0, "failed_tools": 1}
 
+    async def add_or_update_many(self, items: list[tuple[str, dict[str, Any], bool]]) -> dict[str, int]:
+        """
+        Add or update many servers in the vector database.
+
+        Documents of all servers are embedded and written in shared batches.
+        """
+        servers = []
+        failed = 0
+        for service_path, server_info, is_enabled in items:
+            try:
+                if "path" not in server_info:
+                    server_info["path"] = service_path
+                servers.append(ExtendedMCPServer.from_server_info(server_info=server_info, is_enabled=is_enabled))
+            except Exception as e:
+                logger.error(f"Failed to build server for '{service_path}': {e}", exc_info=True)
+                failed += 1
+
+        result = await self.mcp_server_repo.bulk_sync_servers(
+            servers, batch_size=self.batch_size, max_concurrency=self.max_concurrency
+        )
+        return {"indexed_servers": result.successful, "failed_servers": result.failed + failed}
+
     async def remove_service(self, service_path: str) -> dict[str, int] | None:
         """
         Remove server from vector database.
@@ -0,0 +1,47 @@
+"""
+Change stream consumers that keep the vector DB in step with MongoDB.
+
+Server documents go through MCPServerRepository.smart_sync, whose content and
+metadata hashes make repeated or bookkeeping-only changes free.
+"""
+
+import logging
+
+from registry_pkgs.models.a2a_agent import A2AAgent
+from registry_pkgs.models.extended_mcp_server import ExtendedMCPServer
+from registry_pkgs.vector.repositories.a2a_agent_repository import A2AAgentRepository
+from registry_pkgs.vector.repositories.mcp_server_repository import MCPServerRepository
+
+from ...core.change_streams import ChangeEvent
+
+logger = logging.getLogger(__name__)
+
+# Agent fields that feed its vector documents; other updates are not re-indexed.
+_AGENT_INDEXED_FIELDS = ("card", "path", "tags", "status", "isEnabled")
+
+
+class VectorIndexSync:
+    """Apply server and agent changes from any replica to the vector DB."""
+
+    def __init__(self, mcp_server_repo: MCPServerRepository, a2a_agent_repo: A2AAgentRepository):
+        self.mcp_server_repo = mcp_server_repo
+        self.a2a_agent_repo = a2a_agent_repo
+
+    async def on_server_change(self, event: ChangeEvent) -> None:
+        if event.is_delete:
+            await self.mcp_server_repo.delete_by_server_id(event.document_id)
+            return
+        if event.document is None:
+            # Deleted before the change could be looked up; the delete event follows.
+            return
+        server = ExtendedMCPServer.model_validate(event.document)
+        await self.mcp_server_repo.smart_sync(server)
+
+    async def on_agent_change(self, event: ChangeEvent) -> None:
+        if event.is_delete:
+            await self.a2a_agent_repo.delete_by_agent_id(event.document_id)
+            return
+        if event.document is None or not event.touches(*_AGENT_INDEXED_FIELDS):
+            return
+        agent = A2AAgent.model_validate(event.document)
+        await self.a2a_agent_repo.sync_agent_to_vector_db(agent, is_delete=event.operation != "insert")
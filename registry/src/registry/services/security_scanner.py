@@ -3,26 +3,63 @@ Security Scanner Service
 
 This service provides security scanning functionality for MCP servers during registration.
 It wraps the CLI security scanner and makes it available to API endpoints with proper
-configuration and error handling.
+configuration and error handling. Scan results are stored in MongoDB (see scan_store).
 """
 
 import asyncio
+import contextlib
 import json
 import logging
 import os
 import re
 import subprocess  # nosec B404 - controlled CLI invocation for the bundled scanner tool
 from datetime import UTC, datetime
-from pathlib import Path
 
 from ..core.config import settings
 from ..schemas.security import SecurityScanConfig, SecurityScanResult
+from .scan_store import TARGET_SERVER, ScanResultStore
 
 logger = logging.getLogger(__name__)
 
-# Constants
-PROJECT_ROOT = Path(__file__).parent.parent.parent
-OUTPUT_DIR = PROJECT_ROOT / "security_scans"
+
+async def run_scanner_command(cmd: list[str], env: dict[str, str], timeout: float | None = None) -> str:
+    """
+    Run a scanner CLI in a child process without blocking the event loop.
+
+    Args:
+        cmd: Command and arguments
+        env: Environment for the child process
+        timeout: Seconds before the process is killed
+
+    Returns:
+        The process's stdout
+
+    Raises:
+        subprocess.TimeoutExpired: If the process ran longer than timeout
+        subprocess.CalledProcessError: If the process exited with a non-zero status
+    """
+    process = await asyncio.create_subprocess_exec(  # nosec B603 - command is built from fixed args and validated inputs
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=env,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except (TimeoutError, asyncio.CancelledError) as e:
+        with contextlib.suppress(ProcessLookupError):
+            process.kill()
+        await process.wait()
+        if isinstance(e, asyncio.CancelledError):
+            raise
+        raise subprocess.TimeoutExpired(cmd, timeout) from None
+
+    output = stdout.decode(errors="replace")
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(
+            process.returncode, cmd, output=output, stderr=stderr.decode(errors="replace")
+        )
+    return output
 
 
 def _extract_bearer_token_from_headers(headers: str) -> str | None:
@@ -133,15 +170,10 @@ def _organize_findings_by_analyzer(tool_results: list) -> dict:
 class SecurityScannerService:
     """Service for scanning MCP servers for security vulnerabilities."""
 
-    def __init__(self, server_service) -> None:
+    def __init__(self, server_service, result_store: ScanResultStore | None = None) -> None:
         """Initialize the security scanner service."""
         self.server_service = server_service
-        self._ensure_output_directory()
-
-    def _ensure_output_directory(self) -> Path:
-        """Ensure output directory exists."""
-        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-        return OUTPUT_DIR
+        self.result_store = result_store
 
     def get_scan_config(self) -> SecurityScanConfig:
         """Get security scan configuration from settings."""
@@ -162,6 +194,8 @@ class SecurityScannerService:
         api_key: str | None = None,
         headers: str | None = None,
         timeout: int | None = None,
+        server_path: str | None = None,
+        fingerprint: str | None = None,
     ) -> SecurityScanResult:
         """
         Scan an MCP server for security vulnerabilities.
@@ -172,6 +206,8 @@ class SecurityScannerService:
             api_key: OpenAI API key for LLM-based analysis (overrides config)
             headers: JSON string of headers to include in requests
             timeout: Scan timeout in seconds (overrides config)
+            server_path: Registry path the result is stored under (defaults to the server URL)
+            fingerprint: Content fingerprint stored with the result, see scan_scheduler
 
         Returns:
             SecurityScanResult containing scan results
@@ -199,9 +235,7 @@ class SecurityScannerService:
         logger.info(f"Starting security scan for {server_url} with analyzers: {analyzers}")
 
         try:
-            # Run the scan in a thread pool to avoid blocking
-            raw_output = await asyncio.to_thread(
-                self._run_mcp_scanner,
+            raw_output = await self._run_mcp_scanner(
                 server_url=server_url,
                 analyzers=analyzers,
                 api_key=api_key,
@@ -212,9 +246,6 @@ class SecurityScannerService:
             # Analyze results
             is_safe, critical, high, medium, low = self._analyze_scan_results(raw_output)
 
-            # Save detailed output
-            output_file = self._save_scan_output(server_url, raw_output)
-
             # Create result object
             result = SecurityScanResult(
                 server_url=server_url,
@@ -226,7 +257,6 @@ class SecurityScannerService:
                 low_severity=low,
                 analyzers_used=analyzers.split(","),
                 raw_output=raw_output,
-                output_file=output_file,
                 scan_failed=False,
             )
 
@@ -235,6 +265,7 @@ class SecurityScannerService:
                 f"Safe: {is_safe}, Critical: {critical}, High: {high}, Medium: {medium}, Low: {low}"
             )
 
+            await self._save_scan_result(server_path or server_url, result, fingerprint)
             return result
 
         except (
@@ -253,11 +284,8 @@ class SecurityScannerService:
                 "scan_failed": True,
             }
 
-            # Save error output
-            output_file = self._save_scan_output(server_url, raw_output)
-
             # Return error result
-            return SecurityScanResult(
+            result = SecurityScanResult(
                 server_url=server_url,
                 scan_timestamp=datetime.now(UTC).isoformat().replace("+00:00", "Z"),
                 is_safe=False,  # Treat scanner failures as unsafe
@@ -267,10 +295,11 @@ class SecurityScannerService:
                 low_severity=0,
                 analyzers_used=analyzers.split(",") if analyzers else [],
                 raw_output=raw_output,
-                output_file=output_file,
                 scan_failed=True,
                 error_message=str(e),
             )
+            await self._save_scan_result(server_path or server_url, result, fingerprint)
+            return result
         except Exception as e:
             logger.exception(f"Unexpected error during security scan for {server_url}")
 
@@ -282,11 +311,8 @@ class SecurityScannerService:
                 "scan_failed": True,
             }
 
-            # Save error output
-            output_file = self._save_scan_output(server_url, raw_output)
-
             # Return error result
-            return SecurityScanResult(
+            result = SecurityScanResult(
                 server_url=server_url,
                 scan_timestamp=datetime.now(UTC).isoformat().replace("+00:00", "Z"),
                 is_safe=False,  # Treat scanner failures as unsafe
@@ -296,12 +322,13 @@ class SecurityScannerService:
                 low_severity=0,
                 analyzers_used=analyzers.split(",") if analyzers else [],
                 raw_output=raw_output,
-                output_file=output_file,
                 scan_failed=True,
                 error_message=str(e),
             )
+            await self._save_scan_result(server_path or server_url, result, fingerprint)
+            return result
 
-    def _run_mcp_scanner(
+    async def _run_mcp_scanner(
         self,
         server_url: str,
         analyzers: str,
@@ -312,7 +339,7 @@ class SecurityScannerService:
         """
         Run mcp-scanner command and return raw output.
 
-        This is a synchronous method that runs in a thread pool.
+        The scanner runs as a child process; the event loop is not blocked while it runs.
 
         Args:
             server_url: URL of the MCP server to scan
@@ -356,22 +383,15 @@ class SecurityScannerService:
             env["MCP_SCANNER_LLM_API_KEY"] = api_key
 
         # Run scanner with timeout
+        stdout = ""
         try:
-            result = subprocess.run(  # nosec B603 - command is built from fixed args and validated inputs
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-                env=env,
-                timeout=timeout,
-            )
+            stdout = await run_scanner_command(cmd, env=env, timeout=timeout)
 
             # Log raw output for debugging
-            logger.debug(f"Raw scanner stdout:\n{result.stdout[:500]}")
+            logger.debug(f"Raw scanner stdout:\n{stdout[:500]}")
 
             # Parse JSON output - scanner outputs JSON array after log messages
-            stdout = result.stdout.strip()
-            tool_results = _parse_scanner_json_output(stdout)
+            tool_results = _parse_scanner_json_output(stdout.strip())
 
             # Wrap in expected format with analysis_results
             raw_output = {"analysis_results": {}, "tool_results": tool_results}
@@ -391,7 +411,7 @@ class SecurityScannerService:
             raise RuntimeError(f"Security scanner failed: {e.stderr}") from e
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse scanner output as JSON: {e}")
-            logger.error(f"Raw stdout: {result.stdout[:1000]}")
+            logger.error(f"Raw stdout: {stdout[:1000]}")
             raise RuntimeError("Failed to parse security scanner output") from e
 
     def _analyze_scan_results(self, raw_output: dict) -> tuple[bool, int, int, int, int]:
@@ -438,119 +458,46 @@ class SecurityScannerService:
 
         return is_safe, critical_count, high_count, medium_count, low_count
 
-    def _save_scan_output(self, server_url: str, raw_output: dict) -> str:
-        """
-        Save detailed scan output to JSON file.
-
-        Saves in two locations:
-        1. security_scans/YYYY-MM-DD/scan_<server>_<timestamp>.json (archived)
-        2. security_scans/scan_<server>_latest.json (always current)
-
-        Args:
-            server_url: URL of the scanned server
-            raw_output: Dictionary containing scan results
-
-        Returns:
-            Path to saved output file (latest version)
+    async def _save_scan_result(
+        self, server_path: str, result: SecurityScanResult, fingerprint: str | None = None
+    ) -> None:
         """
-        output_dir = self._ensure_output_directory()
+        Store a scan result in MongoDB.
 
-        # Generate safe filename from server URL
-        safe_url = server_url.replace("https://", "").replace("http://", "").replace("/", "_")
-
-        # Create date-based subdirectory for archival
-        timestamp = datetime.now(UTC)
-        date_folder = timestamp.strftime("%Y-%m-%d")
-        archive_dir = output_dir / date_folder
-        archive_dir.mkdir(exist_ok=True)
-
-        # Save timestamped version in date folder (archived)
-        timestamp_str = timestamp.strftime("%Y%m%d_%H%M%S")
-        archived_filename = f"scan_{safe_url}_{timestamp_str}.json"
-        archived_file = archive_dir / archived_filename
-
-        with open(archived_file, "w") as f:
-            json.dump(raw_output, f, indent=2, default=str)
-
-        logger.info(f"Archived scan output saved to: {archived_file}")
-
-        # Save latest version in root security_scans folder (always current)
-        server_name = safe_url.replace("localhost_", "")
-        latest_filename = f"{server_name}.json"
-        latest_file = output_dir / latest_filename
-
-        with open(latest_file, "w") as f:
-            json.dump(raw_output, f, indent=2, default=str)
-
-        logger.info(f"Latest scan output saved to: {latest_file}")
-
-        return str(latest_file)
-
-    def _server_url_to_filename(self, server_url: str) -> str:
-        """
-        Convert server URL to scan result filename.
+        A storage failure is logged but does not fail the scan.
 
         Args:
-            server_url: Server URL (e.g., https://docs.mcp.cloudflare.com/mcp)
-
-        Returns:
-            Filename for scan results (e.g., docs.mcp.cloudflare.com_mcp.json)
+            server_path: Registry path (or URL) the result is stored under
+            result: Scan result
+            fingerprint: Content fingerprint of the scanned server
         """
-        # Normalize URL: strip trailing slash, ensure /mcp suffix (same as scanner)
-        normalized_url = server_url.rstrip("/")
-        if not normalized_url.endswith("/mcp"):
-            normalized_url = f"{normalized_url}/mcp"
-
-        # Generate safe filename from server URL (same logic as _save_scan_output)
-        safe_url = normalized_url.replace("https://", "").replace("http://", "").replace("/", "_")
-        server_name = safe_url.replace("localhost_", "")
-        return f"{server_name}.json"
+        if self.result_store is None:
+            return
+        try:
+            await self.result_store.save(TARGET_SERVER, server_path, result.model_dump(), fingerprint)
+            logger.info(f"Security scan result stored for {server_path}")
+        except Exception as e:
+            logger.error(f"Failed to store security scan result for {server_path}: {e}")
 
-    def get_scan_result(self, server_path: str) -> dict | None:
+    async def get_scan_result(self, server_path: str) -> dict | None:
         """
         Get the latest scan result for a server.
 
-        Looks for scan files in the security_scans directory. The scan file
-        is named based on the server URL, not the path, so we need to find it
-        by loading server info and matching URLs, or by using a stored mapping.
-
         Args:
             server_path: Server path (e.g., /cloudflare-docs)
 
         Returns:
-            Dictionary containing scan results, or None if no scan found
+            Dictionary containing the raw scanner output of the latest scan, or None if no scan found
         """
-        # Get server info to retrieve URL
-        server_info = self.server_service.get_server_info(server_path)
-        if not server_info:
-            logger.warning(f"Server not found: {server_path}")
-            return None
-
-        server_url = server_info.get("proxy_pass_url")
-        if not server_url:
-            logger.warning(f"Server {server_path} has no proxy_pass_url configured")
+        if self.result_store is None:
             return None
-
-        output_dir = self._ensure_output_directory()
-        filename = self._server_url_to_filename(server_url)
-        scan_file = output_dir / filename
-
-        # Check if the file exists
-        if not scan_file.exists():
-            logger.warning(
-                f"No security scan results found for server {server_path} "
-                f"(URL: {server_url}, expected file: {scan_file})"
-            )
-            return None
-
         try:
-            with open(scan_file) as f:
-                scan_data = json.load(f)
-            logger.info(f"Loaded security scan results for {server_path} from {scan_file}")
-            return scan_data
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse security scan results for {server_path}: {e}")
-            return None
+            document = await self.result_store.latest(TARGET_SERVER, server_path)
         except Exception:
             logger.exception(f"Unexpected error loading security scan results for {server_path}")
             return None
+
+        if document is None:
+            logger.warning(f"No security scan results found for server {server_path}")
+            return None
+        return document["result"].get("raw_output", {})
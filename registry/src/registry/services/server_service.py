@@ -14,6 +14,7 @@ ODM Schema:
 import asyncio
 import json
 import logging
+from copy import deepcopy
 from datetime import UTC, datetime
 from typing import Any
 
@@ -24,7 +25,12 @@ from registry_pkgs.models.extended_mcp_server import ExtendedMCPServer as MCPSer
 from registry_pkgs.vector.repositories.mcp_server_repository import MCPServerRepository
 
 from ..auth.oauth.types import StateMetadata
-from ..core.mcp_client import get_oauth_metadata_from_server, get_tools_from_server_with_server_info
+from ..core.http_client import HTTPClientManager
+from ..core.mcp_client import (
+    get_oauth_metadata_from_server,
+    get_tools_from_server_with_server_info,
+    probe_mcp_server,
+)
 from ..core.telemetry_decorators import track_tool_discovery
 from ..schemas.errors import (
     AuthenticationError,
@@ -126,12 +132,13 @@ async def build_complete_headers_for_server(
     if user_id:
         service_jwt = generate_service_jwt(user_id)
         headers[settings.internal_auth_header] = f"Bearer {service_jwt}"
-        logger.debug(f"Added internal service JWT to {settings.internal_auth_header} header for user {user_id}")
+        logger.debug("Added internal service JWT to %s header for user %s", settings.internal_auth_header, user_id)
 
     # 1. Add custom headers FIRST (lowest priority)
     custom_headers = normalize_headers(decrypted_config.get("headers"))
-    logger.info(f"custom headers: {custom_headers}")
     if custom_headers:
+        # Header values carry credentials; only the names are logged.
+        logger.debug("Custom headers for %s: %s", server.serverName, sorted(custom_headers))
         headers.update(custom_headers)
 
     # 2. Check OAuth and add OAuth headers LAST (highest priority, overrides custom headers)
@@ -144,7 +151,7 @@ async def build_complete_headers_for_server(
                 server_name=server.serverName,
             )
 
-        logger.info(f"Building OAuth headers for {server.serverName}")
+        logger.debug("Building OAuth headers for %s", server.serverName)
 
         # Validate and merge OAuth metadata with config.oauth as source of truth
         # This ensures correct authorization_servers are used for token validation
@@ -161,7 +168,8 @@ async def build_complete_headers_for_server(
             config["oauthMetadata"] = oauth_metadata
             server.config = config
             logger.debug(
-                f"Validated OAuth metadata for token retrieval: authorization_servers={oauth_metadata.get('authorization_servers')}"
+                "Validated OAuth metadata for token retrieval: authorization_servers=%s",
+                oauth_metadata.get("authorization_servers"),
             )
 
         # Get OAuth token (handles refresh automatically)
@@ -191,7 +199,7 @@ async def build_complete_headers_for_server(
         # Override any existing Authorization header with OAuth Bearer token
         # This ensures OAuth always takes priority over custom headers
         headers["Authorization"] = f"Bearer {access_token}"
-        logger.debug(f"OAuth Bearer token added for {server.serverName} (overrides any custom Authorization header)")
+        logger.debug("OAuth Bearer token added for %s (overrides any custom Authorization header)", server.serverName)
         return headers
 
     # 2. Handle apiKey authentication (if not OAuth)
@@ -203,24 +211,24 @@ async def build_complete_headers_for_server(
         if key_value:
             if authorization_type == "bearer":
                 headers["Authorization"] = f"Bearer {key_value}"
-                logger.debug(f"Added Bearer apiKey for {server.serverName}")
+                logger.debug("Added Bearer apiKey for %s", server.serverName)
             elif authorization_type == "basic":
                 # Handle base64 encoding
                 try:
                     base64.b64decode(key_value, validate=True)
                     # Already base64 encoded
                     headers["Authorization"] = f"Basic {key_value}"
-                    logger.debug(f"Added Basic auth (pre-encoded) for {server.serverName}")
+                    logger.debug("Added Basic auth (pre-encoded) for %s", server.serverName)
                 except Exception:
                     # Not base64 encoded, encode it
                     encoded_key = base64.b64encode(key_value.encode()).decode()
                     headers["Authorization"] = f"Basic {encoded_key}"
-                    logger.debug(f"Added Basic auth (auto-encoded) for {server.serverName}")
+                    logger.debug("Added Basic auth (auto-encoded) for %s", server.serverName)
             elif authorization_type == "custom":
                 custom_header = api_key_config.get("custom_header")
                 if custom_header:
                     headers[custom_header] = key_value
-                    logger.debug(f"Added custom auth header '{custom_header}' for {server.serverName}")
+                    logger.debug("Added custom auth header '%s' for %s", custom_header, server.serverName)
                 else:
                     logger.warning(
                         f"apiKey with authorization_type='custom' but no custom_header for {server.serverName}"
@@ -531,12 +539,20 @@ class ServerServiceV1:
         token_service: TokenService,
         oauth_service: Any,
         mcp_server_repo: MCPServerRepository,
+        http_client_manager: HTTPClientManager | None = None,
+        sync_vectors_inline: bool = True,
     ):
-        """Initialize server service with search index manager."""
+        """Initialize server service with search index manager.
+
+        With sync_vectors_inline=False the vector DB is left to the change stream
+        subscriber, which syncs once the write is committed.
+        """
         self.mcp_server_repo = mcp_server_repo
+        self.sync_vectors_inline = sync_vectors_inline
         self.user_service = user_service
         self.token_service = token_service
         self.oauth_service = oauth_service
+        self.http_client_manager = http_client_manager
         logger.info("ServerServiceV1 initialized with search index manager")
 
     async def list_servers(
@@ -676,6 +692,63 @@ class ServerServiceV1:
         if existing_name:
             raise ValueError(f"Server with name '{server_name}' already exists")
 
+        # Get author user reference - authentication required
+        author = await self.user_service.get_user_by_user_id(user_id)
+
+        if not author:
+            raise ValueError(f"Authentication required: User {user_id} not found")
+
+        server = self.build_server_document(data, server_name=server_name, author_id=author.id)
+
+        await server.insert(session=session)
+        logger.info(f"Created server: {server.serverName} (ID: {server.id}, Path: {data.path})")
+
+        # Perform health check and tool retrieval after registration
+        if data.url and not skip_post_registration_checks:
+            try:
+                await self.discover_server_capabilities(server, data)
+            except ValueError:
+                # Health check failed - delete the server and reject registration
+                await server.delete(session=session)
+                raise
+            except Exception as e:
+                # Unexpected error during health check or tool retrieval
+                logger.error(
+                    "Unexpected error during post-registration health check and tool "
+                    "retrieval for server %s (ID: %s, Path: %s): %s",
+                    server.serverName,
+                    server.id,
+                    server.path,
+                    str(e),
+                    exc_info=True,
+                )
+                await server.delete(session=session)
+                return server
+
+            # Save updated server
+            await server.save(session=session)
+        return server
+
+    def build_server_document(
+        self,
+        data: ServerCreateRequest,
+        server_name: str,
+        author_id: PydanticObjectId,
+    ) -> MCPServerDocument:
+        """
+        Build (without saving) the document for a new server.
+
+        Args:
+            data: Server creation data
+            server_name: Unique server name derived from the title
+            author_id: ID of the user creating the server
+
+        Returns:
+            Unsaved server document
+
+        Raises:
+            ValueError: If tags contain duplicates (case-insensitive)
+        """
         # Check for duplicate tags (case-insensitive)
         normalized_tags = [tag.lower() for tag in data.tags]
         if len(normalized_tags) != len(set(normalized_tags)):
@@ -691,21 +764,15 @@ class ServerServiceV1:
         tool_functions = config.get("toolFunctions", {})
         num_tools = len(tool_functions) if tool_functions else 0
 
-        # Get author user reference - authentication required
-        author = await self.user_service.get_user_by_user_id(user_id)
-
-        if not author:
-            raise ValueError(f"Authentication required: User {user_id} not found")
-
         # Create server document with registry fields at root level
         now = _get_current_utc_time()
-        server = MCPServerDocument(
+        return MCPServerDocument(
             serverName=server_name,
             config=config,
-            author=author.id,  # Use PydanticObjectId instead of Link
+            author=author_id,  # Use PydanticObjectId instead of Link
             # Registry-specific root-level fields
             path=data.path,
-            tags=[tag.lower() for tag in data.tags],  # Normalize tags to lowercase
+            tags=normalized_tags,  # Normalize tags to lowercase
             status="active",  # Default status (independent of enabled field)
             numTools=num_tools,  # Store calculated numTools at root level
             numStars=data.numStars,
@@ -717,128 +784,112 @@ class ServerServiceV1:
             updatedAt=now,
         )
 
-        await server.insert(session=session)
-        logger.info(f"Created server: {server.serverName} (ID: {server.id}, Path: {data.path})")
+    async def discover_server_capabilities(self, server: MCPServerDocument, data: ServerCreateRequest) -> None:
+        """
+        Post-registration checks: health check, then capabilities, resources, prompts and OAuth metadata.
 
-        # Perform health check and tool retrieval after registration
-        if data.url and not skip_post_registration_checks:
-            logger.info(f"Performing post-registration health check and tool retrieval for {server.serverName}")
+        Updates ``server`` in place; the caller saves it.
 
-            try:
-                # 1. Health check - REQUIRED
-                from registry.core.mcp_client import perform_health_check
-
-                config = server.config or {}
-                url = config.get("url")
-                transport = config.get("type", "streamable-http")
-
-                (
-                    is_healthy,
-                    status_msg,
-                    response_time_ms,
-                    _,
-                ) = await perform_health_check(
-                    url=url,
-                    transport=transport,
-                )
-                logger.info(
-                    f"Health check result for {server.serverName}: {status_msg} (response_time: {response_time_ms}ms)"
-                )
+        Raises:
+            ValueError: If the health check fails and the server should be rejected
+        """
+        logger.info(f"Performing post-registration health check and tool retrieval for {server.serverName}")
 
-                if not is_healthy:
-                    # Health check failed - delete the server and reject registration
-                    logger.error(f"Health check failed for {server.serverName}: {status_msg}")
-                    await server.delete(session=session)
-                    raise ValueError(f"Server registration rejected: Health check failed - {status_msg}")
+        # 1. Health check - REQUIRED
+        from registry.core.mcp_client import perform_health_check
 
-                # Update server with health check results (root-level field)
-                server.lastConnected = _get_current_utc_time()
-                server.status = "active"
+        config = server.config or {}
+        url = config.get("url")
+        transport = config.get("type", "streamable-http")
 
-                # 2. Retrieve capabilities (but skip tools - they will be fetched on-demand)
-                logger.info(f"Retrieving capabilities for {server.serverName} (skipping tools)")
+        (
+            is_healthy,
+            status_msg,
+            response_time_ms,
+            _,
+        ) = await perform_health_check(
+            url=url,
+            transport=transport,
+        )
+        logger.info(f"Health check result for {server.serverName}: {status_msg} (response_time: {response_time_ms}ms)")
 
-                # Initialize empty toolFunctions and tools (will be populated on first use)
-                config["toolFunctions"] = {}
-                config["tools"] = ""
+        if not is_healthy:
+            logger.error(f"Health check failed for {server.serverName}: {status_msg}")
+            raise ValueError(f"Server registration rejected: Health check failed - {status_msg}")
 
-                # Try to get capabilities only
-                try:
-                    # Build server_info dict for mcp_client
-                    server_info = _build_server_info_for_mcp_client(config, server.tags)
+        # Update server with health check results (root-level field)
+        server.lastConnected = _get_current_utc_time()
+        server.status = "active"
 
-                    from registry.core.mcp_client import (
-                        get_tools_and_capabilities_from_server,
-                    )
+        # 2. Retrieve capabilities (but skip tools - they will be fetched on-demand)
+        logger.info(f"Retrieving capabilities for {server.serverName} (skipping tools)")
 
-                    # Get tools, resources, prompts, and capabilities (we'll only use capabilities for now)
-                    result = await get_tools_and_capabilities_from_server(
-                        data.url,
-                        server_info,
-                        include_resources=True,
-                        include_prompts=True,
-                    )
+        # Initialize empty toolFunctions and tools (will be populated on first use)
+        config["toolFunctions"] = {}
+        config["tools"] = ""
 
-                    # Save capabilities if retrieved successfully
-                    if result.capabilities:
-                        config["capabilities"] = json.dumps(result.capabilities)
-                        logger.info(f"Saved capabilities for {server.serverName}: {config['capabilities']}")
-                    else:
-                        config["capabilities"] = "{}"
-                        logger.warning(f"No capabilities retrieved for {server.serverName}, using empty JSON")
-
-                    # Store resources and prompts (empty lists if not retrieved)
-                    config["resources"] = result.resources or []
-                    config["prompts"] = result.prompts or []
-                    logger.info(
-                        f"Saved {len(result.resources or [])} resources and {len(result.prompts or [])} prompts for {server.serverName}"
-                    )
+        # Try to get capabilities only
+        try:
+            # Build server_info dict for mcp_client
+            server_info = _build_server_info_for_mcp_client(config, server.tags)
+
+            from registry.core.mcp_client import (
+                get_tools_and_capabilities_from_server,
+            )
+
+            # Get tools, resources, prompts, and capabilities (we'll only use capabilities for now)
+            result = await get_tools_and_capabilities_from_server(
+                data.url,
+                server_info,
+                include_resources=True,
+                include_prompts=True,
+                http_client_manager=self.http_client_manager,
+            )
 
-                except Exception as e:
-                    # If capabilities retrieval fails, just use empty capabilities
-                    config["capabilities"] = "{}"
-                    logger.warning(f"Failed to retrieve capabilities for {server.serverName}: {e}")
+            # Save capabilities if retrieved successfully
+            if result.capabilities:
+                config["capabilities"] = json.dumps(result.capabilities)
+                logger.info(f"Saved capabilities for {server.serverName}: {config['capabilities']}")
+            else:
+                config["capabilities"] = "{}"
+                logger.warning(f"No capabilities retrieved for {server.serverName}, using empty JSON")
 
-                logger.info(f"Server {server.serverName} registered successfully. Tools will be fetched on-demand.")
+            # Store resources and prompts (empty lists if not retrieved)
+            config["resources"] = result.resources or []
+            config["prompts"] = result.prompts or []
+            logger.info(
+                f"Saved {len(result.resources or [])} resources and {len(result.prompts or [])} prompts for {server.serverName}"
+            )
 
-                if data.requiresOauth:
-                    logger.info(f"OAuth configuration detected for {server.serverName}, retrieving OAuth metadata...")
+        except Exception as e:
+            # If capabilities retrieval fails, just use empty capabilities
+            config["capabilities"] = "{}"
+            logger.warning(f"Failed to retrieve capabilities for {server.serverName}: {e}")
 
-                    oauth_metadata = await get_oauth_metadata_from_server(data.url)
+        logger.info(f"Server {server.serverName} registered successfully. Tools will be fetched on-demand.")
 
-                    if oauth_metadata:
-                        config["oauthMetadata"] = oauth_metadata
-                        logger.info(f"Saved raw OAuth metadata for {server.serverName}: {json.dumps(oauth_metadata)}")
-                    else:
-                        # Save empty oauthMetadata if retrieval failed
-                        config["oauthMetadata"] = {}
-                        logger.info(
-                            f"No OAuth metadata available for {server.serverName} (server may not support OAuth autodiscovery), saved empty oauthMetadata"
-                        )
+        if data.requiresOauth:
+            logger.info(f"OAuth configuration detected for {server.serverName}, retrieving OAuth metadata...")
 
-                # Update numTools at root level (0 since tools not fetched yet)
-                server.numTools = 0
+            oauth_metadata = await get_oauth_metadata_from_server(
+                data.url, http_client_manager=self.http_client_manager
+            )
 
-                # Save updated server
-                server.config = config
-                server.updatedAt = _get_current_utc_time()
-                await server.save(session=session)
-            except ValueError:
-                # Re-raise ValueError (our validation errors)
-                raise
-            except Exception as e:
-                # Unexpected error during health check or tool retrieval
-                logger.error(
-                    "Unexpected error during post-registration health check and tool "
-                    "retrieval for server %s (ID: %s, Path: %s): %s",
-                    server.serverName,
-                    server.id,
-                    server.path,
-                    str(e),
-                    exc_info=True,
+            if oauth_metadata:
+                config["oauthMetadata"] = oauth_metadata
+                logger.info(f"Saved raw OAuth metadata for {server.serverName}: {json.dumps(oauth_metadata)}")
+            else:
+                # Save empty oauthMetadata if retrieval failed
+                config["oauthMetadata"] = {}
+                logger.info(
+                    f"No OAuth metadata available for {server.serverName} (server may not support OAuth autodiscovery), saved empty oauthMetadata"
                 )
-                await server.delete(session=session)
-        return server
+
+        # Update numTools at root level (0 since tools not fetched yet)
+        server.numTools = 0
+
+        server.config = config
+        server.updatedAt = _get_current_utc_time()
 
     async def update_server(
         self,
@@ -892,7 +943,9 @@ class ServerServiceV1:
 
         if data.requiresOauth:
             logger.info(f"OAuth configuration detected for {server.serverName}, retrieving OAuth metadata...")
-            oauth_metadata = await get_oauth_metadata_from_server(data.url)
+            oauth_metadata = await get_oauth_metadata_from_server(
+                data.url, http_client_manager=self.http_client_manager
+            )
             if oauth_metadata:
                 updated_config["oauthMetadata"] = oauth_metadata
                 logger.info(f"Saved raw OAuth metadata for {server.serverName}: {json.dumps(oauth_metadata)}")
@@ -915,7 +968,8 @@ class ServerServiceV1:
 
         await server.save(session=session)
 
-        asyncio.create_task(self.mcp_server_repo.smart_sync(server))
+        if self.sync_vectors_inline:
+            asyncio.create_task(self.mcp_server_repo.smart_sync(server))
         return server
 
     async def delete_server(
@@ -948,7 +1002,8 @@ class ServerServiceV1:
             raise ValueError("Server not found")
 
         # Remove from vector DB before deleting from MongoDB (background task)
-        asyncio.create_task(self.mcp_server_repo.delete_by_server_id(server_id, server.serverName))
+        if self.sync_vectors_inline:
+            asyncio.create_task(self.mcp_server_repo.delete_by_server_id(server_id, server.serverName))
         await server.delete(session=session)
         logger.info(f"Deleted server: {server.serverName} (ID: {server.id})")
         return True
@@ -1056,7 +1111,8 @@ class ServerServiceV1:
         await server.save()
         logger.info(f"Toggled server {server.serverName} (ID: {server.id}) enabled to {enabled}")
 
-        asyncio.create_task(self.mcp_server_repo.smart_sync(server))
+        if self.sync_vectors_inline:
+            asyncio.create_task(self.mcp_server_repo.smart_sync(server))
         return server
 
     async def get_server_tools(
@@ -1183,6 +1239,7 @@ class ServerServiceV1:
                 transport_type=transport_type,
                 include_resources=include_resources,
                 include_prompts=include_prompts,
+                http_client_manager=self.http_client_manager,
             )
             server.config["requiresInit"] = bool(result.requires_init)
 
@@ -1386,7 +1443,30 @@ class ServerServiceV1:
         if not server:
             raise ValueError("Server not found")
 
+        return await self._refresh_server(server, user_id)
+
+    async def _refresh_server(
+        self,
+        server: MCPServerDocument,
+        user_id: str | None = None,
+        fingerprint: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Re-read tools, resources, prompts and capabilities and store them on the server.
+
+        The document is only written when its status or config actually changed, so a
+        refresh of an unchanged server costs no MongoDB write (and no change stream event).
+
+        Args:
+            server: Server document
+            user_id: User ID for OAuth token retrieval
+            fingerprint: Probe fingerprint to record alongside the refreshed state
+
+        Returns:
+            Health information dictionary
+        """
         now = _get_current_utc_time()
+        previous = (server.status, server.errorMessage, server.numTools, deepcopy(server.config))
 
         # Use the same validation as registration: retrieve tools, resources, prompts, and capabilities
         # This is a more comprehensive health check than just HTTP GET
@@ -1403,12 +1483,12 @@ class ServerServiceV1:
             logger.error(f"Health check failed for {server.serverName}: {tool_error}")
 
             server.status = "error"
-            server.lastError = now
             server.errorMessage = tool_error or "Failed to retrieve capabilities"
-            server.lastConnected = now
-            server.updatedAt = now
-
-            await server.save()
+            if (server.status, server.errorMessage) != previous[:2]:
+                server.lastError = now
+                server.lastConnected = now
+                server.updatedAt = now
+                await server.save()
 
             return {
                 "server": server,
@@ -1424,10 +1504,7 @@ class ServerServiceV1:
         )
 
         server.status = "active"
-        server.lastError = None
         server.errorMessage = None
-        server.lastConnected = now
-        server.updatedAt = now
 
         # Update capabilities, tools, resources, and prompts in config
         config = server.config or {}
@@ -1456,7 +1533,18 @@ class ServerServiceV1:
         )
 
         server.config = config
-        await server.save()
+        if (server.status, server.errorMessage, server.numTools, server.config) != previous:
+            server.lastError = None
+            server.lastConnected = now
+            server.updatedAt = now
+            if fingerprint:
+                server.healthFingerprint = fingerprint
+            await server.save()
+        elif fingerprint and fingerprint != server.healthFingerprint:
+            server.healthFingerprint = fingerprint
+            await server.set({"healthFingerprint": fingerprint})
+        else:
+            logger.debug(f"Health refresh for {server.serverName} found no changes, skipping write")
 
         # Return health info
         return {
@@ -1467,6 +1555,73 @@ class ServerServiceV1:
             "response_time_ms": None,  # We don't track response time for MCP connections
         }
 
+    async def list_health_check_targets(self) -> list[str]:
+        """Ids of enabled servers reachable over the network (stdio servers are not probed)."""
+        servers = await MCPServerDocument.find(
+            {"config.enabled": {"$ne": False}, "config.type": {"$ne": "stdio"}, "config.url": {"$nin": [None, ""]}}
+        ).to_list()
+        return [str(server.id) for server in servers]
+
+    async def check_server_health(self, server: MCPServerDocument, timeout: float) -> tuple[bool, str]:
+        """
+        Scheduled health check: a cheap probe, with a full refresh only when needed.
+
+        The probe initializes a session, pings it and hashes the server version,
+        capabilities and tool list. The full refresh (resources, prompts, document
+        rewrite, vector re-sync) runs only when that fingerprint differs from the one
+        recorded by the last refresh. Nothing is written while the status is unchanged.
+
+        Args:
+            server: Server document
+            timeout: Deadline for the probe in seconds
+
+        Returns:
+            Tuple of (is_healthy, status_message)
+        """
+        config = server.config or {}
+        url = config.get("url")
+        if not url:
+            return False, "No URL configured"
+
+        try:
+            headers = await build_complete_headers_for_server(self.oauth_service, server)
+        except (MissingUserIdError, OAuthTokenError, OAuthReAuthRequiredError, AuthenticationError):
+            # Per-user OAuth servers are probed anonymously; a 401 still proves liveness.
+            headers = None
+
+        probe = await probe_mcp_server(
+            url,
+            headers=headers,
+            transport_type=config.get("type", "streamable-http"),
+            timeout=timeout,
+            http_client_manager=self.http_client_manager,
+        )
+
+        if not probe.healthy:
+            if server.status != "error":
+                now = _get_current_utc_time()
+                server.status = "error"
+                server.lastError = now
+                server.errorMessage = probe.status_message
+                server.updatedAt = now
+                await server.save()
+            return False, probe.status_message
+
+        if probe.fingerprint and probe.fingerprint != server.healthFingerprint:
+            logger.info(f"Server {server.serverName} changed version, capabilities or tools, refreshing")
+            health = await self._refresh_server(server, fingerprint=probe.fingerprint)
+            return health["status"] == "healthy", health["status_message"]
+
+        if server.status == "error":
+            now = _get_current_utc_time()
+            server.status = "active"
+            server.lastError = None
+            server.errorMessage = None
+            server.lastConnected = now
+            server.updatedAt = now
+            await server.save()
+        return True, probe.status_message
+
     async def get_stats(self) -> dict[str, Any]:
         """
         Get system-wide statistics (Admin only).
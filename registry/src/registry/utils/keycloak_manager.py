@@ -3,9 +3,19 @@ Keycloak group management utilities.
 
 This module provides functions to manage groups in Keycloak via the Admin REST API.
 It handles authentication, group CRUD operations, and integrates with the registry.
+
+All functions share one KeycloakAdminClient, which keeps the master-realm admin
+token until shortly before it expires (refreshing it once for all concurrent
+callers), reuses a pooled HTTP client, and caches the group name -> group and
+clientId -> client UUID lookups for a short TTL. Mutations made through this
+module update or invalidate those caches immediately; changes made directly in
+Keycloak become visible once the TTL expires.
 """
 
+import asyncio
 import logging
+import time
+from collections.abc import Awaitable, Iterable
 from typing import Any
 
 import httpx
@@ -19,38 +29,121 @@ KEYCLOAK_REALM = settings.keycloak_realm
 KEYCLOAK_ADMIN = settings.keycloak_admin
 KEYCLOAK_ADMIN_PASSWORD = settings.keycloak_admin_password
 
+# The admin token is refreshed this long before it expires (at most a fifth of its lifetime).
+_TOKEN_REFRESH_MARGIN_SECONDS = 10.0
+
 
 class KeycloakAdminError(RuntimeError):
     """Raised when Keycloak admin API operations fail."""
 
 
-async def _get_keycloak_admin_token() -> str:
-    """
-    Get admin access token from Keycloak for Admin API calls.
-
-    Returns:
-        Admin access token string
-
-    Raises:
-        Exception: If authentication fails
-    """
-    if not KEYCLOAK_ADMIN_PASSWORD:
-        raise Exception("KEYCLOAK_ADMIN_PASSWORD environment variable not set")
-
-    token_url = f"{KEYCLOAK_ADMIN_URL}/realms/master/protocol/openid-connect/token"
+class KeycloakAdminClient:
+    """Keycloak Admin API client with a cached admin token, pooled connections and directory caches."""
+
+    def __init__(
+        self,
+        base_url: str,
+        realm: str,
+        admin_user: str,
+        admin_password: str | None,
+        *,
+        directory_ttl_seconds: float = 60.0,
+        max_concurrency: int = 8,
+        timeout: float = 10.0,
+    ):
+        """
+        Args:
+            base_url: Keycloak base URL
+            realm: Realm managed through the Admin API
+            admin_user: Master-realm admin username
+            admin_password: Master-realm admin password
+            directory_ttl_seconds: How long group and client lookups are cached
+            max_concurrency: Maximum concurrent Admin API calls in bulk operations
+            timeout: Timeout in seconds for each Admin API call
+        """
+        self.base_url = base_url.rstrip("/")
+        self.realm = realm
+        self.admin_user = admin_user
+        self.admin_password = admin_password
+        self.directory_ttl_seconds = directory_ttl_seconds
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._client: httpx.AsyncClient | None = None
+        self._token: str | None = None
+        self._token_refresh_at = 0.0
+        self._token_lock = asyncio.Lock()
+        self._groups: dict[str, dict[str, Any]] | None = None
+        self._groups_expire_at = 0.0
+        self._groups_lock = asyncio.Lock()
+        self._client_uuids: dict[str, tuple[str, float]] = {}
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    @classmethod
+    def from_settings(cls, settings) -> "KeycloakAdminClient":
+        return cls(
+            settings.keycloak_url,
+            settings.keycloak_realm,
+            settings.keycloak_admin,
+            settings.keycloak_admin_password,
+            directory_ttl_seconds=settings.keycloak_admin_cache_ttl_seconds,
+            max_concurrency=settings.keycloak_admin_max_concurrency,
+        )
 
-    data = {
-        "username": KEYCLOAK_ADMIN,
-        "password": KEYCLOAK_ADMIN_PASSWORD,
-        "grant_type": "password",
-        "client_id": "admin-cli",
-    }
+    @property
+    def admin_url(self) -> str:
+        return f"{self.base_url}/admin/realms/{self.realm}"
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def get_token(self) -> str:
+        """Return a valid admin token; concurrent callers share a single refresh."""
+        if self._token and time.monotonic() < self._token_refresh_at:
+            return self._token
+        async with self._token_lock:
+            if self._token and time.monotonic() < self._token_refresh_at:
+                return self._token
+            token, expires_in = await self._fetch_token()
+            margin = min(_TOKEN_REFRESH_MARGIN_SECONDS, expires_in / 5)
+            self._token = token
+            self._token_refresh_at = time.monotonic() + expires_in - margin
+            return token
+
+    def invalidate_token(self, token: str) -> None:
+        """Drop ``token`` unless it has already been replaced."""
+        if self._token == token:
+            self._token = None
+
+    async def _fetch_token(self) -> tuple[str, float]:
+        if not self.admin_password:
+            raise Exception("KEYCLOAK_ADMIN_PASSWORD environment variable not set")
+
+        token_url = f"{self.base_url}/realms/master/protocol/openid-connect/token"
+
+        data = {
+            "username": self.admin_user,
+            "password": self.admin_password,
+            "grant_type": "password",
+            "client_id": "admin-cli",
+        }
 
-    headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
 
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(token_url, data=data, headers=headers)
+        try:
+            response = await self.http.post(token_url, data=data, headers=headers)
             response.raise_for_status()
 
             token_data = response.json()
@@ -60,53 +153,117 @@ async def _get_keycloak_admin_token() -> str:
                 raise Exception("No access token in Keycloak response")
 
             logger.info("Successfully obtained Keycloak admin token")
-            return access_token
+            return access_token, float(token_data.get("expires_in") or 60)
+
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Failed to authenticate with Keycloak: HTTP {e.response.status_code}")
+            raise Exception(f"Keycloak authentication failed: HTTP {e.response.status_code}") from e
+        except Exception as e:
+            logger.error(f"Error getting Keycloak admin token: {e}")
+            raise Exception(f"Failed to authenticate with Keycloak: {e}") from e
+
+    async def request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """
+        Call the realm Admin API at ``path`` with the cached admin token.
+
+        A 401 (token revoked or expired early) refreshes the token and retries once.
+        """
+        token = await self.get_token()
+        response = await self.http.request(
+            method, f"{self.admin_url}{path}", headers={"Authorization": f"Bearer {token}"}, **kwargs
+        )
+        if response.status_code == 401:
+            self.invalidate_token(token)
+            token = await self.get_token()
+            response = await self.http.request(
+                method, f"{self.admin_url}{path}", headers={"Authorization": f"Bearer {token}"}, **kwargs
+            )
+        return response
+
+    async def get_groups(self, refresh: bool = False) -> dict[str, dict[str, Any]]:
+        """Return the realm's groups by name, from cache unless expired or ``refresh`` is set."""
+        if not refresh and self._groups is not None and time.monotonic() < self._groups_expire_at:
+            return self._groups
+        async with self._groups_lock:
+            if not refresh and self._groups is not None and time.monotonic() < self._groups_expire_at:
+                return self._groups
+            response = await self.request("GET", "/groups")
+            response.raise_for_status()
+            self._groups = {group.get("name"): group for group in response.json() if group.get("id")}
+            self._groups_expire_at = time.monotonic() + self.directory_ttl_seconds
+            return self._groups
+
+    async def find_group(self, group_name: str) -> dict[str, Any] | None:
+        """Look up a group by name; a cache miss re-reads the group list once."""
+        group = (await self.get_groups()).get(group_name)
+        if group is None:
+            group = (await self.get_groups(refresh=True)).get(group_name)
+        return group
+
+    def invalidate_groups(self) -> None:
+        self._groups = None
+
+    async def find_client_uuid(self, client_id: str) -> str | None:
+        """Look up a client UUID by clientId."""
+        cached = self._client_uuids.get(client_id)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+        response = await self.request("GET", "/clients", params={"clientId": client_id})
+        response.raise_for_status()
+        clients = response.json()
+        client_uuid = clients[0].get("id") if clients else None
+        if client_uuid:
+            self.remember_client(client_id, client_uuid)
+        return client_uuid
 
-    except httpx.HTTPStatusError as e:
-        logger.error(f"Failed to authenticate with Keycloak: HTTP {e.response.status_code}")
-        raise Exception(f"Keycloak authentication failed: HTTP {e.response.status_code}") from e
-    except Exception as e:
-        logger.error(f"Error getting Keycloak admin token: {e}")
-        raise Exception(f"Failed to authenticate with Keycloak: {e}") from e
+    def remember_client(self, client_id: str, client_uuid: str) -> None:
+        self._client_uuids[client_id] = (client_uuid, time.monotonic() + self.directory_ttl_seconds)
 
+    def forget_client(self, client_id: str) -> None:
+        self._client_uuids.pop(client_id, None)
 
-def _auth_headers(token: str, content_type: str | None = "application/json") -> dict[str, str]:
-    """Build auth headers for Keycloak admin API."""
-    headers = {"Authorization": f"Bearer {token}"}
-    if content_type:
-        headers["Content-Type"] = content_type
-    return headers
+    async def gather_bounded[T](self, operations: Iterable[Awaitable[T]]) -> list[T | BaseException]:
+        """Await ``operations`` with at most ``max_concurrency`` in flight; failures are returned, not raised."""
 
+        async def run(operation: Awaitable[T]) -> T:
+            async with self._semaphore:
+                return await operation
 
-async def _get_group_name_map(
-    client: httpx.AsyncClient,
-    token: str,
-) -> dict[str, str]:
-    """Return mapping of Keycloak group name to ID."""
-    groups_url = f"{KEYCLOAK_ADMIN_URL}/admin/realms/{KEYCLOAK_REALM}/groups"
-    response = await client.get(groups_url, headers=_auth_headers(token, None))
-    response.raise_for_status()
-    groups = response.json()
-    return {group.get("name"): group.get("id") for group in groups if group.get("id")}
+        return await asyncio.gather(*(run(operation) for operation in operations), return_exceptions=True)
 
 
-async def _find_client_uuid(
-    client: httpx.AsyncClient,
-    token: str,
-    client_id: str,
-) -> str | None:
-    """Look up a client UUID by clientId."""
-    clients_url = f"{KEYCLOAK_ADMIN_URL}/admin/realms/{KEYCLOAK_REALM}/clients"
-    response = await client.get(
-        clients_url,
-        headers=_auth_headers(token, None),
-        params={"clientId": client_id},
-    )
-    response.raise_for_status()
-    clients = response.json()
-    if clients:
-        return clients[0].get("id")
-    return None
+_admin_client: KeycloakAdminClient | None = None
+
+
+def get_keycloak_admin_client() -> KeycloakAdminClient:
+    """Return the process-wide Keycloak admin client."""
+    global _admin_client
+
+    if _admin_client is None:
+        _admin_client = KeycloakAdminClient.from_settings(settings)
+    return _admin_client
+
+
+async def close_keycloak_admin_client() -> None:
+    """Close the pooled connections of the process-wide admin client, if it was created."""
+    global _admin_client
+
+    client, _admin_client = _admin_client, None
+    if client is not None:
+        await client.aclose()
+
+
+async def _get_keycloak_admin_token() -> str:
+    """
+    Get admin access token from Keycloak for Admin API calls.
+
+    Returns:
+        Admin access token string
+
+    Raises:
+        Exception: If authentication fails
+    """
+    return await get_keycloak_admin_client().get_token()
 
 
 def _extract_resource_id(location_header: str | None) -> str | None:
@@ -116,6 +273,45 @@ def _extract_resource_id(location_header: str | None) -> str | None:
     return location_header.rstrip("/").split("/")[-1]
 
 
+async def _post_group(admin: KeycloakAdminClient, group_name: str, description: str) -> None:
+    """Create a group via the Admin API without resolving its details."""
+    # Prepare group data
+    group_data = {"name": group_name, "attributes": {"description": [description] if description else []}}
+
+    response = await admin.request("POST", "/groups", json=group_data)
+
+    if response.status_code == 201:
+        admin.invalidate_groups()
+        logger.info(f"Successfully created Keycloak group: {group_name}")
+
+    elif response.status_code == 409:
+        logger.warning(f"Group already exists in Keycloak: {group_name}")
+        raise Exception(f"Group '{group_name}' already exists in Keycloak")
+
+    else:
+        logger.error(f"Failed to create group: HTTP {response.status_code} - {response.text}")
+        raise Exception(f"Failed to create group in Keycloak: HTTP {response.status_code}")
+
+
+async def _delete_group_by_id(admin: KeycloakAdminClient, group_name: str, group_id: str) -> bool:
+    """Delete a group whose ID is already known."""
+    response = await admin.request("DELETE", f"/groups/{group_id}")
+
+    if response.status_code == 204:
+        admin.invalidate_groups()
+        logger.info(f"Successfully deleted Keycloak group: {group_name}")
+        return True
+
+    elif response.status_code == 404:
+        admin.invalidate_groups()
+        logger.warning(f"Group not found in Keycloak: {group_name}")
+        raise Exception(f"Group '{group_name}' not found in Keycloak")
+
+    else:
+        logger.error(f"Failed to delete group: HTTP {response.status_code} - {response.text}")
+        raise Exception(f"Failed to delete group from Keycloak: HTTP {response.status_code}")
+
+
 async def create_keycloak_group(group_name: str, description: str = "") -> dict[str, Any]:
     """
     Create a group in Keycloak.
@@ -133,37 +329,44 @@ async def create_keycloak_group(group_name: str, description: str = "") -> dict[
     logger.info(f"Creating Keycloak group: {group_name}")
 
     try:
-        # Get admin token
-        admin_token = await _get_keycloak_admin_token()
+        await _post_group(get_keycloak_admin_client(), group_name, description)
 
-        # Prepare group data
-        group_data = {"name": group_name, "attributes": {"description": [description] if description else []}}
+        # Get the created group's details
+        return await get_keycloak_group(group_name)
 
-        # Create group via Admin API
-        groups_url = f"{KEYCLOAK_ADMIN_URL}/admin/realms/{KEYCLOAK_REALM}/groups"
-        headers = {"Authorization": f"Bearer {admin_token}", "Content-Type": "application/json"}
+    except Exception as e:
+        logger.error(f"Error creating Keycloak group '{group_name}': {e}")
+        raise
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(groups_url, json=group_data, headers=headers)
 
-            if response.status_code == 201:
-                logger.info(f"Successfully created Keycloak group: {group_name}")
+async def create_keycloak_groups(groups: dict[str, str]) -> dict[str, dict[str, Any] | Exception]:
+    """
+    Create several groups in Keycloak with bounded concurrency.
 
-                # Get the created group's details
-                group_info = await get_keycloak_group(group_name)
-                return group_info
+    Args:
+        groups: Mapping of group name to description
 
-            elif response.status_code == 409:
-                logger.warning(f"Group already exists in Keycloak: {group_name}")
-                raise Exception(f"Group '{group_name}' already exists in Keycloak")
+    Returns:
+        Dict mapping each group name to the created group's information, or to the
+        exception that prevented its creation
+    """
+    logger.info(f"Creating {len(groups)} Keycloak groups")
+    admin = get_keycloak_admin_client()
 
-            else:
-                logger.error(f"Failed to create group: HTTP {response.status_code} - {response.text}")
-                raise Exception(f"Failed to create group in Keycloak: HTTP {response.status_code}")
+    outcomes = await admin.gather_bounded(_post_group(admin, name, description) for name, description in groups.items())
 
-    except Exception as e:
-        logger.error(f"Error creating Keycloak group '{group_name}': {e}")
-        raise
+    results: dict[str, dict[str, Any] | Exception] = {}
+    created = [name for name, outcome in zip(groups, outcomes, strict=True) if not isinstance(outcome, BaseException)]
+    # One group listing resolves every created group instead of one listing per group.
+    by_name = await admin.get_groups(refresh=True) if created else {}
+    for name, outcome in zip(groups, outcomes, strict=True):
+        if isinstance(outcome, Exception):
+            results[name] = outcome
+        elif name in by_name:
+            results[name] = by_name[name]
+        else:
+            results[name] = Exception(f"Group '{name}' not found in Keycloak")
+    return results
 
 
 async def delete_keycloak_group(group_name: str) -> bool:
@@ -182,9 +385,6 @@ async def delete_keycloak_group(group_name: str) -> bool:
     logger.info(f"Deleting Keycloak group: {group_name}")
 
     try:
-        # Get admin token
-        admin_token = await _get_keycloak_admin_token()
-
         # First, get the group ID
         group_info = await get_keycloak_group(group_name)
         group_id = group_info.get("id")
@@ -192,28 +392,40 @@ async def delete_keycloak_group(group_name: str) -> bool:
         if not group_id:
             raise Exception(f"Group '{group_name}' not found in Keycloak")
 
-        # Delete group via Admin API
-        delete_url = f"{KEYCLOAK_ADMIN_URL}/admin/realms/{KEYCLOAK_REALM}/groups/{group_id}"
-        headers = {"Authorization": f"Bearer {admin_token}"}
+        return await _delete_group_by_id(get_keycloak_admin_client(), group_name, group_id)
+
+    except Exception as e:
+        logger.error(f"Error deleting Keycloak group '{group_name}': {e}")
+        raise
+
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.delete(delete_url, headers=headers)
+async def delete_keycloak_groups(group_names: list[str]) -> dict[str, bool | Exception]:
+    """
+    Delete several groups from Keycloak with bounded concurrency.
 
-            if response.status_code == 204:
-                logger.info(f"Successfully deleted Keycloak group: {group_name}")
-                return True
+    Args:
+        group_names: Names of the groups to delete
 
-            elif response.status_code == 404:
-                logger.warning(f"Group not found in Keycloak: {group_name}")
-                raise Exception(f"Group '{group_name}' not found in Keycloak")
+    Returns:
+        Dict mapping each group name to True, or to the exception that prevented its deletion
+    """
+    logger.info(f"Deleting {len(group_names)} Keycloak groups")
+    admin = get_keycloak_admin_client()
 
-            else:
-                logger.error(f"Failed to delete group: HTTP {response.status_code} - {response.text}")
-                raise Exception(f"Failed to delete group from Keycloak: HTTP {response.status_code}")
+    by_name = await admin.get_groups(refresh=True)
+    results: dict[str, bool | Exception] = {}
+    to_delete = []
+    for name in group_names:
+        group_id = (by_name.get(name) or {}).get("id")
+        if group_id:
+            to_delete.append((name, group_id))
+        else:
+            results[name] = Exception(f"Group '{name}' not found in Keycloak")
 
-    except Exception as e:
-        logger.error(f"Error deleting Keycloak group '{group_name}': {e}")
-        raise
+    outcomes = await admin.gather_bounded(_delete_group_by_id(admin, name, group_id) for name, group_id in to_delete)
+    for (name, _), outcome in zip(to_delete, outcomes, strict=True):
+        results[name] = outcome if isinstance(outcome, Exception) else True
+    return {name: results[name] for name in group_names}
 
 
 async def get_keycloak_group(group_name: str) -> dict[str, Any]:
@@ -232,27 +444,13 @@ async def get_keycloak_group(group_name: str) -> dict[str, Any]:
     logger.info(f"Getting Keycloak group: {group_name}")
 
     try:
-        # Get admin token
-        admin_token = await _get_keycloak_admin_token()
+        group = await get_keycloak_admin_client().find_group(group_name)
+        if group is not None:
+            logger.info(f"Found group: {group_name} with ID: {group.get('id')}")
+            return group
 
-        # List all groups and find the one with matching name
-        groups_url = f"{KEYCLOAK_ADMIN_URL}/admin/realms/{KEYCLOAK_REALM}/groups"
-        headers = {"Authorization": f"Bearer {admin_token}"}
-
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(groups_url, headers=headers)
-            response.raise_for_status()
-
-            groups = response.json()
-
-            # Find group by name
-            for group in groups:
-                if group.get("name") == group_name:
-                    logger.info(f"Found group: {group_name} with ID: {group.get('id')}")
-                    return group
-
-            # Group not found
-            raise Exception(f"Group '{group_name}' not found in Keycloak")
+        # Group not found
+        raise Exception(f"Group '{group_name}' not found in Keycloak")
 
     except httpx.HTTPStatusError as e:
         logger.error(f"HTTP error getting group: {e.response.status_code}")
@@ -266,6 +464,8 @@ async def list_keycloak_groups() -> list[dict[str, Any]]:
     """
     List all groups in Keycloak realm.
 
+    Always reads the current list (and refreshes the group cache with it).
+
     Returns:
         List of dicts containing group information
 
@@ -275,21 +475,9 @@ async def list_keycloak_groups() -> list[dict[str, Any]]:
     logger.info("Listing all Keycloak groups")
 
     try:
-        # Get admin token
-        admin_token = await _get_keycloak_admin_token()
-
-        # List all groups
-        groups_url = f"{KEYCLOAK_ADMIN_URL}/admin/realms/{KEYCLOAK_REALM}/groups"
-        headers = {"Authorization": f"Bearer {admin_token}"}
-
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(groups_url, headers=headers)
-            response.raise_for_status()
-
-            groups = response.json()
-            logger.info(f"Retrieved {len(groups)} groups from Keycloak")
-
-            return groups
+        groups = list((await get_keycloak_admin_client().get_groups(refresh=True)).values())
+        logger.info(f"Retrieved {len(groups)} groups from Keycloak")
+        return groups
 
     except httpx.HTTPStatusError as e:
         logger.error(f"HTTP error listing groups: {e.response.status_code}")
@@ -325,8 +513,7 @@ def _normalize_group_list(groups: list[str]) -> list[str]:
 
 
 async def _assign_user_to_groups_by_name(
-    client: httpx.AsyncClient,
-    token: str,
+    admin: KeycloakAdminClient,
     user_id: str,
     groups: list[str],
 ) -> None:
@@ -334,44 +521,37 @@ async def _assign_user_to_groups_by_name(
     if not groups:
         return
 
-    name_map = await _get_group_name_map(client, token)
+    group_ids = {}
     for group_name in groups:
-        group_id = name_map.get(group_name)
-        if not group_id:
+        group = await admin.find_group(group_name)
+        if not group or not group.get("id"):
             raise KeycloakAdminError(f"Group '{group_name}' not found in Keycloak")
+        group_ids[group_name] = group["id"]
 
-        assign_url = f"{KEYCLOAK_ADMIN_URL}/admin/realms/{KEYCLOAK_REALM}/users/{user_id}/groups/{group_id}"
-        response = await client.put(assign_url, headers=_auth_headers(token, None))
+    for group_name, group_id in group_ids.items():
+        response = await admin.request("PUT", f"/users/{user_id}/groups/{group_id}")
         if response.status_code not in (204, 409):
             logger.error("Failed assigning user %s to group %s: %s", user_id, group_name, response.text)
             raise KeycloakAdminError(f"Failed to assign group '{group_name}' (HTTP {response.status_code})")
 
 
 async def _get_user_groups(
-    client: httpx.AsyncClient,
-    token: str,
+    admin: KeycloakAdminClient,
     user_id: str,
 ) -> list[str]:
     """Fetch group names for a given Keycloak user."""
-    groups_url = f"{KEYCLOAK_ADMIN_URL}/admin/realms/{KEYCLOAK_REALM}/users/{user_id}/groups"
-    response = await client.get(groups_url, headers=_auth_headers(token, None))
+    response = await admin.request("GET", f"/users/{user_id}/groups")
     response.raise_for_status()
     groups = response.json()
     return [group.get("name") for group in groups if group.get("name")]
 
 
 async def _get_user_by_username(
-    client: httpx.AsyncClient,
-    token: str,
+    admin: KeycloakAdminClient,
     username: str,
 ) -> dict[str, Any] | None:
     """Look up a user in Keycloak by username."""
-    users_url = f"{KEYCLOAK_ADMIN_URL}/admin/realms/{KEYCLOAK_REALM}/users"
-    response = await client.get(
-        users_url,
-        headers=_auth_headers(token, None),
-        params={"username": username},
-    )
+    response = await admin.request("GET", "/users", params={"username": username})
     response.raise_for_status()
     matches = response.json()
     for user in matches:
@@ -381,25 +561,22 @@ async def _get_user_by_username(
 
 
 async def _get_user_by_id(
-    client: httpx.AsyncClient,
-    token: str,
+    admin: KeycloakAdminClient,
     user_id: str,
 ) -> dict[str, Any]:
     """Fetch a user document by ID."""
-    user_url = f"{KEYCLOAK_ADMIN_URL}/admin/realms/{KEYCLOAK_REALM}/users/{user_id}"
-    response = await client.get(user_url, headers=_auth_headers(token, None))
+    response = await admin.request("GET", f"/users/{user_id}")
     response.raise_for_status()
     return response.json()
 
 
 async def _ensure_client(
-    client: httpx.AsyncClient,
-    token: str,
+    admin: KeycloakAdminClient,
     client_id: str,
     description: str | None,
 ) -> str:
     """Create the client if it does not yet exist and return UUID."""
-    existing_uuid = await _find_client_uuid(client, token, client_id)
+    existing_uuid = await admin.find_client_uuid(client_id)
     if existing_uuid:
         return existing_uuid
 
@@ -417,30 +594,29 @@ async def _ensure_client(
         "protocol": "openid-connect",
     }
 
-    clients_url = f"{KEYCLOAK_ADMIN_URL}/admin/realms/{KEYCLOAK_REALM}/clients"
-    response = await client.post(clients_url, headers=_auth_headers(token), json=payload)
+    response = await admin.request("POST", "/clients", json=payload)
     if response.status_code not in (201, 204):
         logger.error("Failed to create client %s: %s", client_id, response.text)
         raise KeycloakAdminError(f"Failed to create service account client '{client_id}' (HTTP {response.status_code})")
 
     created_id = _extract_resource_id(response.headers.get("Location"))
     if created_id:
+        admin.remember_client(client_id, created_id)
         return created_id
 
-    client_uuid = await _find_client_uuid(client, token, client_id)
+    client_uuid = await admin.find_client_uuid(client_id)
     if not client_uuid:
         raise KeycloakAdminError(f"Unable to resolve client ID for '{client_id}' after creation")
     return client_uuid
 
 
 async def _ensure_groups_mapper(
-    client: httpx.AsyncClient,
-    token: str,
+    admin: KeycloakAdminClient,
     client_uuid: str,
 ) -> None:
     """Ensure the standard groups protocol mapper exists for the client."""
-    mapper_url = f"{KEYCLOAK_ADMIN_URL}/admin/realms/{KEYCLOAK_REALM}/clients/{client_uuid}/protocol-mappers/models"
-    response = await client.get(mapper_url, headers=_auth_headers(token, None))
+    mapper_path = f"/clients/{client_uuid}/protocol-mappers/models"
+    response = await admin.request("GET", mapper_path)
     response.raise_for_status()
 
     mappers = response.json()
@@ -461,7 +637,7 @@ async def _ensure_groups_mapper(
         },
     }
 
-    create_response = await client.post(mapper_url, headers=_auth_headers(token), json=mapper_payload)
+    create_response = await admin.request("POST", mapper_path, json=mapper_payload)
     if create_response.status_code not in (201, 409):
         logger.error(
             "Failed to create groups mapper for client %s: %s",
@@ -472,13 +648,11 @@ async def _ensure_groups_mapper(
 
 
 async def _get_service_account_user_id(
-    client: httpx.AsyncClient,
-    token: str,
+    admin: KeycloakAdminClient,
     client_uuid: str,
 ) -> str:
     """Return the user ID of the service account backing a client."""
-    sa_url = f"{KEYCLOAK_ADMIN_URL}/admin/realms/{KEYCLOAK_REALM}/clients/{client_uuid}/service-account-user"
-    response = await client.get(sa_url, headers=_auth_headers(token, None))
+    response = await admin.request("GET", f"/clients/{client_uuid}/service-account-user")
     response.raise_for_status()
     data = response.json()
     user_id = data.get("id")
@@ -488,13 +662,11 @@ async def _get_service_account_user_id(
 
 
 async def _get_client_secret_value(
-    client: httpx.AsyncClient,
-    token: str,
+    admin: KeycloakAdminClient,
     client_uuid: str,
 ) -> str:
     """Fetch the client secret value for the specified client."""
-    secret_url = f"{KEYCLOAK_ADMIN_URL}/admin/realms/{KEYCLOAK_REALM}/clients/{client_uuid}/client-secret"
-    response = await client.get(secret_url, headers=_auth_headers(token, None))
+    response = await admin.request("GET", f"/clients/{client_uuid}/client-secret")
     response.raise_for_status()
     data = response.json()
     secret_value = data.get("value")
@@ -504,20 +676,18 @@ async def _get_client_secret_value(
 
 
 async def _set_initial_password(
-    client: httpx.AsyncClient,
-    token: str,
+    admin: KeycloakAdminClient,
     user_id: str,
     password: str,
     temporary: bool = False,
 ) -> None:
     """Set the initial password for a created user."""
-    password_url = f"{KEYCLOAK_ADMIN_URL}/admin/realms/{KEYCLOAK_REALM}/users/{user_id}/reset-password"
     payload = {
         "type": "password",
         "value": password,
         "temporary": temporary,
     }
-    response = await client.put(password_url, headers=_auth_headers(token), json=payload)
+    response = await admin.request("PUT", f"/users/{user_id}/reset-password", json=payload)
     if response.status_code != 204:
         logger.error("Failed to set initial password for user %s: %s", user_id, response.text)
         raise KeycloakAdminError(f"Failed to set password (HTTP {response.status_code})")
@@ -535,14 +705,13 @@ async def create_service_account_client(
         Dict with client_id, client_uuid, service_account_user_id, client_secret, and groups.
     """
     normalized_groups = _normalize_group_list(group_names)
-    admin_token = await _get_keycloak_admin_token()
+    admin = get_keycloak_admin_client()
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        client_uuid = await _ensure_client(client, admin_token, client_id, description)
-        await _ensure_groups_mapper(client, admin_token, client_uuid)
-        service_account_user_id = await _get_service_account_user_id(client, admin_token, client_uuid)
-        await _assign_user_to_groups_by_name(client, admin_token, service_account_user_id, normalized_groups)
-        client_secret = await _get_client_secret_value(client, admin_token, client_uuid)
+    client_uuid = await _ensure_client(admin, client_id, description)
+    await _ensure_groups_mapper(admin, client_uuid)
+    service_account_user_id = await _get_service_account_user_id(admin, client_uuid)
+    await _assign_user_to_groups_by_name(admin, service_account_user_id, normalized_groups)
+    client_secret = await _get_client_secret_value(admin, client_uuid)
 
     logger.info("Configured service account client '%s' with groups: %s", client_id, normalized_groups)
     return {
@@ -566,41 +735,39 @@ async def create_human_user_account(
     Create a human Keycloak user and assign groups.
     """
     normalized_groups = _normalize_group_list(groups)
-    admin_token = await _get_keycloak_admin_token()
-
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        existing = await _get_user_by_username(client, admin_token, username)
-        if existing:
-            raise KeycloakAdminError(f"User '{username}' already exists")
-
-        user_payload = {
-            "username": username,
-            "email": email,
-            "firstName": first_name,
-            "lastName": last_name,
-            "enabled": True,
-            "emailVerified": False,
-        }
+    admin = get_keycloak_admin_client()
 
-        users_url = f"{KEYCLOAK_ADMIN_URL}/admin/realms/{KEYCLOAK_REALM}/users"
-        response = await client.post(users_url, headers=_auth_headers(admin_token), json=user_payload)
-        if response.status_code not in (201, 204):
-            logger.error("Failed to create user %s: %s", username, response.text)
-            raise KeycloakAdminError(f"Failed to create user '{username}' (HTTP {response.status_code})")
+    existing = await _get_user_by_username(admin, username)
+    if existing:
+        raise KeycloakAdminError(f"User '{username}' already exists")
 
-        created_id = _extract_resource_id(response.headers.get("Location"))
-        if not created_id:
-            new_user = await _get_user_by_username(client, admin_token, username)
-            if not new_user:
-                raise KeycloakAdminError(f"Unable to resolve new user ID for '{username}'")
-            created_id = new_user.get("id")
+    user_payload = {
+        "username": username,
+        "email": email,
+        "firstName": first_name,
+        "lastName": last_name,
+        "enabled": True,
+        "emailVerified": False,
+    }
+
+    response = await admin.request("POST", "/users", json=user_payload)
+    if response.status_code not in (201, 204):
+        logger.error("Failed to create user %s: %s", username, response.text)
+        raise KeycloakAdminError(f"Failed to create user '{username}' (HTTP {response.status_code})")
 
-        if password:
-            await _set_initial_password(client, admin_token, created_id, password)
+    created_id = _extract_resource_id(response.headers.get("Location"))
+    if not created_id:
+        new_user = await _get_user_by_username(admin, username)
+        if not new_user:
+            raise KeycloakAdminError(f"Unable to resolve new user ID for '{username}'")
+        created_id = new_user.get("id")
 
-        await _assign_user_to_groups_by_name(client, admin_token, created_id, normalized_groups)
-        user_doc = await _get_user_by_id(client, admin_token, created_id)
-        user_doc["groups"] = normalized_groups
+    if password:
+        await _set_initial_password(admin, created_id, password)
+
+    await _assign_user_to_groups_by_name(admin, created_id, normalized_groups)
+    user_doc = await _get_user_by_id(admin, created_id)
+    user_doc["groups"] = normalized_groups
 
     logger.info("Created Keycloak user '%s' with groups: %s", username, normalized_groups)
     return user_doc
@@ -614,36 +781,66 @@ async def delete_keycloak_user(username: str) -> bool:
     - Human users: deleted via the users endpoint
     - M2M service accounts: deleted via the clients endpoint (they are Keycloak clients)
     """
-    admin_token = await _get_keycloak_admin_token()
-
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        # Try to find as a regular user first
-        user = await _get_user_by_username(client, admin_token, username)
-        if user:
-            # It's a human user - delete via users endpoint
-            user_id = user.get("id")
-            delete_url = f"{KEYCLOAK_ADMIN_URL}/admin/realms/{KEYCLOAK_REALM}/users/{user_id}"
-            response = await client.delete(delete_url, headers=_auth_headers(admin_token, None))
-            if response.status_code != 204:
-                logger.error("Failed to delete user %s: %s", username, response.text)
-                raise KeycloakAdminError(f"Failed to delete user '{username}' (HTTP {response.status_code})")
-            logger.info("Deleted Keycloak user '%s'", username)
-            return True
-
-        # Not found as user - try to find as a client (M2M service account)
-        client_uuid = await _find_client_uuid(client, admin_token, username)
-        if client_uuid:
-            # It's an M2M service account - delete via clients endpoint
-            delete_url = f"{KEYCLOAK_ADMIN_URL}/admin/realms/{KEYCLOAK_REALM}/clients/{client_uuid}"
-            response = await client.delete(delete_url, headers=_auth_headers(admin_token, None))
-            if response.status_code != 204:
-                logger.error("Failed to delete M2M client %s: %s", username, response.text)
-                raise KeycloakAdminError(f"Failed to delete M2M client '{username}' (HTTP {response.status_code})")
-            logger.info("Deleted Keycloak M2M service account (client) '%s'", username)
-            return True
+    admin = get_keycloak_admin_client()
+
+    # Try to find as a regular user first
+    user = await _get_user_by_username(admin, username)
+    if user:
+        # It's a human user - delete via users endpoint
+        user_id = user.get("id")
+        response = await admin.request("DELETE", f"/users/{user_id}")
+        if response.status_code != 204:
+            logger.error("Failed to delete user %s: %s", username, response.text)
+            raise KeycloakAdminError(f"Failed to delete user '{username}' (HTTP {response.status_code})")
+        logger.info("Deleted Keycloak user '%s'", username)
+        return True
 
-        # Not found as either user or client
-        raise KeycloakAdminError(f"User or M2M account '{username}' not found")
+    # Not found as user - try to find as a client (M2M service account)
+    client_uuid = await admin.find_client_uuid(username)
+    if client_uuid:
+        # It's an M2M service account - delete via clients endpoint
+        response = await admin.request("DELETE", f"/clients/{client_uuid}")
+        admin.forget_client(username)
+        if response.status_code != 204:
+            logger.error("Failed to delete M2M client %s: %s", username, response.text)
+            raise KeycloakAdminError(f"Failed to delete M2M client '{username}' (HTTP {response.status_code})")
+        logger.info("Deleted Keycloak M2M service account (client) '%s'", username)
+        return True
+
+    # Not found as either user or client
+    raise KeycloakAdminError(f"User or M2M account '{username}' not found")
+
+
+async def _service_account_entry(
+    admin: KeycloakAdminClient,
+    keycloak_client: dict[str, Any],
+    include_groups: bool,
+) -> dict[str, Any]:
+    """Format an M2M service account client as a user entry."""
+    client_id = keycloak_client.get("clientId", "")
+
+    # Get the service account user to retrieve groups
+    groups = []
+    if include_groups:
+        try:
+            sa_response = await admin.request("GET", f"/clients/{keycloak_client['id']}/service-account-user")
+            if sa_response.status_code == 200:
+                service_account_user_id = sa_response.json().get("id")
+                if service_account_user_id:
+                    groups = await _get_user_groups(admin, service_account_user_id)
+        except Exception as e:
+            logger.warning("Failed to get groups for M2M account %s: %s", client_id, e)
+
+    return {
+        "id": keycloak_client.get("id", ""),
+        "username": client_id,
+        "enabled": keycloak_client.get("enabled", True),
+        "serviceAccountsEnabled": True,  # Mark as M2M account
+        "firstName": "M2M",
+        "lastName": "Service Account",
+        "email": f"{client_id}@service-account.local",
+        "groups": groups,
+    }
 
 
 async def list_keycloak_users(
@@ -659,76 +856,55 @@ async def list_keycloak_users(
     - M2M service accounts (service account clients)
 
     M2M accounts are returned with their clientId as the username and are marked
-    with serviceAccountsEnabled=True for identification.
+    with serviceAccountsEnabled=True for identification. Per-user group lookups
+    run concurrently, bounded by the admin client's concurrency limit.
     """
-    admin_token = await _get_keycloak_admin_token()
-
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        # Fetch human users
-        params: dict[str, Any] = {"max": max_results}
-        if search:
-            params["search"] = search
-        users_url = f"{KEYCLOAK_ADMIN_URL}/admin/realms/{KEYCLOAK_REALM}/users"
-        response = await client.get(users_url, headers=_auth_headers(admin_token, None), params=params)
-        response.raise_for_status()
-        users = response.json()
+    admin = get_keycloak_admin_client()
 
-        # Fetch M2M service account clients
-        clients_url = f"{KEYCLOAK_ADMIN_URL}/admin/realms/{KEYCLOAK_REALM}/clients"
-        response = await client.get(clients_url, headers=_auth_headers(admin_token, None))
-        response.raise_for_status()
-        all_clients = response.json()
-
-        # Filter to only service account clients and convert to user-like format
-        service_accounts = []
-        for keycloak_client in all_clients:
-            if not keycloak_client.get("serviceAccountsEnabled"):
-                continue
-
-            client_id = keycloak_client.get("clientId", "")
-            # Apply search filter if specified
-            if search and search.lower() not in client_id.lower():
-                continue
-
-            # Get the service account user to retrieve groups
-            service_account_user_id = None
-            groups = []
-            if include_groups:
-                try:
-                    sa_url = f"{KEYCLOAK_ADMIN_URL}/admin/realms/{KEYCLOAK_REALM}/clients/{keycloak_client['id']}/service-account-user"
-                    sa_response = await client.get(sa_url, headers=_auth_headers(admin_token, None))
-                    if sa_response.status_code == 200:
-                        sa_user = sa_response.json()
-                        service_account_user_id = sa_user.get("id")
-                        if service_account_user_id:
-                            groups = await _get_user_groups(client, admin_token, service_account_user_id)
-                except Exception as e:
-                    logger.warning("Failed to get groups for M2M account %s: %s", client_id, e)
-
-            # Format M2M account as a user entry
-            service_account_entry = {
-                "id": keycloak_client.get("id", ""),
-                "username": client_id,
-                "enabled": keycloak_client.get("enabled", True),
-                "serviceAccountsEnabled": True,  # Mark as M2M account
-                "firstName": "M2M",
-                "lastName": "Service Account",
-                "email": f"{client_id}@service-account.local",
-                "groups": groups,
-            }
-            service_accounts.append(service_account_entry)
-
-        # Add groups to human users if requested
-        if include_groups:
-            for user in users:
-                user_id = user.get("id")
-                if not user_id:
-                    user["groups"] = []
-                    continue
-                user["groups"] = await _get_user_groups(client, admin_token, user_id)
-
-        # Combine human users and M2M service accounts
-        all_users = users + service_accounts
-
-        # Apply max_results limit to combined list
-        return all_users[:max_results]
+    # Fetch human users
+    params: dict[str, Any] = {"max": max_results}
+    if search:
+        params["search"] = search
+    response = await admin.request("GET", "/users", params=params)
+    response.raise_for_status()
+    users = response.json()
+
+    # Fetch M2M service account clients
+    response = await admin.request("GET", "/clients")
+    response.raise_for_status()
+    all_clients = response.json()
+
+    # Filter to only service account clients; apply search filter if specified
+    service_account_clients = [
+        keycloak_client
+        for keycloak_client in all_clients
+        if keycloak_client.get("serviceAccountsEnabled")
+        and not (search and search.lower() not in keycloak_client.get("clientId", "").lower())
+    ]
+    for keycloak_client in service_account_clients:
+        if keycloak_client.get("clientId") and keycloak_client.get("id"):
+            admin.remember_client(keycloak_client["clientId"], keycloak_client["id"])
+
+    service_accounts = await admin.gather_bounded(
+        _service_account_entry(admin, keycloak_client, include_groups) for keycloak_client in service_account_clients
+    )
+    for entry in service_accounts:
+        if isinstance(entry, BaseException):
+            raise entry
+
+    # Add groups to human users if requested
+    if include_groups:
+        user_ids = [user.get("id") for user in users]
+        user_groups = await admin.gather_bounded(_get_user_groups(admin, user_id) for user_id in user_ids if user_id)
+        found = iter(user_groups)
+        for user, user_id in zip(users, user_ids, strict=True):
+            groups = next(found) if user_id else []
+            if isinstance(groups, BaseException):
+                raise groups
+            user["groups"] = groups
+
+    # Combine human users and M2M service accounts
+    all_users = users + service_accounts
+
+    # Apply max_results limit to combined list
+    return all_users[:max_results]
@@ -251,3 +251,89 @@ def record_tool_discovery(
 
     if duration_seconds is not None:
         metrics.record_histogram("mcp_tool_discovery_duration_seconds", duration_seconds, attributes)
+
+
+def record_http_client_request(origin: str, reused: bool) -> None:
+    """
+    Record an outbound HTTP request sent through the shared connection pools.
+
+    Requires this metric in config:
+    - counter: http_client_requests_total
+
+    Args:
+        origin: Downstream origin (scheme://host:port)
+        reused: Whether the request was served on an existing keep-alive connection
+    """
+    attributes = {
+        "origin": origin,
+        "connection": "reused" if reused else "new",
+    }
+
+    metrics.record_counter("http_client_requests_total", 1, attributes)
+
+
+def record_mcp_gateway_session(server_name: str, outcome: str) -> None:
+    """
+    Record a downstream MCP session pool event in the gateway.
+
+    Requires this metric in config:
+    - counter: mcp_gateway_session_events_total
+
+    Args:
+        server_name: Downstream MCP server name
+        outcome: "warm", "shared" or "joined" (handshake avoided), "handshake", "failed", or "expired"
+    """
+    attributes = {
+        "server_name": server_name,
+        "outcome": outcome,
+    }
+
+    metrics.record_counter("mcp_gateway_session_events_total", 1, attributes)
+
+
+def record_elicitation_notification(outcome: str, route: str) -> None:
+    """
+    Record an elicitation/complete notification sent after an OAuth callback.
+
+    Requires this metric in config:
+    - counter: mcp_elicitation_notifications_total
+
+    Args:
+        outcome: "delivered", "forwarded" (published to the owning replica) or "dropped"
+        route: "local" when this replica holds the MCP session, "remote" when it went through pub/sub
+    """
+    attributes = {
+        "outcome": outcome,
+        "route": route,
+    }
+
+    metrics.record_counter("mcp_elicitation_notifications_total", 1, attributes)
+
+
+def record_websocket_send(lag_seconds: float, queue_depth: int) -> None:
+    """
+    Record a health update delivered to one dashboard WebSocket client.
+
+    Requires these metrics in config:
+    - histogram: websocket_send_lag_seconds
+    - histogram: websocket_queue_depth
+
+    Args:
+        lag_seconds: Time from queueing the update to the send completing
+        queue_depth: Updates still queued for this client after this one
+    """
+    metrics.record_histogram("websocket_send_lag_seconds", lag_seconds)
+    metrics.record_histogram("websocket_queue_depth", queue_depth)
+
+
+def record_websocket_backpressure(dropped: int) -> None:
+    """
+    Record a slow WebSocket client whose backlog was coalesced into one catch-up delta.
+
+    Requires this metric in config:
+    - counter: websocket_messages_dropped_total
+
+    Args:
+        dropped: Number of queued updates dropped
+    """
+    metrics.record_counter("websocket_messages_dropped_total", dropped)
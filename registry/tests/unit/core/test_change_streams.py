@@ -0,0 +1,219 @@
+"""
+Unit tests for the MongoDB change stream subscriber.
+"""
+
+import asyncio
+
+import pytest
+from pymongo.errors import OperationFailure
+
+from registry.core import change_streams
+from registry.core.change_streams import ChangeEvent, ChangeStreamSubscriber
+
+
+class _FakeStream:
+    def __init__(self, changes):
+        self._changes = list(changes)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._changes:
+            return self._changes.pop(0)
+        await asyncio.Event().wait()  # an idle stream blocks until cancelled
+
+
+class _FakeCursor:
+    def __init__(self, documents):
+        self._documents = list(documents)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._documents:
+            raise StopAsyncIteration
+        return self._documents.pop(0)
+
+
+class _FakeCollection:
+    def __init__(self, documents=None, changes=None, watch_error=None):
+        self.documents = {doc["_id"]: doc for doc in documents or []}
+        self.changes = changes or []
+        self.watch_error = watch_error
+        self.watch_calls = []
+
+    async def watch(self, **kwargs):
+        self.watch_calls.append(kwargs)
+        if self.watch_error is not None:
+            raise self.watch_error
+        return _FakeStream(self.changes)
+
+    def find(self, query):
+        return _FakeCursor([dict(doc) for doc in self.documents.values()])
+
+
+class _FakeTokenCollection:
+    def __init__(self):
+        self.tokens = {}
+
+    async def find_one(self, query):
+        token = self.tokens.get(query["_id"])
+        return {"_id": query["_id"], "token": token} if token is not None else None
+
+    async def update_one(self, query, update, upsert=False):
+        self.tokens[query["_id"]] = update["$set"]["token"]
+
+    async def delete_one(self, query):
+        self.tokens.pop(query["_id"], None)
+
+
+async def _wait_for(predicate, timeout=1.0):
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(0.005)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+def _subscriber(collections, mode="auto", tokens=None):
+    return ChangeStreamSubscriber(
+        lambda: collections,
+        mode=mode,
+        poll_interval_seconds=0.01,
+        token_collection=(lambda: tokens) if tokens is not None else None,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.core
+class TestChangeStreamSubscriber:
+    """Test suite for ChangeStreamSubscriber."""
+
+    def test_invalid_mode_is_rejected(self):
+        with pytest.raises(ValueError, match="Invalid change stream mode"):
+            ChangeStreamSubscriber(dict, mode="sometimes")
+
+    async def test_off_mode_starts_nothing(self):
+        collection = _FakeCollection()
+        subscriber = _subscriber({"mcpservers": collection}, mode="off")
+        subscriber.subscribe("mcpservers", lambda event: asyncio.sleep(0))
+
+        await subscriber.start()
+
+        assert collection.watch_calls == []
+        assert subscriber.get_stats()["collections"] == {}
+
+    async def test_change_stream_events_are_dispatched_and_token_persisted(self):
+        changes = [
+            {
+                "_id": {"_data": "t1"},
+                "operationType": "update",
+                "documentKey": {"_id": "s1"},
+                "fullDocument": {"_id": "s1", "path": "/github"},
+                "updateDescription": {"updatedFields": {"config.enabled": False}, "removedFields": []},
+            },
+            {"_id": {"_data": "t2"}, "operationType": "delete", "documentKey": {"_id": "s2"}},
+        ]
+        tokens = _FakeTokenCollection()
+        subscriber = _subscriber({"mcpservers": _FakeCollection(changes=changes)}, tokens=tokens)
+        events: list[ChangeEvent] = []
+
+        async def consumer(event):
+            events.append(event)
+
+        subscriber.subscribe("mcpservers", consumer)
+        await subscriber.start()
+        await _wait_for(lambda: len(events) == 2)
+        await subscriber.stop()
+
+        assert events[0].operation == "update"
+        assert events[0].updated_fields == {"config"}
+        assert events[0].touches("config") and not events[0].touches("tags")
+        assert events[1].is_delete and events[1].document_id == "s2"
+        assert tokens.tokens == {"registry:mcpservers": {"_data": "t2"}}
+
+    async def test_watch_resumes_after_persisted_token(self):
+        tokens = _FakeTokenCollection()
+        tokens.tokens["registry:mcpservers"] = {"_data": "t9"}
+        collection = _FakeCollection()
+        subscriber = _subscriber({"mcpservers": collection}, tokens=tokens)
+        subscriber.subscribe("mcpservers", lambda event: asyncio.sleep(0))
+
+        await subscriber.start()
+        await _wait_for(lambda: collection.watch_calls)
+        await subscriber.stop()
+
+        assert collection.watch_calls[0]["resume_after"] == {"_data": "t9"}
+
+    async def test_standalone_server_falls_back_to_polling(self):
+        collection = _FakeCollection(
+            documents=[{"_id": "s1", "path": "/a"}, {"_id": "s2", "path": "/b"}],
+            watch_error=OperationFailure("The $changeStream stage is only supported on replica sets", code=40573),
+        )
+        subscriber = _subscriber({"mcpservers": collection})
+        events: list[ChangeEvent] = []
+
+        async def consumer(event):
+            events.append(event)
+
+        subscriber.subscribe("mcpservers", consumer)
+        await subscriber.start()
+        await _wait_for(lambda: subscriber.get_stats()["collections"].get("mcpservers") == "polling")
+        await asyncio.sleep(0.02)  # initial scan is the baseline; no events for existing documents
+
+        collection.documents["s1"] = {"_id": "s1", "path": "/a-renamed"}
+        collection.documents.pop("s2")
+        collection.documents["s3"] = {"_id": "s3", "path": "/c"}
+        await _wait_for(lambda: len(events) == 3)
+        await subscriber.stop()
+
+        assert {(event.operation, event.document_id) for event in events} == {
+            ("replace", "s1"),
+            ("delete", "s2"),
+            ("insert", "s3"),
+        }
+        assert next(event for event in events if event.document_id == "s1").document["path"] == "/a-renamed"
+
+    @pytest.mark.parametrize("mode, expected", [("auto", "polling"), ("change_stream", None)])
+    async def test_unauthorized_change_stream_falls_back_to_polling_in_auto_mode(self, mode, expected, monkeypatch):
+        monkeypatch.setattr(change_streams, "_RESTART_DELAY_SECONDS", 0.01)
+        collection = _FakeCollection(
+            documents=[{"_id": "s1", "path": "/a"}],
+            watch_error=OperationFailure("not authorized on jarvis to execute command", code=13),
+        )
+        subscriber = _subscriber({"mcpservers": collection}, mode=mode)
+        subscriber.subscribe("mcpservers", lambda event: asyncio.sleep(0))
+
+        await subscriber.start()
+        await _wait_for(lambda: len(collection.watch_calls) >= 2 or subscriber.get_stats()["collections"])
+        await subscriber.stop()
+
+        assert subscriber.get_stats()["collections"].get("mcpservers") == expected
+
+    async def test_failing_consumer_does_not_block_others(self):
+        changes = [{"_id": {"_data": "t1"}, "operationType": "delete", "documentKey": {"_id": "s1"}}]
+        subscriber = _subscriber({"mcpservers": _FakeCollection(changes=changes)})
+        delivered = []
+
+        async def broken(event):
+            raise RuntimeError("boom")
+
+        async def healthy(event):
+            delivered.append(event.document_id)
+
+        subscriber.subscribe("mcpservers", broken)
+        subscriber.subscribe("mcpservers", healthy)
+        await subscriber.start()
+        await _wait_for(lambda: delivered)
+        await subscriber.stop()
+
+        assert delivered == ["s1"]
+        assert subscriber.get_stats()["consumer_errors"] == 1
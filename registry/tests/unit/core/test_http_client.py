@@ -0,0 +1,179 @@
+"""
+Unit tests for the outbound HTTP client manager.
+"""
+
+import httpx
+import pytest
+
+from registry.core import http_client as http_client_module
+from registry.core.http_client import HTTPClientManager, open_http_client
+
+
+async def _chunks():
+    yield b"chunk"
+
+
+def _echo_handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/stream":
+        return httpx.Response(200, content=_chunks())
+    return httpx.Response(200, json={"url": str(request.url), "auth": request.headers.get("Authorization")})
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """Manager whose per-origin pools are mock transports instead of real sockets."""
+    created: list[httpx.MockTransport] = []
+
+    def fake_transport(**kwargs):
+        transport = httpx.MockTransport(_echo_handler)
+        transport.options = kwargs
+        transport.closed = False
+
+        async def aclose():
+            transport.closed = True
+
+        transport.aclose = aclose
+        created.append(transport)
+        return transport
+
+    for name in (
+        "HTTP_PROXY",
+        "HTTPS_PROXY",
+        "ALL_PROXY",
+        "NO_PROXY",
+        "http_proxy",
+        "https_proxy",
+        "all_proxy",
+        "no_proxy",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(http_client_module.httpx, "AsyncHTTPTransport", fake_transport)
+
+    def make(**kwargs):
+        mgr = HTTPClientManager(max_connections=2, max_keepalive_connections=1, **kwargs)
+        mgr.created_pools = created
+        return mgr
+
+    mgr = make()
+    mgr.make = make
+    return mgr
+
+
+@pytest.mark.unit
+@pytest.mark.core
+class TestHTTPClientManager:
+    """Test suite for HTTPClientManager."""
+
+    @pytest.mark.asyncio
+    async def test_requests_are_routed_to_one_pool_per_origin(self, manager):
+        async with manager.get_client() as client:
+            await client.get("https://a.example.com/one")
+            await client.get("https://a.example.com:443/two")
+            await client.get("http://b.example.com:8080/three")
+
+        assert len(manager.created_pools) == 2
+        stats = manager.get_stats()
+        assert stats["origins"] == 2
+        assert stats["per_origin"]["https://a.example.com:443"]["requests"] == 2
+        assert stats["per_origin"]["http://b.example.com:8080"]["requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_closing_a_client_view_keeps_pools_open(self, manager):
+        async with manager.get_client(headers={"Authorization": "Bearer one"}) as client:
+            first = await client.get("https://a.example.com/")
+
+        async with manager.get_client(headers={"Authorization": "Bearer two"}) as client:
+            second = await client.get("https://a.example.com/")
+
+        # Each view keeps its own headers while sharing the same pool.
+        assert first.json()["auth"] == "Bearer one"
+        assert second.json()["auth"] == "Bearer two"
+        assert len(manager.created_pools) == 1
+
+    @pytest.mark.asyncio
+    async def test_in_use_is_released_when_response_is_closed(self, manager):
+        async with manager.get_client() as client:
+            async with client.stream("GET", "https://a.example.com/stream") as response:
+                assert manager.get_stats()["in_use"] == 1
+                await response.aread()
+
+        stats = manager.get_stats()
+        assert stats["in_use"] == 0
+        assert stats["waiting"] == 0
+        assert stats["per_origin"]["https://a.example.com:443"]["peak_in_use"] == 1
+
+    @pytest.mark.asyncio
+    async def test_closed_manager_rejects_new_clients(self, manager):
+        async with manager.get_client() as client:
+            await client.get("https://a.example.com/")
+
+        await manager.aclose()
+
+        with pytest.raises(RuntimeError):
+            manager.get_client()
+
+    @pytest.mark.asyncio
+    async def test_open_http_client_without_manager_returns_standalone_client(self):
+        client = open_http_client(None, timeout=5.0)
+        try:
+            assert isinstance(client, httpx.AsyncClient)
+            assert client.timeout.connect == 5.0
+        finally:
+            await client.aclose()
+
+    def test_from_settings_uses_configured_limits(self):
+        class _Settings:
+            http_client_max_connections_per_origin = 7
+            http_client_max_keepalive_per_origin = 3
+            http_client_keepalive_expiry_seconds = 12.5
+            http_client_http2_enabled = False
+            http_client_connect_retries = 1
+            http_client_max_origins = 9
+
+        mgr = HTTPClientManager.from_settings(_Settings())
+
+        assert mgr.limits.max_connections == 7
+        assert mgr.limits.max_keepalive_connections == 3
+        assert mgr.limits.keepalive_expiry == 12.5
+        assert mgr.http2 is False
+        assert mgr.retries == 1
+        assert mgr.max_origins == 9
+
+    @pytest.mark.asyncio
+    async def test_pools_use_the_environment_proxy_except_for_no_proxy_hosts(self, manager, monkeypatch):
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.corp:8080")
+        monkeypatch.setenv("NO_PROXY", "internal.example.com,localhost")
+        mgr = manager.make()
+
+        async with mgr.get_client() as client:
+            await client.get("https://peer.example.org/api")
+            await client.get("https://internal.example.com/api")
+            await client.get("http://plain.example.org/")
+
+        assert [pool.options["proxy"] for pool in mgr.created_pools] == ["http://proxy.corp:8080", None, None]
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_idle_pools_are_closed(self, manager):
+        mgr = manager.make(max_origins=2)
+
+        async with mgr.get_client() as client:
+            await client.get("https://a.example.com/")
+            await client.get("https://b.example.com/")
+            await client.get("https://a.example.com/")  # b is now the least recently used
+            await client.get("https://c.example.com/")
+
+        a, b, c = mgr.created_pools
+        assert (a.closed, b.closed, c.closed) == (False, True, False)
+        assert set(mgr.get_stats()["per_origin"]) == {"https://a.example.com:443", "https://c.example.com:443"}
+
+    @pytest.mark.asyncio
+    async def test_pools_with_requests_in_flight_are_not_evicted(self, manager):
+        mgr = manager.make(max_origins=1)
+
+        async with mgr.get_client() as client:
+            async with client.stream("GET", "https://a.example.com/stream") as response:
+                await client.get("https://b.example.com/")
+                assert mgr.get_stats()["origins"] == 2
+                await response.aread()
+
+        assert not mgr.created_pools[0].closed
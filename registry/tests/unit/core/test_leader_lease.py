@@ -0,0 +1,122 @@
+"""
+Unit tests for the MongoDB leader lease.
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from pymongo.errors import DuplicateKeyError
+
+from registry.core.leader_lease import LeaderLease
+
+
+class _FakeLeaseCollection:
+    """Just enough of update_one/delete_one for lease documents keyed by _id."""
+
+    def __init__(self):
+        self.documents = {}
+
+    async def update_one(self, query, update, upsert=False):
+        current = self.documents.get(query["_id"])
+        matches = current is not None and any(
+            current["holder"] == clause.get("holder")
+            or ("expiresAt" in clause and current["expiresAt"] < clause["expiresAt"]["$lt"])
+            for clause in query["$or"]
+        )
+        if matches or (current is None and upsert):
+            self.documents[query["_id"]] = {**(current or {}), **update["$set"]}
+            return
+        if upsert:
+            raise DuplicateKeyError("E11000 duplicate key")
+
+    async def delete_one(self, query):
+        current = self.documents.get(query["_id"])
+        if current is not None and current["holder"] == query["holder"]:
+            del self.documents[query["_id"]]
+
+
+class _Work:
+    def __init__(self):
+        self.running = False
+        self.starts = 0
+
+    async def start(self):
+        self.running = True
+        self.starts += 1
+
+    async def stop(self):
+        self.running = False
+
+
+def _lease(collection, work, holder_id, ttl_seconds=30.0):
+    return LeaderLease(
+        lambda: collection,
+        "vector-index",
+        on_acquired=work.start,
+        on_lost=work.stop,
+        ttl_seconds=ttl_seconds,
+        holder_id=holder_id,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.core
+class TestLeaderLease:
+    """Test suite for LeaderLease."""
+
+    async def test_only_one_replica_runs_the_work(self):
+        collection = _FakeLeaseCollection()
+        work_a, work_b = _Work(), _Work()
+        lease_a, lease_b = _lease(collection, work_a, "a"), _lease(collection, work_b, "b")
+
+        await lease_a.start()
+        await asyncio.sleep(0)
+        await lease_b.start()
+        await asyncio.sleep(0)
+
+        assert (work_a.running, work_b.running) == (True, False)
+        assert collection.documents["vector-index"]["holder"] == "a"
+        await lease_a.stop()
+        await lease_b.stop()
+
+    async def test_stop_hands_the_lease_over(self):
+        collection = _FakeLeaseCollection()
+        work_a, work_b = _Work(), _Work()
+        lease_a, lease_b = _lease(collection, work_a, "a"), _lease(collection, work_b, "b", ttl_seconds=0.03)
+
+        await lease_a.start()
+        await asyncio.sleep(0)
+        await lease_b.start()
+        await lease_a.stop()
+        await asyncio.sleep(0.05)
+
+        assert (work_a.running, work_b.running) == (False, True)
+        await lease_b.stop()
+
+    async def test_expired_lease_is_taken_over(self):
+        collection = _FakeLeaseCollection()
+        collection.documents["vector-index"] = {"holder": "crashed", "expiresAt": datetime.now(UTC) - timedelta(1)}
+        lease = _lease(collection, _Work(), "b")
+        lease._collection = collection
+
+        assert await lease.try_acquire()
+        assert collection.documents["vector-index"]["holder"] == "b"
+
+    async def test_steps_down_when_renewal_fails(self):
+        collection = _FakeLeaseCollection()
+        work = _Work()
+        lease = _lease(collection, work, "a", ttl_seconds=0.03)
+        await lease.start()
+        await asyncio.sleep(0)
+        assert work.running
+
+        async def unavailable(*args, **kwargs):
+            raise ConnectionError("mongo down")
+
+        collection.update_one = unavailable
+        await asyncio.sleep(0.05)
+
+        assert not work.running
+        assert not lease.is_leader
+        await lease.stop()
@@ -0,0 +1,106 @@
+"""
+Unit tests for the elicitation session store.
+"""
+
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from registry.core.session_store import SessionStore
+
+
+class _FakeRedis:
+    """Shared key space and pub/sub channel for two simulated replicas."""
+
+    def __init__(self):
+        self.values: dict[str, str] = {}
+        self.published: list[tuple[str, str]] = []
+
+    def setex(self, key, ttl, value):
+        self.values[key] = value
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+    def publish(self, channel, message):
+        self.published.append((channel, message))
+        return 1
+
+
+def _session():
+    session = Mock()
+    session.send_elicit_complete = AsyncMock()
+    return session
+
+
+@pytest.mark.unit
+@pytest.mark.core
+class TestSessionStore:
+    """Test suite for SessionStore."""
+
+    def test_oldest_elicitation_is_evicted_at_capacity(self):
+        store = SessionStore(max_session_count=2)
+        first, second, third = _session(), _session(), _session()
+
+        store.append("e1", first)
+        store.append("e2", second)
+        store.append("e3", third)
+
+        assert store.pop("e1") is None
+        assert store.pop("e2") is second
+        assert store.pop("e3") is third
+
+    def test_append_does_not_overwrite_existing_elicitation(self):
+        store = SessionStore()
+        original = _session()
+
+        store.append("e1", original)
+        store.append("e1", _session())
+
+        assert store.pop("e1") is original
+
+    async def test_local_session_is_notified(self):
+        store = SessionStore()
+        session = _session()
+        store.append("e1", session)
+
+        assert await store.notify_elicitation_complete("e1") is True
+        session.send_elicit_complete.assert_awaited_once_with("e1")
+        assert store.pop("e1") is None
+
+    async def test_unknown_elicitation_is_dropped_without_redis(self):
+        store = SessionStore()
+
+        assert await store.notify_elicitation_complete("missing") is False
+
+    async def test_completion_is_forwarded_to_owning_replica(self):
+        redis = _FakeRedis()
+        owner = SessionStore(redis_client=redis, replica_id="replica-a")
+        other = SessionStore(redis_client=redis, replica_id="replica-b")
+        session = _session()
+        owner.append("e1", session)
+
+        assert await other.notify_elicitation_complete("e1") is True
+        channel, payload = redis.published[0]
+        assert json.loads(payload) == {"elicitation_id": "e1", "owner": "replica-a"}
+
+        # The owning replica receives the pub/sub message and delivers to its session.
+        await owner._handle_forwarded(payload)
+
+        session.send_elicit_complete.assert_awaited_once_with("e1")
+        assert redis.get("mcpgw:elicitation_owner:e1") is None
+
+    async def test_forwarded_message_for_another_replica_is_ignored(self):
+        redis = _FakeRedis()
+        store = SessionStore(redis_client=redis, replica_id="replica-a")
+        session = _session()
+        store.append("e1", session)
+
+        await store._handle_forwarded(json.dumps({"elicitation_id": "e1", "owner": "replica-c"}))
+
+        session.send_elicit_complete.assert_not_awaited()
+        assert store.pop("e1") is session
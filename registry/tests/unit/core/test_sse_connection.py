@@ -0,0 +1,170 @@
+"""
+Unit tests for persistent, multiplexed downstream SSE connections.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from registry.core import http_client as http_client_module
+from registry.core.exceptions import MisimplementedSpecException
+from registry.core.http_client import HTTPClientManager
+from registry.core.sse_connection import SSEConnectionManager
+
+
+class FakeSSEServer:
+    """Legacy SSE MCP server: responses to POSTed requests are delivered on the GET stream."""
+
+    def __init__(self):
+        self.streams_opened = 0
+        self.posts: list[dict] = []
+        self.reply_in_reverse = False
+        self.held: list[dict] = []
+        self.queue: asyncio.Queue[str | None] | None = None
+
+    def drop_stream(self) -> None:
+        self.queue.put_nowait(None)
+
+    async def _events(self, queue: asyncio.Queue):
+        yield b"event: endpoint\ndata: /messages?session_id=abc\n\n"
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            yield f"event: message\ndata: {item}\n\n".encode()
+
+    def _reply(self, request_body: dict) -> None:
+        if request_body["method"] == "tools/call":
+            result = {"content": [{"type": "text", "text": request_body["params"]["arguments"]["echo"]}]}
+        else:
+            result = {}
+        self.queue.put_nowait(json.dumps({"jsonrpc": "2.0", "id": request_body["id"], "result": result}))
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            self.streams_opened += 1
+            self.queue = asyncio.Queue()
+            return httpx.Response(200, headers={"content-type": "text/event-stream"}, content=self._events(self.queue))
+
+        body = json.loads(request.content)
+        self.posts.append(body)
+        if "id" in body:
+            if self.reply_in_reverse and body["method"] == "tools/call":
+                self.held.append(body)
+                if len(self.held) == 2:
+                    for held in reversed(self.held):
+                        self._reply(held)
+            else:
+                self._reply(body)
+        return httpx.Response(202)
+
+
+def _tool_call(request_id, echo: str) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {"name": "echo", "arguments": {"echo": echo}},
+    }
+
+
+@pytest.fixture
+def make_manager():
+    def _make(server: FakeSSEServer) -> SSEConnectionManager:
+        manager = SSEConnectionManager(heartbeat_interval_seconds=0)
+        manager._http_client = httpx.AsyncClient(transport=httpx.MockTransport(server.handler))
+        manager._stream_client = httpx.AsyncClient(transport=httpx.MockTransport(server.handler))
+        return manager
+
+    return _make
+
+
+@pytest.mark.unit
+@pytest.mark.proxy
+class TestSSEConnectionManager:
+    """Test suite for SSEConnectionManager."""
+
+    async def test_repeated_calls_reuse_one_stream_and_handshake(self, make_manager):
+        server = FakeSSEServer()
+        manager = make_manager(server)
+
+        for i in range(3):
+            response = await manager.call_tool("u:s", "http://mcp.example/sse", {}, _tool_call(i, f"hi-{i}"))
+            assert response["id"] == i
+            assert response["result"]["content"][0]["text"] == f"hi-{i}"
+
+        methods = [post["method"] for post in server.posts]
+        assert server.streams_opened == 1
+        assert methods.count("initialize") == 1
+        assert methods.count("tools/call") == 3
+        await manager.aclose()
+
+    async def test_concurrent_calls_are_routed_by_id(self, make_manager):
+        server = FakeSSEServer()
+        manager = make_manager(server)
+        await manager.call_tool("u:s", "http://mcp.example/sse", {}, _tool_call("warmup", "w"))
+        server.reply_in_reverse = True
+
+        # Both clients use the same JSON-RPC id; the connection must still tell the responses apart.
+        first, second = await asyncio.gather(
+            manager.call_tool("u:s", "http://mcp.example/sse", {}, _tool_call(1, "first")),
+            manager.call_tool("u:s", "http://mcp.example/sse", {}, _tool_call(1, "second")),
+        )
+
+        assert first["id"] == second["id"] == 1
+        assert first["result"]["content"][0]["text"] == "first"
+        assert second["result"]["content"][0]["text"] == "second"
+        await manager.aclose()
+
+    async def test_dropped_stream_reconnects_on_next_call(self, make_manager):
+        server = FakeSSEServer()
+        manager = make_manager(server)
+        await manager.call_tool("u:s", "http://mcp.example/sse", {}, _tool_call(1, "a"))
+
+        server.drop_stream()
+        await asyncio.sleep(0.05)
+
+        response = await manager.call_tool("u:s", "http://mcp.example/sse", {}, _tool_call(2, "b"))
+
+        assert response["result"]["content"][0]["text"] == "b"
+        assert server.streams_opened == 2
+        await manager.aclose()
+
+    async def test_missing_request_id_is_rejected(self, make_manager):
+        manager = make_manager(FakeSSEServer())
+
+        with pytest.raises(MisimplementedSpecException):
+            await manager.call_tool("u:s", "http://mcp.example/sse", {}, {"jsonrpc": "2.0", "method": "tools/call"})
+
+    async def test_stats_report_open_connections(self, make_manager):
+        server = FakeSSEServer()
+        manager = make_manager(server)
+        await manager.call_tool("u:a", "http://mcp.example/sse", {}, _tool_call(1, "a"))
+        await manager.call_tool("u:b", "http://mcp.example/sse", {}, _tool_call(1, "b"))
+
+        stats = manager.get_stats()
+        assert stats["connections"] == 2
+        assert stats["in_flight"] == 0
+
+        await manager.aclose()
+        assert manager.get_stats()["connections"] == 0
+
+    async def test_streams_do_not_use_the_shared_request_pools(self, monkeypatch):
+        server = FakeSSEServer()
+        monkeypatch.setattr(
+            http_client_module.httpx, "AsyncHTTPTransport", lambda **kwargs: httpx.MockTransport(server.handler)
+        )
+        shared = HTTPClientManager(max_connections=1)
+        manager = SSEConnectionManager(http_client_manager=shared, heartbeat_interval_seconds=0, max_connections=50)
+
+        await manager.call_tool("u:a", "http://mcp.example/sse", {}, _tool_call(1, "a"))
+        await manager.call_tool("u:b", "http://mcp.example/sse", {}, _tool_call(1, "b"))
+
+        # Two streams are open to the origin, yet its single shared connection stays free for POSTs.
+        assert shared.get_stats()["in_use"] == 0
+        assert shared.get_stats()["requests"] == len(server.posts)
+        assert manager._stream_pools.limits.max_connections == 50
+        assert manager._stream_pools.get_stats()["in_use"] == 2
+        await manager.aclose()
@@ -0,0 +1,147 @@
+"""
+Unit tests for the health check scheduler.
+"""
+
+import asyncio
+
+import pytest
+
+from registry.health.scheduler import HealthCheckScheduler, _ServerState
+
+
+async def _wait_for(predicate, timeout=1.0):
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(0.005)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+def _scheduler(check, server_ids=(), **kwargs):
+    async def discover():
+        return list(server_ids)
+
+    options = {"interval_seconds": 0.05, "recheck_seconds": 0.01, "jitter_ratio": 0.0} | kwargs
+    return HealthCheckScheduler(check, discover, **options)
+
+
+@pytest.mark.unit
+@pytest.mark.health
+class TestHealthCheckScheduler:
+    """Test suite for HealthCheckScheduler."""
+
+    def test_failing_servers_back_off_up_to_the_cap(self):
+        scheduler = HealthCheckScheduler(
+            None, None, interval_seconds=60, max_interval_seconds=300, recheck_seconds=10, jitter_ratio=0.0
+        )
+
+        assert scheduler.next_delay(_ServerState(healthy=True), previous=True) == 60
+        assert scheduler.next_delay(_ServerState(healthy=False, failures=1), previous=True) == 10
+        assert scheduler.next_delay(_ServerState(healthy=False, failures=2), previous=False) == 120
+        assert scheduler.next_delay(_ServerState(healthy=False, failures=3), previous=False) == 240
+        assert scheduler.next_delay(_ServerState(healthy=False, failures=9), previous=False) == 300
+
+    def test_jitter_stays_within_ratio(self):
+        scheduler = HealthCheckScheduler(None, None, interval_seconds=100, jitter_ratio=0.2)
+
+        delays = {scheduler.next_delay(_ServerState(healthy=True), previous=True) for _ in range(50)}
+
+        assert all(80 <= delay <= 120 for delay in delays)
+        assert len(delays) > 1
+
+    async def test_concurrency_is_capped(self):
+        running = 0
+        peak = 0
+        checked = []
+
+        async def check(server_id):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            checked.append(server_id)
+            return True
+
+        servers = ("s1", "s2", "s3", "s4", "s5")
+        scheduler = _scheduler(check, server_ids=servers, max_concurrency=2, interval_seconds=10)
+        for server_id in servers:
+            scheduler.schedule(server_id)
+        await scheduler.start()
+        await _wait_for(lambda: len(checked) == 5)
+        await scheduler.stop()
+
+        assert peak == 2
+
+    async def test_removed_or_vanished_servers_are_not_rescheduled(self):
+        calls = []
+
+        async def check(server_id):
+            calls.append(server_id)
+            return None if server_id == "gone" else True
+
+        scheduler = _scheduler(check, server_ids=("gone", "kept"), interval_seconds=10)
+        scheduler.schedule("gone")
+        scheduler.schedule("kept")
+        await scheduler.start()
+        await _wait_for(lambda: len(calls) == 2)
+        await scheduler.stop()
+
+        assert scheduler.get_stats()["servers"] == 1
+        assert scheduler.get_stats()["queued"] == 1
+
+    async def test_state_change_is_rechecked_quickly(self):
+        results = iter([True, False, False])
+        calls = []
+
+        async def check(server_id):
+            calls.append(server_id)
+            return next(results)
+
+        scheduler = _scheduler(check, server_ids=("s1",), interval_seconds=10, recheck_seconds=0.0)
+        scheduler.schedule("s1")
+        await scheduler.start()
+        await _wait_for(lambda: len(calls) == 1)
+        # A change event asks for an early check, which finds the server down ...
+        scheduler.schedule("s1")
+        # ... and the healthy -> unhealthy flip is confirmed right away instead of after the interval.
+        await _wait_for(lambda: len(calls) == 3)
+        await asyncio.sleep(0.02)
+        await scheduler.stop()
+
+        assert len(calls) == 3
+        assert scheduler.get_stats()["unhealthy"] == 1
+
+    async def test_discovery_tracks_server_set(self):
+        async def check(server_id):
+            return True
+
+        scheduler = _scheduler(check, server_ids=("a", "b"), interval_seconds=10)
+        await scheduler.start()
+        await _wait_for(lambda: scheduler.get_stats()["servers"] == 2)
+        scheduler.sync(["b", "c"])
+        await scheduler.stop()
+
+        assert set(scheduler._servers) == {"b", "c"}
+
+    async def test_restart_rediscovers_servers(self):
+        """A replica that regains the health check lease starts from a fresh discovery."""
+        server_ids = ["a"]
+
+        async def check(server_id):
+            return True
+
+        async def discover():
+            return list(server_ids)
+
+        scheduler = HealthCheckScheduler(check, discover, interval_seconds=10, jitter_ratio=0.0)
+        await scheduler.start()
+        await _wait_for(lambda: scheduler.get_stats()["servers"] == 1)
+        await scheduler.stop()
+
+        assert not scheduler.running
+
+        server_ids[:] = ["b", "c"]
+        await scheduler.start()
+        await _wait_for(lambda: set(scheduler._servers) == {"b", "c"})
+        await scheduler.stop()
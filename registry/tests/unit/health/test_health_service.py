@@ -3,6 +3,8 @@ Unit tests for health monitoring service.
 """
 
 import asyncio
+import json
+import time
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -277,3 +279,151 @@ class TestHealthMonitoringService:
             assert "/test2" in result
             # _get_service_health_data_fast should be called for each server
             assert mock_get_data.call_count == 2
+
+
+class _FakeWebSocket:
+    """WebSocket that records messages; a cleared gate makes it a slow client."""
+
+    def __init__(self):
+        self.client = None
+        self.messages: list[str] = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def accept(self):
+        pass
+
+    async def close(self, code=1000, reason=None):
+        pass
+
+    async def send_text(self, message):
+        await self.gate.wait()
+        self.messages.append(message)
+
+
+async def _settle():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.unit
+@pytest.mark.health
+class TestHighPerformanceWebSocketManager:
+    """Test suite for versioned, delta-based WebSocket broadcasts."""
+
+    @pytest.fixture
+    async def manager(self):
+        from registry.health.service import HighPerformanceWebSocketManager
+
+        manager = HighPerformanceWebSocketManager()
+        manager.min_broadcast_interval = 0
+        manager.max_queue_size = 2
+        yield manager
+        await manager.close()
+
+    async def test_only_changed_services_are_sent_and_encoded_once(self, manager):
+        first, second = _FakeWebSocket(), _FakeWebSocket()
+        await manager.add_connection(first)
+        await manager.add_connection(second)
+
+        await manager.broadcast_update("/a", {"status": "healthy"})
+        await manager.broadcast_update("/a", {"status": "healthy"})  # unchanged: no message
+        await manager.broadcast_update("/b", {"status": "unknown"})
+        await _settle()
+
+        assert [json.loads(m) for m in first.messages] == [{"/a": {"status": "healthy"}}, {"/b": {"status": "unknown"}}]
+        assert all(a is b for a, b in zip(first.messages, second.messages, strict=True))
+        assert manager.get_stats()["state_version"] == 2
+
+    async def test_updates_within_interval_are_coalesced(self, manager):
+        client = _FakeWebSocket()
+        await manager.add_connection(client)
+        manager.min_broadcast_interval = 0.05
+        manager.last_broadcast_time = time.time()
+
+        await manager.broadcast_update("/a", {"status": "unknown"})
+        await manager.broadcast_update("/a", {"status": "healthy"})
+        await manager.broadcast_update("/b", {"status": "healthy"})
+        await asyncio.sleep(0.1)
+
+        assert [json.loads(m) for m in client.messages] == [{"/a": {"status": "healthy"}, "/b": {"status": "healthy"}}]
+
+    async def test_slow_client_gets_one_catch_up_delta(self, manager):
+        fast, slow = _FakeWebSocket(), _FakeWebSocket()
+        await manager.add_connection(fast)
+        await manager.add_connection(slow)
+        slow.gate.clear()
+
+        for i in range(6):
+            await manager.broadcast_update(f"/s{i % 3}", {"status": "healthy", "num_tools": i})
+            await _settle()
+        slow.gate.set()
+        await _settle()
+
+        assert len(fast.messages) == 6
+        # The send in flight when the client stalled, then everything newer in one message.
+        assert len(slow.messages) == 2
+        merged = {**json.loads(slow.messages[0]), **json.loads(slow.messages[1])}
+        assert merged == {f"/s{i}": {"status": "healthy", "num_tools": i + 3} for i in range(3)}
+        stats = manager.get_stats()
+        assert stats["resyncs"] == 1
+        assert stats["dropped_messages"] == 2
+
+    async def test_removed_service_is_sent_as_null(self, manager):
+        client = _FakeWebSocket()
+        await manager.add_connection(client)
+
+        await manager.broadcast_update("/a", {"status": "healthy"})
+        await manager.remove_service("/a")
+        await _settle()
+
+        assert json.loads(client.messages[-1]) == {"/a": None}
+
+    async def test_tombstones_are_dropped_once_every_client_has_them(self, manager):
+        fast, slow = _FakeWebSocket(), _FakeWebSocket()
+        await manager.add_connection(fast)
+        await manager.add_connection(slow)
+        await manager.broadcast_update("/a", {"status": "healthy"})
+        await _settle()
+        slow.gate.clear()
+
+        await manager.remove_service("/a")
+        await manager.broadcast_update("/b", {"status": "healthy"})
+        await _settle()
+
+        # The stalled client has not been sent the removal yet.
+        assert "/a" in manager.state
+        slow.gate.set()
+        await _settle()
+        await manager.broadcast_update("/c", {"status": "healthy"})
+
+        assert "/a" not in manager.state
+        assert manager.removed == {}
+        assert json.loads(slow.messages[1]) == {"/a": None}
+
+    async def test_initial_snapshot_excludes_removed_services(self, manager):
+        await manager.broadcast_update("/a", {"status": "healthy"})
+        await manager.broadcast_update("/b", {"status": "healthy"})
+        await manager.remove_service("/a")
+
+        client = _FakeWebSocket()
+        await manager.add_connection(client)
+        await _settle()
+
+        assert [json.loads(m) for m in client.messages] == [{"/b": {"status": "healthy"}}]
+        # No client was connected to be sent the removal, so nothing is kept for it.
+        assert "/a" not in manager.state
+
+    async def test_failed_client_is_removed(self, manager):
+        client = _FakeWebSocket()
+        await manager.add_connection(client)
+
+        async def broken(message):
+            raise ConnectionError("gone")
+
+        client.send_text = broken
+        await manager.broadcast_update("/a", {"status": "healthy"})
+        await _settle()
+
+        assert client not in manager.connections
+        assert manager.get_stats()["failed_sends"] == 1
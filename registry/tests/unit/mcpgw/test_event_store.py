@@ -0,0 +1,287 @@
+"""
+Unit tests for the gateway's resumable-stream event stores.
+"""
+
+import asyncio
+
+import pytest
+from mcp.types import JSONRPCMessage, JSONRPCNotification
+
+from registry.mcpgw.core.event_store import (
+    EventStoreSessionScope,
+    InMemoryEventStore,
+    RedisEventStore,
+    bind_event_session,
+)
+
+
+def _message(n: int) -> JSONRPCMessage:
+    return JSONRPCMessage(JSONRPCNotification(jsonrpc="2.0", method="notifications/message", params={"n": n}))
+
+
+def _stream_key(event_id: str) -> str:
+    return event_id.split(":")[0]
+
+
+async def _in_session(session: str, coro_fn):
+    """Run ``coro_fn`` with events attributed to ``session``, as EventStoreSessionScope would."""
+
+    async def _run():
+        bind_event_session(session)
+        return await coro_fn()
+
+    # A task gets its own copy of the context, like each request does
+    return await asyncio.create_task(_run())
+
+
+class _Collector:
+    def __init__(self):
+        self.events = []
+
+    async def __call__(self, event_message):
+        self.events.append(event_message)
+
+    @property
+    def numbers(self) -> list[int]:
+        return [event.message.root.params["n"] for event in self.events]
+
+
+class _FakeRedisStreams:
+    """Just enough of the Redis Streams API for RedisEventStore."""
+
+    def __init__(self):
+        self.streams: dict[str, list[tuple[str, dict[str, str]]]] = {}
+        self.expiry: dict[str, int] = {}
+        self._seq = 0
+
+    def pipeline(self):
+        return _FakePipeline(self)
+
+    def xadd(self, key, fields, maxlen=None, approximate=True):
+        self._seq += 1
+        entry_id = f"{self._seq}-0"
+        entries = self.streams.setdefault(key, [])
+        entries.append((entry_id, dict(fields)))
+        if maxlen is not None and len(entries) > maxlen:
+            del entries[: len(entries) - maxlen]
+        return entry_id
+
+    def expire(self, key, seconds):
+        self.expiry[key] = seconds
+        return True
+
+    def xrange(self, key, min="-", max="+", count=None):
+        def seq(entry_id):
+            return int(entry_id.split("-")[0])
+
+        exclusive = min.startswith("(")
+        low = -1 if min == "-" else seq(min.lstrip("("))
+        high = float("inf") if max == "+" else seq(max)
+        result = [
+            (entry_id, fields)
+            for entry_id, fields in self.streams.get(key, [])
+            if (seq(entry_id) > low if exclusive else seq(entry_id) >= low) and seq(entry_id) <= high
+        ]
+        return result[:count] if count else result
+
+    def xtrim(self, key, minid):
+        minimum = int(minid.split("-")[0])
+        self.streams[key] = [entry for entry in self.streams.get(key, []) if int(entry[0].split("-")[0]) >= minimum]
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    def __getattr__(self, name):
+        def _queue(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+            return self
+
+        return _queue
+
+    def execute(self):
+        return [getattr(self._redis, name)(*args, **kwargs) for name, args, kwargs in self._calls]
+
+
+@pytest.mark.unit
+@pytest.mark.proxy
+class TestInMemoryEventStore:
+    """Test suite for InMemoryEventStore."""
+
+    async def test_replays_only_events_after_last_event_id(self):
+        store = InMemoryEventStore()
+        ids = [await store.store_event("stream-1", _message(n)) for n in range(5)]
+        collector = _Collector()
+
+        stream_id = await store.replay_events_after(ids[1], collector)
+
+        assert stream_id == "stream-1"
+        assert collector.numbers == [2, 3, 4]
+
+    async def test_replay_reclaims_confirmed_events_but_keeps_anchor(self):
+        store = InMemoryEventStore()
+        ids = [await store.store_event("stream-1", _message(n)) for n in range(5)]
+
+        await store.replay_events_after(ids[2], _Collector())
+        collector = _Collector()
+        await store.replay_events_after(ids[2], collector)
+
+        assert len(store.streams[_stream_key(ids[2])].entries) == 3
+        assert collector.numbers == [3, 4]
+        assert await store.replay_events_after(ids[1], _Collector()) is None
+
+    async def test_events_are_not_mixed_between_streams(self):
+        store = InMemoryEventStore()
+        first = await store.store_event("stream-1", _message(1))
+        await store.store_event("stream-2", _message(2))
+        await store.store_event("stream-1", _message(3))
+        collector = _Collector()
+
+        await store.replay_events_after(first, collector)
+
+        assert collector.numbers == [3]
+
+    async def test_evicted_events_cannot_be_resumed(self):
+        store = InMemoryEventStore(max_events_per_stream=2)
+        ids = [await store.store_event("stream-1", _message(n)) for n in range(4)]
+
+        assert await store.replay_events_after(ids[0], _Collector()) is None
+        assert await store.replay_events_after(ids[2], _Collector()) == "stream-1"
+
+    async def test_least_recently_used_stream_is_evicted(self):
+        store = InMemoryEventStore(max_streams=2)
+        first = await store.store_event("stream-1", _message(1))
+        await store.store_event("stream-2", _message(2))
+        await store.store_event("stream-1", _message(3))
+        await store.store_event("stream-3", _message(4))
+
+        assert [stream.stream_id for stream in store.streams.values()] == ["stream-1", "stream-3"]
+        assert await store.replay_events_after(first, _Collector()) == "stream-1"
+
+    async def test_priming_events_without_message_are_not_replayed(self):
+        store = InMemoryEventStore()
+        anchor = await store.store_event("stream-1", None)
+        await store.store_event("stream-1", None)
+        await store.store_event("stream-1", _message(1))
+        collector = _Collector()
+
+        await store.replay_events_after(anchor, collector)
+
+        assert collector.numbers == [1]
+
+    async def test_unknown_event_id_returns_none(self):
+        store = InMemoryEventStore()
+
+        assert await store.replay_events_after("not-an-event", _Collector()) is None
+
+    async def test_sessions_with_the_same_request_id_are_kept_apart(self):
+        store = InMemoryEventStore()
+
+        async def store_two(first: int, second: int):
+            return [await store.store_event("1", _message(first)), await store.store_event("1", _message(second))]
+
+        session_a = await _in_session("session-a", lambda: store_two(1, 2))
+        session_b = await _in_session("session-b", lambda: store_two(10, 20))
+        await _in_session("session-a", lambda: store.store_event("1", _message(3)))
+        collector = _Collector()
+
+        assert await store.replay_events_after(session_a[0], collector) == "1"
+        assert collector.numbers == [2, 3]
+        # Reclaiming session A's confirmed events leaves session B's untouched
+        collector = _Collector()
+        await store.replay_events_after(session_b[0], collector)
+        assert collector.numbers == [20]
+
+    async def test_event_ids_do_not_expose_the_stream_id(self):
+        store = InMemoryEventStore()
+
+        event_id = await store.store_event("1", _message(1))
+
+        assert not event_id.startswith("1:")
+        assert await store.replay_events_after("1:1", _Collector()) is None
+
+
+@pytest.mark.unit
+@pytest.mark.proxy
+class TestRedisEventStore:
+    """Test suite for RedisEventStore."""
+
+    async def test_resume_works_from_another_store_instance(self):
+        redis = _FakeRedisStreams()
+        replica_a = RedisEventStore(lambda: redis, max_events_per_stream=10)
+        replica_b = RedisEventStore(lambda: redis, max_events_per_stream=10)
+        ids = [await replica_a.store_event("stream-1", _message(n)) for n in range(4)]
+        collector = _Collector()
+
+        stream_id = await replica_b.replay_events_after(ids[1], collector)
+
+        assert stream_id == "stream-1"
+        assert collector.numbers == [2, 3]
+        assert [event.event_id for event in collector.events] == ids[2:]
+        assert redis.expiry[f"mcpgw:events:{_stream_key(ids[0])}"] == 3600
+
+    async def test_trimmed_anchor_cannot_be_resumed(self):
+        redis = _FakeRedisStreams()
+        store = RedisEventStore(lambda: redis, max_events_per_stream=2)
+        ids = [await store.store_event("stream-1", _message(n)) for n in range(4)]
+
+        assert await store.replay_events_after(ids[0], _Collector()) is None
+
+    async def test_falls_back_to_memory_without_redis(self):
+        store = RedisEventStore(lambda: None)
+        first = await store.store_event("stream-1", _message(1))
+        await store.store_event("stream-1", _message(2))
+        collector = _Collector()
+
+        assert await store.replay_events_after(first, collector) == "stream-1"
+        assert collector.numbers == [2]
+
+    async def test_sessions_with_the_same_request_id_are_kept_apart(self):
+        redis = _FakeRedisStreams()
+        store = RedisEventStore(lambda: redis, max_events_per_stream=10)
+
+        async def store_two(first: int, second: int):
+            return [await store.store_event("1", _message(first)), await store.store_event("1", _message(second))]
+
+        session_a = await _in_session("session-a", lambda: store_two(1, 2))
+        session_b = await _in_session("session-b", lambda: store_two(10, 20))
+        collector = _Collector()
+
+        assert await store.replay_events_after(session_a[0], collector) == "1"
+        assert collector.numbers == [2]
+        collector = _Collector()
+        await store.replay_events_after(session_b[0], collector)
+        assert collector.numbers == [20]
+
+
+@pytest.mark.unit
+@pytest.mark.proxy
+class TestEventStoreSessionScope:
+    """Test suite for EventStoreSessionScope."""
+
+    async def test_requests_of_one_session_share_a_scope(self):
+        store = InMemoryEventStore()
+        stored = []
+
+        async def app(scope, receive, send):
+            stored.append(await store.store_event("_GET_stream", _message(len(stored))))
+            headers = [(b"mcp-session-id", b"s-1")] if not scope["headers"] else []
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+
+        async def send(message):
+            pass
+
+        middleware = EventStoreSessionScope(app)
+
+        async def request(headers):
+            scope = {"type": "http", "method": "POST", "headers": headers}
+            await asyncio.create_task(middleware(scope, None, send))
+
+        await request([])
+        await request([(b"mcp-session-id", b"s-1")])
+        await request([])
+
+        assert _stream_key(stored[0]) == _stream_key(stored[1])
+        assert _stream_key(stored[2]) != _stream_key(stored[0])
@@ -0,0 +1,166 @@
+"""
+Unit tests for the gateway downstream MCP session pool.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from registry.mcpgw.core.session_pool import DownstreamSessionPool, session_pool_key
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _FakeClock()
+
+
+@pytest.fixture
+def pool(clock):
+    return DownstreamSessionPool(idle_ttl_seconds=60.0, max_sessions=2, clock=clock)
+
+
+@pytest.mark.unit
+@pytest.mark.proxy
+class TestDownstreamSessionPool:
+    """Test suite for DownstreamSessionPool."""
+
+    async def test_warm_session_skips_handshake(self, pool):
+        initialize = AsyncMock(return_value="sess-1")
+        key = session_pool_key("user-1", "server-1")
+
+        first = await pool.acquire(key, initialize)
+        second = await pool.acquire(key, initialize)
+
+        assert first == second == "sess-1"
+        initialize.assert_awaited_once()
+        stats = pool.get_stats()
+        assert stats["handshakes"] == 1
+        assert stats["handshakes_avoided"] == 1
+        assert stats["handshake_avoidance_ratio"] == 0.5
+
+    async def test_concurrent_acquires_share_one_handshake(self, pool):
+        release = asyncio.Event()
+        calls = 0
+
+        async def initialize():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "sess-1"
+
+        tasks = [asyncio.create_task(pool.acquire("u:s", initialize)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert results == ["sess-1"] * 5
+        assert calls == 1
+        assert pool.get_stats()["outcomes"]["joined"] == 4
+
+    async def test_failed_handshake_propagates_to_joined_callers(self, pool):
+        release = asyncio.Event()
+
+        async def initialize():
+            await release.wait()
+            raise ConnectionError("boom")
+
+        tasks = [asyncio.create_task(pool.acquire("u:s", initialize)) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert pool.get_stats()["warm_sessions"] == 0
+
+    async def test_cancelled_leader_hands_the_handshake_to_a_joined_caller(self, pool):
+        started = asyncio.Event()
+        calls = 0
+
+        async def initialize():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                started.set()
+                await asyncio.Event().wait()
+            return "sess-2"
+
+        leader = asyncio.create_task(pool.acquire("u:s", initialize))
+        await started.wait()
+        joined = asyncio.create_task(pool.acquire("u:s", initialize))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await joined == "sess-2"
+        assert leader.cancelled()
+        assert calls == 2
+        assert pool.get_stats()["outcomes"]["failed"] == 0
+
+    async def test_invalidate_forces_reinitialize(self, pool):
+        initialize = AsyncMock(side_effect=["sess-1", "sess-2"])
+
+        assert await pool.acquire("u:s", initialize) == "sess-1"
+        pool.invalidate("u:s", "sess-1")
+
+        assert await pool.acquire("u:s", initialize) == "sess-2"
+        assert pool.get_stats()["outcomes"]["expired"] == 1
+
+    async def test_invalidate_ignores_stale_session_id(self, pool):
+        await pool.acquire("u:s", AsyncMock(return_value="sess-2"))
+
+        pool.invalidate("u:s", "sess-1")
+
+        assert pool.get_stats()["warm_sessions"] == 1
+
+    async def test_idle_sessions_are_evicted(self, pool, clock):
+        initialize = AsyncMock(side_effect=["sess-1", "sess-2"])
+        await pool.acquire("u:s", initialize)
+
+        clock.now += 61.0
+
+        assert await pool.acquire("u:s", initialize) == "sess-2"
+        assert pool.get_stats()["evicted_idle"] == 1
+
+    async def test_max_sessions_drops_least_recently_used(self, pool):
+        await pool.acquire("u:a", AsyncMock(return_value="a"))
+        await pool.acquire("u:b", AsyncMock(return_value="b"))
+        await pool.acquire("u:a", AsyncMock())
+        await pool.acquire("u:c", AsyncMock(return_value="c"))
+
+        initialize_b = AsyncMock(return_value="b2")
+        assert await pool.acquire("u:b", initialize_b) == "b2"
+        initialize_b.assert_awaited_once()
+
+    async def test_shared_session_from_redis_is_reused(self, clock):
+        mcp_client_service = MagicMock()
+        mcp_client_service.get_session.return_value = ("sess-remote", True)
+        pool = DownstreamSessionPool(mcp_client_service=mcp_client_service, clock=clock)
+        initialize = AsyncMock()
+
+        assert await pool.acquire("u:s", initialize) == "sess-remote"
+        initialize.assert_not_awaited()
+        assert pool.get_stats()["outcomes"]["shared"] == 1
+
+    async def test_uninitialized_shared_session_is_not_reused(self, clock):
+        mcp_client_service = MagicMock()
+        mcp_client_service.get_session.return_value = ("sess-remote", False)
+        pool = DownstreamSessionPool(mcp_client_service=mcp_client_service, clock=clock)
+
+        assert await pool.acquire("u:s", AsyncMock(return_value="sess-new")) == "sess-new"
+
+    async def test_invalidate_clears_matching_shared_session(self, clock):
+        mcp_client_service = MagicMock()
+        mcp_client_service.get_session.return_value = ("sess-1", True)
+        pool = DownstreamSessionPool(mcp_client_service=mcp_client_service, clock=clock)
+
+        pool.invalidate("u:s", "sess-1")
+
+        mcp_client_service.clear_session.assert_called_once_with("u:s")
@@ -0,0 +1,155 @@
+"""
+Unit tests for the auth middleware (registry/src/registry/middleware/auth.py).
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from registry.middleware.auth import AuthenticationError, UnifiedAuthMiddleware, _scopes_for_groups
+from registry.middleware.rbac import ScopePermissionMiddleware
+
+_original_has_permission = ScopePermissionMiddleware._has_permission
+
+
+@pytest.fixture(autouse=True)
+def restore_rbac(monkeypatch):
+    """Restore original RBAC behavior for these tests."""
+    monkeypatch.setattr(ScopePermissionMiddleware, "_has_permission", _original_has_permission)
+    yield
+
+
+@pytest.fixture
+def scopes_settings(monkeypatch):
+    from registry.middleware import rbac as rbac_module
+
+    mock_settings = MagicMock()
+    mock_settings.api_version = "v1"
+    mock_settings.scopes_config = {
+        "servers-read": [{"endpoint": "/servers", "method": "GET"}],
+        "mcp-proxy-ops": [{"endpoint": "/proxy/{full_path:path}", "method": "*"}],
+    }
+    monkeypatch.setattr(rbac_module, "settings", mock_settings)
+    return mock_settings
+
+
+def _authenticate_as(monkeypatch, scopes):
+    async def authenticate(self, request):
+        if "authorization" not in request.headers:
+            raise AuthenticationError("JWT or session authentication required")
+        return {"username": "alice", "groups": [], "scopes": scopes, "auth_source": "jwt_auth"}
+
+    monkeypatch.setattr(UnifiedAuthMiddleware, "_authenticate", authenticate)
+
+
+def _build_app(events=None):
+    app = FastAPI()
+
+    @app.get("/health")
+    def health():
+        return {"status": "ok"}
+
+    @app.get("/servers")
+    def list_servers():
+        return {"servers": []}
+
+    @app.get("/proxy/{server}/mcp")
+    def stream(server: str):
+        def chunks():
+            for index in range(3):
+                if events is not None:
+                    events.append(f"produced-{index}")
+                yield f"event-{index}\n"
+
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    app.add_middleware(UnifiedAuthMiddleware, enforce_scopes=True)
+    return app
+
+
+@pytest.mark.unit
+@pytest.mark.auth
+class TestUnifiedAuthMiddleware:
+    """Test suite for UnifiedAuthMiddleware with inline scope enforcement."""
+
+    def test_public_path_skips_authentication(self, monkeypatch, scopes_settings):
+        _authenticate_as(monkeypatch, [])
+
+        response = TestClient(_build_app()).get("/health")
+
+        assert response.status_code == 200
+
+    def test_unauthenticated_proxy_request_gets_resource_metadata(self, monkeypatch, scopes_settings):
+        _authenticate_as(monkeypatch, ["mcp-proxy-ops"])
+
+        response = TestClient(_build_app()).get("/proxy/github/mcp")
+
+        assert response.status_code == 401
+        assert "oauth-protected-resource/proxy/github" in response.headers["WWW-Authenticate"]
+
+    def test_scopes_are_enforced_after_authentication(self, monkeypatch, scopes_settings):
+        _authenticate_as(monkeypatch, ["servers-read"])
+        client = TestClient(_build_app(), headers={"Authorization": "Bearer token"})
+
+        assert client.get("/servers").status_code == 200
+        assert client.get("/proxy/github/mcp").status_code == 403
+
+    async def test_streaming_response_is_not_buffered(self, monkeypatch, scopes_settings):
+        _authenticate_as(monkeypatch, ["mcp-proxy-ops"])
+        events = []
+        app = _build_app(events)
+        messages = []
+
+        requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+        async def receive():
+            if requests:
+                return requests.pop()
+            await asyncio.Event().wait()  # the client stays connected
+
+        async def send(message):
+            messages.append(message)
+            if message["type"] == "http.response.body" and message["body"]:
+                events.append(f"sent-{message['body'].decode().strip()}")
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/proxy/github/mcp",
+            "raw_path": b"/proxy/github/mcp",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"authorization", b"Bearer token")],
+            "client": ("127.0.0.1", 1),
+            "server": ("testserver", 80),
+        }
+        await app(scope, receive, send)
+
+        assert messages[0]["status"] == 200
+        # Each chunk reaches the client before the next one is produced.
+        assert events == ["produced-0", "sent-event-0", "produced-1", "sent-event-1", "produced-2", "sent-event-2"]
+
+    def test_group_scope_mapping_is_cached(self, monkeypatch):
+        from registry.middleware import auth as auth_module
+
+        calls = []
+
+        def map_groups(groups, config):
+            calls.append(list(groups))
+            return ["servers-read"]
+
+        monkeypatch.setattr(auth_module, "map_groups_to_scopes", map_groups)
+        _scopes_for_groups.cache_clear()
+
+        assert auth_module._map_groups_to_scopes(["team-a"]) == ["servers-read"]
+        assert auth_module._map_groups_to_scopes(["team-a"]) == ["servers-read"]
+        _scopes_for_groups.cache_clear()
+
+        assert calls == [["team-a"]]
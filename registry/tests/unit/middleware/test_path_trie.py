@@ -0,0 +1,74 @@
+"""
+Unit tests for the path trie (registry/src/registry/middleware/path_trie.py).
+"""
+
+import pytest
+from starlette.routing import compile_path
+
+from registry.middleware.path_trie import PathTrie
+
+PATTERNS = [
+    "/",
+    "/servers",
+    "/servers/stats",
+    "/servers/{server_id}",
+    "/servers/{server_id}/tools",
+    "/agents/{path:path}",
+    "/proxy/{full_path:path}",
+    "/static/{path:path}",
+    "/items/{item_id:int}",
+    "/files/{name}.json",
+    "/a/{rest:path}/b",
+    "/{anything:path}",
+]
+
+PATHS = [
+    "",
+    "/",
+    "/servers",
+    "/servers/",
+    "/servers/stats",
+    "/servers/abc123",
+    "/servers/abc123/tools",
+    "/servers/abc123/tools/x",
+    "/agents",
+    "/agents/",
+    "/agents/foo/bar/baz",
+    "/proxy/github/mcp",
+    "/items/42",
+    "/items/forty-two",
+    "/files/report.json",
+    "/a/x/y/b",
+    "//servers",
+    "servers",
+]
+
+
+@pytest.mark.unit
+class TestPathTrie:
+    """Test suite for PathTrie."""
+
+    @pytest.mark.parametrize("path", PATHS)
+    def test_matches_exactly_what_starlette_matches(self, path):
+        trie: PathTrie[str] = PathTrie()
+        for pattern in PATTERNS:
+            trie.add(pattern, pattern)
+
+        expected = {pattern for pattern in PATTERNS if compile_path(pattern)[0].match(path)}
+
+        assert set(trie.match(path)) == expected
+
+    def test_len_counts_all_patterns(self):
+        trie: PathTrie[str] = PathTrie()
+        for pattern in PATTERNS:
+            trie.add(pattern, pattern)
+
+        assert len(trie) == len(PATTERNS)
+
+    def test_matches_is_false_without_a_match(self):
+        trie: PathTrie[int] = PathTrie()
+        trie.add("/health", 1)
+
+        assert trie.matches("/health")
+        assert not trie.matches("/healthz")
+        assert not trie.matches("/health/")
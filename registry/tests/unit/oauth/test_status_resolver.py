@@ -0,0 +1,81 @@
+"""
+Unit tests for bulk connection status resolution.
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from registry.schemas.enums import ConnectionState
+from registry.services.oauth.status_resolver import ConnectionStateContext, ConnectionStatusResolver
+
+
+def _context(server_id: str, *, is_oauth_server: bool = True, connection=None) -> ConnectionStateContext:
+    return ConnectionStateContext(
+        user_id="user-1",
+        server_name=f"name-{server_id}",
+        server_id=server_id,
+        server_config={},
+        connection=connection,
+        is_oauth_server=is_oauth_server,
+    )
+
+
+def _connected():
+    connection = Mock()
+    connection.is_stale.return_value = False
+    connection.connection_state = ConnectionState.CONNECTED
+    return connection
+
+
+@pytest.fixture
+def reconnection_manager():
+    manager = Mock()
+    manager.is_reconnecting = Mock(return_value=False)
+    manager.get_oauth_state_overrides = AsyncMock(return_value={})
+    return manager
+
+
+@pytest.mark.unit
+class TestResolveStatuses:
+    """Test suite for ConnectionStatusResolver.resolve_statuses."""
+
+    async def test_flow_state_is_fetched_once_for_all_disconnected_oauth_servers(self, reconnection_manager):
+        reconnection_manager.get_oauth_state_overrides.return_value = {"s1": "active", "s2": "failed", "s3": None}
+        resolver = ConnectionStatusResolver(reconnection_manager=reconnection_manager)
+        contexts = [_context("s1"), _context("s2"), _context("s3"), _context("s4", connection=_connected())]
+
+        statuses = await resolver.resolve_statuses(contexts)
+
+        assert [status["connection_state"] for status in statuses] == [
+            ConnectionState.CONNECTING.value,
+            ConnectionState.ERROR.value,
+            ConnectionState.DISCONNECTED.value,
+            ConnectionState.CONNECTED.value,
+        ]
+        reconnection_manager.get_oauth_state_overrides.assert_awaited_once_with("user-1", ["s1", "s2", "s3"])
+
+    async def test_reconnecting_servers_skip_the_flow_lookup(self, reconnection_manager):
+        reconnection_manager.is_reconnecting.side_effect = lambda user_id, server_id: server_id == "s1"
+        resolver = ConnectionStatusResolver(reconnection_manager=reconnection_manager)
+
+        statuses = await resolver.resolve_statuses([_context("s1"), _context("s2")])
+
+        assert statuses[0]["connection_state"] == ConnectionState.CONNECTING.value
+        reconnection_manager.get_oauth_state_overrides.assert_awaited_once_with("user-1", ["s2"])
+
+    async def test_non_oauth_servers_are_not_overridden(self, reconnection_manager):
+        resolver = ConnectionStatusResolver(reconnection_manager=reconnection_manager)
+
+        statuses = await resolver.resolve_statuses([_context("s1", is_oauth_server=False)])
+
+        assert statuses == [{"requires_oauth": False, "connection_state": ConnectionState.DISCONNECTED.value}]
+        reconnection_manager.get_oauth_state_overrides.assert_not_awaited()
+
+    async def test_lookup_failure_keeps_base_state(self, reconnection_manager):
+        reconnection_manager.get_oauth_state_overrides.side_effect = Exception("redis down")
+        resolver = ConnectionStatusResolver(reconnection_manager=reconnection_manager)
+
+        statuses = await resolver.resolve_statuses([_context("s1")])
+
+        assert statuses[0]["connection_state"] == ConnectionState.DISCONNECTED.value
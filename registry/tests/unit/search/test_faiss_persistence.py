@@ -0,0 +1,562 @@
+"""
+Unit tests for index bookkeeping and write-behind persistence of the embedded FAISS service.
+"""
+
+import asyncio
+import json
+import pickle
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+DIMENSIONS = 4
+
+
+class _FakeIndex:
+    """In-memory stand-in for the faiss indexes the service builds, with just the calls it makes."""
+
+    def __init__(self, d: int, spec: str = "IDMap2,Flat", metric: str = "l2"):
+        self.d = d
+        self.spec = spec
+        self.metric = metric
+        self.is_trained = "IVF" not in spec
+        self.vectors: dict[int, np.ndarray] = {}
+        # index.index.hnsw for HNSW, nprobe for IVF (extract_index_ivf returns the index itself).
+        self.index = SimpleNamespace(hnsw=SimpleNamespace())
+        self.nprobe = None
+
+    @property
+    def ntotal(self) -> int:
+        return len(self.vectors)
+
+    def train(self, x):
+        self.is_trained = True
+
+    def set_direct_map_type(self, kind):
+        pass
+
+    def add_with_ids(self, x, ids):
+        assert self.is_trained, "adding to an untrained index"
+        for vector, faiss_id in zip(x, ids, strict=True):
+            self.vectors[int(faiss_id)] = np.array(vector, dtype=np.float32)
+
+    def remove_ids(self, ids) -> int:
+        if "HNSW" in self.spec:
+            raise RuntimeError("remove_ids not implemented for this type of index")
+        return sum(self.vectors.pop(int(faiss_id), None) is not None for faiss_id in ids)
+
+    def reconstruct_batch(self, ids):
+        return np.array([self.vectors[int(faiss_id)] for faiss_id in ids], dtype=np.float32)
+
+    def _distance(self, vector, query) -> float:
+        if self.metric == "ip":
+            return -float(vector @ query)
+        return float(((vector - query) ** 2).sum())
+
+    def search(self, x, k):
+        self.last_k = k
+        ranked = sorted(self.vectors.items(), key=lambda item: self._distance(item[1], x[0]))[:k]
+        distances = [self._distance(vector, x[0]) for _, vector in ranked]
+        if self.metric == "ip":
+            distances = [-distance for distance in distances]
+        ids = [faiss_id for faiss_id, _ in ranked]
+        return np.array([distances], dtype=np.float32), np.array([ids], dtype=np.int64)
+
+
+class _FakeFaiss:
+    METRIC_L2 = "l2"
+    METRIC_INNER_PRODUCT = "ip"
+    DirectMap = SimpleNamespace(Hashtable="hashtable")
+
+    @staticmethod
+    def index_factory(d, spec, metric):
+        return _FakeIndex(d, spec, metric)
+
+    @staticmethod
+    def downcast_index(index):
+        return index
+
+    @staticmethod
+    def extract_index_ivf(index):
+        return index
+
+    @staticmethod
+    def normalize_L2(x):
+        x /= np.linalg.norm(x, axis=1, keepdims=True)
+
+    @staticmethod
+    def serialize_index(index):
+        vectors = {faiss_id: vector.tolist() for faiss_id, vector in index.vectors.items()}
+        return np.frombuffer(pickle.dumps((index.d, index.spec, index.metric, vectors)), dtype=np.uint8)
+
+    @staticmethod
+    def read_index(path):
+        with open(path, "rb") as f:
+            d, spec, metric, vectors = pickle.load(f)
+        index = _FakeIndex(d, spec, metric)
+        index.is_trained = True
+        index.vectors = {faiss_id: np.array(vector, dtype=np.float32) for faiss_id, vector in vectors.items()}
+        return index
+
+
+class _FakeModel:
+    def __init__(self):
+        self.batches: list[int] = []
+
+    def encode(self, texts):
+        self.batches.append(len(texts))
+        return np.array([[float(len(text)), 1.0, 2.0, 3.0] for text in texts], dtype=np.float32)
+
+
+@pytest.fixture
+def make_service(tmp_path):
+    # Imported here rather than at module level: test_faiss_service.py swaps faiss and numpy for
+    # mocks in sys.modules, and this module must keep the real numpy it imported above.
+    from registry.services.search.embedded_service import EmbeddedFaissService
+
+    def _make(**overrides) -> EmbeddedFaissService:
+        settings = SimpleNamespace(
+            servers_dir=tmp_path,
+            local_embeddings_model_dimensions=DIMENSIONS,
+            faiss_index_path=tmp_path / "service_index.faiss",
+            faiss_metadata_path=tmp_path / "service_index_metadata.json",
+            faiss_journal_path=tmp_path / "service_index_metadata.journal",
+            faiss_flush_interval_seconds=3600,
+            faiss_flush_max_pending=1000,
+            faiss_journal_compact_threshold=1000,
+            faiss_search_overfetch_factor=2,
+            faiss_index_type="flat",
+            faiss_metric="l2",
+            faiss_hnsw_m=8,
+            faiss_hnsw_ef_construction=40,
+            faiss_hnsw_ef_search=16,
+            faiss_ivf_nlist=3,
+            faiss_ivf_nprobe=2,
+            faiss_pq_m=2,
+            faiss_pq_nbits=1,
+            faiss_tool_index_path=tmp_path / "tool_index.faiss",
+            faiss_tool_keyword_boost=0.1,
+            vector_index_batch_size=64,
+            vector_index_max_concurrency=2,
+        )
+        for key, value in overrides.items():
+            setattr(settings, key, value)
+        service = EmbeddedFaissService(settings)
+        service.embedding_model = _FakeModel()
+        return service
+
+    with (
+        patch("registry.services.search.embedded_service.FAISS_AVAILABLE", True),
+        patch("registry.services.search.embedded_service.faiss", _FakeFaiss),
+        patch("registry.services.search.embedded_service.np", np),
+    ):
+        yield _make
+
+
+async def _restart(make_service, **overrides):
+    service = make_service(**overrides)
+    await service._load_faiss_data()
+    return service
+
+
+@pytest.mark.unit
+@pytest.mark.search
+class TestFaissPersistence:
+    """Test suite for the FAISS journal and snapshots."""
+
+    async def test_changes_are_journaled_not_snapshotted(self, make_service, tmp_path):
+        service = await _restart(make_service)
+        for i in range(5):
+            await service.add_or_update_service(f"/server-{i}", {"server_name": f"server {i}"})
+
+        assert not (tmp_path / "service_index.faiss").exists()
+        await service.flush()
+
+        assert not (tmp_path / "service_index.faiss").exists()
+        assert len((tmp_path / "service_index_metadata.journal").read_text().splitlines()) == 5
+
+    async def test_restart_replays_journal(self, make_service):
+        service = await _restart(make_service)
+        await service.add_or_update_service("/a", {"server_name": "a"})
+        await service.add_or_update_service("/b", {"server_name": "b"})
+        await service.remove_service("/a")
+        await service.flush()
+
+        restarted = await _restart(make_service)
+
+        assert list(restarted.metadata_store) == ["/b"]
+        assert restarted.next_id_counter == 2
+        b_id = restarted.metadata_store["/b"]["id"]
+        assert restarted.faiss_index.vectors[b_id].tolist() == service.faiss_index.vectors[b_id].tolist()
+
+    async def test_journal_is_compacted_into_snapshot(self, make_service, tmp_path):
+        service = await _restart(make_service, faiss_journal_compact_threshold=3)
+        for i in range(3):
+            await service.add_or_update_service(f"/server-{i}", {"server_name": f"server {i}"})
+        await service.flush()
+
+        assert (tmp_path / "service_index.faiss").exists()
+        assert not (tmp_path / "service_index_metadata.journal").exists()
+        assert not list(tmp_path.glob("*.tmp"))
+
+        restarted = await _restart(make_service)
+        assert sorted(restarted.metadata_store) == ["/server-0", "/server-1", "/server-2"]
+        assert restarted.faiss_index.ntotal == 3
+
+    async def test_torn_journal_tail_is_ignored(self, make_service, tmp_path):
+        service = await _restart(make_service)
+        await service.add_or_update_service("/a", {"server_name": "a"})
+        await service.flush()
+        with open(tmp_path / "service_index_metadata.journal", "a") as f:
+            f.write('{"op":"put","path":"/b","ent')
+
+        restarted = await _restart(make_service)
+
+        assert list(restarted.metadata_store) == ["/a"]
+
+    async def test_pending_limit_flushes_immediately(self, make_service, tmp_path):
+        service = await _restart(make_service, faiss_flush_max_pending=2)
+        await service.add_or_update_service("/a", {"server_name": "a"})
+        assert not (tmp_path / "service_index_metadata.journal").exists()
+
+        await service.add_or_update_service("/b", {"server_name": "b"})
+
+        assert service._dirty == {}
+        assert len((tmp_path / "service_index_metadata.journal").read_text().splitlines()) == 2
+
+    async def test_cleanup_writes_final_snapshot(self, make_service, tmp_path):
+        service = await _restart(make_service)
+        await service.add_or_update_service("/a", {"server_name": "a"})
+
+        await service.cleanup()
+
+        assert not (tmp_path / "service_index_metadata.journal").exists()
+        restarted = await _restart(make_service)
+        assert list(restarted.metadata_store) == ["/a"]
+        assert restarted.faiss_index.ntotal == 1
+
+
+@pytest.mark.unit
+@pytest.mark.search
+class TestFaissIdMap:
+    """Test suite for id-to-path resolution and vector removal."""
+
+    async def test_removed_service_is_not_returned_before_compaction(self, make_service):
+        service = await _restart(make_service)
+        for path in ["/a", "/bb", "/ccc", "/dddd"]:
+            await service.add_or_update_service(path, {"server_name": path.strip("/")})
+        await service.remove_service("/a")
+
+        assert service.faiss_index.ntotal == 4
+        results = await service.search(query="a", top_k=1)
+
+        assert [result["service_path"] for result in results] == ["/bb"]
+        # Over-fetched by the configured factor, plus one for the removed id still in the index.
+        assert service.faiss_index.last_k == 3
+
+    async def test_flush_removes_deleted_vectors(self, make_service):
+        service = await _restart(make_service)
+        await service.add_or_update_service("/a", {"server_name": "a"})
+        await service.add_or_update_service("/b", {"server_name": "b"})
+        await service.remove_service("/a")
+
+        await service.flush(snapshot=True)
+
+        assert service.faiss_index.ntotal == 1
+        restarted = await _restart(make_service)
+        assert restarted.faiss_index.ntotal == 1
+        assert restarted._id_to_path == {restarted.metadata_store["/b"]["id"]: "/b"}
+
+    async def test_readded_service_does_not_leave_orphan_vector(self, make_service):
+        service = await _restart(make_service)
+        await service.add_or_update_service("/a", {"server_name": "a"})
+        await service.flush(snapshot=True)
+
+        await service.remove_service("/a")
+        await service.add_or_update_service("/a", {"server_name": "a"})
+        await service.flush()
+
+        restarted = await _restart(make_service)
+        assert restarted.faiss_index.ntotal == 1
+        assert restarted.metadata_store["/a"]["id"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.search
+class TestFaissIndexModes:
+    """Test suite for index types, metrics and migration between them."""
+
+    async def test_cosine_normalizes_vectors_and_scores_similarity(self, make_service):
+        service = await _restart(make_service, faiss_metric="cosine")
+        await service.add_or_update_service("/a", {"server_name": "a"})
+        await service.add_or_update_service("/bbbbbbbb", {"server_name": "bbbbbbbb"})
+
+        assert service.faiss_index.metric == "ip"
+        for vector in service.faiss_index.vectors.values():
+            assert abs(float(np.linalg.norm(vector)) - 1.0) < 1e-6
+
+        results = await service.search(query=service._get_text_for_embedding({"server_name": "a"}), top_k=2)
+
+        assert results[0]["service_path"] == "/a"
+        assert abs(results[0]["score"] - 1.0) < 1e-6
+        assert 0.0 <= results[1]["score"] < 1.0
+
+    async def test_ivf_stays_flat_until_trainable(self, make_service):
+        service = await _restart(make_service, faiss_index_type="ivf_flat")
+        await service.add_or_update_service("/a", {"server_name": "a"})
+        await service.add_or_update_service("/b", {"server_name": "b"})
+        await service.flush()
+        assert service.faiss_index.spec == "IDMap2,Flat"
+
+        await service.add_or_update_service("/c", {"server_name": "c"})
+        await service.flush()
+
+        assert service.faiss_index.spec == "IVF3,Flat"
+        assert service.faiss_index.nprobe == 2
+        assert service.faiss_index.ntotal == 3
+        restarted = await _restart(make_service, faiss_index_type="ivf_flat")
+        assert restarted._index_config == {"type": "ivf_flat", "metric": "l2", "nlist": 3}
+        assert restarted.faiss_index.ntotal == 3
+
+    async def test_changed_settings_migrate_existing_index(self, make_service, tmp_path):
+        service = await _restart(make_service)
+        await service.add_or_update_service("/a", {"server_name": "a"})
+        await service.add_or_update_service("/b", {"server_name": "b"})
+        await service.cleanup()
+
+        restarted = await _restart(make_service, faiss_index_type="hnsw")
+
+        assert restarted.faiss_index.spec == "IDMap2,HNSW8"
+        assert restarted.faiss_index.index.hnsw.efSearch == 16
+        assert sorted(restarted.faiss_index.vectors) == sorted(
+            entry["id"] for entry in restarted.metadata_store.values()
+        )
+        # The migrated index is snapshotted so the next start does not rebuild again.
+        again = await _restart(make_service, faiss_index_type="hnsw")
+        assert again._index_config["type"] == "hnsw"
+
+    async def test_hnsw_updates_are_tombstoned_and_rebuilt(self, make_service):
+        service = await _restart(make_service, faiss_index_type="hnsw")
+        await service.add_or_update_service("/a", {"server_name": "a"})
+        await service.add_or_update_service("/b", {"server_name": "b"})
+
+        await service.add_or_update_service("/a", {"server_name": "a", "description": "changed"})
+
+        new_id = service.metadata_store["/a"]["id"]
+        assert new_id == 2
+        assert service._deleted_ids == {0}
+        results = await service.search(query="a", top_k=3)
+        assert sorted(result["service_path"] for result in results) == ["/a", "/b"]
+
+        await service.flush()
+
+        assert sorted(service.faiss_index.vectors) == [1, 2]
+        assert service._deleted_ids == set()
+
+    async def test_rebuild_builds_outside_the_lock_and_replays_new_vectors(self, make_service):
+        service = await _restart(make_service)
+        await service.add_or_update_service("/a", {"server_name": "a"})
+        building, release = threading.Event(), threading.Event()
+        build_index = service._build_index
+
+        def slow_build(*args):
+            building.set()
+            release.wait(5)
+            return build_index(*args)
+
+        service._build_index = slow_build
+        rebuild = asyncio.create_task(
+            service._rebuild_index({"type": "hnsw", "metric": "l2", "m": 8, "ef_construction": 40})
+        )
+        await asyncio.to_thread(building.wait, 5)
+
+        # Searches and writes go on while the new index is being built.
+        results = await asyncio.wait_for(service.search(query="a", top_k=1), 1)
+        assert [result["service_path"] for result in results] == ["/a"]
+        await asyncio.wait_for(service.add_or_update_service("/b", {"server_name": "b"}), 1)
+        release.set()
+
+        assert await rebuild is True
+        assert service.faiss_index.spec == "IDMap2,HNSW8"
+        assert sorted(service.faiss_index.vectors) == sorted(entry["id"] for entry in service.metadata_store.values())
+
+    async def test_writer_waits_for_running_searches(self):
+        from registry.services.search.embedded_service import _ReadWriteLock
+
+        lock = _ReadWriteLock()
+        events = []
+
+        async def write():
+            async with lock.write():
+                events.append("write")
+
+        async with lock.read():
+            writer = asyncio.create_task(write())
+            await asyncio.sleep(0)
+            events.append("read done")
+        await writer
+
+        assert events == ["read done", "write"]
+
+
+WEATHER_SERVER = {
+    "server_name": "weather",
+    "tool_list": [
+        {"name": "get_weather", "parsed_description": {"main": "Current weather for a city", "args": "city: str"}},
+        {"name": "get_forecast", "parsed_description": {"main": "Five day forecast", "args": "city: str"}},
+    ],
+    "resources": [{"name": "stations", "uri": "weather://stations", "description": "Known weather stations"}],
+    "prompts": [{"name": "summarize", "description": "Summarize the weather", "arguments": [{"name": "city"}]}],
+}
+
+
+@pytest.mark.unit
+@pytest.mark.search
+class TestFaissToolIndex:
+    """Test suite for tool-level vectors and the inverted keyword index."""
+
+    async def test_tools_resources_and_prompts_get_vectors(self, make_service):
+        service = await _restart(make_service)
+        await service.add_or_update_service("/weather", WEATHER_SERVER)
+
+        tool_ids = service.metadata_store["/weather"]["tool_ids"]
+        assert service.tool_index.ntotal == 4
+        assert [service.tool_store[tool_id]["kind"] for tool_id in tool_ids] == ["tool", "tool", "resource", "prompt"]
+        assert {service.tool_store[tool_id]["server_path"] for tool_id in tool_ids} == {"/weather"}
+
+    async def test_tools_are_ranked_by_vector_similarity(self, make_service):
+        service = await _restart(make_service, faiss_tool_keyword_boost=0)
+        await service.add_or_update_service("/weather", WEATHER_SERVER)
+        forecast = next(tool for tool in service.tool_store.values() if tool["tool_name"] == "get_forecast")
+
+        results = await service.search_mixed(query=forecast["text"], entity_types=["tool", "mcp_server"])
+
+        assert results["tools"][0]["tool_name"] == "get_forecast"
+        assert results["tools"][0]["server_name"] == "weather"
+        assert results["tools"][0]["relevance_score"] == 1.0
+        assert results["servers"][0]["matching_tools"][0]["tool_name"] == "get_forecast"
+        assert service._keyword_index == {}
+
+    async def test_exact_terms_boost_tools(self, make_service):
+        service = await _restart(make_service)
+        await service.add_or_update_service("/weather", WEATHER_SERVER)
+        forecast_id = next(i for i, tool in service.tool_store.items() if tool["tool_name"] == "get_forecast")
+
+        boosts = service._keyword_boosts("forecast please")
+
+        assert boosts == {forecast_id: 0.05}
+
+    async def test_changed_tools_are_reembedded_and_compacted(self, make_service):
+        service = await _restart(make_service)
+        await service.add_or_update_service("/weather", WEATHER_SERVER)
+        changed = {**WEATHER_SERVER, "tool_list": WEATHER_SERVER["tool_list"][:1], "resources": [], "prompts": []}
+
+        await service.add_or_update_service("/weather", changed)
+
+        assert service.metadata_store["/weather"]["tool_ids"] == [4]
+        assert "get" in service._keyword_index and "forecast" not in service._keyword_index
+        await service.flush()
+        assert sorted(service.tool_index.vectors) == [4]
+
+        await service.remove_service("/weather")
+        await service.flush()
+        assert service.tool_index.ntotal == 0
+        assert service.tool_store == {}
+
+    async def test_tools_survive_restart(self, make_service):
+        service = await _restart(make_service)
+        await service.add_or_update_service("/weather", WEATHER_SERVER)
+        await service.flush()
+
+        replayed = await _restart(make_service)
+        assert replayed.tool_store == service.tool_store
+        assert replayed.tool_index.ntotal == 4
+
+        await replayed.cleanup()
+        snapshotted = await _restart(make_service)
+        assert snapshotted.tool_store == service.tool_store
+        assert snapshotted.next_tool_id == 4
+
+    async def test_snapshot_without_tools_is_backfilled(self, make_service, tmp_path):
+        service = await _restart(make_service)
+        await service.add_or_update_service("/weather", WEATHER_SERVER)
+        await service.cleanup()
+        metadata_path = tmp_path / "service_index_metadata.json"
+        payload = json.loads(metadata_path.read_text())
+        for key in ("tools", "next_tool_id", "deleted_tool_ids", "tool_index_config"):
+            payload.pop(key)
+        for entry in payload["metadata"].values():
+            entry.pop("tool_ids")
+        metadata_path.write_text(json.dumps(payload))
+        (tmp_path / "tool_index.faiss").unlink()
+
+        restarted = await _restart(make_service)
+
+        assert restarted.tool_index.ntotal == 4
+        assert (tmp_path / "tool_index.faiss").exists()
+
+
+@pytest.mark.unit
+@pytest.mark.search
+class TestFaissBulkIndexing:
+    """Test suite for add_or_update_many."""
+
+    async def test_texts_are_embedded_in_batches(self, make_service):
+        service = await _restart(make_service, vector_index_batch_size=3)
+        calls = []
+        original_add = service.faiss_index.add_with_ids
+        service.faiss_index.add_with_ids = lambda x, ids: (calls.append(len(ids)), original_add(x, ids))
+
+        await service.add_or_update_many(
+            [("/weather", WEATHER_SERVER, True), ("/other", {"server_name": "other"}, False)]
+        )
+
+        # 2 server texts and 4 tool texts, 3 per encode call
+        assert service.embedding_model.batches == [3, 3]
+        assert calls == [2]
+        assert service.tool_index.ntotal == 4
+        assert service.metadata_store["/weather"]["full_server_info"]["is_enabled"] is True
+
+    async def test_failed_batch_skips_only_its_services(self, make_service):
+        service = await _restart(make_service, vector_index_batch_size=1)
+        encode = service.embedding_model.encode
+
+        def flaky_encode(texts):
+            if texts[0].startswith("Name: broken"):
+                raise RuntimeError("provider error")
+            return encode(texts)
+
+        service.embedding_model.encode = flaky_encode
+
+        await service.add_or_update_many(
+            [("/ok", {"server_name": "ok"}, True), ("/broken", {"server_name": "broken"}, True)]
+        )
+
+        assert list(service.metadata_store) == ["/ok"]
+        assert service.faiss_index.ntotal == 1
+
+    async def test_unchanged_services_are_not_reembedded(self, make_service):
+        service = await _restart(make_service)
+        await service.add_or_update_many([("/weather", WEATHER_SERVER, True)])
+        service.embedding_model.batches.clear()
+
+        await service.add_or_update_many([("/weather", WEATHER_SERVER, False)])
+
+        assert service.embedding_model.batches == []
+        assert service.metadata_store["/weather"]["full_server_info"]["is_enabled"] is False
+
+    async def test_entries_without_hashes_are_compared_by_text(self, make_service):
+        service = await _restart(make_service)
+        await service.add_or_update_many([("/weather", WEATHER_SERVER, True)])
+        entry = service.metadata_store["/weather"]
+        content_hash, tools_hash = entry.pop("content_hash"), entry.pop("tools_hash")
+        service.embedding_model.batches.clear()
+
+        await service.add_or_update_many([("/weather", WEATHER_SERVER, False)])
+
+        assert service.embedding_model.batches == []
+        assert service.metadata_store["/weather"]["content_hash"] == content_hash
+        assert service._stored_tools_hash(service.metadata_store["/weather"]) == tools_hash
@@ -42,6 +42,19 @@ class TestFaissService:
         mock_settings.local_embeddings_model_dimensions = 384
         mock_settings.faiss_index_path = Path("/tmp/test_index.faiss")
         mock_settings.faiss_metadata_path = Path("/tmp/test_metadata.json")
+        mock_settings.faiss_journal_path = Path("/tmp/test_metadata.journal")
+        mock_settings.faiss_flush_interval_seconds = 3600
+        mock_settings.faiss_flush_max_pending = 1000
+        mock_settings.faiss_journal_compact_threshold = 1000
+        mock_settings.faiss_search_overfetch_factor = 2
+        mock_settings.faiss_index_type = "flat"
+        mock_settings.faiss_metric = "l2"
+        mock_settings.faiss_hnsw_ef_search = 64
+        mock_settings.faiss_ivf_nprobe = 16
+        mock_settings.faiss_tool_keyword_boost = 0.1
+        mock_settings.vector_index_batch_size = 64
+        mock_settings.vector_index_max_concurrency = 2
+        mock_settings.faiss_tool_index_path = Path("/tmp/test_tool_index.faiss")
         return mock_settings
 
     @pytest.fixture
@@ -233,6 +246,7 @@ class TestFaissService:
         with (
             patch("registry.services.search.embedded_service.faiss", mock_faiss),
             patch("builtins.open", create=True) as mock_open,
+            patch("registry.services.search.embedded_service.os") as mock_os,
         ):
             # Setup service state
             mock_index = Mock()
@@ -240,14 +254,18 @@ class TestFaissService:
             faiss_service_instance.faiss_index = mock_index
             faiss_service_instance.metadata_store = {"test": "data"}
             faiss_service_instance.next_id_counter = 10
+            faiss_service_instance._journal_records = 3
 
             mock_file = Mock()
             mock_open.return_value.__enter__.return_value = mock_file
 
             await faiss_service_instance._save_data()
 
-            mock_faiss.write_index.assert_called_once()
+            mock_faiss.serialize_index.assert_called_once_with(mock_index)
             mock_file.write.assert_called()
+            # Both files are written to a temporary sibling and renamed into place
+            assert mock_os.replace.call_count == 2
+            assert faiss_service_instance._journal_records == 0
 
     @pytest.mark.asyncio
     async def test_save_data_no_index(self, faiss_service_instance, mock_settings):
@@ -260,9 +278,10 @@ class TestFaissService:
     @pytest.mark.asyncio
     async def test_save_data_exception(self, faiss_service_instance, mock_settings):
         """Test handling exception during save."""
-        with patch("registry.services.search.embedded_service.faiss", mock_faiss):
-            mock_faiss.write_index.side_effect = Exception("Save failed")
-
+        with (
+            patch("registry.services.search.embedded_service.faiss", mock_faiss),
+            patch.object(mock_faiss, "serialize_index", side_effect=Exception("Save failed")),
+        ):
             mock_index = Mock()
             faiss_service_instance.faiss_index = mock_index
 
@@ -315,8 +334,9 @@ class TestFaissService:
             mock_index.add_with_ids.assert_called_once()
             # Verify asyncio.to_thread was called for encode
             assert mock_to_thread.call_count >= 1
-            # Verify save_data was called
-            mock_save.assert_called_once()
+            # Persistence is write-behind: the change is queued, not saved inline
+            mock_save.assert_not_called()
+            assert "new_service" in faiss_service_instance._dirty
 
     @pytest.mark.asyncio
     async def test_add_or_update_service_existing_no_change(self, faiss_service_instance):
@@ -342,7 +362,8 @@ class TestFaissService:
             await faiss_service_instance.add_or_update_service("existing_service", server_info, True)
 
         # Should update metadata but not re-embed (text hasn't changed, but is_enabled has)
-        mock_save.assert_called_once()
+        mock_save.assert_not_called()
+        assert faiss_service_instance._dirty == {"existing_service": None}
         assert faiss_service_instance.metadata_store["existing_service"]["full_server_info"]["is_enabled"] is True
 
     @pytest.mark.asyncio
@@ -427,21 +448,30 @@ class TestFaissService:
             },
         }
 
-        with (
-            patch("asyncio.to_thread") as mock_to_thread,
-            patch.object(faiss_service_instance, "_extract_matching_tools") as mock_extract_tools,
-        ):
-            # Mock asyncio.to_thread to return the embedding
-            mock_to_thread.return_value = query_embedding
-
-            # Mock _extract_matching_tools to return matching tools
-            mock_extract_tools.return_value = [
-                {
-                    "tool_name": "alpha_tool",
-                    "description": "Alpha tool handles tokens",
-                    "raw_score": 0.8,
-                    "match_context": "Alpha tool handles tokens",
-                }
+        # Tool vectors live in their own index, with back-references to the server
+        mock_tool_index = Mock()
+        mock_tool_index.ntotal = 1
+        faiss_service_instance.tool_index = mock_tool_index
+        faiss_service_instance._store_tool(
+            0,
+            {
+                "server_path": "/demo",
+                "kind": "tool",
+                "tool_name": "alpha_tool",
+                "description": "Alpha tool handles tokens",
+                "match_context": "Alpha tool handles tokens",
+                "text": "Tool: alpha_tool",
+            },
+        )
+        tool_distances = np.array([[0.25]], dtype=np.float32)
+        tool_indices = np.array([[0]], dtype=np.int64)
+
+        with patch("asyncio.to_thread") as mock_to_thread:
+            # Mock asyncio.to_thread to return the embedding, then run the server and tool index searches
+            mock_to_thread.side_effect = [
+                query_embedding,
+                (mock_distances, mock_indices),
+                (tool_distances, tool_indices),
             ]
 
             results = await faiss_service_instance.search_mixed(
@@ -466,7 +496,7 @@ class TestFaissService:
             # If we have servers, verify structure
             if len(results["servers"]) > 0:
                 assert results["servers"][0]["server_name"] == "Demo Server"
-                # matching_tools should be populated since we mocked _extract_matching_tools
+                # matching_tools come from the tool index hits for this server
                 if len(results["servers"][0]["matching_tools"]) > 0:
                     assert results["servers"][0]["matching_tools"][0]["tool_name"] == "alpha_tool"
 
@@ -5,7 +5,7 @@ Unit tests for server service.
 import json
 from pathlib import Path
 from typing import Any
-from unittest.mock import Mock, mock_open, patch
+from unittest.mock import AsyncMock, Mock, mock_open, patch
 
 import pytest
 
@@ -1263,3 +1263,82 @@ class TestHealthCheckEndpointUrlConstruction:
         mock_result.serverInfo = Mock()
         mock_result.serverInfo.name = "test-server"
         return mock_result
+
+
+@pytest.mark.unit
+@pytest.mark.servers
+@pytest.mark.health
+class TestCheckServerHealth:
+    """Test suite for the scheduled probe-first health check."""
+
+    @pytest.fixture
+    def service(self):
+        return ServerServiceV1(user_service=Mock(), token_service=Mock(), oauth_service=Mock(), mcp_server_repo=Mock())
+
+    @pytest.fixture
+    def server(self):
+        from registry_pkgs.models.extended_mcp_server import ExtendedMCPServer as MCPServerDocument
+
+        server = Mock(spec=MCPServerDocument)
+        server.serverName = "test-server"
+        server.config = {"url": "http://localhost:8000/mcp", "type": "streamable-http"}
+        server.status = "active"
+        server.healthFingerprint = "fp-1"
+        server.save = AsyncMock()
+        return server
+
+    def _patch_probe(self, result):
+        return (
+            patch(
+                "registry.services.server_service.build_complete_headers_for_server",
+                AsyncMock(return_value={}),
+            ),
+            patch("registry.services.server_service.probe_mcp_server", AsyncMock(return_value=result)),
+        )
+
+    async def test_unchanged_healthy_server_is_not_written(self, service, server):
+        from registry.core.mcp_client import MCPProbeResult
+
+        headers_patch, probe_patch = self._patch_probe(MCPProbeResult(True, "healthy", 5, "fp-1"))
+        with headers_patch, probe_patch, patch.object(service, "_refresh_server", AsyncMock()) as refresh:
+            assert await service.check_server_health(server, timeout=2) == (True, "healthy")
+
+        refresh.assert_not_awaited()
+        server.save.assert_not_awaited()
+
+    async def test_fingerprint_change_triggers_full_refresh(self, service, server):
+        from registry.core.mcp_client import MCPProbeResult
+
+        refreshed = {"status": "healthy", "status_message": "healthy (retrieved 3 tools)"}
+        headers_patch, probe_patch = self._patch_probe(MCPProbeResult(True, "healthy", 5, "fp-2"))
+        with (
+            headers_patch,
+            probe_patch,
+            patch.object(service, "_refresh_server", AsyncMock(return_value=refreshed)) as refresh,
+        ):
+            assert await service.check_server_health(server, timeout=2) == (True, "healthy (retrieved 3 tools)")
+
+        refresh.assert_awaited_once_with(server, fingerprint="fp-2")
+
+    async def test_failure_is_written_once(self, service, server):
+        from registry.core.mcp_client import MCPProbeResult
+
+        headers_patch, probe_patch = self._patch_probe(MCPProbeResult(False, "unhealthy: timeout", 2000))
+        with headers_patch, probe_patch:
+            assert await service.check_server_health(server, timeout=2) == (False, "unhealthy: timeout")
+            assert server.status == "error"
+            assert await service.check_server_health(server, timeout=2) == (False, "unhealthy: timeout")
+
+        server.save.assert_awaited_once()
+
+    async def test_recovery_is_written(self, service, server):
+        from registry.core.mcp_client import MCPProbeResult
+
+        server.status = "error"
+        headers_patch, probe_patch = self._patch_probe(MCPProbeResult(True, "healthy", 5, "fp-1"))
+        with headers_patch, probe_patch:
+            assert await service.check_server_health(server, timeout=2) == (True, "healthy")
+
+        assert server.status == "active"
+        assert server.errorMessage is None
+        server.save.assert_awaited_once()
@@ -230,6 +230,46 @@ class TestACLService:
         )
         assert perms == ResourcePermissions()
 
+    @pytest.mark.asyncio
+    @patch("registry.services.access_control_service.IAclEntry")
+    async def test_get_user_permissions_for_resources_single_query(self, mock_acl_entry):
+        """Bulk lookup should use one $in query and keep the highest bits per resource."""
+        service = ACLService(user_service=Mock(), group_service=Mock())
+        owned, public, unshared = PydanticObjectId(), PydanticObjectId(), PydanticObjectId()
+        entries = [
+            MagicMock(resourceId=owned, permBits=RoleBits.VIEWER),
+            MagicMock(resourceId=owned, permBits=RoleBits.OWNER),
+            MagicMock(resourceId=public, permBits=RoleBits.VIEWER),
+        ]
+        mock_acl_entry.find = MagicMock(return_value=MagicMock(to_list=AsyncMock(return_value=entries)))
+
+        perms = await service.get_user_permissions_for_resources(
+            user_id=PydanticObjectId(),
+            resource_type=ResourceType.MCPSERVER.value,
+            resource_ids=[owned, public, unshared],
+        )
+
+        mock_acl_entry.find.assert_called_once()
+        assert mock_acl_entry.find.call_args.args[0]["resourceId"] == {"$in": [owned, public, unshared]}
+        assert perms[owned] == ResourcePermissions(VIEW=True, EDIT=True, DELETE=True, SHARE=True)
+        assert perms[public] == ResourcePermissions(VIEW=True)
+        assert perms[unshared] == ResourcePermissions()
+
+    @pytest.mark.asyncio
+    @patch("registry.services.access_control_service.IAclEntry")
+    async def test_get_user_permissions_for_resources_exception(self, mock_acl_entry):
+        """Exception should return all-False permissions for every resource."""
+        service = ACLService(user_service=Mock(), group_service=Mock())
+        mock_acl_entry.find = MagicMock(side_effect=Exception("db error"))
+        resource_id = PydanticObjectId()
+
+        perms = await service.get_user_permissions_for_resources(
+            user_id=PydanticObjectId(),
+            resource_type=ResourceType.MCPSERVER.value,
+            resource_ids=[resource_id],
+        )
+        assert perms == {resource_id: ResourcePermissions()}
+
     @pytest.mark.asyncio
     @patch("registry.services.access_control_service.IAclEntry")
     async def test_check_user_permission_allowed(self, mock_acl_entry):
@@ -145,6 +145,24 @@ class TestAgentCoreImportService:
         existing.save.assert_awaited_once()
         assert len(repo.synced) == 1
 
+    async def test_updates_leave_vectors_to_the_change_stream(self, service, repo, monkeypatch):
+        service.sync_vectors_inline = False
+        existing = _FakeServer(name="srv-upd", federation_id="fed-upd")
+        existing.id = PydanticObjectId()
+        discovered = _FakeServer(name="srv-upd", federation_id="fed-upd")
+        discovered.federationMetadata["runtimeVersion"] = "2"
+        monkeypatch.setattr(ExtendedMCPServer, "find_one", AsyncMock(return_value=existing))
+
+        result = await service._import_single_server(
+            discovered_server=discovered,
+            owner_id=PydanticObjectId(),
+            viewer_id=None,
+            dry_run=False,
+        )
+
+        assert result["action"] == "updated"
+        assert repo.synced == []
+
     async def test_create_server_uses_server_service_create_server(self, service, repo, monkeypatch):
         discovered = _FakeServer(name="srv-create", federation_id="fed-create")
         owner_id = PydanticObjectId()
@@ -0,0 +1,282 @@
+"""
+Unit tests for the NDJSON bulk import service.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from beanie import PydanticObjectId
+from pymongo import UpdateOne
+
+from registry.schemas.bulk_import_schemas import BulkImportSummary
+from registry.services.bulk_import_service import BulkImportService, read_ndjson
+
+MODULE = "registry.services.bulk_import_service"
+
+
+async def _stream(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def _records(*lines):
+    body = "\n".join(line if isinstance(line, str) else json.dumps(line) for line in lines).encode()
+    async for record in read_ndjson(_stream(body)):
+        yield record
+
+
+async def _collect(results):
+    return [result async for result in results]
+
+
+class FakeCollection:
+    """Stands in for a Beanie document class: find() returns the matching existing documents."""
+
+    def __init__(self, existing=()):
+        self.existing = list(existing)
+        self.queries = []
+        self.bulk_writes = []
+
+    def find(self, query):
+        self.queries.append(query)
+        cursor = MagicMock()
+        cursor.to_list = AsyncMock(return_value=self.existing)
+        return cursor
+
+    def get_pymongo_collection(self):
+        collection = MagicMock()
+        collection.bulk_write = AsyncMock(side_effect=lambda requests, ordered: self.bulk_writes.append(requests))
+        return collection
+
+
+def _server_document(data, server_name, author_id):
+    return SimpleNamespace(
+        id=None,
+        serverName=server_name,
+        path=data.path,
+        compute_vector_hashes=lambda: ("content", "metadata"),
+    )
+
+
+def _agent_document(data, user_id):
+    return SimpleNamespace(id=None, path=data.path, card=SimpleNamespace(name=data.name))
+
+
+@pytest.fixture
+def server_service():
+    service = MagicMock()
+    service.build_server_document = MagicMock(side_effect=_server_document)
+    service.discover_server_capabilities = AsyncMock()
+    return service
+
+
+@pytest.fixture
+def agent_service():
+    service = MagicMock()
+    service.build_agent = AsyncMock(side_effect=_agent_document)
+    return service
+
+
+@pytest.fixture
+def mcp_server_repo():
+    repo = MagicMock()
+    repo.bulk_sync_servers = AsyncMock(return_value=SimpleNamespace(errors=[]))
+    return repo
+
+
+@pytest.fixture
+def bulk_service(server_service, agent_service, mcp_server_repo):
+    user_service = MagicMock()
+    user_service.get_user_by_user_id = AsyncMock(return_value=SimpleNamespace(id="507f1f77bcf86cd799439011"))
+    service = BulkImportService(
+        server_service=server_service,
+        a2a_agent_service=agent_service,
+        acl_service=MagicMock(),
+        user_service=user_service,
+        mcp_server_repo=mcp_server_repo,
+        chunk_size=2,
+    )
+    service._insert_chunk_in_transaction = AsyncMock()
+    return service
+
+
+def _server(title, path=None, url="http://backend:8000/mcp", **fields):
+    return {"title": title, "path": path or f"/{title.lower()}", "url": url, **fields}
+
+
+@pytest.mark.unit
+@pytest.mark.servers
+class TestReadNDJSON:
+    """Test suite for read_ndjson."""
+
+    async def test_splits_lines_across_chunks(self):
+        records = [record async for record in read_ndjson(_stream(b'{"a": 1}\n{"b"', b": 2}\n\n", b'{"c": 3}'))]
+
+        assert [(record.line, record.data) for record in records] == [(1, {"a": 1}), (2, {"b": 2}), (4, {"c": 3})]
+
+    async def test_reports_unparseable_lines(self):
+        records = [record async for record in read_ndjson(_stream(b"not json\n[1, 2]\n"))]
+
+        assert [record.line for record in records] == [1, 2]
+        assert records[0].error.startswith("Invalid JSON")
+        assert records[1].error == "Expected a JSON object"
+
+    async def test_oversized_lines_are_not_buffered(self):
+        body = [b'{"ok": 1}\n', b"x" * 40, b"x" * 40, b'\n{"ok": 2}\n']
+
+        records = [record async for record in read_ndjson(_stream(*body), max_line_bytes=32)]
+
+        assert [(record.line, record.data is not None) for record in records] == [(1, True), (2, False), (3, True)]
+        assert "exceeds 32 bytes" in records[1].error
+
+
+@pytest.mark.unit
+@pytest.mark.servers
+class TestBulkImportServers:
+    """Test suite for BulkImportService.import_servers."""
+
+    async def test_imports_in_chunks_and_keeps_input_order(self, bulk_service, mcp_server_repo):
+        servers = FakeCollection()
+        with patch(f"{MODULE}.ExtendedMCPServer", servers):
+            results = await _collect(
+                await bulk_service.import_servers(
+                    _records(_server("Alpha"), {"path": "/missing-title"}, _server("Beta"), _server("Gamma")),
+                    "user-1",
+                )
+            )
+            await asyncio.gather(*bulk_service._index_tasks)
+
+        summary = results.pop()
+        assert [(result.line, result.status, result.name) for result in results] == [
+            (1, "created", "alpha"),
+            (2, "failed", None),
+            (3, "created", "beta"),
+            (4, "created", "gamma"),
+        ]
+        assert "title" in results[1].error
+        assert isinstance(summary, BulkImportSummary)
+        assert (summary.total, summary.created, summary.failed) == (4, 3, 1)
+        # One duplicate lookup, one insert and one vector sync per chunk of two records
+        assert len(servers.queries) == 2
+        assert bulk_service._insert_chunk_in_transaction.await_count == 2
+        assert mcp_server_repo.bulk_sync_servers.await_count == 2
+
+    async def test_rejects_existing_and_repeated_servers(self, bulk_service):
+        existing = SimpleNamespace(serverName="taken", path="/other", config={"url": "http://elsewhere"})
+        with patch(f"{MODULE}.ExtendedMCPServer", FakeCollection([existing])):
+            results = await _collect(
+                await bulk_service.import_servers(
+                    _records(
+                        _server("Taken"),
+                        _server("Fresh"),
+                        _server("Fresh", path="/fresh-2"),
+                        _server("Other", path="/fresh"),
+                        _server("Copy", path="/copy"),
+                        _server("Copy", path="/copy-2"),
+                    ),
+                    "user-1",
+                )
+            )
+
+        errors = {result.line: result.error for result in results[:-1] if result.status == "failed"}
+        assert errors == {
+            1: "Server with name 'taken' already exists",
+            3: "Server with name 'fresh' already exists",
+            4: "Server with path '/fresh' and URL 'http://backend:8000/mcp' already exists",
+            6: "Duplicate of line 5",
+        }
+
+    async def test_unhealthy_servers_are_not_inserted(self, bulk_service, server_service):
+        async def discover(server, data):
+            if server.serverName == "down":
+                raise ValueError("Server registration rejected: Health check failed - timeout")
+
+        server_service.discover_server_capabilities.side_effect = discover
+        with patch(f"{MODULE}.ExtendedMCPServer", FakeCollection()):
+            results = await _collect(await bulk_service.import_servers(_records(_server("Up"), _server("Down")), "u"))
+
+        assert [result.status for result in results[:-1]] == ["created", "failed"]
+        assert "Health check failed" in results[1].error
+        inserted = bulk_service._insert_chunk_in_transaction.await_args.args[0]
+        assert [server.serverName for server in inserted] == ["up"]
+        # Hashes are recorded only once the vector documents exist.
+        assert getattr(inserted[0], "vectorContentHash", None) is None
+
+    async def test_failed_insert_fails_the_whole_chunk(self, bulk_service):
+        bulk_service._insert_chunk_in_transaction.side_effect = RuntimeError("write conflict")
+        with patch(f"{MODULE}.ExtendedMCPServer", FakeCollection()):
+            results = await _collect(await bulk_service.import_servers(_records(_server("One"), _server("Two")), "u"))
+
+        assert [result.error for result in results[:-1]] == ["Insert failed: write conflict"] * 2
+        assert bulk_service._index_tasks == set()
+
+    async def test_hashes_are_recorded_only_for_indexed_servers(self, bulk_service, mcp_server_repo):
+        mcp_server_repo.bulk_sync_servers.return_value = SimpleNamespace(errors=[{"server_name": "two"}])
+        servers = FakeCollection()
+        with patch(f"{MODULE}.ExtendedMCPServer", servers):
+            results = await _collect(await bulk_service.import_servers(_records(_server("One"), _server("Two")), "u"))
+            await asyncio.gather(*bulk_service._index_tasks)
+
+        hashes = {"vectorContentHash": "content", "vectorMetadataHash": "metadata"}
+        assert servers.bulk_writes == [[UpdateOne({"_id": PydanticObjectId(results[0].id)}, {"$set": hashes})]]
+
+    async def test_indexing_is_left_to_the_change_stream(self, bulk_service, mcp_server_repo):
+        bulk_service.sync_vectors_inline = False
+        servers = FakeCollection()
+        with patch(f"{MODULE}.ExtendedMCPServer", servers):
+            await _collect(await bulk_service.import_servers(_records(_server("One")), "u"))
+
+        assert bulk_service._index_tasks == set()
+        mcp_server_repo.bulk_sync_servers.assert_not_awaited()
+        assert servers.bulk_writes == []
+
+    async def test_unknown_user_is_rejected_before_reading(self, bulk_service):
+        bulk_service.user_service.get_user_by_user_id.return_value = None
+
+        with pytest.raises(ValueError, match="Authentication required"):
+            await bulk_service.import_servers(_records(_server("One")), "ghost")
+
+
+@pytest.mark.unit
+@pytest.mark.servers
+class TestBulkImportAgents:
+    """Test suite for BulkImportService.import_agents."""
+
+    async def test_imports_agents_and_reports_card_failures(self, bulk_service, agent_service):
+        async def build(data, user_id):
+            if data.path == "/broken":
+                raise ValueError("Failed to fetch agent card")
+            return _agent_document(data, user_id)
+
+        agent_service.build_agent.side_effect = build
+        existing = SimpleNamespace(path="/taken")
+        agent = {"name": "Agent", "url": "http://agent:9000"}
+        with patch(f"{MODULE}.A2AAgent", FakeCollection([existing])):
+            results = await _collect(
+                await bulk_service.import_agents(
+                    _records(
+                        {**agent, "path": "/reviewer"},
+                        {**agent, "path": "/taken"},
+                        {**agent, "path": "/broken"},
+                        {**agent, "path": "/reviewer"},
+                    ),
+                    "507f1f77bcf86cd799439011",
+                )
+            )
+
+        assert [(result.status, result.error) for result in results[:-1]] == [
+            ("created", None),
+            ("failed", "Agent with path '/taken' already exists"),
+            ("failed", "Failed to fetch agent card"),
+            ("failed", "Agent with path '/reviewer' already exists"),
+        ]
+        assert results[0].id is not None
+
+    async def test_unknown_user_is_rejected_before_reading(self, bulk_service):
+        bulk_service.user_service.get_user_by_user_id.return_value = None
+
+        with pytest.raises(ValueError, match="Authentication required"):
+            await bulk_service.import_agents(_records({"name": "Agent", "path": "/a", "url": "http://a"}), "ghost")
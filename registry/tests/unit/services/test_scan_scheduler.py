@@ -0,0 +1,292 @@
+"""
+Unit tests for the security scan scheduler and the async scanner subprocess runner.
+"""
+
+import asyncio
+import itertools
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from registry.core.change_streams import ChangeEvent
+from registry.services.scan_scheduler import (
+    PRIORITY_REGISTRATION,
+    PRIORITY_SWEEP,
+    PRIORITY_UPDATE,
+    ScanTarget,
+    SecurityScanScheduler,
+    compute_fingerprint,
+)
+from registry.services.scan_store import (
+    JOB_CANCELLED,
+    JOB_DONE,
+    JOB_FAILED,
+    JOB_PENDING,
+    JOB_RUNNING,
+    JOB_SKIPPED,
+    TARGET_AGENT,
+    TARGET_SERVER,
+)
+from registry.services.security_scanner import run_scanner_command
+
+
+class InMemoryJobQueue:
+    """ScanJobQueue with the same claim order and one-pending-job-per-target rule."""
+
+    def __init__(self):
+        self.jobs = []
+        self._ids = itertools.count()
+
+    async def enqueue(self, target_type, target_id, priority, *, force=False, reason=""):
+        for job in self.jobs:
+            if (job["targetType"], job["targetId"], job["status"]) == (target_type, target_id, JOB_PENDING):
+                job["priority"] = max(job["priority"], priority)
+                job["force"] = job["force"] or force
+                return
+        sequence = next(self._ids)
+        self.jobs.append(
+            {
+                "_id": sequence,
+                "targetType": target_type,
+                "targetId": target_id,
+                "priority": priority,
+                "force": force,
+                "enqueuedAt": sequence,
+                "status": JOB_PENDING,
+            }
+        )
+
+    async def claim(self, worker_id, lease_seconds, exclude_target_ids=()):
+        excluded = set(exclude_target_ids)
+        pending = [job for job in self.jobs if job["status"] == JOB_PENDING and job["targetId"] not in excluded]
+        if not pending:
+            return None
+        job = min(pending, key=lambda job: (-job["priority"], job["enqueuedAt"]))
+        job["status"] = JOB_RUNNING
+        return dict(job)
+
+    async def complete(self, job_id, status, error=None):
+        self._job(job_id).update(status=status, error=error)
+
+    async def requeue(self, job_id):
+        self._job(job_id)["status"] = JOB_PENDING
+
+    async def release_expired(self, max_attempts):
+        return 0
+
+    def _job(self, job_id):
+        return next(job for job in self.jobs if job["_id"] == job_id)
+
+    def statuses(self):
+        return {job["targetId"]: job["status"] for job in self.jobs}
+
+
+class InMemoryResultStore:
+    def __init__(self, fingerprints=None):
+        self.fingerprints = dict(fingerprints or {})
+
+    async def latest_fingerprint(self, target_type, target_path):
+        return self.fingerprints.get((target_type, target_path))
+
+
+async def _wait_for(predicate, timeout=2.0):
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(0.005)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+def _scheduler(queue, results, scan, fingerprint="current", **kwargs):
+    async def resolve(target_type, target_id):
+        return ScanTarget(path=f"/{target_id}", fingerprint=fingerprint, scan=lambda: scan(target_id))
+
+    options = {"poll_interval_seconds": 0.01} | kwargs
+    return SecurityScanScheduler(queue, results, resolve, **options)
+
+
+def _result(scan_failed=False, error_message=None):
+    return SimpleNamespace(is_safe=not scan_failed, scan_failed=scan_failed, error_message=error_message)
+
+
+@pytest.mark.unit
+@pytest.mark.servers
+class TestSecurityScanScheduler:
+    """Test suite for SecurityScanScheduler."""
+
+    def test_fingerprint_ignores_key_order(self):
+        assert compute_fingerprint({"url": "u", "tools": [1]}) == compute_fingerprint({"tools": [1], "url": "u"})
+        assert compute_fingerprint({"url": "u"}) != compute_fingerprint({"url": "v"})
+
+    async def test_unchanged_targets_are_skipped_unless_forced(self):
+        queue = InMemoryJobQueue()
+        results = InMemoryResultStore({(TARGET_SERVER, "/same"): "current", (TARGET_SERVER, "/forced"): "current"})
+        scanned = []
+
+        async def scan(target_id):
+            scanned.append(target_id)
+            return _result()
+
+        scheduler = _scheduler(queue, results, scan)
+        await scheduler.enqueue(TARGET_SERVER, "same")
+        await scheduler.enqueue(TARGET_SERVER, "changed")
+        await scheduler.enqueue(TARGET_SERVER, "forced", force=True)
+        await scheduler.start()
+        await _wait_for(lambda: all(status not in (JOB_PENDING, JOB_RUNNING) for status in queue.statuses().values()))
+        await scheduler.stop()
+
+        assert sorted(scanned) == ["changed", "forced"]
+        assert queue.statuses() == {"same": JOB_SKIPPED, "changed": JOB_DONE, "forced": JOB_DONE}
+
+    async def test_concurrency_is_capped(self):
+        running = 0
+        peak = 0
+        queue = InMemoryJobQueue()
+
+        async def scan(target_id):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return _result()
+
+        scheduler = _scheduler(queue, InMemoryResultStore(), scan, max_concurrency=2)
+        for index in range(6):
+            await scheduler.enqueue(TARGET_SERVER, f"s{index}")
+        await scheduler.start()
+        await _wait_for(lambda: scheduler.get_stats().get(JOB_DONE) == 6)
+        await scheduler.stop()
+
+        assert peak == 2
+
+    async def test_higher_priority_jobs_run_first(self):
+        queue = InMemoryJobQueue()
+        order = []
+
+        async def scan(target_id):
+            order.append(target_id)
+            return _result()
+
+        scheduler = _scheduler(queue, InMemoryResultStore(), scan, max_concurrency=1)
+        await scheduler.enqueue(TARGET_SERVER, "sweep", PRIORITY_SWEEP)
+        await scheduler.enqueue(TARGET_SERVER, "updated", PRIORITY_UPDATE)
+        await scheduler.enqueue(TARGET_SERVER, "registered", PRIORITY_REGISTRATION)
+        await scheduler.start()
+        await _wait_for(lambda: len(order) == 3)
+        await scheduler.stop()
+
+        assert order == ["registered", "updated", "sweep"]
+
+    async def test_failed_scans_and_vanished_targets_are_recorded(self):
+        queue = InMemoryJobQueue()
+
+        async def resolve(target_type, target_id):
+            if target_id == "gone":
+                return None
+
+            async def scan():
+                if target_id == "raises":
+                    raise RuntimeError("scanner crashed")
+                return _result(scan_failed=True, error_message="timed out")
+
+            return ScanTarget(path=f"/{target_id}", fingerprint="fp", scan=scan)
+
+        scheduler = SecurityScanScheduler(queue, InMemoryResultStore(), resolve, poll_interval_seconds=0.01)
+        for target_id in ("gone", "raises", "timeout"):
+            await scheduler.enqueue(TARGET_SERVER, target_id)
+        await scheduler.start()
+        await _wait_for(lambda: all(status not in (JOB_PENDING, JOB_RUNNING) for status in queue.statuses().values()))
+        await scheduler.stop()
+
+        assert queue.statuses() == {"gone": JOB_CANCELLED, "raises": JOB_FAILED, "timeout": JOB_FAILED}
+        errors = {job["targetId"]: job["error"] for job in queue.jobs}
+        assert errors["raises"] == "scanner crashed"
+        assert errors["timeout"] == "timed out"
+
+    async def test_stop_requeues_scans_in_progress(self):
+        queue = InMemoryJobQueue()
+        started = asyncio.Event()
+
+        async def scan(target_id):
+            started.set()
+            await asyncio.sleep(60)
+
+        scheduler = _scheduler(queue, InMemoryResultStore(), scan)
+        await scheduler.enqueue(TARGET_AGENT, "slow")
+        await scheduler.start()
+        await asyncio.wait_for(started.wait(), 2.0)
+        await scheduler.stop()
+
+        assert queue.statuses() == {"slow": JOB_PENDING}
+
+    async def test_stats_count_each_stage(self):
+        queue = InMemoryJobQueue()
+        done = asyncio.Event()
+
+        async def scan(target_id):
+            done.set()
+            return _result()
+
+        scheduler = _scheduler(queue, InMemoryResultStore(), scan)
+        await scheduler.enqueue(TARGET_SERVER, "s1", reason="manual")
+        await scheduler.start()
+        await asyncio.wait_for(done.wait(), 2.0)
+        await scheduler.stop()
+
+        stats = scheduler.get_stats()
+        assert (stats["queued"], stats["started"], stats[JOB_DONE], stats["in_flight"]) == (1, 1, 1, 0)
+
+    async def test_change_events_queue_registrations_before_updates(self):
+        queue = InMemoryJobQueue()
+        scheduler = _scheduler(queue, InMemoryResultStore(), None)
+
+        await scheduler.handle_server_change(ChangeEvent("mcpservers", "insert", "new"))
+        await scheduler.handle_server_change(ChangeEvent("mcpservers", "update", "edited", updated_fields={"config"}))
+        await scheduler.handle_server_change(ChangeEvent("mcpservers", "update", "health", updated_fields={"status"}))
+        await scheduler.handle_agent_change(ChangeEvent("a2a_agents", "delete", "removed"))
+
+        assert {job["targetId"]: job["priority"] for job in queue.jobs} == {
+            "new": PRIORITY_REGISTRATION,
+            "edited": PRIORITY_UPDATE,
+        }
+
+    async def test_sweep_queues_every_discovered_target(self):
+        queue = InMemoryJobQueue()
+
+        async def discover():
+            return [(TARGET_SERVER, "s1"), (TARGET_AGENT, "a1")]
+
+        scheduler = SecurityScanScheduler(queue, InMemoryResultStore(), None, discover)
+
+        assert await scheduler.sweep() == 2
+        assert {(job["targetType"], job["targetId"], job["priority"]) for job in queue.jobs} == {
+            (TARGET_SERVER, "s1", PRIORITY_SWEEP),
+            (TARGET_AGENT, "a1", PRIORITY_SWEEP),
+        }
+
+
+@pytest.mark.unit
+@pytest.mark.servers
+class TestRunScannerCommand:
+    """Test suite for run_scanner_command."""
+
+    async def test_returns_stdout(self):
+        output = await run_scanner_command([sys.executable, "-c", "print('scanned')"], env=None)
+
+        assert output.strip() == "scanned"
+
+    async def test_non_zero_exit_raises(self):
+        with pytest.raises(subprocess.CalledProcessError) as error:
+            await run_scanner_command(
+                [sys.executable, "-c", "import sys; sys.stderr.write('bad'); sys.exit(3)"], env=None
+            )
+
+        assert error.value.returncode == 3
+        assert "bad" in error.value.stderr
+
+    async def test_timeout_kills_the_scanner(self):
+        with pytest.raises(subprocess.TimeoutExpired):
+            await run_scanner_command([sys.executable, "-c", "import time; time.sleep(30)"], env=None, timeout=0.2)
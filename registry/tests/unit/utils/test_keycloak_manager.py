@@ -0,0 +1,119 @@
+"""
+Unit tests for the Keycloak admin client and group helpers.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from registry.utils import keycloak_manager
+from registry.utils.keycloak_manager import KeycloakAdminClient
+
+REALM_URL = "http://keycloak:8080/admin/realms/test"
+
+
+class _FakeKeycloak:
+    """Minimal in-memory Keycloak Admin API."""
+
+    def __init__(self, groups=()):
+        self.groups = {name: {"id": f"id-{name}", "name": name, "path": f"/{name}"} for name in groups}
+        self.calls: list[tuple[str, str]] = []
+        self.tokens_issued = 0
+        self.revoked: set[str] = set()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append((request.method, request.url.path))
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            return self._respond(request)
+        finally:
+            self.in_flight -= 1
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.endswith("/openid-connect/token"):
+            self.tokens_issued += 1
+            return httpx.Response(200, json={"access_token": f"token-{self.tokens_issued}", "expires_in": 60})
+        if request.headers.get("Authorization", "").removeprefix("Bearer ") in self.revoked:
+            return httpx.Response(401)
+        if path == "/admin/realms/test/groups" and request.method == "GET":
+            return httpx.Response(200, json=list(self.groups.values()))
+        if path == "/admin/realms/test/groups" and request.method == "POST":
+            name = json.loads(request.content)["name"]
+            if name in self.groups:
+                return httpx.Response(409)
+            self.groups[name] = {"id": f"id-{name}", "name": name, "path": f"/{name}"}
+            return httpx.Response(201, headers={"Location": f"{REALM_URL}/groups/id-{name}"})
+        if path.startswith("/admin/realms/test/groups/") and request.method == "DELETE":
+            group_id = path.rsplit("/", 1)[-1]
+            for name, group in list(self.groups.items()):
+                if group["id"] == group_id:
+                    del self.groups[name]
+                    return httpx.Response(204)
+            return httpx.Response(404)
+        return httpx.Response(404)
+
+
+@pytest.fixture
+def keycloak(monkeypatch):
+    fake = _FakeKeycloak(groups=("admins", "devs"))
+    admin = KeycloakAdminClient("http://keycloak:8080", "test", "admin", "secret", max_concurrency=2)
+    admin._client = httpx.AsyncClient(transport=httpx.MockTransport(fake.handle))
+    monkeypatch.setattr(keycloak_manager, "_admin_client", admin)
+    yield fake
+
+
+def _group_listings(fake):
+    return sum(1 for call in fake.calls if call == ("GET", "/admin/realms/test/groups"))
+
+
+@pytest.mark.unit
+@pytest.mark.auth
+class TestKeycloakAdminClient:
+    """Test suite for KeycloakAdminClient."""
+
+    async def test_concurrent_callers_share_one_token_fetch(self, keycloak):
+        admin = keycloak_manager.get_keycloak_admin_client()
+
+        tokens = await asyncio.gather(*(admin.get_token() for _ in range(5)))
+
+        assert set(tokens) == {"token-1"}
+        assert keycloak.tokens_issued == 1
+
+    async def test_revoked_token_is_refreshed_and_request_retried(self, keycloak):
+        admin = keycloak_manager.get_keycloak_admin_client()
+        await admin.get_token()
+        keycloak.revoked.add("token-1")
+
+        response = await admin.request("GET", "/groups")
+
+        assert response.status_code == 200
+        assert keycloak.tokens_issued == 2
+
+    async def test_group_lookups_are_cached_and_invalidated_by_mutations(self, keycloak):
+        assert (await keycloak_manager.get_keycloak_group("admins"))["id"] == "id-admins"
+        assert await keycloak_manager.group_exists_in_keycloak("devs")
+        assert _group_listings(keycloak) == 1
+
+        created = await keycloak_manager.create_keycloak_group("ops")
+        await keycloak_manager.delete_keycloak_group("ops")
+
+        assert created["id"] == "id-ops"
+        assert not await keycloak_manager.group_exists_in_keycloak("ops")
+
+    async def test_bulk_group_operations_report_per_group_results(self, keycloak):
+        created = await keycloak_manager.create_keycloak_groups({"g1": "", "g2": "", "admins": ""})
+        deleted = await keycloak_manager.delete_keycloak_groups(["g1", "g2", "missing"])
+
+        assert created["g1"]["id"] == "id-g1"
+        assert "already exists" in str(created["admins"])
+        assert deleted["g1"] is True and deleted["g2"] is True
+        assert "not found" in str(deleted["missing"])
+        assert keycloak.peak_in_flight <= 2
+        assert keycloak.tokens_issued == 1
@@ -0,0 +1,65 @@
+"""
+Unit tests for the credentials-provider token refresher's scheduling.
+"""
+
+import importlib.util
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).resolve().parents[4] / "credentials-provider" / "token_refresher.py"
+
+
+@pytest.fixture
+def refresher_module(tmp_path, monkeypatch):
+    spec = importlib.util.spec_from_file_location("token_refresher", _SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "OAUTH_TOKENS_DIR", tmp_path)
+    return module
+
+
+def _write_token(directory: Path, name: str, expires_in: float, written_ago: float = 0.0) -> Path:
+    filepath = directory / name
+    filepath.write_text(json.dumps({"expires_at": time.time() + expires_in, "access_token": "t"}))
+    written_at = time.time() - written_ago
+    os.utime(filepath, (written_at, written_at))
+    return filepath
+
+
+@pytest.mark.unit
+@pytest.mark.core
+class TestTokenRefresherSchedule:
+    """Test suite for TokenRefresher refresh scheduling."""
+
+    def test_token_living_shorter_than_the_buffer_is_not_due_at_once(self, refresher_module, tmp_path):
+        _write_token(tmp_path, "ingress.json", expires_in=3599)
+        refresher = refresher_module.TokenRefresher(buffer_seconds=3600)
+        refresher._apply_changes(refresher._index.scan())
+
+        # Half of the lifetime is left as buffer, so the next refresh is ~30 minutes away, not 1 second.
+        assert refresher.seconds_until_next_refresh(max_seconds=7200) == pytest.approx(1799.5, abs=5)
+
+    def test_stale_token_is_due_immediately(self, refresher_module, tmp_path):
+        _write_token(tmp_path, "egress.json", expires_in=600, written_ago=86400)
+        refresher = refresher_module.TokenRefresher(buffer_seconds=3600)
+        refresher._apply_changes(refresher._index.scan())
+
+        assert refresher._schedule.pop_due(time.time()) == [tmp_path / "egress.json"]
+
+    def test_token_files_found_without_a_refresh_update_the_mcp_configs(self, refresher_module, tmp_path, monkeypatch):
+        egress = _write_token(tmp_path, "atlassian-egress.json", expires_in=86400)
+        updates = []
+        monkeypatch.setattr(
+            refresher_module, "_update_mcp_configs", lambda changed: updates.append(set(changed)) or True
+        )
+        refresher = refresher_module.TokenRefresher(buffer_seconds=3600)
+
+        assert refresher.run_cycle() == 0
+        assert updates == [{egress}]
+
+        refresher.run_cycle()
+        assert len(updates) == 1
@@ -15,6 +15,7 @@ import os
 import sys
 from datetime import UTC, datetime, timedelta
 
+from beanie import PydanticObjectId
 from dotenv import load_dotenv
 
 from registry_pkgs.models._generated import PrincipalType, ResourceType
@@ -625,106 +626,100 @@ async def seed_mcp_servers(users):
         },
     ]
 
+    names = [server_data["serverName"] for server_data in servers_data]
+    existing_servers = {
+        server.serverName: server for server in await MCPServerDocument.find({"serverName": {"$in": names}}).to_list()
+    }
+
     created_servers = []
+    new_servers = []
     for server_data in servers_data:
-        # Check if server already exists
-        existing_server = await MCPServerDocument.find_one(MCPServerDocument.serverName == server_data["serverName"])
+        existing_server = existing_servers.get(server_data["serverName"])
         if existing_server:
             print(f"  Server {server_data['serverName']} already exists, skipping...")
             created_servers.append(existing_server)
-        else:
-            # Encrypt sensitive authentication fields before storing
-            server_data["config"] = encrypt_auth_fields(server_data["config"])
-
-            server = MCPServerDocument(**server_data)
-            await server.insert()
-            created_servers.append(server)
-
-            # Determine auth type for logging
-            auth_type = "none"
-            if server_data["config"].get("requiresOAuth"):
-                auth_type = "oauth"
-            elif "apiKey" in server_data["config"]:
-                auth_type = "apiKey"
-            elif "authentication" in server_data["config"]:
-                auth_type = server_data["config"]["authentication"].get("type", "none")
+            continue
 
-            print(
-                f"  Created server: {server_data['serverName']} (auth: {auth_type}, tools: {server_data['numTools']})"
-            )
+        # Encrypt sensitive authentication fields before storing
+        server_data["config"] = encrypt_auth_fields(server_data["config"])
+
+        # insert_many does not fill in ids, and the ACL entries need them
+        server = MCPServerDocument(id=PydanticObjectId(), **server_data)
+        new_servers.append(server)
+        created_servers.append(server)
+
+    if new_servers:
+        await MCPServerDocument.insert_many(new_servers)
+
+    for server in new_servers:
+        # Determine auth type for logging
+        auth_type = "none"
+        if server.config.get("requiresOAuth"):
+            auth_type = "oauth"
+        elif "apiKey" in server.config:
+            auth_type = "apiKey"
+        elif "authentication" in server.config:
+            auth_type = server.config["authentication"].get("type", "none")
+
+        print(f"  Created server: {server.serverName} (auth: {auth_type}, tools: {server.numTools})")
 
     return created_servers
 
 
+def _acl_key(principal_type, principal_id, resource_id) -> tuple:
+    return (getattr(principal_type, "value", principal_type), principal_id, resource_id)
+
+
 async def seed_acl_entries(users, servers):
     print("Seeding ACL Entries...")
     # Grant admin OWNER on all servers, authors OWNER, others VIEWER
-    acl_entries = []
     admin_user = next((u for u in users if getattr(u, "role", "").upper() == "ADMIN"), None)
+
+    # One lookup for the entries of all servers instead of one per (principal, server) pair
+    existing_entries = {
+        _acl_key(entry.principalType, entry.principalId, entry.resourceId): entry
+        for entry in await IAclEntry.find(
+            {"resourceType": ResourceType.MCPSERVER, "resourceId": {"$in": [server.id for server in servers]}}
+        ).to_list()
+    }
+
+    acl_entries = []
+    new_entries = []
+
+    def add_entry(principal_type, principal_id, server, perm_bits, label):
+        existing_acl = existing_entries.get(_acl_key(principal_type, principal_id, server.id))
+        if existing_acl:
+            print(f"  {label} ACL entry for server {server.serverName} already exists, skipping...")
+            acl_entries.append(existing_acl)
+            return
+        now = datetime.now(UTC)
+        entry = IAclEntry(
+            principalType=principal_type,
+            principalId=principal_id,
+            resourceType=ResourceType.MCPSERVER.value,
+            resourceId=server.id,
+            permBits=perm_bits,
+            grantedAt=now,
+            createdAt=now,
+            updatedAt=now,
+        )
+        new_entries.append(entry)
+        acl_entries.append(entry)
+        print(f"  Created {label} ACL entry for server {server.serverName} (permBits={perm_bits})")
+
     for server in servers:
         # Create a public entry
-        print(f"Seeding public ACL Entry for server: {server.id}")
-        existing_public_acl = await IAclEntry.find_one(
-            {
-                "principalType": PrincipalType.PUBLIC,
-                "principalId": None,
-                "resourceType": ResourceType.MCPSERVER,
-                "resourceId": server.id,
-            }
-        )
-        if existing_public_acl:
-            print(f"  Public ACL entry for server {server.serverName} already exists, skipping...")
-            acl_entries.append(existing_public_acl)
-        else:
-            public_acl_entry = IAclEntry(
-                principalType=PrincipalType.PUBLIC,
-                principalId=None,
-                resourceType=ResourceType.MCPSERVER.value,
-                resourceId=server.id,
-                permBits=PermissionBits.VIEW,
-                grantedAt=datetime.now(UTC),
-                createdAt=datetime.now(UTC),
-                updatedAt=datetime.now(UTC),
-            )
-            created_public_entry = await public_acl_entry.insert()
-            acl_entries.append(created_public_entry)
-            print(f"  Created public ACL entry server {server.serverName}")
+        add_entry(PrincipalType.PUBLIC, None, server, PermissionBits.VIEW, "public")
 
         for user in users:
-            print(f"Seeding ACL Entry for user: {user.id} on server: {server.serverName}")
             # Admin and Authors get OWNER on all servers
             if user.id == admin_user.id or user.id == server.author:
-                perm_bits = RoleBits.OWNER
-
-                existing_acl = await IAclEntry.find_one(
-                    {
-                        "principalType": PrincipalType.USER,
-                        "principalId": user.id,
-                        "resourceType": ResourceType.MCPSERVER,
-                        "resourceId": server.id,
-                    }
-                )
-                if existing_acl:
-                    print(f"  ACL entry for user {user} and server {server.serverName} already exists, skipping...")
-                    acl_entries.append(existing_acl)
-                else:
-                    acl_entry = IAclEntry(
-                        principalType=PrincipalType.USER,
-                        principalId=user.id,
-                        resourceType=ResourceType.MCPSERVER.value,
-                        resourceId=server.id,
-                        permBits=perm_bits,
-                        grantedAt=datetime.now(UTC),
-                        createdAt=datetime.now(UTC),
-                        updatedAt=datetime.now(UTC),
-                    )
-                    await acl_entry.insert()
-                    acl_entries.append(acl_entry)
-                    print(
-                        f"  Created ACL entry for user {user.username} and server {server.serverName} (permBits={perm_bits})"
-                    )
-
-    print(f"  - {len(acl_entries)} ACL entries seeded")
+                add_entry(PrincipalType.USER, user.id, server, RoleBits.OWNER, f"user {user.username}")
+
+    if new_entries:
+        await IAclEntry.insert_many(new_entries)
+
+    print(f"  - {len(acl_entries)} ACL entries seeded ({len(new_entries)} new)")
     return acl_entries
 
 
@@ -4,6 +4,8 @@ MongoDB to Weaviate Sync Script for MCP Gateway Registry
 This script synchronizes MCP servers from MongoDB to Weaviate.
 It reads all servers from MongoDB using the DI-managed server service and imports
 them into Weaviate for semantic search. Already existing servers are skipped.
+Each batch is checked for existing servers with one query, and the new servers of
+a batch are embedded together rather than one server at a time.
 
 Usage:
     uv run python scripts/sync_mongo_to_weaviate.py [--clean] [--batch-size N] [--env-file PATH]
@@ -154,62 +156,57 @@ def parse_args() -> tuple[bool, int, str]:
     return clean_mode, batch_size, env_file
 
 
-async def check_server_exists(mcp_server_repo, server_id: str) -> bool:
-    """Check if server already exists in Weaviate."""
+async def find_indexed_servers(mcp_server_repo, server_ids: list[str]) -> set[str]:
+    """Return the IDs of servers that already exist in Weaviate, with one query per page."""
     try:
-        existing = await mcp_server_repo.get_by_server_id(server_id)
-        return existing is not None
+        return await mcp_server_repo.get_indexed_server_ids(server_ids)
     except Exception as e:
-        print(f"  Warning: Failed to check existence for server {server_id}: {e}")
-        return False
+        print(f"  Warning: Failed to check existence for {len(server_ids)} servers: {e}")
+        return set()
 
 
-async def sync_server(server: Any, stats: SyncStats, mcp_server_repo):
-    """Sync a single server to Weaviate."""
-    server_name = server.serverName
-    server_path = server.path
-    server_id = str(server.id)
+async def sync_servers(servers: list[Any], stats: SyncStats, mcp_server_repo, progress_offset: int, total: int):
+    """Sync one page of servers to Weaviate, embedding all new servers in shared batches."""
+    indexed = await find_indexed_servers(mcp_server_repo, [str(server.id) for server in servers])
 
-    print(f"Processing: {server_name} ({server_path}) [ID: {server_id}]")
-
-    try:
-        exists = await check_server_exists(mcp_server_repo, server_id)
-
-        if exists:
+    to_sync = []
+    for position, server in enumerate(servers, start=progress_offset + 1):
+        print(f"\n[{position}/{total}] Processing: {server.serverName} ({server.path}) [ID: {server.id}]")
+        if str(server.id) in indexed:
             print("  ○ Server already exists, skipping...")
             stats.servers_without_tools += 1
             stats.tools_skipped += 1
-            stats.add_server(server_name, server_path, 1, 0, 1, 0)
-            return
+            stats.add_server(server.serverName, server.path, 1, 0, 1, 0)
+            continue
 
         num_tools = server.numTools if hasattr(server, "numTools") else 0
         print(f"  Server has {num_tools} tools")
         stats.servers_with_tools += 1
         stats.total_tools += 1
+        to_sync.append(server)
 
-        result = await mcp_server_repo.sync_server_to_vector_db(
-            server=server,
-            is_delete=False,
-        )
+    if not to_sync:
+        return
 
-        if result and result.get("indexed_tools", 0) > 0:
-            print("  ✓ Successfully imported server")
-            stats.tools_imported += 1
-            stats.add_server(server_name, server_path, 1, 1, 0, 0)
-        else:
-            error_msg = f"{server_name}: Failed to import server"
+    print(f"\n  Importing {len(to_sync)} server(s)...")
+    try:
+        result = await mcp_server_repo.bulk_sync_servers(to_sync)
+        failed = {error["server_name"]: error.get("error", "") for error in result.errors if error.get("server_name")}
+    except Exception as e:
+        failed = {server.serverName: str(e) for server in to_sync}
+
+    for server in to_sync:
+        if server.serverName in failed:
+            reason = failed[server.serverName]
+            error_msg = f"{server.serverName}: Failed to import server" + (f" ({reason})" if reason else "")
             print(f"  ✗ {error_msg}")
             stats.add_error(error_msg)
             stats.tools_failed += 1
-            stats.add_server(server_name, server_path, 1, 0, 0, 1)
-
-    except Exception as e:
-        error_msg = f"Unexpected error processing {server_name}: {e}"
-        print(f"  ✗ {error_msg}")
-        stats.add_error(error_msg)
-        stats.total_tools += 1
-        stats.tools_failed += 1
-        stats.add_server(server_name, server_path, 1, 0, 0, 1)
+            stats.add_server(server.serverName, server.path, 1, 0, 0, 1)
+        else:
+            stats.tools_imported += 1
+            stats.add_server(server.serverName, server.path, 1, 1, 0, 0)
+    print(f"  ✓ Imported {len(to_sync) - len(failed)} server(s)")
 
 
 async def clean_weaviate(mcp_server_repo):
@@ -263,12 +260,9 @@ async def sync_all_servers(server_service, mcp_server_repo, batch_size: int = 10
                 print(f"  No servers returned for page {page}, stopping...")
                 break
 
-            for server in servers:
-                processed_count += 1
-                stats.total_servers = processed_count
-
-                print(f"\n[{processed_count}/{total}] ", end="")
-                await sync_server(server, stats, mcp_server_repo)
+            await sync_servers(servers, stats, mcp_server_repo, processed_count, total)
+            processed_count += len(servers)
+            stats.total_servers = processed_count
 
             print(f"\n{'─' * 80}")
             print(